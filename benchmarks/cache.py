@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Times parsing stories against loading their trees from the cache of trees,
+and shows the size of the cached trees.
+
+Run with: python -m benchmarks.cache
+"""
+import os
+import tempfile
+
+from storyscript.parser import Parser, TreeCache
+
+from .stories import best, story
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TreeCache(directory)
+        parser = Parser()
+        cached = Parser(cache=cache)
+        parser.lark()
+        for lines in (1000, 10000):
+            source = story(lines)
+            parsing = best(parser.parse, source)
+            cached.parse(source)
+            loading = best(cached.parse, source)
+            key = cache.key(source, parser.grammar(), 'lalr', False)
+            size = os.path.getsize(cache.path(key))
+            line = ('{:>6} lines: parse {:6.3f}s, load {:6.3f}s, '
+                    '{:>8} bytes cached for {:>8} bytes of source')
+            print(line.format(lines, parsing, loading, size, len(source)))
+
+
+if __name__ == '__main__':
+    main()
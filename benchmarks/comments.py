@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Times parsing comment-heavy stories, where comments are skipped by the
+lexer, against the regular expression passes that used to remove them from
+the source before parsing.
+
+Run with: python -m benchmarks.comments
+"""
+import re
+
+from storyscript.parser import Parser
+
+from .stories import best, story
+
+
+def commented(lines):
+    """
+    Generates a story with a comment on every line and a block comment
+    every ten lines
+    """
+    chunks = []
+    for n, line in enumerate(story(lines).splitlines()):
+        if n % 10 == 0:
+            chunks.append('###\nblock comment {}\n###'.format(n))
+        chunks.append('{} # comment {}'.format(line, n))
+    return '\n'.join(chunks) + '\n'
+
+
+def clean(source):
+    """
+    The former preprocessing passes, for comparison
+    """
+    source = re.sub(r'#[^#\n]+', '', source)
+    return re.sub(r'###[^#]+###',
+                  lambda match: re.sub(r'.*', '', match.group()), source)
+
+
+def main():
+    parser = Parser()
+    parser.lark()
+    for lines in (1000, 10000):
+        source = commented(lines)
+        cleaning = best(clean, source, repeat=7, collect=False)
+        cleaned = best(parser.parse, clean(source), repeat=7,
+                       collect=False)
+        parsing = best(parser.parse, source, repeat=7, collect=False)
+        line = ('{:>6} lines: clean {:6.3f}s + parse {:6.3f}s, '
+                'parse with comments {:6.3f}s')
+        print(line.format(lines, cleaning, cleaned, parsing))
+
+
+if __name__ == '__main__':
+    main()
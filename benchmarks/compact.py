@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Compares full and compact trees of expression-heavy stories: node counts,
+parsing and compiling time.
+
+Run with: python -m benchmarks.compact
+"""
+from storyscript.compiler import Compiler, Objects
+from storyscript.parser import Parser
+
+from .stories import timed
+
+expression = ('a{n} = {n} + 2 * (3 - b) ^ 2 > 1 and [c, 4, {{"k": d}}] '
+              '!= e or !f\n')
+
+
+def nodes(tree):
+    return sum(1 for _ in tree.iter_subtrees())
+
+
+def expressions(trees):
+    for tree in trees:
+        Objects.expression(tree)
+
+
+def main():
+    for lines in (500, 2000):
+        source = ''.join(expression.format(n=n) for n in range(lines))
+        for compact in (False, True):
+            parser = Parser(compact=compact)
+            parser.lark()
+            tree, parsing = timed(parser.parse, source)
+            count = nodes(tree)
+            trees = [fragment.expression for fragment
+                     in tree.find_data('assignment_fragment')]
+            objects = timed(expressions, trees)[1]
+            compiling = timed(Compiler.compile, tree)[1]
+            name = 'compact' if compact else 'full'
+            print('{:>6} lines {:>8}: {:7} nodes, parse {:6.3f}s, '
+                  'expressions {:6.3f}s, compile {:6.3f}s'.format(
+                      lines, name, count, parsing, objects, compiling))
+
+
+if __name__ == '__main__':
+    main()
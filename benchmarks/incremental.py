@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the latency of reparsing a story after typing a character, with
+incremental reparsing and with full parses.
+
+Run with: python -m benchmarks.incremental
+"""
+import time
+
+from storyscript.parser import Parser
+
+from .stories import story
+
+
+def main():
+    parser = Parser()
+    parser.lark()
+    for lines in (1000, 5000):
+        source = story(lines)
+        start = time.perf_counter()
+        tree = parser.incremental(source)
+        full = time.perf_counter() - start
+        position = source.index('\na', len(source) // 2) + 2
+        times = []
+        for char in 'abcdefghij':
+            start = time.perf_counter()
+            tree = parser.reparse(tree, source, position, position, char)
+            times.append(time.perf_counter() - start)
+            source = source[:position] + char + source[position:]
+            position += 1
+        print('{:>6} lines: full {:7.2f}ms, first edit {:6.2f}ms, '
+              'next edits {:6.2f}ms'.format(lines, full * 1000,
+                                            times[0] * 1000,
+                                            min(times[1:]) * 1000))
+
+
+if __name__ == '__main__':
+    main()
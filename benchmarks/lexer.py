@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Compares lexing and parsing with the Scanner and with Lark's lexers.
+
+Run with: python -m benchmarks.lexer
+"""
+from storyscript.parser import Parser
+
+from .stories import best, story
+
+
+def main():
+    for lines in (1000, 10000):
+        source = story(lines)
+        for lexer in ('lark', 'scanner'):
+            parser = Parser(lexer=lexer)
+            parser.lark()
+            lexing = best(lambda source: list(parser.lex(source)), source)
+            parsing = best(parser.parse, source)
+            print('{:>6} lines {:>8}: lex {:6.3f}s, parse {:6.3f}s'.format(
+                lines, lexer, lexing, parsing))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Measures how compiling scales with the number of lines, finding the last
+line from the sorted line index and, for the smaller stories, by sorting
+all the lines every time as before.
+
+Run with: python -m benchmarks.lines
+"""
+import time
+
+from storyscript.compiler import Compiler, Lines
+from storyscript.parser import Parser
+
+from .stories import story
+
+
+class SortingLines(Lines):
+    """
+    Lines that are sorted every time the first or last one is needed
+    """
+    def sort(self):
+        return sorted(self.lines.keys(), reverse=True,
+                      key=lambda x: list(map(
+                          lambda i: -int(i), x.split('.'))))
+
+    def first(self):
+        if self.lines:
+            return self.sort()[0]
+
+    def last(self):
+        if self.lines:
+            return self.sort()[-1]
+
+
+class SortingCompiler(Compiler):
+
+    @staticmethod
+    def compiler():
+        compiler = Compiler()
+        compiler.lines = SortingLines()
+        return compiler
+
+
+def measure(compiler, parser, source):
+    tree = parser.parse(source)
+    start = time.perf_counter()
+    compiler.compile(tree)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = Parser()
+    parser.lark()
+    for lines in (1000, 2000, 5000, 10000, 20000, 50000):
+        source = story(lines)
+        elapsed = measure(Compiler, parser, source)
+        sorting = ''
+        if lines <= 5000:
+            sorting = ', sorting {:7.3f}s'.format(
+                measure(SortingCompiler, parser, source))
+        print('{:>6} lines: index {:7.3f}s, {:6.2f}us per line{}'.format(
+            lines, elapsed, elapsed / lines * 1e6, sorting))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Compares compiling stories with big constant literals, scanned at once by
+LiteralScanner, with the grammar's rules for each value, and with loading
+the same literal as JSON.
+
+Run with: python -m benchmarks.literals
+"""
+import json
+
+from storyscript.compiler import Compiler
+from storyscript.parser import Parser
+
+from .stories import best
+
+
+def literal(entries):
+    """
+    Generates an indented list of configuration objects
+    """
+    items = []
+    for n in range(entries):
+        items.append('    {{"name": "item {n}", "size": {n}, '
+                     '"ratio": {n}.5, "enabled": true, '
+                     '"tags": ["a", "b"]}}'.format(n=n))
+    return '[\n{}\n]'.format(',\n'.join(items))
+
+
+def main():
+    scanner = Parser(compact=True)
+    grammar = Parser(compact=True, lexer='lark')
+    scanner.lark()
+    grammar.lark()
+    for entries in (1000, 10000):
+        text = literal(entries)
+        source = 'config = {}\n'.format(text)
+        timings = (
+            ('grammar', best(lambda s: Compiler.compile(grammar.parse(s)),
+                             source, collect=False)),
+            ('constant', best(lambda s: Compiler.compile(scanner.parse(s)),
+                              source, collect=False)),
+            ('json', best(json.loads, text, collect=False)))
+        print('{:>6} entries: {}'.format(entries, ', '.join(
+            '{} {:6.3f}s'.format(name, timing) for name, timing in timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the memory retained by parsed trees and arenas, per node.
+
+Run with: python -m benchmarks.memory
+"""
+import gc
+import sys
+import tracemalloc
+
+from lark.lexer import Token
+
+from storyscript.parser import Parser
+
+from .stories import story
+
+
+def count(tree):
+    trees = 0
+    tokens = 0
+    for subtree in tree.iter_subtrees():
+        trees += 1
+        for child in subtree.children:
+            if isinstance(child, Token):
+                tokens += 1
+    return trees, tokens
+
+
+def retained(function, source):
+    gc.collect()
+    tracemalloc.start()
+    tree = function(source)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, size
+
+
+def report(lines, name, trees, tokens, size):
+    print('{:>6} lines {:>8}: {:7} trees, {:6} tokens, {:6.1f} MB, '
+          '{:4.0f} B/node'.format(lines, name, trees, tokens,
+                                  size / 1024 / 1024, size / (trees + tokens)))
+
+
+def main():
+    for lines in (1000, 10000):
+        source = story(lines)
+        for compact in (False, True):
+            parser = Parser(compact=compact)
+            parser.lark()
+            tree, size = retained(parser.parse, source)
+            trees, tokens = count(tree)
+            name = 'compact' if compact else 'full'
+            report(lines, name, trees, tokens, size)
+        arena, size = retained(parser.arena, source)
+        tokens = sum(1 for index in range(len(arena))
+                     if arena.is_token(index))
+        report(lines, 'arena', len(arena) - tokens, tokens, size)
+        print('{:>6} lines {:>8}: {:6.1f} MB'.format(
+            lines, 'dump', len(arena.dump()) / 1024 / 1024))
+    tree = parser.parse('a = 1')
+    node = tree.block.rules.assignment
+    print('tree object: {} B, children: {} B, token: {} B'.format(
+        sys.getsizeof(node), sys.getsizeof(node.children),
+        sys.getsizeof(node.child(0).child(0))))
+
+
+if __name__ == '__main__':
+    main()
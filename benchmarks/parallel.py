@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Compares parsing long stories serially with parsing their top-level blocks
+in a pool of processes, with as many workers as there are CPUs.
+
+Run with: python -m benchmarks.parallel
+"""
+import os
+
+from storyscript.parser import Parser
+
+from .stories import best, story
+
+
+def main():
+    workers = os.cpu_count()
+    for compact in (False, True):
+        serial = Parser(compact=compact)
+        parallel = Parser(compact=compact, workers=workers)
+        serial.lark()
+        for lines in (10000, 60000):
+            source = story(lines)
+            print('{:>6} lines compact={!s:5}: serial {:6.3f}s, {} workers '
+                  '{:6.3f}s'.format(lines, compact,
+                                    best(serial.parse, source, repeat=3),
+                                    workers,
+                                    best(parallel.parse, source, repeat=3)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Compares transforming the tree while parsing with the two-pass approach of
+building Lark's tree and transforming it afterwards.
+
+Run with: python -m benchmarks.parse
+"""
+import time
+import tracemalloc
+
+from storyscript.parser import Parser, Tables, Transformer
+
+from .stories import story
+
+
+def measure(function, source):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(source)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = Parser()
+    tables = Tables.get(parser.grammar())
+    two_pass = Tables.lark(tables, postlex=Parser.indenter())
+    parser.lark()
+
+    def single(source):
+        return parser.parse(source)
+
+    def double(source):
+        return Transformer().transform(two_pass.parse('{}\n'.format(source)))
+
+    for lines in (1000, 10000):
+        source = story(lines)
+        for name, function in (('two-pass', double), ('single', single)):
+            elapsed, peak = measure(function, source)
+            print('{:>6} lines {:>9}: {:7.3f}s, peak {:8.1f} MB'.format(
+                lines, name, elapsed, peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main()
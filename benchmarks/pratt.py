@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Compares parsing arithmetic-heavy and condition-heavy stories with the
+expression levels of the LALR grammar and with precedence climbing.
+
+Run with: python -m benchmarks.pratt
+"""
+from storyscript.parser import Parser
+
+from .stories import best
+
+statements = {
+    'arithmetic': 'a{n} = {n} + 2 * (3 - b) ^ 2 / c % 4 - -d * (e + f)\n',
+    'conditions': ('if a{n} > 1 and b <= 2 or !c == d and e != f or g\n'
+                   '    x = !y or z and w < {n}\n')
+}
+
+
+def main():
+    for name, statement in statements.items():
+        source = ''.join(statement.format(n=n) for n in range(2000))
+        for algo in ('lalr', 'pratt'):
+            for compact in (False, True):
+                parser = Parser(algo=algo, compact=compact)
+                parser.lark()
+                mode = 'compact' if compact else 'full'
+                print('{:>10} {:>5} {:>7}: parse {:6.3f}s'.format(
+                    name, algo, mode,
+                    best(parser.parse, source, repeat=3)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Generates synthetic stories for the benchmarks, and times them.
+"""
+import gc
+import time
+
+statements = [
+    'a{n} = {n} + 2 * 3\n',
+    'b{n} = "hello {{a{n}}}"\n',
+    'c{n} = [1, 2, {{"key": a{n}}}]\n',
+    'if a{n} > 10 and b{n} != "x"\n    d{n} = a{n} ^ 2\nelse\n    d{n} = 0\n',
+    'alpine echo message: "text {n}"\n',
+    'e{n} = (alpine echo text: b{n})\n',
+    'foreach c{n} as item\n    f{n} = item\n',
+    'function f{n} x:int returns int\n    return x * {n}\n',
+]
+
+
+def story(lines):
+    """
+    Generates a story with approximately the given number of lines.
+    """
+    chunks = []
+    count = 0
+    n = 0
+    while count < lines:
+        statement = statements[n % len(statements)].format(n=n)
+        chunks.append(statement)
+        count += statement.count('\n')
+        n += 1
+    return ''.join(chunks)
+
+
+def timed(function, *args):
+    """
+    Calls a function, returning its result and the time it took.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def best(function, source, repeat=5, collect=True):
+    """
+    Times a function on a source, returning the best time of repeat runs.
+    The garbage collector is paused during the runs unless collect is true.
+    """
+    times = []
+    if collect is False:
+        gc.disable()
+    try:
+        for _ in range(repeat):
+            times.append(timed(function, source)[1])
+    finally:
+        if collect is False:
+            gc.enable()
+    return min(times)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Compares lexing story files read in memory and cleaned with lexing them in
+place from memory maps, in time and peak memory.
+
+Run with: python -m benchmarks.streaming
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+from storyscript.Story import Story
+
+from .stories import story
+
+
+def write(path, megabytes):
+    """
+    Writes a commented story of about the given size
+    """
+    chunk = '# generated\n{}'.format(story(1000))
+    chunk = chunk.replace('\n', ' # comment\n', 50)
+    with open(path, 'w') as file:
+        for _ in range(megabytes * 1024 * 1024 // len(chunk)):
+            file.write(chunk)
+
+
+def read(path):
+    return Story.from_file(path).lex()
+
+
+def stream(path):
+    return Story.lex_file(path)
+
+
+def measure(function, path):
+    start = time.perf_counter()
+    tokens = sum(1 for token in function(path))
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for token in function(path):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return tokens, elapsed, peak
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'big.story')
+    for megabytes in (2, 16):
+        write(path, megabytes)
+        for name, function in (('read', read), ('stream', stream)):
+            tokens, elapsed, peak = measure(function, path)
+            print('{:>3} MB {:>7}: {:8} tokens, {:6.2f}s, peak {:7.2f} MB'
+                  .format(megabytes, name, tokens, elapsed,
+                          peak / 1024 / 1024))
+    os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Compares lists of tokens with token streams, in retained memory and in the
+time taken to write them out like `storyscript lex` does.
+
+Run with: python -m benchmarks.tokens
+"""
+import gc
+import io
+import tracemalloc
+
+import click
+
+from storyscript.parser import Parser
+
+from .stories import story, timed
+
+
+def retained(function, source):
+    gc.collect()
+    tracemalloc.start()
+    result = function(source)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def echo(tokens):
+    output = io.StringIO()
+    for n, token in enumerate(tokens):
+        click.echo('{} {} {}'.format(n, token.type, token.value),
+                   file=output)
+
+
+def tsv(stream):
+    output = io.StringIO()
+    output.writelines(stream.tsv('story'))
+
+
+def main():
+    parser = Parser()
+    parser.lark()
+    for lines in (1000, 10000):
+        source = story(lines).encode('utf-8')
+        tokens, size = retained(lambda s: list(parser.lex(s)), source)
+        print('{:>6} lines   tokens: {:6.2f} MB, echo {:6.3f}s'.format(
+            lines, size / 1024 / 1024, timed(echo, tokens)[1]))
+        stream, size = retained(parser.token_stream, source)
+        print('{:>6} lines   stream: {:6.2f} MB, tsv  {:6.3f}s'.format(
+            lines, size / 1024 / 1024, timed(tsv, stream)[1]))
+
+
+if __name__ == '__main__':
+    main()
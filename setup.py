@@ -3,7 +3,7 @@
 import io
 from os import path
 
-from setuptools import find_packages, setup
+from setuptools import Command, find_packages, setup
 from setuptools.command.install import install as _install
 from setuptools.command.sdist import sdist as _sdist
 
@@ -86,6 +86,23 @@ class Sdist(_sdist):
                      msg='Building the release')
 
 
+class Tables(Command):
+    description = 'generate the parsing tables of the built-in grammar'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        from storyscript.parser import Grammar, Tables
+        module = path.join(root_dir, name, 'parser', 'GrammarTables.py')
+        print(f'writing parsing tables -> {module}')
+        Tables.generate(Grammar().build(), module)
+
+
 setup(name=name,
       version=release_version,
       description=short_description,
@@ -112,4 +129,5 @@ setup(name=name,
       cmdclass={
         'install': Install,
         'sdist': Sdist,
+        'tables': Tables,
       })
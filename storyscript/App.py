@@ -3,7 +3,7 @@ import json
 
 from .Bundle import Bundle
 from .compiler.Preprocessor import Preprocessor
-from .parser import Grammar
+from .parser import Grammar, TreeCache
 
 
 class App:
@@ -12,11 +12,23 @@ class App:
     """
 
     @staticmethod
-    def parse(path, ignored_path=None, ebnf=None, preprocess=False):
+    def tree_cache(cache):
         """
-        Parses stories found in path, returning their trees
+        Initialize the cache of trees, when enabled
         """
-        bundle = Bundle.from_path(path, ignored_path=ignored_path)
+        if cache:
+            return TreeCache()
+        return None
+
+    @classmethod
+    def parse(cls, path, ignored_path=None, ebnf=None, preprocess=False,
+              cache=False):
+        """
+        Parses stories found in path, returning their trees. Unchanged
+        stories are loaded from the cache of trees, when enabled.
+        """
+        bundle = Bundle.from_path(path, ignored_path=ignored_path,
+                                  cache=cls.tree_cache(cache))
         stories = bundle.bundle_trees(ebnf=ebnf)
         if preprocess:
             for story, tree in stories.items():
@@ -24,11 +36,39 @@ class App:
         return stories
 
     @staticmethod
-    def compile(path, ignored_path=None, ebnf=None):
+    def format_trees(trees, output_format='text', raw=False):
+        """
+        Yields the trees of stories as chunks of text, pretty or raw, JSON
+        lines or nested JSON, so that they can be written as they are made,
+        see Tree.pretty_lines, Tree.jsonl and Tree.json
+        """
+        if output_format == 'jsonl':
+            for story, tree in trees.items():
+                yield from tree.jsonl(story)
+            return
+        if output_format == 'json':
+            yield '{'
+            separator = ''
+            for story, tree in trees.items():
+                yield '{}{}: '.format(separator, json.dumps(story))
+                yield from tree.json()
+                separator = ', '
+            yield '}\n'
+            return
+        for story, tree in trees.items():
+            yield 'File: {}\n'.format(story)
+            if raw:
+                yield '{!r}\n'.format(tree)
+            else:
+                yield from tree.pretty_lines()
+
+    @classmethod
+    def compile(cls, path, ignored_path=None, ebnf=None, cache=False):
         """
         Parses and compiles stories found in path, returning JSON
         """
-        bundle = Bundle.from_path(path, ignored_path=ignored_path)
+        bundle = Bundle.from_path(path, ignored_path=ignored_path,
+                                  cache=cls.tree_cache(cache))
         return json.dumps(bundle.bundle(ebnf=ebnf), indent=2)
 
     @staticmethod
@@ -38,9 +78,16 @@ class App:
         """
         return Bundle.from_path(path).lex(ebnf=ebnf)
 
+    @staticmethod
+    def lex_files(path, ebnf=None, compact=False):
+        """
+        Lex stories one at a time from their files, see Bundle.lex_files
+        """
+        return Bundle.from_path(path).lex_files(ebnf=ebnf, compact=compact)
+
     @staticmethod
     def grammar():
         """
         Returns the current grammar
         """
-        return Grammar().build()
+        return Grammar.grammar()
@@ -7,12 +7,14 @@ from .Story import Story
 
 class Bundle:
     """
-    Bundles all stories that must be compiled together.
+    Bundles all stories that must be compiled together. Trees are loaded
+    from the given TreeCache when possible.
     """
 
-    def __init__(self, story_files={}):
+    def __init__(self, story_files={}, cache=None):
         self.stories = {}
         self.story_files = story_files
+        self.cache = cache
 
     @staticmethod
     def gitignores():
@@ -63,13 +65,13 @@ class Bundle:
         return paths
 
     @classmethod
-    def from_path(cls, path, ignored_path=None):
+    def from_path(cls, path, ignored_path=None, cache=None):
         """
         Load a bundle of stories from the filesystem.
         If a directory is given. all `.story` files in the directory will be
         loaded.
         """
-        bundle = Bundle()
+        bundle = Bundle(cache=cache)
         if os.path.isdir(path):
             for story in cls.parse_directory(path, ignored_path=ignored_path):
                 bundle.load_story(story)
@@ -111,7 +113,7 @@ class Bundle:
         """
         for storypath in stories:
             story = self.load_story(storypath)
-            story.parse(ebnf=ebnf)
+            story.parse(ebnf=ebnf, cache=self.cache)
             self.parse_modules(story.modules(), ebnf)
             self.stories[storypath] = story.tree
 
@@ -122,7 +124,7 @@ class Bundle:
         """
         for storypath in stories:
             story = self.load_story(storypath)
-            story.parse(ebnf=ebnf)
+            story.parse(ebnf=ebnf, compact=True, cache=self.cache)
             self.compile_modules(story.modules(), ebnf)
             story.compile()
             self.stories[storypath] = story.compiled
@@ -150,5 +152,18 @@ class Bundle:
         stories = self.find_stories()
         results = {}
         for story in stories:
-            results[story] = Story.from_file(story).lex(ebnf=ebnf)
+            results[story] = list(Story.from_file(story).lex(ebnf=ebnf))
         return results
+
+    def lex_files(self, ebnf=None, compact=False):
+        """
+        Lexes the bundle story by story, producing each story with its
+        tokens, which are produced lazily from its file, see Story.lex_file.
+        Compact tokens are the TokenStream of each story instead. Stories
+        are lexed as they are reached, so that one file is open at a time.
+        """
+        stories = self.find_stories()
+        lex = Story.lex_file
+        if compact:
+            lex = Story.token_stream
+        return ((story, lex(story, ebnf=ebnf)) for story in stories)
@@ -10,6 +10,7 @@ from .App import App
 from .Project import Project
 from .Version import version as app_version
 from .exceptions import StoryError
+from .parser import TokenStream
 
 
 class Cli:
@@ -17,6 +18,9 @@ class Cli:
     version_help = 'Prints Storyscript version'
     silent_help = 'Silent mode. Return syntax errors only.'
     ebnf_help = 'Load the grammar from a file. Useful for development'
+    format_help = 'Output tokens as text, tab-separated values or JSON lines'
+    cache_help = 'Load the trees of unchanged stories from the cache'
+    tree_format_help = 'Output trees as pretty text, JSON or JSON lines'
 
     @click.group(invoke_without_command=True, cls=ClickAliasedGroup)
     @click.option('--version', '-v', is_flag=True, help=version_help)
@@ -36,25 +40,33 @@ class Cli:
     @staticmethod
     @main.command(aliases=['p'])
     @click.argument('path', default=os.getcwd())
+    @click.argument('output', required=False)
     @click.option('--debug', is_flag=True)
     @click.option('--ebnf', help=ebnf_help)
     @click.option('--raw', is_flag=True)
     @click.option('--preprocess', is_flag=True)
     @click.option('--ignore', default=None,
                   help='Specify path of ignored files')
-    def parse(path, debug, ebnf, raw, ignore, preprocess):
+    @click.option('--cache', is_flag=True, help=cache_help)
+    @click.option('--format', 'output_format', default='text',
+                  type=click.Choice(['text', 'json', 'jsonl']),
+                  help=tree_format_help)
+    def parse(path, output, debug, ebnf, raw, ignore, preprocess, cache,
+              output_format):
         """
         Parses stories, producing the abstract syntax tree.
         """
         try:
             trees = App.parse(path, ignored_path=ignore, ebnf=ebnf,
-                              preprocess=preprocess)
-            for story, tree in trees.items():
-                click.echo('File: {}'.format(story))
-                if raw:
-                    click.echo(tree)
-                else:
-                    click.echo(tree.pretty())
+                              preprocess=preprocess, cache=cache)
+            chunks = App.format_trees(trees, output_format, raw=raw)
+            if output:
+                with io.open(output, 'w') as f:
+                    f.writelines(chunks)
+                return
+            stdout = click.get_text_stream('stdout')
+            stdout.writelines(chunks)
+            stdout.flush()
         except StoryError as e:
             if debug:
                 raise e
@@ -78,13 +90,14 @@ class Cli:
     @click.option('--ebnf', help=ebnf_help)
     @click.option('--ignore', default=None,
                   help='Specify path of ignored files')
-    def compile(path, output, json, silent, debug, ebnf, ignore):
+    @click.option('--cache', is_flag=True, help=cache_help)
+    def compile(path, output, json, silent, debug, ebnf, ignore, cache):
         """
         Compiles stories and prints the resulting json
         """
         try:
             results = App.compile(path, ignored_path=ignore,
-                                  ebnf=ebnf)
+                                  ebnf=ebnf, cache=cache)
             if not silent:
                 if json:
                     if output:
@@ -113,13 +126,25 @@ class Cli:
     @click.argument('path', default=os.getcwd())
     @click.option('--ebnf', help=ebnf_help)
     @click.option('--debug', is_flag=True)
-    def lex(path, ebnf, debug):
+    @click.option('--format', 'output_format', default='text',
+                  type=click.Choice(['text', 'tsv', 'jsonl']),
+                  help=format_help)
+    def lex(path, ebnf, debug, output_format):
         """
         Shows lexer tokens for given stories
         """
         try:
-            results = App.lex(path, ebnf=ebnf)
-            for file, tokens in results.items():
+            if output_format != 'text':
+                results = App.lex_files(path, ebnf=ebnf, compact=True)
+                stdout = click.get_text_stream('stdout')
+                if output_format == 'tsv':
+                    stdout.write('\t'.join(TokenStream.headers) + '\n')
+                for file, stream in results:
+                    stdout.writelines(getattr(stream, output_format)(file))
+                stdout.flush()
+                return
+            results = App.lex_files(path, ebnf=ebnf)
+            for file, tokens in results:
                 click.echo('File: {}'.format(file))
                 for n, token in enumerate(tokens):
                     click.echo('{} {} {}'.format(n, token.type, token.value))
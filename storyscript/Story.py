@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import io
 import os
-import re
 
 from lark.exceptions import UnexpectedInput, UnexpectedToken
 
@@ -14,34 +13,41 @@ class Story:
     """
     Represents a single story and exposes methods for reading, parsing and
     compiling it.
+
+    Stories can be edited, reparsing only what the edit affects, see edit.
     """
+    parsed_story = None
 
     def __init__(self, story, path=None):
-        self.story = self.clean_source(story)
+        self.story = story
         self.path = path
 
     @staticmethod
-    def remove_comments(source):
-        """
-        Removes inline comments from source.
-        """
-        return re.sub(r'#[^#\n]+', '', source)
-
-    @staticmethod
-    def delete_line(match):
-        """
-        Clears the contents of a line.
-        """
-        return re.sub(r'.*', '', match.group())
-
-    @classmethod
-    def clean_source(cls, source):
-        """
-        Cleans a story by removing all comments.
-        """
-        return re.sub(
-            r'###[^#]+###', cls.delete_line, cls.remove_comments(source)
-        )
+    def changes(previous, story):
+        """
+        Finds the range of the previous story that changed in story, and the
+        text replacing it, comparing slices to find what they share.
+        """
+        length = min(len(previous), len(story))
+        low = 0
+        high = length
+        while low < high:
+            middle = (low + high + 1) // 2
+            if previous[:middle] == story[:middle]:
+                low = middle
+            else:
+                high = middle - 1
+        start = low
+        low = 0
+        high = length - start
+        while low < high:
+            middle = (low + high + 1) // 2
+            if previous[len(previous) - middle:] == \
+                    story[len(story) - middle:]:
+                low = middle
+            else:
+                high = middle - 1
+        return start, len(previous) - low, story[start:len(story) - low]
 
     @classmethod
     def read(cls, path):
@@ -53,12 +59,19 @@ class Story:
             with io.open(path, 'r') as file:
                 return file.read()
         except FileNotFoundError:
-            abspath = os.path.abspath(path)
-            msg = 'File "{}" not found at {}'.format(path, abspath)
+            msg = cls.not_found(path)
 
         if msg is not None:
             raise StoryError.unnamed_error(msg)
 
+    @staticmethod
+    def not_found(path):
+        """
+        Describes a missing story file
+        """
+        abspath = os.path.abspath(path)
+        return 'File "{}" not found at {}'.format(path, abspath)
+
     @classmethod
     def from_file(cls, path):
         """
@@ -79,14 +92,24 @@ class Story:
         """
         return StoryError(error, self.story, path=self.path)
 
-    def parse(self, ebnf=None):
+    def parse(self, ebnf=None, compact=False, workers=None, cache=None):
         """
-        Parses the story, storing the tree
+        Parses the story, storing the tree. Compact trees can only be
+        compiled, see Transformer. Long stories are parsed in parallel by
+        the given number of worker processes, see Parser.parse_parallel.
+        Trees are loaded from the given TreeCache when possible.
+        """
+        parser = Parser(ebnf=ebnf, compact=compact, workers=workers,
+                        cache=cache)
+        self.build_tree(parser.parse, self.story)
+
+    def build_tree(self, parse, *args):
+        """
+        Builds the tree with the given parsing function, handling errors
         """
-        parser = Parser(ebnf=ebnf)
         e = None
         try:
-            self.tree = parser.parse(self.story)
+            self.tree = parse(*args)
         except StorySyntaxError as error:
             e = self.error(error)
         except UnexpectedToken as error:
@@ -95,13 +118,38 @@ class Story:
             e = self.error(error)
         if e is not None:
             raise e
+        self.parsed_story = self.story
+
+    def edit(self, start, end, text, ebnf=None, compact=False, cache=None):
+        """
+        Replaces the source of the story from start to end with text, and
+        parses the story again, reusing the parts of the last tree that the
+        edit doesn't affect, see Parser.reparse. Compiling changes the tree,
+        so a compiled story is parsed again entirely. When the last parse
+        failed, the changes since the last parsed story are found by
+        comparing them. Stories parsed entirely can be loaded from cache.
+        """
+        previous = self.story
+        self.story = previous[:start] + text + previous[end:]
+        if self.parsed_story is None:
+            return self.parse(ebnf=ebnf, compact=compact, cache=cache)
+        changes = (start, end, text)
+        if self.parsed_story != previous:
+            changes = self.changes(self.parsed_story, self.story)
+        parser = Parser(ebnf=ebnf, compact=compact)
+        self.build_tree(parser.reparse, self.tree, self.parsed_story,
+                        *changes)
 
     def modules(self):
         """
-        Gets the modules of a story from its tree.
+        Gets the modules of a story from its tree, or from the imports
+        recorded while parsing it.
         """
         modules = []
-        for module in self.tree.find_data('imports'):
+        imports = self.tree.find_data('imports')
+        if self.tree.side_tables is not None:
+            imports = self.tree.side_tables.imports
+        for module in imports:
             path = module.string.child(0).value[1:-1]
             if path.endswith('.story') is False:
                 path = '{}.story'.format(path)
@@ -113,6 +161,7 @@ class Story:
         Compiles the story and stores the result.
         """
         e = None
+        self.parsed_story = None
         try:
             self.compiled = Compiler.compile(self.tree)
         except (CompilerError, StorySyntaxError) as error:
@@ -126,10 +175,53 @@ class Story:
         """
         return Parser(ebnf=ebnf).lex(self.story)
 
+    @classmethod
+    def lex_file(cls, path, ebnf=None):
+        """
+        Lexes a story file lazily, without reading it in memory, see
+        Parser.lex_file. The file is opened right away, so that missing
+        files are found here, and closed once its tokens have been produced.
+        Token positions are byte offsets.
+        """
+        file = None
+        try:
+            file = io.open(path, 'rb')
+        except FileNotFoundError:
+            msg = cls.not_found(path)
+
+        if file is None:
+            raise StoryError.unnamed_error(msg)
+        return cls.lex_stream(file, ebnf=ebnf)
+
+    @staticmethod
+    def lex_stream(file, ebnf=None):
+        """
+        Produces the tokens of an open story file, closing it afterwards
+        """
+        with file:
+            yield from Parser(ebnf=ebnf).lex(file)
+
+    @classmethod
+    def token_stream(cls, path, ebnf=None):
+        """
+        Lexes a story file into a TokenStream, keeping the bytes of the file
+        as its source.
+        """
+        msg = None
+        try:
+            with io.open(path, 'rb') as file:
+                source = file.read()
+        except FileNotFoundError:
+            msg = cls.not_found(path)
+
+        if msg is not None:
+            raise StoryError.unnamed_error(msg)
+        return Parser(ebnf=ebnf).token_stream(source)
+
     def process(self, ebnf=None):
         """
         Parse and compile a story, returning the compiled JSON
         """
-        self.parse(ebnf=ebnf)
+        self.parse(ebnf=ebnf, compact=True)
         self.compile()
         return self.compiled
@@ -12,7 +12,12 @@ class Compiler:
 
     """
     Compiles Storyscript abstract syntax tree to JSON.
+
+    The side tables of the tree being compiled, when it has them, tell
+    whether there's anything to look for in its subtrees.
     """
+    side_tables = None
+
     def __init__(self):
         self.lines = Lines()
 
@@ -37,12 +42,14 @@ class Compiler:
             return [Objects.expression(fragment.expression)]
         return [Objects.entity(fragment.child(1))]
 
-    @staticmethod
-    def chained_mutations(tree):
+    def chained_mutations(self, tree):
         """
         Finds and compile chained mutations
         """
         mutations = []
+        tables = self.side_tables
+        if tables is not None and tables.chained_mutations == []:
+            return mutations
         for mutation in tree.find_data('chained_mutation'):
             mutations.append(Objects.mutation(mutation.mutation_fragment))
         return mutations
@@ -69,10 +76,7 @@ class Compiler:
         """
         Simplifies an expression with only one leaf to its respective value
         """
-        entity = tree.or_expression.and_expression.cmp_expression. \
-            arith_expression.mul_expression.unary_expression.pow_expression. \
-            primary_expression.entity
-        args = [Objects.entity(entity)]
+        args = [Objects.entity(tree.unary_entity())]
         kwargs = {}
         # name is required for 'set' only
         if name is not None:
@@ -100,7 +104,7 @@ class Compiler:
         service = fragment.service
         if service:
             path = Objects.names(service.path)
-            if [path] not in self.lines.variables:
+            if self.lines.is_variable([path]) is False:
                 self.service(service, None, parent)
                 self.lines.set_name(name)
                 return
@@ -137,7 +141,7 @@ class Compiler:
         Compiles a service tree.
         """
         service_name = Objects.names(tree.path)
-        if service_name in self.lines.variables:
+        if self.lines.is_variable(service_name):
             self.mutation_block(tree, parent)
             return
         line = tree.line()
@@ -401,6 +405,7 @@ class Compiler:
     def compile(cls, tree, debug=False):
         tree = Preprocessor.process(tree)
         compiler = cls.compiler()
+        compiler.side_tables = tree.side_tables
         compiler.parse_tree(tree)
         lines = compiler.lines
         return {'tree': lines.lines, 'services': lines.get_services(),
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_left
+
+
+class LineIndex:
+    """
+    Keeps the numbers of compiled lines sorted as they are added, along with
+    their parsed keys, so that the first and last lines are always at hand.
+
+    Inserted fake lines ('.' suffix) must appear before their inserted line,
+    but after their original's line previous line, giving this order:
+    0, 1.0.9, 1.0, 1.1, 1, 2. Line numbers are parsed to their parts,
+    followed by a part greater than any other, so that a line comes after
+    the lines inserted before it.
+
+    Lines are mostly added in order, at the end of the index. Fake lines are
+    found by bisection.
+    """
+    end = float('inf')
+
+    def __init__(self, lines=()):
+        self.keys = []
+        self.numbers = []
+        for line in sorted(lines, key=self.key):
+            self.add(line)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __iter__(self):
+        return iter(self.numbers)
+
+    def __reversed__(self):
+        return reversed(self.numbers)
+
+    @classmethod
+    def key(cls, line):
+        """
+        Parses a line number into its sorting key
+        """
+        return tuple(map(int, line.split('.'))) + (cls.end,)
+
+    def add(self, line):
+        """
+        Adds a line number, unless it's already there
+        """
+        key = self.key(line)
+        keys = self.keys
+        if keys == [] or keys[-1] < key:
+            keys.append(key)
+            self.numbers.append(line)
+            return
+        index = bisect_left(keys, key)
+        if keys[index] != key:
+            keys.insert(index, key)
+            self.numbers.insert(index, line)
+
+    def first(self):
+        if self.numbers:
+            return self.numbers[0]
+
+    def last(self):
+        if self.numbers:
+            return self.numbers[-1]
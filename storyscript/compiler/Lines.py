@@ -1,43 +1,51 @@
 # -*- coding: utf-8 -*-
+from .LineIndex import LineIndex
 from ..exceptions import StorySyntaxError
 
 
 class Lines:
     """
     Holds compiled lines and provides methods for operation on lines.
+    Line numbers are kept sorted in an index as lines are made, see
+    LineIndex, and the names of variables are kept in a set, so that
+    compiling takes linear time in the number of lines.
     """
     def __init__(self):
         self.lines = {}
         self.variables = []
+        self.variable_names = set()
         self.services = []
         self.functions = {}
         self.output_scopes = {}
         self.modules = {}
 
+    @property
+    def lines(self):
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines):
+        self._lines = lines
+        self.index = LineIndex(lines)
+
     def sort(self):
         """
         Returns ordered line numbers
-        Inserted fake lines ('.' suffix) must appear before their inserted
-        line, but after their original's line previous line.
         """
         # Generates this sorting: 0, 1.0.9, 1.0, 1.1, 1, 2
-        return sorted(self.lines.keys(), reverse=True,
-                      key=lambda x: list(map(
-                          lambda i: -int(i), x.split('.'))))
+        return list(self.index)
 
     def first(self):
         """
         Gets the first line.
         """
-        if self.lines:
-            return self.sort()[0]
+        return self.index.first()
 
     def last(self):
         """
         Gets the last line
         """
-        if self.lines:
-            return self.sort()[-1]
+        return self.index.last()
 
     def set_name(self, name):
         """
@@ -61,11 +69,22 @@ class Lines:
         in if/elif/else and try/catch/finally blocks.
         """
         methods = ['if', 'elif', 'try', 'catch']
-        for line_number in self.sort()[::-1]:
+        for line_number in reversed(self.index):
             if self.lines[line_number]['method'] in methods:
                 self.lines[line_number]['exit'] = line
                 break
 
+    def add_variable(self, name):
+        """
+        Registers the names of a variable, which are lists and are kept in
+        the set by their representation.
+        """
+        self.variables.append(name)
+        self.variable_names.add(repr(name))
+
+    def is_variable(self, name):
+        return repr(name) in self.variable_names
+
     def set_scope(self, line, parent, output=[]):
         """
         Keeps track of output scopes so that defined outputs are recognized for
@@ -90,24 +109,23 @@ class Lines:
              command=None, function=None, output=None, enter=None, exit=None,
              parent=None):
         """
-        Creates the base dictionary for a given line.
-        """
-        dictionary = {
-            line: {
-                'method': method,
-                'ln': line,
-                'output': output,
-                'name': name,
-                'service': service,
-                'command': command,
-                'function': function,
-                'args': args,
-                'enter': enter,
-                'exit': exit,
-                'parent': parent
-            }
+        Creates the base dictionary for a given line. Lines are stored in
+        place, so a line made again keeps its position.
+        """
+        self._lines[line] = {
+            'method': method,
+            'ln': line,
+            'output': output,
+            'name': name,
+            'service': service,
+            'command': command,
+            'function': function,
+            'args': args,
+            'enter': enter,
+            'exit': exit,
+            'parent': parent
         }
-        self.lines = {**self.lines, **dictionary}
+        self.index.add(line)
 
     def service_method(self, service, line):
         """
@@ -128,7 +146,7 @@ class Lines:
         if method == 'function':
             self.functions[kwargs['function']] = line
         elif method == 'set':
-            self.variables.append(kwargs['name'])
+            self.add_variable(kwargs['name'])
         elif method == 'execute':
             if self.is_output(kwargs['parent'], kwargs['service']) is False:
                 self.services.append(kwargs['service'])
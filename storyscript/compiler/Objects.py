@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
+import json
 import re
 
 from lark.lexer import Token
 
 from ..exceptions import internal_assert
-from ..parser import Tree
+from ..parser import LiteralScanner, Tree
 
 
 class Objects:
+    separators = ('space', 'newline', 'comma', 'colon')
+    collections = {'[': 'list', '{': 'dict'}
+    words = {'true': True, 'false': False, 'null': None}
 
     @classmethod
     def names(cls, tree):
@@ -77,7 +81,7 @@ class Objects:
         if len(names) > 1:
             for name in names[1:]:
                 fragment = Tree('path_fragment', [Token('NAME', name)])
-                tree.children.append(fragment)
+                tree.append(fragment)
         return tree
 
     @classmethod
@@ -137,6 +141,104 @@ class Objects:
             items.append([key, value])
         return {'$OBJECT': 'dict', 'items': items}
 
+    @classmethod
+    def constant_value(cls, kind, value):
+        """
+        Compiles a value of a constant literal. Strings are unescaped only
+        when they have escapes, as unescaping changes nothing otherwise.
+        """
+        if kind == 'string':
+            if '\\' in value:
+                return cls.string(Tree('string', [Token('STRING', value)]))
+            return {'$OBJECT': 'string', 'string': value[1:-1]}
+        if kind == 'number':
+            if '.' in value:
+                return float(value)
+            return int(value)
+        return cls.words[value]
+
+    @classmethod
+    def constant(cls, token):
+        """
+        Compiles a CONSTANT token, a constant literal scanned at once by
+        LiteralScanner, into the objects of its lists and dictionaries.
+        Literals without escapes are usually valid JSON too, and are decoded
+        as such, with dictionaries decoded as tuples of pairs to keep
+        repeated keys.
+        """
+        if '\\' not in token.value:
+            try:
+                value = json.loads(token.value, strict=False,
+                                   object_pairs_hook=tuple)
+            except ValueError:
+                return cls.constant_tokens(token)
+            return cls.json_constant(value)
+        return cls.constant_tokens(token)
+
+    @classmethod
+    def json_constant(cls, value):
+        """
+        Converts a decoded constant literal to objects, replacing the items
+        of each list in place. The values of dictionaries are converted as a
+        list too, and paired with their keys at the end.
+        """
+        root = [value]
+        stack = [root]
+        dictionaries = []
+        while stack:
+            items = stack.pop()
+            for index, item in enumerate(items):
+                kind = type(item)
+                if kind is str:
+                    items[index] = {'$OBJECT': 'string', 'string': item}
+                elif kind is list:
+                    items[index] = {'$OBJECT': 'list', 'items': item}
+                    stack.append(item)
+                elif kind is tuple:
+                    items[index] = {'$OBJECT': 'dict'}
+                    values = [value for key, value in item]
+                    dictionaries.append((items[index], item, values))
+                    stack.append(values)
+        for dictionary, pairs, values in dictionaries:
+            dictionary['items'] = [
+                [{'$OBJECT': 'string', 'string': pair[0]}, value]
+                for pair, value in zip(pairs, values)]
+        return root[0]
+
+    @classmethod
+    def constant_tokens(cls, token):
+        """
+        Compiles a CONSTANT token value by value. Open lists and
+        dictionaries are kept with the key of the value expected by
+        dictionaries.
+        """
+        result = None
+        frames = []
+        for match in LiteralScanner.tokens.finditer(token.value):
+            kind = match.lastgroup
+            if kind in cls.separators:
+                continue
+            if kind == 'close':
+                result = frames.pop()[0]
+                continue
+            if kind == 'open':
+                collection = cls.collections[match.group('open')]
+                value = {'$OBJECT': collection, 'items': []}
+            else:
+                value = cls.constant_value(kind, match.group())
+            if frames:
+                frame = frames[-1]
+                if frame[0]['$OBJECT'] == 'list':
+                    frame[0]['items'].append(value)
+                elif frame[1] is None:
+                    frame[1] = value
+                else:
+                    frame[0]['items'].append([frame[1], value])
+                    frame[1] = None
+            if kind == 'open':
+                frames.append([value, None])
+        return result
+
     @classmethod
     def regular_expression(cls, tree):
         """
@@ -181,6 +283,8 @@ class Objects:
                 return None
         if subtree.type == 'NAME':
             return cls.path(tree)
+        if subtree.type == 'CONSTANT':
+            return cls.constant(subtree)
         internal_assert(0)
 
     @classmethod
@@ -233,8 +337,51 @@ class Objects:
         """
         Compiles an expression object with the given tree.
         """
-        assert tree.child(0).data == 'or_expression'
-        return cls.or_expression(tree.child(0))
+        return cls.operand(tree.child(0))
+
+    @classmethod
+    def operand(cls, tree):
+        """
+        Compiles the operand of an expression. In compact trees pass-through
+        levels are inlined, so an operand can be any expression level.
+
+        Levels are compiled in postorder from a stack of the levels being
+        compiled, with the objects of the operands found so far, instead of
+        recursing, so that long chains of operators and deeply nested
+        parentheses don't reach the recursion limit. Each level gets the
+        objects of its operands, see operands.
+        """
+        internal_assert(tree.data in Tree.expression_levels)
+        stack = [(tree, cls.operands(tree), [])]
+        while True:
+            tree, operands, values = stack[-1]
+            if len(values) < len(operands):
+                child = operands[len(values)]
+                internal_assert(child.data in Tree.expression_levels)
+                stack.append((child, cls.operands(child), []))
+                continue
+            stack.pop()
+            value = getattr(cls, tree.data)(tree, *values)
+            if stack == []:
+                return value
+            stack[-1][2].append(value)
+
+    @staticmethod
+    def operands(tree):
+        """
+        Finds the operands of an expression level: the child of a
+        pass-through level, or the ones of its operator. Primary expressions
+        with an entity have none.
+        """
+        if tree.data == 'primary_expression':
+            if tree.child(0).data == 'entity':
+                return ()
+            return (tree.child(0),)
+        if len(tree.children) == 1:
+            return (tree.child(0),)
+        if tree.data == 'unary_expression':
+            return (tree.child(1),)
+        return (tree.child(0), tree.child(2))
 
     @classmethod
     def absolute_expression(cls, tree):
@@ -263,125 +410,112 @@ class Objects:
         }
 
     @classmethod
-    def primary_expression(cls, tree):
+    def primary_expression(cls, tree, value=None):
         """
-        Compiles a primary expression object with the given tree.
+        Compiles a primary expression object with the given tree, or the
+        object of the expression in its parentheses.
         """
         if tree.child(0).data == 'entity':
             return cls.entity(tree.entity)
         else:
-            assert tree.child(0).data == 'or_expression'
-            return cls.or_expression(tree.child(0))
+            return value
 
     @classmethod
-    def pow_expression(cls, tree):
+    def pow_expression(cls, tree, left, right=None):
         """
-        Compiles a pow expression object with the given tree.
+        Compiles a pow expression object with the given tree, from the objects
+        of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'primary_expression'
-            return cls.primary_expression(tree.child(0))
+            return left
 
         assert tree.child(1).type == 'POWER'
-        return cls.build_binary_expression(
-                    tree, tree.child(1),
-                    cls.primary_expression(tree.child(0)),
-                    cls.unary_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, tree.child(1), left, right)
 
     @classmethod
-    def unary_expression(cls, tree):
+    def unary_expression(cls, tree, value):
         """
-        Compiles an unary expression object with the given tree.
+        Compiles an unary expression object with the given tree, from the
+        object of its operand.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'pow_expression'
-            return cls.pow_expression(tree.child(0))
+            return value
 
         assert tree.child(0).data == 'unary_operator'
         op = tree.unary_operator.child(0)
-        return cls.build_unary_expression(
-                    tree, op,
-                    cls.unary_expression(tree.child(1)))
+        return cls.build_unary_expression(tree, op, value)
 
     @classmethod
-    def mul_expression(cls, tree):
+    def mul_expression(cls, tree, left, right=None):
         """
-        Compiles a mul_expression object with the given tree.
+        Compiles a mul_expression object with the given tree, from the objects
+        of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'unary_expression'
-            return cls.unary_expression(tree.child(0))
+            return left
 
         assert tree.child(1).data == 'mul_operator'
         op = tree.child(1).child(0)
-        return cls.build_binary_expression(
-                    tree, op,
-                    cls.mul_expression(tree.child(0)),
-                    cls.unary_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, op, left, right)
 
     @classmethod
-    def arith_expression(cls, tree):
+    def arith_expression(cls, tree, left, right=None):
         """
-        Compiles a binary expression object with the given tree.
+        Compiles a binary expression object with the given tree, from the
+        objects of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'mul_expression'
-            return cls.mul_expression(tree.child(0))
+            return left
 
         assert tree.child(1).data == 'arith_operator'
         op = tree.child(1).child(0)
-        return cls.build_binary_expression(
-                    tree, op,
-                    cls.arith_expression(tree.child(0)),
-                    cls.mul_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, op, left, right)
 
     @classmethod
-    def cmp_expression(cls, tree):
+    def cmp_expression(cls, tree, left, right=None):
         """
-        Compiles a comparison expression object with the given tree.
+        Compiles a comparison expression object with the given tree, from the
+        objects of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'arith_expression'
-            return cls.arith_expression(tree.child(0))
+            return left
 
         assert tree.child(1).data == 'cmp_operator'
         op = tree.child(1).child(0)
-        return cls.build_binary_expression(
-                    tree, op,
-                    cls.cmp_expression(tree.child(0)),
-                    cls.arith_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, op, left, right)
 
     @classmethod
-    def and_expression(cls, tree):
+    def and_expression(cls, tree, left, right=None):
         """
-        Compiles an AND expression object with the given tree.
+        Compiles an AND expression object with the given tree, from the objects
+        of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'cmp_expression'
-            return cls.cmp_expression(tree.child(0))
+            return left
 
         assert tree.child(1).type == 'AND'
         op = tree.child(1)
-        return cls.build_binary_expression(
-                    tree, op,
-                    cls.and_expression(tree.child(0)),
-                    cls.cmp_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, op, left, right)
 
     @classmethod
-    def or_expression(cls, tree):
+    def or_expression(cls, tree, left, right=None):
         """
-        Compiles an OR expression object with the given tree.
+        Compiles an OR expression object with the given tree, from the objects
+        of its operands.
         """
         if len(tree.children) == 1:
             assert tree.child(0).data == 'and_expression'
-            return cls.and_expression(tree.child(0))
+            return left
 
         assert tree.child(1).type == 'OR'
         op = tree.child(1)
-        return cls.build_binary_expression(
-                    tree, op,
-                    cls.or_expression(tree.child(0)),
-                    cls.and_expression(tree.child(2)))
+        return cls.build_binary_expression(tree, op, left, right)
 
     @classmethod
     def assertion(cls, tree):
@@ -30,31 +30,50 @@ class Preprocessor:
 
     @classmethod
     def visit(cls, node, block, entity, pred, fun):
-        if not hasattr(node, 'children') or len(node.children) == 0:
-            return
+        """
+        Visits a tree in postorder, keeping the block and the entity that
+        contain each node. Nodes are kept on a stack with the iterator over
+        their children instead of recursing, so that deep trees don't reach
+        the recursion limit.
+        """
+        stack = [(node, block, entity, None)]
+        while stack:
+            node, block, entity, children = stack[-1]
+            if children is None:
+                if not hasattr(node, 'children') or len(node.children) == 0:
+                    stack.pop()
+                    continue
 
-        if node.data == 'block':
-            # the block in which the fake assignments should be inserted
-            block = node
-            # only generate a fake_block once for every line
-            block = cls.fake_tree(block)
-        elif node.data == 'entity':
-            # set the parent where the inline_expression path should be
-            # inserted
-            entity = node
+                if node.data == 'block':
+                    # the block in which the fake assignments should be
+                    # inserted
+                    block = node
+                    # only generate a fake_block once for every line
+                    block = cls.fake_tree(block)
+                elif node.data == 'entity':
+                    # set the parent where the inline_expression path should
+                    # be inserted
+                    entity = node
 
-        for c in node.children:
-            cls.visit(c, block, entity, pred, fun)
+                children = iter(node.children)
+                stack[-1] = (node, block, entity, children)
 
-        if pred(node):
-            assert entity is not None
-            assert block is not None
-            fake_tree = block
-            if not isinstance(fake_tree, FakeTree):
-                fake_tree = cls.fake_tree(block)
+            for c in children:
+                # leaves have nothing to visit
+                if hasattr(c, 'children') and len(c.children) > 0:
+                    stack.append((c, block, entity, None))
+                    break
+            else:
+                stack.pop()
+                if pred(node):
+                    assert entity is not None
+                    assert block is not None
+                    fake_tree = block
+                    if not isinstance(fake_tree, FakeTree):
+                        fake_tree = cls.fake_tree(block)
 
-            # Evaluate from leaf to the top
-            fun(node, fake_tree, entity)
+                    # Evaluate from leaf to the top
+                    fun(node, fake_tree, entity)
 
     @staticmethod
     def is_inline_expression(n):
@@ -62,6 +81,13 @@ class Preprocessor:
 
     @classmethod
     def process(cls, tree):
+        """
+        Replaces the inline expressions of a tree. Trees without inline
+        expressions in their side tables aren't visited.
+        """
+        tables = tree.side_tables
+        if tables is not None and tables.inline_expressions == []:
+            return tree
         pred = Preprocessor.is_inline_expression
         cls.visit(tree, None, None, pred, cls.replace_expression)
         return tree
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from .Compiler import Compiler
 from .Faketree import FakeTree
+from .LineIndex import LineIndex
 from .Lines import Lines
 from .Objects import Objects
 from .Preprocessor import Preprocessor
 
-__all__ = ['Compiler', 'FakeTree', 'Lines', 'Objects', 'Preprocessor']
+__all__ = ['Compiler', 'FakeTree', 'LineIndex', 'Lines', 'Objects',
+           'Preprocessor']
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+import json
+import struct
+import sys
+
+from lark.lexer import Token
+
+from .ArenaTree import ArenaTree
+from .ColumnStore import ColumnStore
+from .Tree import Tree
+
+
+class Arena(ColumnStore):
+    """
+    Stores all the nodes of a tree as columns, see ColumnStore. Nodes are
+    numbered in preorder, so the root is the node 0 and children always come
+    after their parents.
+
+    Trees store the id of their rule name, tokens the complement of the id of
+    their type. Each node has its parent, first child and next sibling, and
+    the offsets in the source where it starts and ends. Tokens also have
+    their lines and columns.
+
+    ArenaTree views provide the Tree API on top of the arrays, and the arrays
+    can be dumped to a buffer and loaded back as they are.
+    """
+    version = 1
+    fields = ('rules', 'parents', 'first_children', 'next_siblings',
+              'starts', 'ends', 'lines', 'columns', 'end_lines',
+              'end_columns')
+
+    @classmethod
+    def from_tree(cls, tree, source=''):
+        """
+        Builds an arena from a tree, parsed from the given source. The last
+        child added to each node is kept, to link the next one to it.
+        """
+        arena = cls(source)
+        name_id = arena.name_id
+        rules = arena.rules.append
+        parents = arena.parents.append
+        first_children = arena.first_children
+        next_siblings = arena.next_siblings
+        positions = [getattr(arena, field).append
+                     for field in cls.fields[4:]]
+        starts, ends, lines, columns, end_lines, end_columns = positions
+        last = []
+        stack = [(tree, -1)]
+        while stack:
+            item, parent = stack.pop()
+            index = len(last)
+            if isinstance(item, Tree):
+                rules(name_id(item.data))
+                for append in positions:
+                    append(-1)
+                for child in reversed(item.children):
+                    stack.append((child, index))
+            else:
+                rules(~name_id(item.type))
+                start, end = arena.offsets(index, item)
+                starts(start)
+                ends(end)
+                lines(-1 if item.line is None else item.line)
+                columns(-1 if item.column is None else item.column)
+                end_lines(-1 if item.end_line is None else item.end_line)
+                end_columns(-1 if item.end_column is None
+                            else item.end_column)
+            parents(parent)
+            first_children.append(-1)
+            next_siblings.append(-1)
+            last.append(-1)
+            if parent != -1:
+                if last[parent] == -1:
+                    first_children[parent] = index
+                else:
+                    next_siblings[last[parent]] = index
+                last[parent] = index
+        for index in reversed(range(len(arena))):
+            first = first_children[index]
+            if first != -1:
+                arena.starts[index] = arena.starts[first]
+                arena.ends[index] = arena.ends[last[index]]
+        return arena
+
+    def is_token(self, index):
+        return self.rules[index] < 0
+
+    def name(self, index):
+        """
+        Gets the rule name of a tree or the type of a token
+        """
+        rule = self.rules[index]
+        if rule < 0:
+            return self.names[~rule]
+        return self.names[rule]
+
+    def token(self, index):
+        """
+        Builds the token at index
+        """
+        optional = self.optional
+        token = Token(self.name(index), self.value(index),
+                      optional(self.starts[index]),
+                      optional(self.lines[index]),
+                      optional(self.columns[index]))
+        token.end_line = optional(self.end_lines[index])
+        token.end_column = optional(self.end_columns[index])
+        return token
+
+    def item(self, index):
+        """
+        Gets a view of the tree at index, or the token at index
+        """
+        if self.rules[index] < 0:
+            return self.token(index)
+        return ArenaTree(self, index)
+
+    def child_ids(self, index):
+        child = self.first_children[index]
+        while child != -1:
+            yield child
+            child = self.next_siblings[child]
+
+    def children(self, index):
+        return tuple(self.item(child) for child in self.child_ids(index))
+
+    def first_leaf(self, index):
+        """
+        Finds the first token of the tree at index
+        """
+        while index != -1 and self.rules[index] >= 0:
+            index = self.first_children[index]
+        return index
+
+    def last_leaf(self, index):
+        """
+        Finds the last token of the tree at index
+        """
+        while index != -1 and self.rules[index] >= 0:
+            child = self.first_children[index]
+            index = child
+            while child != -1:
+                index = child
+                child = self.next_siblings[child]
+        return index
+
+    def tree(self, offset=0, lines=0):
+        """
+        Builds the tree out of Tree and Token objects, with tokens moved by
+        offset characters and the given number of lines. Nodes are built in
+        reverse, so that the children of a tree are the last ones built.
+        The arrays are read as lists, which are faster to index.
+        """
+        counts = [0] * len(self)
+        for parent in self.parents.tolist()[1:]:
+            counts[parent] += 1
+        rules = self.rules.tolist()
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        token_lines = self.lines.tolist()
+        columns = self.columns.tolist()
+        end_lines = self.end_lines.tolist()
+        end_columns = self.end_columns.tolist()
+        names = self.names
+        values = self.values
+        source = self.source
+        stack = []
+        for index in range(len(rules) - 1, -1, -1):
+            rule = rules[index]
+            if rule >= 0:
+                count = counts[index]
+                if count == 1:
+                    stack[-1] = Tree(names[rule], (stack[-1],))
+                    continue
+                children = ()
+                if count:
+                    children = stack[-count:]
+                    del stack[-count:]
+                    children.reverse()
+                    children = tuple(children)
+                stack.append(Tree(names[rule], children))
+                continue
+            start = starts[index]
+            if index in values:
+                value = values[index]
+            else:
+                value = source[start:ends[index]]
+            line = token_lines[index]
+            column = columns[index]
+            token = Token(names[~rule], value,
+                          None if start == -1 else start + offset,
+                          None if line == -1 else line + lines,
+                          None if column == -1 else column)
+            end_line = end_lines[index]
+            end_column = end_columns[index]
+            token.end_line = None if end_line == -1 else end_line + lines
+            token.end_column = None if end_column == -1 else end_column
+            stack.append(token)
+        return stack[0]
+
+    def root(self):
+        return ArenaTree(self, 0)
+
+    def dump(self):
+        """
+        Dumps the arena to a buffer: a JSON header with the names, source and
+        token values, followed by the arrays.
+        """
+        header = json.dumps({
+            'version': self.version, 'byteorder': sys.byteorder,
+            'nodes': len(self), 'names': self.names, 'source': self.source,
+            'values': self.values}).encode('utf-8')
+        arrays = [getattr(self, field).tobytes() for field in self.fields]
+        return b''.join([struct.pack('<I', len(header)), header] + arrays)
+
+    @classmethod
+    def load(cls, buffer):
+        """
+        Loads an arena from a buffer made with dump
+        """
+        size = struct.unpack_from('<I', buffer)[0]
+        header = json.loads(bytes(buffer[4:4 + size]).decode('utf-8'))
+        arena = cls(header['source'])
+        for name in header['names']:
+            arena.name_id(name)
+        arena.values = {int(index): value
+                        for index, value in header['values'].items()}
+        offset = 4 + size
+        for field in cls.fields:
+            values = getattr(arena, field)
+            end = offset + header['nodes'] * values.itemsize
+            values.frombytes(buffer[offset:end])
+            if header['byteorder'] != sys.byteorder:
+                values.byteswap()
+            offset = end
+        return arena
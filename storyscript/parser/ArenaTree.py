@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from .Tree import Tree
+
+
+class ArenaTree(Tree):
+    """
+    A view of a tree stored in an Arena, providing the Tree API. The views of
+    the children are made the first time they are needed, and positions are
+    read from the arena until then. The tokens read from the arena are
+    forgotten when the children are made, so that positions come from the
+    tokens of the children afterwards.
+
+    Changing a view doesn't change the arena.
+    """
+    __slots__ = ('arena', 'index')
+
+    def __init__(self, arena, index):
+        super().__init__(arena.name(index), None)
+        self.arena = arena
+        self.index = index
+
+    @property
+    def children(self):
+        if self._children is None:
+            children = self.arena.children(self.index)
+            self._children = children
+            self.mutated()
+            if children:
+                for child in (children[0], children[-1]):
+                    if isinstance(child, Tree):
+                        child.depends(self)
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        self._children = children
+        self.mutated()
+
+    def find_tokens(self):
+        """
+        Finds the first and last tokens of the tree from the arena, unless
+        its children have been loaded.
+        """
+        if self._children is not None:
+            return super().find_tokens()
+        first = self.arena.first_leaf(self.index)
+        last = self.arena.last_leaf(self.index)
+        first = self.arena.token(first) if first != -1 else None
+        last = self.arena.token(last) if last != -1 else None
+        self._tokens = (first, last)
+        return self._tokens
+
+    def start_pos(self):
+        if self._children is not None:
+            return super().start_pos()
+        return self.arena.optional(self.arena.starts[self.index])
+
+    def end_pos(self):
+        if self._children is not None:
+            return super().end_pos()
+        return self.arena.optional(self.arena.ends[self.index])
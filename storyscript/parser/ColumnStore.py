@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+
+class ColumnStore:
+    """
+    Stores items in parallel arrays, one per field, instead of an object per
+    item, see Arena and TokenStream. Names are stored by id, and the values
+    of tokens are read from the source, unless they don't match it. Missing
+    values are stored as -1.
+
+    Sources can be strings, or bytes in UTF-8 with byte offsets.
+    """
+    fields = ()
+
+    def __init__(self, source=''):
+        self.source = source
+        self.binary = isinstance(source, str) is False
+        self.names = []
+        self.name_ids = {}
+        self.values = {}
+        for field in self.fields:
+            setattr(self, field, array('i'))
+
+    def __len__(self):
+        return len(getattr(self, self.fields[0]))
+
+    @staticmethod
+    def optional(value):
+        if value == -1:
+            return None
+        return value
+
+    def name_id(self, name):
+        if name not in self.name_ids:
+            self.name_ids[name] = len(self.names)
+            self.names.append(name)
+        return self.name_ids[name]
+
+    def offsets(self, index, token):
+        """
+        Finds the offsets where the token at index starts and ends in the
+        source, keeping its value when the source doesn't have it
+        """
+        start = token.pos_in_stream
+        if start is None:
+            self.values[index] = str(token)
+            return -1, -1
+        value = str(token)
+        if self.binary:
+            value = value.encode('utf-8')
+        end = start + len(value)
+        if self.source[start:end] != value:
+            self.values[index] = str(token)
+        return start, end
+
+    def value(self, index):
+        """
+        Gets the value of the token at index from the source
+        """
+        if index in self.values:
+            return self.values[index]
+        value = self.source[self.starts[index]:self.ends[index]]
+        if self.binary:
+            return bytes(value).decode('utf-8')
+        return value
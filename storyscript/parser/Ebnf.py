@@ -11,6 +11,8 @@ class Ebnf:
 
     Tokens can also be imported from an available grammar, or ignored
     completely, meaning they will not appear in the parsed tree.
+
+    Resolved rule shards are memoized, until a new token is registered.
     """
 
     def __init__(self):
@@ -18,6 +20,7 @@ class Ebnf:
         self._rules = {}
         self._imports = {}
         self._ignores = []
+        self._resolved = {}
 
     def macro(self, name, template):
         """
@@ -47,28 +50,29 @@ class Ebnf:
                 token_value = value
         dictionary = {'name': name, 'value': token_value, 'token': token}
         self._tokens[token_name] = dictionary
+        self._resolved = {}
 
     def resolve(self, name):
         """
         Resolves a name to its real value if it's a token, or leave it as it
         is.
         """
-        name = name.replace(',', '|')
-        clean_name = name.strip('*[]()?|+')
+        if name in self._resolved:
+            return self._resolved[name]
+        shard = name.replace(',', '|')
+        clean_name = shard.strip('*[]()?|+')
         if clean_name in self._tokens:
             real_name = self._tokens[clean_name]['token']
-        else:
-            real_name = clean_name
-        return name.replace(clean_name, real_name)
+            shard = shard.replace(clean_name, real_name)
+        self._resolved[name] = shard
+        return shard
 
     def set_rule(self, name, value):
         """
         Registers a rule, transforming tokens to their identifiers.
         """
-        rule = ''
-        for shard in value.split():
-            rule = '{} {}'.format(rule, self.resolve(shard))
-        self._rules[name] = rule.strip()
+        shards = [self.resolve(shard) for shard in value.split()]
+        self._rules[name] = ' '.join(shards).strip()
 
     def ignore(self, terminal):
         self._ignores.append('%ignore {}'.format(terminal))
@@ -80,19 +84,19 @@ class Ebnf:
         """
         Build the tokens that have been defined into a string
         """
-        string = ''
-        for name, value in self._tokens.items():
-            string = '{}{}: {}\n'.format(string, value['name'], value['value'])
-        return string
+        lines = []
+        for value in self._tokens.values():
+            lines.append('{}: {}\n'.format(value['name'], value['value']))
+        return ''.join(lines)
 
     def build_rules(self):
         """
         Build the rules that have been defined into a string
         """
-        string = ''
+        lines = []
         for name, value in self._rules.items():
-            string = '{}{}: {}\n'.format(string, name, value)
-        return string
+            lines.append('{}: {}\n'.format(name, value))
+        return ''.join(lines)
 
     def build(self):
         """
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from lark.parser_frontends import LALR_ContextualLexer
+
+
+class Frontend(LALR_ContextualLexer):
+    """
+    Lark's LALR frontend with a contextual lexer, which can be shared
+    between threads. The contextual lexer follows the state of the parser,
+    so each parse lexes with its own copy of the lexer, sharing the tables
+    of the original. The postlexer keeps its own state for each stream, see
+    CustomIndenter.
+    """
+
+    def lex(self, text, lexer=None):
+        """
+        Lexes and postlexes the text, with a copy of the lexer unless one is
+        given
+        """
+        if lexer is None:
+            lexer = copy.copy(self.lexer)
+        stream = lexer.lex(text)
+        if self.lexer_conf.postlex:
+            return self.lexer_conf.postlex.process(stream)
+        return stream
+
+    def parse(self, text):
+        """
+        Parses the text, with a copy of the lexer following the state of
+        the parser
+        """
+        lexer = copy.copy(self.lexer)
+        return self.parser.parse(self.lex(text, lexer), lexer.set_parser_state)
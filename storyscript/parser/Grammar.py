@@ -7,7 +7,11 @@ class Grammar:
     """
     Defines Storyscript's grammar using the Ebnf module, producing the complete
     EBNF grammar for it.
+
+    The built grammar is cached on the class, so that it's shared by all
+    parsers.
     """
+    built = None
 
     def __init__(self):
         self.ebnf = Ebnf()
@@ -38,9 +42,12 @@ class Grammar:
         self.ebnf.types = rule
 
     def values(self):
-        self.ebnf._NL = r'/(\r?\n[\t ]*)+/'
+        comment = r'###(?:[^#]|#(?!##))*###|#(?!##)[^\n]*'
+        self.ebnf._NL = r'/(\r?\n[\t ]*(({})(?=\r?\n))?)+/'.format(comment)
+        self.ebnf.COMMENT = '/{}/'.format(comment)
         self.ebnf._INDENT = '<INDENT>'
         self.ebnf._DEDENT = '<DEDENT>'
+        self.ebnf.CONSTANT = '<CONSTANT>'
         self.ebnf.TRUE = 'true'
         self.ebnf.FALSE = 'false'
         self.ebnf.NULL = 'null'
@@ -72,7 +79,7 @@ class Grammar:
         self.ebnf.regular_expression = 'regexp name?'
         self.ebnf.inline_expression = 'op service cp'
         values = ('number, string, boolean, void, list, objects, '
-                  'regular_expression')
+                  'regular_expression, constant')
         self.ebnf.values = values
 
     def assignments(self):
@@ -91,8 +98,10 @@ class Grammar:
         self.ebnf._IMPORT = 'import'
         self.ebnf.imports = 'import string as name'
 
-    def expressions(self):
-
+    def operators(self):
+        """
+        Defines the operators of expressions
+        """
         self.ebnf.POWER = '^'
         self.ebnf.NOT = '!'
 
@@ -119,6 +128,11 @@ class Grammar:
         self.ebnf.unary_operator = 'NOT'
         self.ebnf.mul_operator = 'MULTIPLIER, BSLASH, MODULUS'
 
+    def expressions(self):
+        """
+        Defines expressions, with a rule for each level of precedence
+        """
+        self.operators()
         self.ebnf.primary_expression = 'entity , op or_expression cp'
         self.ebnf.pow_expression = ('primary_expression (POWER '
                                     'unary_expression)?')
@@ -242,4 +256,14 @@ class Grammar:
         self.block()
         self.ebnf.start = 'nl? block*'
         self.ebnf.ignore('_WS')
+        self.ebnf.ignore('COMMENT')
         return self.ebnf.build()
+
+    @classmethod
+    def grammar(cls):
+        """
+        Gets the built grammar, building it only the first time.
+        """
+        if cls.built is None:
+            cls.built = cls().build()
+        return cls.built
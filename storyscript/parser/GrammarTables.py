@@ -0,0 +1,7616 @@
+# -*- coding: utf-8 -*-
+# Generated with `python setup.py tables`, do not edit.
+grammar_hash = '5841d270bd6663e14fc727cefd5e3a95a3e77304650d91cb7f983ce226108ad0'
+tables = {'end': 98,
+ 'ignore': ['_WS', 'COMMENT'],
+ 'rules': [('types', [('NUMBER_TYPE', True, False)], None,
+            (False, False, None)),
+           ('types', [('LIST_TYPE', True, False)], None, (False, False, None)),
+           ('types', [('INT_TYPE', True, False)], None, (False, False, None)),
+           ('types', [('FLOAT_TYPE', True, False)], None, (False, False, None)),
+           ('types', [('STRING_TYPE', True, False)], None,
+            (False, False, None)),
+           ('types', [('ANY_TYPE', True, False)], None, (False, False, None)),
+           ('types', [('FUNCTION_TYPE', True, False)], None,
+            (False, False, None)),
+           ('types', [('REGEXP_TYPE', True, False)], None,
+            (False, False, None)),
+           ('types', [('OBJECT_TYPE', True, False)], None,
+            (False, False, None)),
+           ('boolean', [('FALSE', True, False)], None, (False, False, None)),
+           ('boolean', [('TRUE', True, False)], None, (False, False, None)),
+           ('void', [('NULL', True, False)], None, (False, False, None)),
+           ('number', [('INT', True, False)], None, (False, False, None)),
+           ('number', [('FLOAT', True, False)], None, (False, False, None)),
+           ('string', [('DOUBLE_QUOTED', True, False)], None,
+            (False, False, None)),
+           ('string', [('SINGLE_QUOTED', True, False)], None,
+            (False, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('expression', False, False), ('__anon_star_0', False, False),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('expression', False, False),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list', [('_OSB', True, True), ('_CSB', True, True)], None,
+            (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('expression', False, False), ('_NL', True, True),
+             ('_DEDENT', True, True), ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('expression', False, False),
+             ('__anon_star_0', False, False), ('_NL', True, True),
+             ('_DEDENT', True, True), ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('expression', False, False), ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('expression', False, False), ('__anon_star_0', False, False),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('expression', False, False),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('expression', False, False),
+             ('__anon_star_0', False, False), ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('list',
+            [('_OSB', True, True), ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CSB', True, True)],
+            None, (True, False, None)),
+           ('key_value',
+            [('path', False, False), ('_COLON', True, True),
+             ('expression', False, False)],
+            None, (False, False, None)),
+           ('key_value',
+            [('string', False, False), ('_COLON', True, True),
+             ('expression', False, False)],
+            None, (False, False, None)),
+           ('objects', [('_OCB', True, True), ('_CCB', True, True)], None,
+            (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('key_value', False, False),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('key_value', False, False), ('__anon_star_1', False, False),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('key_value', False, False), ('__anon_star_1', False, False),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('key_value', False, False), ('_NL', True, True),
+             ('_DEDENT', True, True), ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('key_value', False, False),
+             ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_INDENT', True, True),
+             ('key_value', False, False), ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('_NL', True, True), ('_DEDENT', True, True),
+             ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('key_value', False, False),
+             ('__anon_star_1', False, False), ('_NL', True, True),
+             ('_DEDENT', True, True), ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('objects',
+            [('_OCB', True, True), ('key_value', False, False),
+             ('__anon_star_1', False, False), ('_CCB', True, True)],
+            None, (False, False, None)),
+           ('regular_expression',
+            [('REGEXP', True, False), ('NAME', True, False)], None,
+            (False, False, None)),
+           ('regular_expression', [('REGEXP', True, False)], None,
+            (False, False, None)),
+           ('inline_expression',
+            [('_OP', True, True), ('service', False, False),
+             ('_CP', True, True)],
+            None, (False, False, None)),
+           ('values', [('number', False, False)], None, (False, False, None)),
+           ('values', [('objects', False, False)], None, (False, False, None)),
+           ('values', [('string', False, False)], None, (False, False, None)),
+           ('values', [('boolean', False, False)], None, (False, False, None)),
+           ('values', [('regular_expression', False, False)], None,
+            (False, False, None)),
+           ('values', [('CONSTANT', True, False)], None, (False, False, None)),
+           ('values', [('list', False, False)], None, (False, False, None)),
+           ('values', [('void', False, False)], None, (False, False, None)),
+           ('path_fragment', [('_DOT', True, True), ('NAME', True, False)],
+            None, (False, False, None)),
+           ('path_fragment',
+            [('_OSB', True, True), ('path', False, False),
+             ('_CSB', True, True)],
+            None, (False, False, None)),
+           ('path_fragment',
+            [('_OSB', True, True), ('string', False, False),
+             ('_CSB', True, True)],
+            None, (False, False, None)),
+           ('path_fragment',
+            [('_OSB', True, True), ('INT', True, False), ('_CSB', True, True)],
+            None, (False, False, None)),
+           ('path',
+            [('inline_expression', False, False),
+             ('__anon_star_2', False, False)],
+            None, (False, False, None)),
+           ('path', [('NAME', True, False)], None, (False, False, None)),
+           ('path', [('NAME', True, False), ('__anon_star_2', False, False)],
+            None, (False, False, None)),
+           ('path', [('inline_expression', False, False)], None,
+            (False, False, None)),
+           ('assignment_fragment',
+            [('EQUALS', True, False), ('mutation', False, False)], None,
+            (False, False, None)),
+           ('assignment_fragment',
+            [('EQUALS', True, False), ('service', False, False)], None,
+            (False, False, None)),
+           ('assignment_fragment',
+            [('EQUALS', True, False), ('expression', False, False)], None,
+            (False, False, None)),
+           ('assignment',
+            [('path', False, False), ('assignment_fragment', False, False)],
+            None, (False, False, None)),
+           ('imports',
+            [('_IMPORT', True, True), ('string', False, False),
+             ('_AS', True, True), ('NAME', True, False)],
+            None, (False, False, None)),
+           ('cmp_operator', [('EQUAL', True, False)], None,
+            (False, False, None)),
+           ('cmp_operator', [('NOT_EQUAL', True, False)], None,
+            (False, False, None)),
+           ('cmp_operator', [('LESSER_EQUAL', True, False)], None,
+            (False, False, None)),
+           ('cmp_operator', [('LESSER', True, False)], None,
+            (False, False, None)),
+           ('cmp_operator', [('GREATER', True, False)], None,
+            (False, False, None)),
+           ('cmp_operator', [('GREATER_EQUAL', True, False)], None,
+            (False, False, None)),
+           ('arith_operator', [('DASH', True, False)], None,
+            (False, False, None)),
+           ('arith_operator', [('PLUS', True, False)], None,
+            (False, False, None)),
+           ('unary_operator', [('NOT', True, False)], None,
+            (False, False, None)),
+           ('mul_operator', [('MODULUS', True, False)], None,
+            (False, False, None)),
+           ('mul_operator', [('MULTIPLIER', True, False)], None,
+            (False, False, None)),
+           ('mul_operator', [('BSLASH', True, False)], None,
+            (False, False, None)),
+           ('primary_expression',
+            [('_OP', True, True), ('or_expression', False, False),
+             ('_CP', True, True)],
+            None, (False, False, None)),
+           ('primary_expression', [('entity', False, False)], None,
+            (False, False, None)),
+           ('pow_expression',
+            [('primary_expression', False, False), ('POWER', True, False),
+             ('unary_expression', False, False)],
+            None, (False, False, None)),
+           ('pow_expression', [('primary_expression', False, False)], None,
+            (False, False, None)),
+           ('unary_expression', [('pow_expression', False, False)], None,
+            (False, False, None)),
+           ('unary_expression',
+            [('unary_operator', False, False),
+             ('unary_expression', False, False)],
+            None, (False, False, None)),
+           ('mul_expression',
+            [('mul_expression', False, False), ('mul_operator', False, False),
+             ('unary_expression', False, False)],
+            None, (False, False, None)),
+           ('mul_expression', [('unary_expression', False, False)], None,
+            (False, False, None)),
+           ('arith_expression',
+            [('arith_expression', False, False),
+             ('arith_operator', False, False),
+             ('mul_expression', False, False)],
+            None, (False, False, None)),
+           ('arith_expression', [('mul_expression', False, False)], None,
+            (False, False, None)),
+           ('cmp_expression',
+            [('cmp_expression', False, False), ('cmp_operator', False, False),
+             ('arith_expression', False, False)],
+            None, (False, False, None)),
+           ('cmp_expression', [('arith_expression', False, False)], None,
+            (False, False, None)),
+           ('and_expression',
+            [('and_expression', False, False), ('AND', True, False),
+             ('cmp_expression', False, False)],
+            None, (False, False, None)),
+           ('and_expression', [('cmp_expression', False, False)], None,
+            (False, False, None)),
+           ('or_expression', [('and_expression', False, False)], None,
+            (False, False, None)),
+           ('or_expression',
+            [('or_expression', False, False), ('OR', True, False),
+             ('and_expression', False, False)],
+            None, (False, False, None)),
+           ('expression', [('or_expression', False, False)], None,
+            (False, False, None)),
+           ('absolute_expression', [('expression', False, False)], None,
+            (False, False, None)),
+           ('return_statement', [('RETURN', True, False)], None,
+            (False, False, None)),
+           ('return_statement',
+            [('RETURN', True, False), ('expression', False, False)], None,
+            (False, False, None)),
+           ('break_statement', [('BREAK', True, False)], None,
+            (False, False, None)),
+           ('entity', [('values', False, False)], None, (False, False, None)),
+           ('entity', [('path', False, False)], None, (False, False, None)),
+           ('rules', [('absolute_expression', False, False)], None,
+            (False, False, None)),
+           ('rules', [('break_statement', False, False)], None,
+            (False, False, None)),
+           ('rules', [('assignment', False, False)], None,
+            (False, False, None)),
+           ('rules', [('block', False, False)], None, (False, False, None)),
+           ('rules', [('imports', False, False)], None, (False, False, None)),
+           ('rules', [('raise_statement', False, False)], None,
+            (False, False, None)),
+           ('rules', [('return_statement', False, False)], None,
+            (False, False, None)),
+           ('mutation_fragment', [('NAME', True, False)], None,
+            (False, False, None)),
+           ('mutation_fragment',
+            [('NAME', True, False), ('__anon_star_3', False, False)], None,
+            (False, False, None)),
+           ('chained_mutation',
+            [('_THEN', True, True), ('mutation_fragment', False, False)], None,
+            (False, False, None)),
+           ('mutation',
+            [('entity', False, False), ('mutation_fragment', False, False)],
+            None, (False, False, None)),
+           ('mutation',
+            [('entity', False, False), ('mutation_fragment', False, False),
+             ('__anon_star_4', False, False)],
+            None, (False, False, None)),
+           ('mutation_block',
+            [('mutation', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('mutation_block', [('mutation', False, False), ('_NL', True, True)],
+            None, (False, False, None)),
+           ('indented_chain',
+            [('_INDENT', True, True), ('__anon_plus_5', False, False),
+             ('_DEDENT', True, True)],
+            None, (False, False, None)),
+           ('command', [('NAME', True, False)], None, (False, False, None)),
+           ('arguments',
+            [('NAME', True, False), ('_COLON', True, True),
+             ('expression', False, False)],
+            None, (False, False, None)),
+           ('arguments', [('_COLON', True, True), ('expression', False, False)],
+            None, (False, False, None)),
+           ('output', [('_AS', True, True), ('NAME', True, False)], None,
+            (False, False, None)),
+           ('output',
+            [('_AS', True, True), ('NAME', True, False),
+             ('__anon_star_6', False, False)],
+            None, (False, False, None)),
+           ('service_fragment',
+            [('command', False, False), ('output', False, False)], None,
+            (False, False, None)),
+           ('service_fragment',
+            [('command', False, False), ('__anon_star_3', False, False)], None,
+            (False, False, None)),
+           ('service_fragment', [('command', False, False)], None,
+            (False, False, None)),
+           ('service_fragment', [('__anon_star_3', False, False)], None,
+            (False, False, None)),
+           ('service_fragment',
+            [('command', False, False), ('__anon_star_3', False, False),
+             ('output', False, False)],
+            None, (False, False, None)),
+           ('service_fragment',
+            [('__anon_star_3', False, False), ('output', False, False)], None,
+            (False, False, None)),
+           ('service',
+            [('path', False, False), ('service_fragment', False, False)], None,
+            (False, False, None)),
+           ('service',
+            [('path', False, False), ('service_fragment', False, False),
+             ('__anon_star_7', False, False)],
+            None, (False, False, None)),
+           ('service_block',
+            [('service', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('service_block', [('service', False, False), ('_NL', True, True)],
+            None, (False, False, None)),
+           ('if_statement', [('_IF', True, True), ('expression', False, False)],
+            None, (False, False, None)),
+           ('elseif_statement',
+            [('_ELSE', True, True), ('_IF', True, True),
+             ('expression', False, False)],
+            None, (False, False, None)),
+           ('elseif_block',
+            [('elseif_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('else_statement', [('_ELSE', True, True)], None,
+            (True, False, None)),
+           ('else_block',
+            [('else_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('if_block',
+            [('if_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('if_block',
+            [('if_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('__anon_star_8', False, False)],
+            None, (False, False, None)),
+           ('if_block',
+            [('if_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('else_block', False, False)],
+            None, (False, False, None)),
+           ('if_block',
+            [('if_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('__anon_star_8', False, False),
+             ('else_block', False, False)],
+            None, (False, False, None)),
+           ('foreach_statement',
+            [('_FOREACH', True, True), ('entity', False, False),
+             ('output', False, False)],
+            None, (False, False, None)),
+           ('foreach_block',
+            [('foreach_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('while_statement',
+            [('_WHILE', True, True), ('expression', False, False)], None,
+            (False, False, None)),
+           ('while_block',
+            [('while_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('typed_argument',
+            [('NAME', True, False), ('_COLON', True, True),
+             ('types', False, False)],
+            None, (False, False, None)),
+           ('function_output',
+            [('_RETURNS', True, True), ('types', False, False)], None,
+            (False, False, None)),
+           ('function_statement',
+            [('FUNCTION_TYPE', True, False), ('NAME', True, False)], None,
+            (False, False, None)),
+           ('function_statement',
+            [('FUNCTION_TYPE', True, False), ('NAME', True, False),
+             ('__anon_star_9', False, False),
+             ('function_output', False, False)],
+            None, (False, False, None)),
+           ('function_statement',
+            [('FUNCTION_TYPE', True, False), ('NAME', True, False),
+             ('function_output', False, False)],
+            None, (False, False, None)),
+           ('function_statement',
+            [('FUNCTION_TYPE', True, False), ('NAME', True, False),
+             ('__anon_star_9', False, False)],
+            None, (False, False, None)),
+           ('function_block',
+            [('function_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('catch_statement',
+            [('_CATCH', True, True), ('_AS', True, True),
+             ('NAME', True, False)],
+            None, (False, False, None)),
+           ('catch_block',
+            [('catch_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('finally_statement', [('FINALLY', True, False)], None,
+            (False, False, None)),
+           ('finally_block',
+            [('finally_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('try_statement', [('TRY', True, False)], None,
+            (False, False, None)),
+           ('try_block',
+            [('try_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('catch_block', False, False),
+             ('finally_block', False, False)],
+            None, (False, False, None)),
+           ('try_block',
+            [('try_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('try_block',
+            [('try_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('catch_block', False, False)],
+            None, (False, False, None)),
+           ('try_block',
+            [('try_statement', False, False), ('_NL', True, True),
+             ('nested_block', False, False), ('finally_block', False, False)],
+            None, (False, False, None)),
+           ('raise_statement',
+            [('RAISE', True, False), ('entity', False, False)], None,
+            (False, False, None)),
+           ('raise_statement', [('RAISE', True, False)], None,
+            (False, False, None)),
+           ('when_block',
+            [('_WHEN', True, True), ('service', False, False),
+             ('_NL', True, True), ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('when_block',
+            [('_WHEN', True, True), ('path', False, False),
+             ('output', False, False), ('_NL', True, True),
+             ('nested_block', False, False)],
+            None, (False, False, None)),
+           ('indented_arguments',
+            [('_INDENT', True, True), ('__anon_plus_10', False, False),
+             ('_DEDENT', True, True)],
+            None, (False, False, None)),
+           ('block', [('service_block', False, False)], None,
+            (False, False, None)),
+           ('block', [('try_block', False, False)], None, (False, False, None)),
+           ('block', [('if_block', False, False)], None, (False, False, None)),
+           ('block', [('when_block', False, False)], None,
+            (False, False, None)),
+           ('block', [('indented_chain', False, False)], None,
+            (False, False, None)),
+           ('block', [('arguments', False, False)], None, (False, False, None)),
+           ('block', [('chained_mutation', False, False)], None,
+            (False, False, None)),
+           ('block', [('foreach_block', False, False)], None,
+            (False, False, None)),
+           ('block', [('function_block', False, False)], None,
+            (False, False, None)),
+           ('block', [('rules', False, False), ('_NL', True, True)], None,
+            (False, False, None)),
+           ('block', [('indented_arguments', False, False)], None,
+            (False, False, None)),
+           ('block', [('while_block', False, False)], None,
+            (False, False, None)),
+           ('block', [('mutation_block', False, False)], None,
+            (False, False, None)),
+           ('nested_block',
+            [('_INDENT', True, True), ('__anon_plus_11', False, False),
+             ('_DEDENT', True, True)],
+            None, (False, False, None)),
+           ('start', [('_NL', True, True)], None, (False, False, None)),
+           ('start', [], None, (False, False, None)),
+           ('start', [('_NL', True, True), ('__anon_plus_11', False, False)],
+            None, (False, False, None)),
+           ('start', [('__anon_plus_11', False, False)], None,
+            (False, False, None)),
+           ('__anon_star_0',
+            [('_COMMA', True, True), ('_NL', True, True),
+             ('expression', False, False)],
+            None, (True, False, None)),
+           ('__anon_star_0',
+            [('_COMMA', True, True), ('expression', False, False)], None,
+            (True, False, None)),
+           ('__anon_star_0',
+            [('__anon_star_0', False, False), ('_COMMA', True, True),
+             ('_NL', True, True), ('expression', False, False)],
+            None, (True, False, None)),
+           ('__anon_star_0',
+            [('__anon_star_0', False, False), ('_COMMA', True, True),
+             ('expression', False, False)],
+            None, (True, False, None)),
+           ('__anon_star_1',
+            [('__anon_star_1', False, False), ('_COMMA', True, True),
+             ('_NL', True, True), ('key_value', False, False)],
+            None, None),
+           ('__anon_star_1',
+            [('_COMMA', True, True), ('_NL', True, True),
+             ('key_value', False, False)],
+            None, None),
+           ('__anon_star_1',
+            [('__anon_star_1', False, False), ('_COMMA', True, True),
+             ('key_value', False, False)],
+            None, None),
+           ('__anon_star_1',
+            [('_COMMA', True, True), ('key_value', False, False)], None, None),
+           ('__anon_star_2', [('path_fragment', False, False)], None, None),
+           ('__anon_star_2',
+            [('__anon_star_2', False, False), ('path_fragment', False, False)],
+            None, None),
+           ('__anon_star_3',
+            [('__anon_star_3', False, False), ('arguments', False, False)],
+            None, None),
+           ('__anon_star_3', [('arguments', False, False)], None, None),
+           ('__anon_star_4',
+            [('__anon_star_4', False, False),
+             ('chained_mutation', False, False)],
+            None, None),
+           ('__anon_star_4', [('chained_mutation', False, False)], None, None),
+           ('__anon_plus_5',
+            [('__anon_plus_5', False, False),
+             ('chained_mutation', False, False), ('_NL', True, True)],
+            None, None),
+           ('__anon_plus_5',
+            [('chained_mutation', False, False), ('_NL', True, True)], None,
+            None),
+           ('__anon_star_6',
+            [('__anon_star_6', False, False), ('_COMMA', True, True),
+             ('NAME', True, False)],
+            None, None),
+           ('__anon_star_6', [('_COMMA', True, True), ('NAME', True, False)],
+            None, None),
+           ('__anon_star_7', [('chained_mutation', False, False)], None, None),
+           ('__anon_star_7',
+            [('__anon_star_7', False, False),
+             ('chained_mutation', False, False)],
+            None, None),
+           ('__anon_star_8',
+            [('__anon_star_8', False, False), ('elseif_block', False, False)],
+            None, None),
+           ('__anon_star_8', [('elseif_block', False, False)], None, None),
+           ('__anon_star_9', [('typed_argument', False, False)], None, None),
+           ('__anon_star_9',
+            [('__anon_star_9', False, False), ('typed_argument', False, False)],
+            None, None),
+           ('__anon_plus_10',
+            [('__anon_plus_10', False, False), ('arguments', False, False),
+             ('_NL', True, True)],
+            None, None),
+           ('__anon_plus_10',
+            [('arguments', False, False), ('_NL', True, True)], None, None),
+           ('__anon_plus_11', [('block', False, False)], None, None),
+           ('__anon_plus_11',
+            [('__anon_plus_11', False, False), ('block', False, False)], None,
+            None)],
+ 'start': 0,
+ 'states': {0: {'$END': (1, 180),
+                'BREAK': (0, 68),
+                'CONSTANT': (0, 66),
+                'DOUBLE_QUOTED': (0, 28),
+                'FALSE': (0, 55),
+                'FLOAT': (0, 5),
+                'FUNCTION_TYPE': (0, 10),
+                'INT': (0, 11),
+                'NAME': (0, 3),
+                'NOT': (0, 46),
+                'NULL': (0, 25),
+                'RAISE': (0, 20),
+                'REGEXP': (0, 53),
+                'RETURN': (0, 15),
+                'SINGLE_QUOTED': (0, 42),
+                'TRUE': (0, 76),
+                'TRY': (0, 60),
+                '_COLON': (0, 63),
+                '_FOREACH': (0, 56),
+                '_IF': (0, 67),
+                '_IMPORT': (0, 36),
+                '_INDENT': (0, 18),
+                '_NL': (0, 6),
+                '_OCB': (0, 9),
+                '_OP': (0, 52),
+                '_OSB': (0, 1),
+                '_THEN': (0, 12),
+                '_WHEN': (0, 23),
+                '_WHILE': (0, 69),
+                '__anon_plus_11': (0, 21),
+                'absolute_expression': (0, 54),
+                'and_expression': (0, 27),
+                'arguments': (0, 30),
+                'arith_expression': (0, 48),
+                'assignment': (0, 2),
+                'block': (0, 64),
+                'boolean': (0, 78),
+                'break_statement': (0, 14),
+                'chained_mutation': (0, 13),
+                'cmp_expression': (0, 51),
+                'entity': (0, 24),
+                'expression': (0, 75),
+                'foreach_block': (0, 44),
+                'foreach_statement': (0, 34),
+                'function_block': (0, 37),
+                'function_statement': (0, 71),
+                'if_block': (0, 16),
+                'if_statement': (0, 17),
+                'imports': (0, 59),
+                'indented_arguments': (0, 62),
+                'indented_chain': (0, 32),
+                'inline_expression': (0, 40),
+                'list': (0, 41),
+                'mul_expression': (0, 26),
+                'mutation': (0, 31),
+                'mutation_block': (0, 49),
+                'number': (0, 38),
+                'objects': (0, 19),
+                'or_expression': (0, 22),
+                'path': (0, 4),
+                'pow_expression': (0, 61),
+                'primary_expression': (0, 29),
+                'raise_statement': (0, 72),
+                'regular_expression': (0, 47),
+                'return_statement': (0, 73),
+                'rules': (0, 8),
+                'service': (0, 57),
+                'service_block': (0, 43),
+                'start': (0, 7),
+                'string': (0, 50),
+                'try_block': (0, 35),
+                'try_statement': (0, 39),
+                'unary_expression': (0, 77),
+                'unary_operator': (0, 33),
+                'values': (0, 65),
+                'void': (0, 70),
+                'when_block': (0, 58),
+                'while_block': (0, 74),
+                'while_statement': (0, 45)},
+            1: {'CONSTANT': (0, 66),
+                'DOUBLE_QUOTED': (0, 28),
+                'FALSE': (0, 55),
+                'FLOAT': (0, 5),
+                'INT': (0, 11),
+                'NAME': (0, 81),
+                'NOT': (0, 46),
+                'NULL': (0, 25),
+                'REGEXP': (0, 53),
+                'SINGLE_QUOTED': (0, 42),
+                'TRUE': (0, 76),
+                '_CSB': (0, 82),
+                '_NL': (0, 79),
+                '_OCB': (0, 9),
+                '_OP': (0, 52),
+                '_OSB': (0, 1),
+                'and_expression': (0, 27),
+                'arith_expression': (0, 48),
+                'boolean': (0, 78),
+                'cmp_expression': (0, 51),
+                'entity': (0, 83),
+                'expression': (0, 80),
+                'inline_expression': (0, 40),
+                'list': (0, 41),
+                'mul_expression': (0, 26),
+                'number': (0, 38),
+                'objects': (0, 19),
+                'or_expression': (0, 22),
+                'path': (0, 84),
+                'pow_expression': (0, 61),
+                'primary_expression': (0, 29),
+                'regular_expression': (0, 47),
+                'string': (0, 50),
+                'unary_expression': (0, 77),
+                'unary_operator': (0, 33),
+                'values': (0, 65),
+                'void': (0, 70)},
+            2: {'_NL': (1, 103)},
+            3: {'$END': (1, 58),
+                'AND': (1, 58),
+                'BREAK': (1, 58),
+                'BSLASH': (1, 58),
+                'CONSTANT': (1, 58),
+                'DASH': (1, 58),
+                'DOUBLE_QUOTED': (1, 58),
+                'EQUAL': (1, 58),
+                'EQUALS': (1, 58),
+                'FALSE': (1, 58),
+                'FLOAT': (1, 58),
+                'FUNCTION_TYPE': (1, 58),
+                'GREATER': (1, 58),
+                'GREATER_EQUAL': (1, 58),
+                'INT': (1, 58),
+                'LESSER': (1, 58),
+                'LESSER_EQUAL': (1, 58),
+                'MODULUS': (1, 58),
+                'MULTIPLIER': (1, 58),
+                'NAME': (1, 58),
+                'NOT': (1, 58),
+                'NOT_EQUAL': (1, 58),
+                'NULL': (1, 58),
+                'OR': (1, 58),
+                'PLUS': (1, 58),
+                'POWER': (1, 58),
+                'RAISE': (1, 58),
+                'REGEXP': (1, 58),
+                'RETURN': (1, 58),
+                'SINGLE_QUOTED': (1, 58),
+                'TRUE': (1, 58),
+                'TRY': (1, 58),
+                '_AS': (1, 58),
+                '_CCB': (1, 58),
+                '_COLON': (0, 85),
+                '_COMMA': (1, 58),
+                '_CP': (1, 58),
+                '_CSB': (1, 58),
+                '_DEDENT': (1, 58),
+                '_DOT': (0, 88),
+                '_FOREACH': (1, 58),
+                '_IF': (1, 58),
+                '_IMPORT': (1, 58),
+                '_INDENT': (1, 58),
+                '_NL': (1, 58),
+                '_OCB': (1, 58),
+                '_OP': (1, 58),
+                '_OSB': (0, 86),
+                '_THEN': (1, 58),
+                '_WHEN': (1, 58),
+                '_WHILE': (1, 58),
+                '__anon_star_2': (0, 87),
+                'path_fragment': (0, 89)},
+            4: {'$END': (1, 100),
+                'AND': (1, 100),
+                'BREAK': (1, 100),
+                'BSLASH': (1, 100),
+                'CONSTANT': (1, 100),
+                'DASH': (1, 100),
+                'DOUBLE_QUOTED': (1, 100),
+                'EQUAL': (1, 100),
+                'EQUALS': (0, 92),
+                'FALSE': (1, 100),
+                'FLOAT': (1, 100),
+                'FUNCTION_TYPE': (1, 100),
+                'GREATER': (1, 100),
+                'GREATER_EQUAL': (1, 100),
+                'INT': (1, 100),
+                'LESSER': (1, 100),
+                'LESSER_EQUAL': (1, 100),
+                'MODULUS': (1, 100),
+                'MULTIPLIER': (1, 100),
+                'NAME': (0, 90),
+                'NOT': (1, 100),
+                'NOT_EQUAL': (1, 100),
+                'NULL': (1, 100),
+                'OR': (1, 100),
+                'PLUS': (1, 100),
+                'POWER': (1, 100),
+                'RAISE': (1, 100),
+                'REGEXP': (1, 100),
+                'RETURN': (1, 100),
+                'SINGLE_QUOTED': (1, 100),
+                'TRUE': (1, 100),
+                'TRY': (1, 100),
+                '_AS': (1, 100),
+                '_CCB': (1, 100),
+                '_COLON': (0, 63),
+                '_COMMA': (1, 100),
+                '_CP': (1, 100),
+                '_CSB': (1, 100),
+                '_DEDENT': (1, 100),
+                '_FOREACH': (1, 100),
+                '_IF': (1, 100),
+                '_IMPORT': (1, 100),
+                '_INDENT': (1, 100),
+                '_NL': (1, 100),
+                '_OCB': (1, 100),
+                '_OP': (1, 100),
+                '_OSB': (1, 100),
+                '_THEN': (1, 100),
+                '_WHEN': (1, 100),
+                '_WHILE': (1, 100),
+                '__anon_star_3': (0, 95),
+                'arguments': (0, 96),
+                'assignment_fragment': (0, 93),
+                'command': (0, 91),
+                'service_fragment': (0, 94)},
+            5: {'$END': (1, 13),
+                'AND': (1, 13),
+                'BREAK': (1, 13),
+                'BSLASH': (1, 13),
+                'CONSTANT': (1, 13),
+                'DASH': (1, 13),
+                'DOUBLE_QUOTED': (1, 13),
+                'EQUAL': (1, 13),
+                'FALSE': (1, 13),
+                'FLOAT': (1, 13),
+                'FUNCTION_TYPE': (1, 13),
+                'GREATER': (1, 13),
+                'GREATER_EQUAL': (1, 13),
+                'INT': (1, 13),
+                'LESSER': (1, 13),
+                'LESSER_EQUAL': (1, 13),
+                'MODULUS': (1, 13),
+                'MULTIPLIER': (1, 13),
+                'NAME': (1, 13),
+                'NOT': (1, 13),
+                'NOT_EQUAL': (1, 13),
+                'NULL': (1, 13),
+                'OR': (1, 13),
+                'PLUS': (1, 13),
+                'POWER': (1, 13),
+                'RAISE': (1, 13),
+                'REGEXP': (1, 13),
+                'RETURN': (1, 13),
+                'SINGLE_QUOTED': (1, 13),
+                'TRUE': (1, 13),
+                'TRY': (1, 13),
+                '_AS': (1, 13),
+                '_CCB': (1, 13),
+                '_COLON': (1, 13),
+                '_COMMA': (1, 13),
+                '_CP': (1, 13),
+                '_CSB': (1, 13),
+                '_DEDENT': (1, 13),
+                '_FOREACH': (1, 13),
+                '_IF': (1, 13),
+                '_IMPORT': (1, 13),
+                '_INDENT': (1, 13),
+                '_NL': (1, 13),
+                '_OCB': (1, 13),
+                '_OP': (1, 13),
+                '_OSB': (1, 13),
+                '_THEN': (1, 13),
+                '_WHEN': (1, 13),
+                '_WHILE': (1, 13)},
+            6: {'$END': (1, 179),
+                'BREAK': (0, 68),
+                'CONSTANT': (0, 66),
+                'DOUBLE_QUOTED': (0, 28),
+                'FALSE': (0, 55),
+                'FLOAT': (0, 5),
+                'FUNCTION_TYPE': (0, 10),
+                'INT': (0, 11),
+                'NAME': (0, 3),
+                'NOT': (0, 46),
+                'NULL': (0, 25),
+                'RAISE': (0, 20),
+                'REGEXP': (0, 53),
+                'RETURN': (0, 15),
+                'SINGLE_QUOTED': (0, 42),
+                'TRUE': (0, 76),
+                'TRY': (0, 60),
+                '_COLON': (0, 63),
+                '_FOREACH': (0, 56),
+                '_IF': (0, 67),
+                '_IMPORT': (0, 36),
+                '_INDENT': (0, 18),
+                '_OCB': (0, 9),
+                '_OP': (0, 52),
+                '_OSB': (0, 1),
+                '_THEN': (0, 12),
+                '_WHEN': (0, 23),
+                '_WHILE': (0, 69),
+                '__anon_plus_11': (0, 97),
+                'absolute_expression': (0, 54),
+                'and_expression': (0, 27),
+                'arguments': (0, 30),
+                'arith_expression': (0, 48),
+                'assignment': (0, 2),
+                'block': (0, 64),
+                'boolean': (0, 78),
+                'break_statement': (0, 14),
+                'chained_mutation': (0, 13),
+                'cmp_expression': (0, 51),
+                'entity': (0, 24),
+                'expression': (0, 75),
+                'foreach_block': (0, 44),
+                'foreach_statement': (0, 34),
+                'function_block': (0, 37),
+                'function_statement': (0, 71),
+                'if_block': (0, 16),
+                'if_statement': (0, 17),
+                'imports': (0, 59),
+                'indented_arguments': (0, 62),
+                'indented_chain': (0, 32),
+                'inline_expression': (0, 40),
+                'list': (0, 41),
+                'mul_expression': (0, 26),
+                'mutation': (0, 31),
+                'mutation_block': (0, 49),
+                'number': (0, 38),
+                'objects': (0, 19),
+                'or_expression': (0, 22),
+                'path': (0, 4),
+                'pow_expression': (0, 61),
+                'primary_expression': (0, 29),
+                'raise_statement': (0, 72),
+                'regular_expression': (0, 47),
+                'return_statement': (0, 73),
+                'rules': (0, 8),
+                'service': (0, 57),
+                'service_block': (0, 43),
+                'string': (0, 50),
+                'try_block': (0, 35),
+                'try_statement': (0, 39),
+                'unary_expression': (0, 77),
+                'unary_operator': (0, 33),
+                'values': (0, 65),
+                'void': (0, 70),
+                'when_block': (0, 58),
+                'while_block': (0, 74),
+                'while_statement': (0, 45)},
+            7: {'$END': (0, 98)},
+            8: {'_NL': (0, 99)},
+            9: {'DOUBLE_QUOTED': (0, 28),
+                'NAME': (0, 81),
+                'SINGLE_QUOTED': (0, 42),
+                '_CCB': (0, 105),
+                '_NL': (0, 100),
+                '_OP': (0, 101),
+                'inline_expression': (0, 40),
+                'key_value': (0, 102),
+                'path': (0, 104),
+                'string': (0, 103)},
+            10: {'NAME': (0, 106)},
+            11: {'$END': (1, 12),
+                 'AND': (1, 12),
+                 'BREAK': (1, 12),
+                 'BSLASH': (1, 12),
+                 'CONSTANT': (1, 12),
+                 'DASH': (1, 12),
+                 'DOUBLE_QUOTED': (1, 12),
+                 'EQUAL': (1, 12),
+                 'FALSE': (1, 12),
+                 'FLOAT': (1, 12),
+                 'FUNCTION_TYPE': (1, 12),
+                 'GREATER': (1, 12),
+                 'GREATER_EQUAL': (1, 12),
+                 'INT': (1, 12),
+                 'LESSER': (1, 12),
+                 'LESSER_EQUAL': (1, 12),
+                 'MODULUS': (1, 12),
+                 'MULTIPLIER': (1, 12),
+                 'NAME': (1, 12),
+                 'NOT': (1, 12),
+                 'NOT_EQUAL': (1, 12),
+                 'NULL': (1, 12),
+                 'OR': (1, 12),
+                 'PLUS': (1, 12),
+                 'POWER': (1, 12),
+                 'RAISE': (1, 12),
+                 'REGEXP': (1, 12),
+                 'RETURN': (1, 12),
+                 'SINGLE_QUOTED': (1, 12),
+                 'TRUE': (1, 12),
+                 'TRY': (1, 12),
+                 '_AS': (1, 12),
+                 '_CCB': (1, 12),
+                 '_COLON': (1, 12),
+                 '_COMMA': (1, 12),
+                 '_CP': (1, 12),
+                 '_CSB': (1, 12),
+                 '_DEDENT': (1, 12),
+                 '_FOREACH': (1, 12),
+                 '_IF': (1, 12),
+                 '_IMPORT': (1, 12),
+                 '_INDENT': (1, 12),
+                 '_NL': (1, 12),
+                 '_OCB': (1, 12),
+                 '_OP': (1, 12),
+                 '_OSB': (1, 12),
+                 '_THEN': (1, 12),
+                 '_WHEN': (1, 12),
+                 '_WHILE': (1, 12)},
+            12: {'NAME': (0, 107), 'mutation_fragment': (0, 108)},
+            13: {'$END': (1, 171),
+                 'BREAK': (1, 171),
+                 'CONSTANT': (1, 171),
+                 'DOUBLE_QUOTED': (1, 171),
+                 'FALSE': (1, 171),
+                 'FLOAT': (1, 171),
+                 'FUNCTION_TYPE': (1, 171),
+                 'INT': (1, 171),
+                 'NAME': (1, 171),
+                 'NOT': (1, 171),
+                 'NULL': (1, 171),
+                 'RAISE': (1, 171),
+                 'REGEXP': (1, 171),
+                 'RETURN': (1, 171),
+                 'SINGLE_QUOTED': (1, 171),
+                 'TRUE': (1, 171),
+                 'TRY': (1, 171),
+                 '_COLON': (1, 171),
+                 '_DEDENT': (1, 171),
+                 '_FOREACH': (1, 171),
+                 '_IF': (1, 171),
+                 '_IMPORT': (1, 171),
+                 '_INDENT': (1, 171),
+                 '_NL': (1, 171),
+                 '_OCB': (1, 171),
+                 '_OP': (1, 171),
+                 '_OSB': (1, 171),
+                 '_THEN': (1, 171),
+                 '_WHEN': (1, 171),
+                 '_WHILE': (1, 171)},
+            14: {'_NL': (1, 102)},
+            15: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_NL': (1, 96),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'expression': (0, 109),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            16: {'$END': (1, 167),
+                 'BREAK': (1, 167),
+                 'CONSTANT': (1, 167),
+                 'DOUBLE_QUOTED': (1, 167),
+                 'FALSE': (1, 167),
+                 'FLOAT': (1, 167),
+                 'FUNCTION_TYPE': (1, 167),
+                 'INT': (1, 167),
+                 'NAME': (1, 167),
+                 'NOT': (1, 167),
+                 'NULL': (1, 167),
+                 'RAISE': (1, 167),
+                 'REGEXP': (1, 167),
+                 'RETURN': (1, 167),
+                 'SINGLE_QUOTED': (1, 167),
+                 'TRUE': (1, 167),
+                 'TRY': (1, 167),
+                 '_COLON': (1, 167),
+                 '_DEDENT': (1, 167),
+                 '_FOREACH': (1, 167),
+                 '_IF': (1, 167),
+                 '_IMPORT': (1, 167),
+                 '_INDENT': (1, 167),
+                 '_NL': (1, 167),
+                 '_OCB': (1, 167),
+                 '_OP': (1, 167),
+                 '_OSB': (1, 167),
+                 '_THEN': (1, 167),
+                 '_WHEN': (1, 167),
+                 '_WHILE': (1, 167)},
+            17: {'_NL': (0, 110)},
+            18: {'NAME': (0, 113),
+                 '_COLON': (0, 63),
+                 '_THEN': (0, 12),
+                 '__anon_plus_10': (0, 111),
+                 '__anon_plus_5': (0, 115),
+                 'arguments': (0, 114),
+                 'chained_mutation': (0, 112)},
+            19: {'$END': (1, 46),
+                 'AND': (1, 46),
+                 'BREAK': (1, 46),
+                 'BSLASH': (1, 46),
+                 'CONSTANT': (1, 46),
+                 'DASH': (1, 46),
+                 'DOUBLE_QUOTED': (1, 46),
+                 'EQUAL': (1, 46),
+                 'FALSE': (1, 46),
+                 'FLOAT': (1, 46),
+                 'FUNCTION_TYPE': (1, 46),
+                 'GREATER': (1, 46),
+                 'GREATER_EQUAL': (1, 46),
+                 'INT': (1, 46),
+                 'LESSER': (1, 46),
+                 'LESSER_EQUAL': (1, 46),
+                 'MODULUS': (1, 46),
+                 'MULTIPLIER': (1, 46),
+                 'NAME': (1, 46),
+                 'NOT': (1, 46),
+                 'NOT_EQUAL': (1, 46),
+                 'NULL': (1, 46),
+                 'OR': (1, 46),
+                 'PLUS': (1, 46),
+                 'POWER': (1, 46),
+                 'RAISE': (1, 46),
+                 'REGEXP': (1, 46),
+                 'RETURN': (1, 46),
+                 'SINGLE_QUOTED': (1, 46),
+                 'TRUE': (1, 46),
+                 'TRY': (1, 46),
+                 '_AS': (1, 46),
+                 '_CCB': (1, 46),
+                 '_COLON': (1, 46),
+                 '_COMMA': (1, 46),
+                 '_CP': (1, 46),
+                 '_CSB': (1, 46),
+                 '_DEDENT': (1, 46),
+                 '_FOREACH': (1, 46),
+                 '_IF': (1, 46),
+                 '_IMPORT': (1, 46),
+                 '_INDENT': (1, 46),
+                 '_NL': (1, 46),
+                 '_OCB': (1, 46),
+                 '_OP': (1, 46),
+                 '_OSB': (1, 46),
+                 '_THEN': (1, 46),
+                 '_WHEN': (1, 46),
+                 '_WHILE': (1, 46)},
+            20: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_NL': (1, 161),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 101),
+                 '_OSB': (0, 1),
+                 'boolean': (0, 78),
+                 'entity': (0, 116),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'path': (0, 84),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            21: {'$END': (1, 182),
+                 'BREAK': (0, 68),
+                 'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'FUNCTION_TYPE': (0, 10),
+                 'INT': (0, 11),
+                 'NAME': (0, 3),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'RAISE': (0, 20),
+                 'REGEXP': (0, 53),
+                 'RETURN': (0, 15),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 'TRY': (0, 60),
+                 '_COLON': (0, 63),
+                 '_FOREACH': (0, 56),
+                 '_IF': (0, 67),
+                 '_IMPORT': (0, 36),
+                 '_INDENT': (0, 18),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 '_THEN': (0, 12),
+                 '_WHEN': (0, 23),
+                 '_WHILE': (0, 69),
+                 'absolute_expression': (0, 54),
+                 'and_expression': (0, 27),
+                 'arguments': (0, 30),
+                 'arith_expression': (0, 48),
+                 'assignment': (0, 2),
+                 'block': (0, 117),
+                 'boolean': (0, 78),
+                 'break_statement': (0, 14),
+                 'chained_mutation': (0, 13),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 24),
+                 'expression': (0, 75),
+                 'foreach_block': (0, 44),
+                 'foreach_statement': (0, 34),
+                 'function_block': (0, 37),
+                 'function_statement': (0, 71),
+                 'if_block': (0, 16),
+                 'if_statement': (0, 17),
+                 'imports': (0, 59),
+                 'indented_arguments': (0, 62),
+                 'indented_chain': (0, 32),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'mutation': (0, 31),
+                 'mutation_block': (0, 49),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 4),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'raise_statement': (0, 72),
+                 'regular_expression': (0, 47),
+                 'return_statement': (0, 73),
+                 'rules': (0, 8),
+                 'service': (0, 57),
+                 'service_block': (0, 43),
+                 'string': (0, 50),
+                 'try_block': (0, 35),
+                 'try_statement': (0, 39),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70),
+                 'when_block': (0, 58),
+                 'while_block': (0, 74),
+                 'while_statement': (0, 45)},
+            22: {'$END': (1, 94),
+                 'BREAK': (1, 94),
+                 'CONSTANT': (1, 94),
+                 'DOUBLE_QUOTED': (1, 94),
+                 'FALSE': (1, 94),
+                 'FLOAT': (1, 94),
+                 'FUNCTION_TYPE': (1, 94),
+                 'INT': (1, 94),
+                 'NAME': (1, 94),
+                 'NOT': (1, 94),
+                 'NULL': (1, 94),
+                 'OR': (0, 118),
+                 'RAISE': (1, 94),
+                 'REGEXP': (1, 94),
+                 'RETURN': (1, 94),
+                 'SINGLE_QUOTED': (1, 94),
+                 'TRUE': (1, 94),
+                 'TRY': (1, 94),
+                 '_AS': (1, 94),
+                 '_CCB': (1, 94),
+                 '_COLON': (1, 94),
+                 '_COMMA': (1, 94),
+                 '_CP': (1, 94),
+                 '_CSB': (1, 94),
+                 '_DEDENT': (1, 94),
+                 '_FOREACH': (1, 94),
+                 '_IF': (1, 94),
+                 '_IMPORT': (1, 94),
+                 '_INDENT': (1, 94),
+                 '_NL': (1, 94),
+                 '_OCB': (1, 94),
+                 '_OP': (1, 94),
+                 '_OSB': (1, 94),
+                 '_THEN': (1, 94),
+                 '_WHEN': (1, 94),
+                 '_WHILE': (1, 94)},
+            23: {'NAME': (0, 81),
+                 '_OP': (0, 101),
+                 'inline_expression': (0, 40),
+                 'path': (0, 119),
+                 'service': (0, 120)},
+            24: {'$END': (1, 79),
+                 'AND': (1, 79),
+                 'BREAK': (1, 79),
+                 'BSLASH': (1, 79),
+                 'CONSTANT': (1, 79),
+                 'DASH': (1, 79),
+                 'DOUBLE_QUOTED': (1, 79),
+                 'EQUAL': (1, 79),
+                 'FALSE': (1, 79),
+                 'FLOAT': (1, 79),
+                 'FUNCTION_TYPE': (1, 79),
+                 'GREATER': (1, 79),
+                 'GREATER_EQUAL': (1, 79),
+                 'INT': (1, 79),
+                 'LESSER': (1, 79),
+                 'LESSER_EQUAL': (1, 79),
+                 'MODULUS': (1, 79),
+                 'MULTIPLIER': (1, 79),
+                 'NAME': (0, 107),
+                 'NOT': (1, 79),
+                 'NOT_EQUAL': (1, 79),
+                 'NULL': (1, 79),
+                 'OR': (1, 79),
+                 'PLUS': (1, 79),
+                 'POWER': (1, 79),
+                 'RAISE': (1, 79),
+                 'REGEXP': (1, 79),
+                 'RETURN': (1, 79),
+                 'SINGLE_QUOTED': (1, 79),
+                 'TRUE': (1, 79),
+                 'TRY': (1, 79),
+                 '_AS': (1, 79),
+                 '_CCB': (1, 79),
+                 '_COLON': (1, 79),
+                 '_COMMA': (1, 79),
+                 '_CP': (1, 79),
+                 '_CSB': (1, 79),
+                 '_DEDENT': (1, 79),
+                 '_FOREACH': (1, 79),
+                 '_IF': (1, 79),
+                 '_IMPORT': (1, 79),
+                 '_INDENT': (1, 79),
+                 '_NL': (1, 79),
+                 '_OCB': (1, 79),
+                 '_OP': (1, 79),
+                 '_OSB': (1, 79),
+                 '_THEN': (1, 79),
+                 '_WHEN': (1, 79),
+                 '_WHILE': (1, 79),
+                 'mutation_fragment': (0, 121)},
+            25: {'$END': (1, 11),
+                 'AND': (1, 11),
+                 'BREAK': (1, 11),
+                 'BSLASH': (1, 11),
+                 'CONSTANT': (1, 11),
+                 'DASH': (1, 11),
+                 'DOUBLE_QUOTED': (1, 11),
+                 'EQUAL': (1, 11),
+                 'FALSE': (1, 11),
+                 'FLOAT': (1, 11),
+                 'FUNCTION_TYPE': (1, 11),
+                 'GREATER': (1, 11),
+                 'GREATER_EQUAL': (1, 11),
+                 'INT': (1, 11),
+                 'LESSER': (1, 11),
+                 'LESSER_EQUAL': (1, 11),
+                 'MODULUS': (1, 11),
+                 'MULTIPLIER': (1, 11),
+                 'NAME': (1, 11),
+                 'NOT': (1, 11),
+                 'NOT_EQUAL': (1, 11),
+                 'NULL': (1, 11),
+                 'OR': (1, 11),
+                 'PLUS': (1, 11),
+                 'POWER': (1, 11),
+                 'RAISE': (1, 11),
+                 'REGEXP': (1, 11),
+                 'RETURN': (1, 11),
+                 'SINGLE_QUOTED': (1, 11),
+                 'TRUE': (1, 11),
+                 'TRY': (1, 11),
+                 '_AS': (1, 11),
+                 '_CCB': (1, 11),
+                 '_COLON': (1, 11),
+                 '_COMMA': (1, 11),
+                 '_CP': (1, 11),
+                 '_CSB': (1, 11),
+                 '_DEDENT': (1, 11),
+                 '_FOREACH': (1, 11),
+                 '_IF': (1, 11),
+                 '_IMPORT': (1, 11),
+                 '_INDENT': (1, 11),
+                 '_NL': (1, 11),
+                 '_OCB': (1, 11),
+                 '_OP': (1, 11),
+                 '_OSB': (1, 11),
+                 '_THEN': (1, 11),
+                 '_WHEN': (1, 11),
+                 '_WHILE': (1, 11)},
+            26: {'$END': (1, 87),
+                 'AND': (1, 87),
+                 'BREAK': (1, 87),
+                 'BSLASH': (0, 122),
+                 'CONSTANT': (1, 87),
+                 'DASH': (1, 87),
+                 'DOUBLE_QUOTED': (1, 87),
+                 'EQUAL': (1, 87),
+                 'FALSE': (1, 87),
+                 'FLOAT': (1, 87),
+                 'FUNCTION_TYPE': (1, 87),
+                 'GREATER': (1, 87),
+                 'GREATER_EQUAL': (1, 87),
+                 'INT': (1, 87),
+                 'LESSER': (1, 87),
+                 'LESSER_EQUAL': (1, 87),
+                 'MODULUS': (0, 124),
+                 'MULTIPLIER': (0, 123),
+                 'NAME': (1, 87),
+                 'NOT': (1, 87),
+                 'NOT_EQUAL': (1, 87),
+                 'NULL': (1, 87),
+                 'OR': (1, 87),
+                 'PLUS': (1, 87),
+                 'RAISE': (1, 87),
+                 'REGEXP': (1, 87),
+                 'RETURN': (1, 87),
+                 'SINGLE_QUOTED': (1, 87),
+                 'TRUE': (1, 87),
+                 'TRY': (1, 87),
+                 '_AS': (1, 87),
+                 '_CCB': (1, 87),
+                 '_COLON': (1, 87),
+                 '_COMMA': (1, 87),
+                 '_CP': (1, 87),
+                 '_CSB': (1, 87),
+                 '_DEDENT': (1, 87),
+                 '_FOREACH': (1, 87),
+                 '_IF': (1, 87),
+                 '_IMPORT': (1, 87),
+                 '_INDENT': (1, 87),
+                 '_NL': (1, 87),
+                 '_OCB': (1, 87),
+                 '_OP': (1, 87),
+                 '_OSB': (1, 87),
+                 '_THEN': (1, 87),
+                 '_WHEN': (1, 87),
+                 '_WHILE': (1, 87),
+                 'mul_operator': (0, 125)},
+            27: {'$END': (1, 92),
+                 'AND': (0, 126),
+                 'BREAK': (1, 92),
+                 'CONSTANT': (1, 92),
+                 'DOUBLE_QUOTED': (1, 92),
+                 'FALSE': (1, 92),
+                 'FLOAT': (1, 92),
+                 'FUNCTION_TYPE': (1, 92),
+                 'INT': (1, 92),
+                 'NAME': (1, 92),
+                 'NOT': (1, 92),
+                 'NULL': (1, 92),
+                 'OR': (1, 92),
+                 'RAISE': (1, 92),
+                 'REGEXP': (1, 92),
+                 'RETURN': (1, 92),
+                 'SINGLE_QUOTED': (1, 92),
+                 'TRUE': (1, 92),
+                 'TRY': (1, 92),
+                 '_AS': (1, 92),
+                 '_CCB': (1, 92),
+                 '_COLON': (1, 92),
+                 '_COMMA': (1, 92),
+                 '_CP': (1, 92),
+                 '_CSB': (1, 92),
+                 '_DEDENT': (1, 92),
+                 '_FOREACH': (1, 92),
+                 '_IF': (1, 92),
+                 '_IMPORT': (1, 92),
+                 '_INDENT': (1, 92),
+                 '_NL': (1, 92),
+                 '_OCB': (1, 92),
+                 '_OP': (1, 92),
+                 '_OSB': (1, 92),
+                 '_THEN': (1, 92),
+                 '_WHEN': (1, 92),
+                 '_WHILE': (1, 92)},
+            28: {'$END': (1, 14),
+                 'AND': (1, 14),
+                 'BREAK': (1, 14),
+                 'BSLASH': (1, 14),
+                 'CONSTANT': (1, 14),
+                 'DASH': (1, 14),
+                 'DOUBLE_QUOTED': (1, 14),
+                 'EQUAL': (1, 14),
+                 'FALSE': (1, 14),
+                 'FLOAT': (1, 14),
+                 'FUNCTION_TYPE': (1, 14),
+                 'GREATER': (1, 14),
+                 'GREATER_EQUAL': (1, 14),
+                 'INT': (1, 14),
+                 'LESSER': (1, 14),
+                 'LESSER_EQUAL': (1, 14),
+                 'MODULUS': (1, 14),
+                 'MULTIPLIER': (1, 14),
+                 'NAME': (1, 14),
+                 'NOT': (1, 14),
+                 'NOT_EQUAL': (1, 14),
+                 'NULL': (1, 14),
+                 'OR': (1, 14),
+                 'PLUS': (1, 14),
+                 'POWER': (1, 14),
+                 'RAISE': (1, 14),
+                 'REGEXP': (1, 14),
+                 'RETURN': (1, 14),
+                 'SINGLE_QUOTED': (1, 14),
+                 'TRUE': (1, 14),
+                 'TRY': (1, 14),
+                 '_AS': (1, 14),
+                 '_CCB': (1, 14),
+                 '_COLON': (1, 14),
+                 '_COMMA': (1, 14),
+                 '_CP': (1, 14),
+                 '_CSB': (1, 14),
+                 '_DEDENT': (1, 14),
+                 '_FOREACH': (1, 14),
+                 '_IF': (1, 14),
+                 '_IMPORT': (1, 14),
+                 '_INDENT': (1, 14),
+                 '_NL': (1, 14),
+                 '_OCB': (1, 14),
+                 '_OP': (1, 14),
+                 '_OSB': (1, 14),
+                 '_THEN': (1, 14),
+                 '_WHEN': (1, 14),
+                 '_WHILE': (1, 14)},
+            29: {'$END': (1, 81),
+                 'AND': (1, 81),
+                 'BREAK': (1, 81),
+                 'BSLASH': (1, 81),
+                 'CONSTANT': (1, 81),
+                 'DASH': (1, 81),
+                 'DOUBLE_QUOTED': (1, 81),
+                 'EQUAL': (1, 81),
+                 'FALSE': (1, 81),
+                 'FLOAT': (1, 81),
+                 'FUNCTION_TYPE': (1, 81),
+                 'GREATER': (1, 81),
+                 'GREATER_EQUAL': (1, 81),
+                 'INT': (1, 81),
+                 'LESSER': (1, 81),
+                 'LESSER_EQUAL': (1, 81),
+                 'MODULUS': (1, 81),
+                 'MULTIPLIER': (1, 81),
+                 'NAME': (1, 81),
+                 'NOT': (1, 81),
+                 'NOT_EQUAL': (1, 81),
+                 'NULL': (1, 81),
+                 'OR': (1, 81),
+                 'PLUS': (1, 81),
+                 'POWER': (0, 127),
+                 'RAISE': (1, 81),
+                 'REGEXP': (1, 81),
+                 'RETURN': (1, 81),
+                 'SINGLE_QUOTED': (1, 81),
+                 'TRUE': (1, 81),
+                 'TRY': (1, 81),
+                 '_AS': (1, 81),
+                 '_CCB': (1, 81),
+                 '_COLON': (1, 81),
+                 '_COMMA': (1, 81),
+                 '_CP': (1, 81),
+                 '_CSB': (1, 81),
+                 '_DEDENT': (1, 81),
+                 '_FOREACH': (1, 81),
+                 '_IF': (1, 81),
+                 '_IMPORT': (1, 81),
+                 '_INDENT': (1, 81),
+                 '_NL': (1, 81),
+                 '_OCB': (1, 81),
+                 '_OP': (1, 81),
+                 '_OSB': (1, 81),
+                 '_THEN': (1, 81),
+                 '_WHEN': (1, 81),
+                 '_WHILE': (1, 81)},
+            30: {'$END': (1, 170),
+                 'BREAK': (1, 170),
+                 'CONSTANT': (1, 170),
+                 'DOUBLE_QUOTED': (1, 170),
+                 'FALSE': (1, 170),
+                 'FLOAT': (1, 170),
+                 'FUNCTION_TYPE': (1, 170),
+                 'INT': (1, 170),
+                 'NAME': (1, 170),
+                 'NOT': (1, 170),
+                 'NULL': (1, 170),
+                 'RAISE': (1, 170),
+                 'REGEXP': (1, 170),
+                 'RETURN': (1, 170),
+                 'SINGLE_QUOTED': (1, 170),
+                 'TRUE': (1, 170),
+                 'TRY': (1, 170),
+                 '_COLON': (1, 170),
+                 '_DEDENT': (1, 170),
+                 '_FOREACH': (1, 170),
+                 '_IF': (1, 170),
+                 '_IMPORT': (1, 170),
+                 '_INDENT': (1, 170),
+                 '_NL': (1, 170),
+                 '_OCB': (1, 170),
+                 '_OP': (1, 170),
+                 '_OSB': (1, 170),
+                 '_THEN': (1, 170),
+                 '_WHEN': (1, 170),
+                 '_WHILE': (1, 170)},
+            31: {'_NL': (0, 128)},
+            32: {'$END': (1, 169),
+                 'BREAK': (1, 169),
+                 'CONSTANT': (1, 169),
+                 'DOUBLE_QUOTED': (1, 169),
+                 'FALSE': (1, 169),
+                 'FLOAT': (1, 169),
+                 'FUNCTION_TYPE': (1, 169),
+                 'INT': (1, 169),
+                 'NAME': (1, 169),
+                 'NOT': (1, 169),
+                 'NULL': (1, 169),
+                 'RAISE': (1, 169),
+                 'REGEXP': (1, 169),
+                 'RETURN': (1, 169),
+                 'SINGLE_QUOTED': (1, 169),
+                 'TRUE': (1, 169),
+                 'TRY': (1, 169),
+                 '_COLON': (1, 169),
+                 '_DEDENT': (1, 169),
+                 '_FOREACH': (1, 169),
+                 '_IF': (1, 169),
+                 '_IMPORT': (1, 169),
+                 '_INDENT': (1, 169),
+                 '_NL': (1, 169),
+                 '_OCB': (1, 169),
+                 '_OP': (1, 169),
+                 '_OSB': (1, 169),
+                 '_THEN': (1, 169),
+                 '_WHEN': (1, 169),
+                 '_WHILE': (1, 169)},
+            33: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'boolean': (0, 78),
+                 'entity': (0, 83),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 129),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            34: {'_NL': (0, 130)},
+            35: {'$END': (1, 166),
+                 'BREAK': (1, 166),
+                 'CONSTANT': (1, 166),
+                 'DOUBLE_QUOTED': (1, 166),
+                 'FALSE': (1, 166),
+                 'FLOAT': (1, 166),
+                 'FUNCTION_TYPE': (1, 166),
+                 'INT': (1, 166),
+                 'NAME': (1, 166),
+                 'NOT': (1, 166),
+                 'NULL': (1, 166),
+                 'RAISE': (1, 166),
+                 'REGEXP': (1, 166),
+                 'RETURN': (1, 166),
+                 'SINGLE_QUOTED': (1, 166),
+                 'TRUE': (1, 166),
+                 'TRY': (1, 166),
+                 '_COLON': (1, 166),
+                 '_DEDENT': (1, 166),
+                 '_FOREACH': (1, 166),
+                 '_IF': (1, 166),
+                 '_IMPORT': (1, 166),
+                 '_INDENT': (1, 166),
+                 '_NL': (1, 166),
+                 '_OCB': (1, 166),
+                 '_OP': (1, 166),
+                 '_OSB': (1, 166),
+                 '_THEN': (1, 166),
+                 '_WHEN': (1, 166),
+                 '_WHILE': (1, 166)},
+            36: {'DOUBLE_QUOTED': (0, 28),
+                 'SINGLE_QUOTED': (0, 42),
+                 'string': (0, 131)},
+            37: {'$END': (1, 173),
+                 'BREAK': (1, 173),
+                 'CONSTANT': (1, 173),
+                 'DOUBLE_QUOTED': (1, 173),
+                 'FALSE': (1, 173),
+                 'FLOAT': (1, 173),
+                 'FUNCTION_TYPE': (1, 173),
+                 'INT': (1, 173),
+                 'NAME': (1, 173),
+                 'NOT': (1, 173),
+                 'NULL': (1, 173),
+                 'RAISE': (1, 173),
+                 'REGEXP': (1, 173),
+                 'RETURN': (1, 173),
+                 'SINGLE_QUOTED': (1, 173),
+                 'TRUE': (1, 173),
+                 'TRY': (1, 173),
+                 '_COLON': (1, 173),
+                 '_DEDENT': (1, 173),
+                 '_FOREACH': (1, 173),
+                 '_IF': (1, 173),
+                 '_IMPORT': (1, 173),
+                 '_INDENT': (1, 173),
+                 '_NL': (1, 173),
+                 '_OCB': (1, 173),
+                 '_OP': (1, 173),
+                 '_OSB': (1, 173),
+                 '_THEN': (1, 173),
+                 '_WHEN': (1, 173),
+                 '_WHILE': (1, 173)},
+            38: {'$END': (1, 45),
+                 'AND': (1, 45),
+                 'BREAK': (1, 45),
+                 'BSLASH': (1, 45),
+                 'CONSTANT': (1, 45),
+                 'DASH': (1, 45),
+                 'DOUBLE_QUOTED': (1, 45),
+                 'EQUAL': (1, 45),
+                 'FALSE': (1, 45),
+                 'FLOAT': (1, 45),
+                 'FUNCTION_TYPE': (1, 45),
+                 'GREATER': (1, 45),
+                 'GREATER_EQUAL': (1, 45),
+                 'INT': (1, 45),
+                 'LESSER': (1, 45),
+                 'LESSER_EQUAL': (1, 45),
+                 'MODULUS': (1, 45),
+                 'MULTIPLIER': (1, 45),
+                 'NAME': (1, 45),
+                 'NOT': (1, 45),
+                 'NOT_EQUAL': (1, 45),
+                 'NULL': (1, 45),
+                 'OR': (1, 45),
+                 'PLUS': (1, 45),
+                 'POWER': (1, 45),
+                 'RAISE': (1, 45),
+                 'REGEXP': (1, 45),
+                 'RETURN': (1, 45),
+                 'SINGLE_QUOTED': (1, 45),
+                 'TRUE': (1, 45),
+                 'TRY': (1, 45),
+                 '_AS': (1, 45),
+                 '_CCB': (1, 45),
+                 '_COLON': (1, 45),
+                 '_COMMA': (1, 45),
+                 '_CP': (1, 45),
+                 '_CSB': (1, 45),
+                 '_DEDENT': (1, 45),
+                 '_FOREACH': (1, 45),
+                 '_IF': (1, 45),
+                 '_IMPORT': (1, 45),
+                 '_INDENT': (1, 45),
+                 '_NL': (1, 45),
+                 '_OCB': (1, 45),
+                 '_OP': (1, 45),
+                 '_OSB': (1, 45),
+                 '_THEN': (1, 45),
+                 '_WHEN': (1, 45),
+                 '_WHILE': (1, 45)},
+            39: {'_NL': (0, 132)},
+            40: {'$END': (1, 60),
+                 'AND': (1, 60),
+                 'BREAK': (1, 60),
+                 'BSLASH': (1, 60),
+                 'CONSTANT': (1, 60),
+                 'DASH': (1, 60),
+                 'DOUBLE_QUOTED': (1, 60),
+                 'EQUAL': (1, 60),
+                 'EQUALS': (1, 60),
+                 'FALSE': (1, 60),
+                 'FLOAT': (1, 60),
+                 'FUNCTION_TYPE': (1, 60),
+                 'GREATER': (1, 60),
+                 'GREATER_EQUAL': (1, 60),
+                 'INT': (1, 60),
+                 'LESSER': (1, 60),
+                 'LESSER_EQUAL': (1, 60),
+                 'MODULUS': (1, 60),
+                 'MULTIPLIER': (1, 60),
+                 'NAME': (1, 60),
+                 'NOT': (1, 60),
+                 'NOT_EQUAL': (1, 60),
+                 'NULL': (1, 60),
+                 'OR': (1, 60),
+                 'PLUS': (1, 60),
+                 'POWER': (1, 60),
+                 'RAISE': (1, 60),
+                 'REGEXP': (1, 60),
+                 'RETURN': (1, 60),
+                 'SINGLE_QUOTED': (1, 60),
+                 'TRUE': (1, 60),
+                 'TRY': (1, 60),
+                 '_AS': (1, 60),
+                 '_CCB': (1, 60),
+                 '_COLON': (1, 60),
+                 '_COMMA': (1, 60),
+                 '_CP': (1, 60),
+                 '_CSB': (1, 60),
+                 '_DEDENT': (1, 60),
+                 '_DOT': (0, 88),
+                 '_FOREACH': (1, 60),
+                 '_IF': (1, 60),
+                 '_IMPORT': (1, 60),
+                 '_INDENT': (1, 60),
+                 '_NL': (1, 60),
+                 '_OCB': (1, 60),
+                 '_OP': (1, 60),
+                 '_OSB': (0, 86),
+                 '_THEN': (1, 60),
+                 '_WHEN': (1, 60),
+                 '_WHILE': (1, 60),
+                 '__anon_star_2': (0, 133),
+                 'path_fragment': (0, 89)},
+            41: {'$END': (1, 51),
+                 'AND': (1, 51),
+                 'BREAK': (1, 51),
+                 'BSLASH': (1, 51),
+                 'CONSTANT': (1, 51),
+                 'DASH': (1, 51),
+                 'DOUBLE_QUOTED': (1, 51),
+                 'EQUAL': (1, 51),
+                 'FALSE': (1, 51),
+                 'FLOAT': (1, 51),
+                 'FUNCTION_TYPE': (1, 51),
+                 'GREATER': (1, 51),
+                 'GREATER_EQUAL': (1, 51),
+                 'INT': (1, 51),
+                 'LESSER': (1, 51),
+                 'LESSER_EQUAL': (1, 51),
+                 'MODULUS': (1, 51),
+                 'MULTIPLIER': (1, 51),
+                 'NAME': (1, 51),
+                 'NOT': (1, 51),
+                 'NOT_EQUAL': (1, 51),
+                 'NULL': (1, 51),
+                 'OR': (1, 51),
+                 'PLUS': (1, 51),
+                 'POWER': (1, 51),
+                 'RAISE': (1, 51),
+                 'REGEXP': (1, 51),
+                 'RETURN': (1, 51),
+                 'SINGLE_QUOTED': (1, 51),
+                 'TRUE': (1, 51),
+                 'TRY': (1, 51),
+                 '_AS': (1, 51),
+                 '_CCB': (1, 51),
+                 '_COLON': (1, 51),
+                 '_COMMA': (1, 51),
+                 '_CP': (1, 51),
+                 '_CSB': (1, 51),
+                 '_DEDENT': (1, 51),
+                 '_FOREACH': (1, 51),
+                 '_IF': (1, 51),
+                 '_IMPORT': (1, 51),
+                 '_INDENT': (1, 51),
+                 '_NL': (1, 51),
+                 '_OCB': (1, 51),
+                 '_OP': (1, 51),
+                 '_OSB': (1, 51),
+                 '_THEN': (1, 51),
+                 '_WHEN': (1, 51),
+                 '_WHILE': (1, 51)},
+            42: {'$END': (1, 15),
+                 'AND': (1, 15),
+                 'BREAK': (1, 15),
+                 'BSLASH': (1, 15),
+                 'CONSTANT': (1, 15),
+                 'DASH': (1, 15),
+                 'DOUBLE_QUOTED': (1, 15),
+                 'EQUAL': (1, 15),
+                 'FALSE': (1, 15),
+                 'FLOAT': (1, 15),
+                 'FUNCTION_TYPE': (1, 15),
+                 'GREATER': (1, 15),
+                 'GREATER_EQUAL': (1, 15),
+                 'INT': (1, 15),
+                 'LESSER': (1, 15),
+                 'LESSER_EQUAL': (1, 15),
+                 'MODULUS': (1, 15),
+                 'MULTIPLIER': (1, 15),
+                 'NAME': (1, 15),
+                 'NOT': (1, 15),
+                 'NOT_EQUAL': (1, 15),
+                 'NULL': (1, 15),
+                 'OR': (1, 15),
+                 'PLUS': (1, 15),
+                 'POWER': (1, 15),
+                 'RAISE': (1, 15),
+                 'REGEXP': (1, 15),
+                 'RETURN': (1, 15),
+                 'SINGLE_QUOTED': (1, 15),
+                 'TRUE': (1, 15),
+                 'TRY': (1, 15),
+                 '_AS': (1, 15),
+                 '_CCB': (1, 15),
+                 '_COLON': (1, 15),
+                 '_COMMA': (1, 15),
+                 '_CP': (1, 15),
+                 '_CSB': (1, 15),
+                 '_DEDENT': (1, 15),
+                 '_FOREACH': (1, 15),
+                 '_IF': (1, 15),
+                 '_IMPORT': (1, 15),
+                 '_INDENT': (1, 15),
+                 '_NL': (1, 15),
+                 '_OCB': (1, 15),
+                 '_OP': (1, 15),
+                 '_OSB': (1, 15),
+                 '_THEN': (1, 15),
+                 '_WHEN': (1, 15),
+                 '_WHILE': (1, 15)},
+            43: {'$END': (1, 165),
+                 'BREAK': (1, 165),
+                 'CONSTANT': (1, 165),
+                 'DOUBLE_QUOTED': (1, 165),
+                 'FALSE': (1, 165),
+                 'FLOAT': (1, 165),
+                 'FUNCTION_TYPE': (1, 165),
+                 'INT': (1, 165),
+                 'NAME': (1, 165),
+                 'NOT': (1, 165),
+                 'NULL': (1, 165),
+                 'RAISE': (1, 165),
+                 'REGEXP': (1, 165),
+                 'RETURN': (1, 165),
+                 'SINGLE_QUOTED': (1, 165),
+                 'TRUE': (1, 165),
+                 'TRY': (1, 165),
+                 '_COLON': (1, 165),
+                 '_DEDENT': (1, 165),
+                 '_FOREACH': (1, 165),
+                 '_IF': (1, 165),
+                 '_IMPORT': (1, 165),
+                 '_INDENT': (1, 165),
+                 '_NL': (1, 165),
+                 '_OCB': (1, 165),
+                 '_OP': (1, 165),
+                 '_OSB': (1, 165),
+                 '_THEN': (1, 165),
+                 '_WHEN': (1, 165),
+                 '_WHILE': (1, 165)},
+            44: {'$END': (1, 172),
+                 'BREAK': (1, 172),
+                 'CONSTANT': (1, 172),
+                 'DOUBLE_QUOTED': (1, 172),
+                 'FALSE': (1, 172),
+                 'FLOAT': (1, 172),
+                 'FUNCTION_TYPE': (1, 172),
+                 'INT': (1, 172),
+                 'NAME': (1, 172),
+                 'NOT': (1, 172),
+                 'NULL': (1, 172),
+                 'RAISE': (1, 172),
+                 'REGEXP': (1, 172),
+                 'RETURN': (1, 172),
+                 'SINGLE_QUOTED': (1, 172),
+                 'TRUE': (1, 172),
+                 'TRY': (1, 172),
+                 '_COLON': (1, 172),
+                 '_DEDENT': (1, 172),
+                 '_FOREACH': (1, 172),
+                 '_IF': (1, 172),
+                 '_IMPORT': (1, 172),
+                 '_INDENT': (1, 172),
+                 '_NL': (1, 172),
+                 '_OCB': (1, 172),
+                 '_OP': (1, 172),
+                 '_OSB': (1, 172),
+                 '_THEN': (1, 172),
+                 '_WHEN': (1, 172),
+                 '_WHILE': (1, 172)},
+            45: {'_NL': (0, 134)},
+            46: {'CONSTANT': (1, 74),
+                 'DOUBLE_QUOTED': (1, 74),
+                 'FALSE': (1, 74),
+                 'FLOAT': (1, 74),
+                 'INT': (1, 74),
+                 'NAME': (1, 74),
+                 'NOT': (1, 74),
+                 'NULL': (1, 74),
+                 'REGEXP': (1, 74),
+                 'SINGLE_QUOTED': (1, 74),
+                 'TRUE': (1, 74),
+                 '_OCB': (1, 74),
+                 '_OP': (1, 74),
+                 '_OSB': (1, 74)},
+            47: {'$END': (1, 49),
+                 'AND': (1, 49),
+                 'BREAK': (1, 49),
+                 'BSLASH': (1, 49),
+                 'CONSTANT': (1, 49),
+                 'DASH': (1, 49),
+                 'DOUBLE_QUOTED': (1, 49),
+                 'EQUAL': (1, 49),
+                 'FALSE': (1, 49),
+                 'FLOAT': (1, 49),
+                 'FUNCTION_TYPE': (1, 49),
+                 'GREATER': (1, 49),
+                 'GREATER_EQUAL': (1, 49),
+                 'INT': (1, 49),
+                 'LESSER': (1, 49),
+                 'LESSER_EQUAL': (1, 49),
+                 'MODULUS': (1, 49),
+                 'MULTIPLIER': (1, 49),
+                 'NAME': (1, 49),
+                 'NOT': (1, 49),
+                 'NOT_EQUAL': (1, 49),
+                 'NULL': (1, 49),
+                 'OR': (1, 49),
+                 'PLUS': (1, 49),
+                 'POWER': (1, 49),
+                 'RAISE': (1, 49),
+                 'REGEXP': (1, 49),
+                 'RETURN': (1, 49),
+                 'SINGLE_QUOTED': (1, 49),
+                 'TRUE': (1, 49),
+                 'TRY': (1, 49),
+                 '_AS': (1, 49),
+                 '_CCB': (1, 49),
+                 '_COLON': (1, 49),
+                 '_COMMA': (1, 49),
+                 '_CP': (1, 49),
+                 '_CSB': (1, 49),
+                 '_DEDENT': (1, 49),
+                 '_FOREACH': (1, 49),
+                 '_IF': (1, 49),
+                 '_IMPORT': (1, 49),
+                 '_INDENT': (1, 49),
+                 '_NL': (1, 49),
+                 '_OCB': (1, 49),
+                 '_OP': (1, 49),
+                 '_OSB': (1, 49),
+                 '_THEN': (1, 49),
+                 '_WHEN': (1, 49),
+                 '_WHILE': (1, 49)},
+            48: {'$END': (1, 89),
+                 'AND': (1, 89),
+                 'BREAK': (1, 89),
+                 'CONSTANT': (1, 89),
+                 'DASH': (0, 136),
+                 'DOUBLE_QUOTED': (1, 89),
+                 'EQUAL': (1, 89),
+                 'FALSE': (1, 89),
+                 'FLOAT': (1, 89),
+                 'FUNCTION_TYPE': (1, 89),
+                 'GREATER': (1, 89),
+                 'GREATER_EQUAL': (1, 89),
+                 'INT': (1, 89),
+                 'LESSER': (1, 89),
+                 'LESSER_EQUAL': (1, 89),
+                 'NAME': (1, 89),
+                 'NOT': (1, 89),
+                 'NOT_EQUAL': (1, 89),
+                 'NULL': (1, 89),
+                 'OR': (1, 89),
+                 'PLUS': (0, 137),
+                 'RAISE': (1, 89),
+                 'REGEXP': (1, 89),
+                 'RETURN': (1, 89),
+                 'SINGLE_QUOTED': (1, 89),
+                 'TRUE': (1, 89),
+                 'TRY': (1, 89),
+                 '_AS': (1, 89),
+                 '_CCB': (1, 89),
+                 '_COLON': (1, 89),
+                 '_COMMA': (1, 89),
+                 '_CP': (1, 89),
+                 '_CSB': (1, 89),
+                 '_DEDENT': (1, 89),
+                 '_FOREACH': (1, 89),
+                 '_IF': (1, 89),
+                 '_IMPORT': (1, 89),
+                 '_INDENT': (1, 89),
+                 '_NL': (1, 89),
+                 '_OCB': (1, 89),
+                 '_OP': (1, 89),
+                 '_OSB': (1, 89),
+                 '_THEN': (1, 89),
+                 '_WHEN': (1, 89),
+                 '_WHILE': (1, 89),
+                 'arith_operator': (0, 135)},
+            49: {'$END': (1, 177),
+                 'BREAK': (1, 177),
+                 'CONSTANT': (1, 177),
+                 'DOUBLE_QUOTED': (1, 177),
+                 'FALSE': (1, 177),
+                 'FLOAT': (1, 177),
+                 'FUNCTION_TYPE': (1, 177),
+                 'INT': (1, 177),
+                 'NAME': (1, 177),
+                 'NOT': (1, 177),
+                 'NULL': (1, 177),
+                 'RAISE': (1, 177),
+                 'REGEXP': (1, 177),
+                 'RETURN': (1, 177),
+                 'SINGLE_QUOTED': (1, 177),
+                 'TRUE': (1, 177),
+                 'TRY': (1, 177),
+                 '_COLON': (1, 177),
+                 '_DEDENT': (1, 177),
+                 '_FOREACH': (1, 177),
+                 '_IF': (1, 177),
+                 '_IMPORT': (1, 177),
+                 '_INDENT': (1, 177),
+                 '_NL': (1, 177),
+                 '_OCB': (1, 177),
+                 '_OP': (1, 177),
+                 '_OSB': (1, 177),
+                 '_THEN': (1, 177),
+                 '_WHEN': (1, 177),
+                 '_WHILE': (1, 177)},
+            50: {'$END': (1, 47),
+                 'AND': (1, 47),
+                 'BREAK': (1, 47),
+                 'BSLASH': (1, 47),
+                 'CONSTANT': (1, 47),
+                 'DASH': (1, 47),
+                 'DOUBLE_QUOTED': (1, 47),
+                 'EQUAL': (1, 47),
+                 'FALSE': (1, 47),
+                 'FLOAT': (1, 47),
+                 'FUNCTION_TYPE': (1, 47),
+                 'GREATER': (1, 47),
+                 'GREATER_EQUAL': (1, 47),
+                 'INT': (1, 47),
+                 'LESSER': (1, 47),
+                 'LESSER_EQUAL': (1, 47),
+                 'MODULUS': (1, 47),
+                 'MULTIPLIER': (1, 47),
+                 'NAME': (1, 47),
+                 'NOT': (1, 47),
+                 'NOT_EQUAL': (1, 47),
+                 'NULL': (1, 47),
+                 'OR': (1, 47),
+                 'PLUS': (1, 47),
+                 'POWER': (1, 47),
+                 'RAISE': (1, 47),
+                 'REGEXP': (1, 47),
+                 'RETURN': (1, 47),
+                 'SINGLE_QUOTED': (1, 47),
+                 'TRUE': (1, 47),
+                 'TRY': (1, 47),
+                 '_AS': (1, 47),
+                 '_CCB': (1, 47),
+                 '_COLON': (1, 47),
+                 '_COMMA': (1, 47),
+                 '_CP': (1, 47),
+                 '_CSB': (1, 47),
+                 '_DEDENT': (1, 47),
+                 '_FOREACH': (1, 47),
+                 '_IF': (1, 47),
+                 '_IMPORT': (1, 47),
+                 '_INDENT': (1, 47),
+                 '_NL': (1, 47),
+                 '_OCB': (1, 47),
+                 '_OP': (1, 47),
+                 '_OSB': (1, 47),
+                 '_THEN': (1, 47),
+                 '_WHEN': (1, 47),
+                 '_WHILE': (1, 47)},
+            51: {'$END': (1, 91),
+                 'AND': (1, 91),
+                 'BREAK': (1, 91),
+                 'CONSTANT': (1, 91),
+                 'DOUBLE_QUOTED': (1, 91),
+                 'EQUAL': (0, 141),
+                 'FALSE': (1, 91),
+                 'FLOAT': (1, 91),
+                 'FUNCTION_TYPE': (1, 91),
+                 'GREATER': (0, 139),
+                 'GREATER_EQUAL': (0, 144),
+                 'INT': (1, 91),
+                 'LESSER': (0, 143),
+                 'LESSER_EQUAL': (0, 142),
+                 'NAME': (1, 91),
+                 'NOT': (1, 91),
+                 'NOT_EQUAL': (0, 140),
+                 'NULL': (1, 91),
+                 'OR': (1, 91),
+                 'RAISE': (1, 91),
+                 'REGEXP': (1, 91),
+                 'RETURN': (1, 91),
+                 'SINGLE_QUOTED': (1, 91),
+                 'TRUE': (1, 91),
+                 'TRY': (1, 91),
+                 '_AS': (1, 91),
+                 '_CCB': (1, 91),
+                 '_COLON': (1, 91),
+                 '_COMMA': (1, 91),
+                 '_CP': (1, 91),
+                 '_CSB': (1, 91),
+                 '_DEDENT': (1, 91),
+                 '_FOREACH': (1, 91),
+                 '_IF': (1, 91),
+                 '_IMPORT': (1, 91),
+                 '_INDENT': (1, 91),
+                 '_NL': (1, 91),
+                 '_OCB': (1, 91),
+                 '_OP': (1, 91),
+                 '_OSB': (1, 91),
+                 '_THEN': (1, 91),
+                 '_WHEN': (1, 91),
+                 '_WHILE': (1, 91),
+                 'cmp_operator': (0, 138)},
+            52: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 145),
+                 'path': (0, 147),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'service': (0, 146),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            53: {'$END': (1, 43),
+                 'AND': (1, 43),
+                 'BREAK': (1, 43),
+                 'BSLASH': (1, 43),
+                 'CONSTANT': (1, 43),
+                 'DASH': (1, 43),
+                 'DOUBLE_QUOTED': (1, 43),
+                 'EQUAL': (1, 43),
+                 'FALSE': (1, 43),
+                 'FLOAT': (1, 43),
+                 'FUNCTION_TYPE': (1, 43),
+                 'GREATER': (1, 43),
+                 'GREATER_EQUAL': (1, 43),
+                 'INT': (1, 43),
+                 'LESSER': (1, 43),
+                 'LESSER_EQUAL': (1, 43),
+                 'MODULUS': (1, 43),
+                 'MULTIPLIER': (1, 43),
+                 'NAME': (0, 148),
+                 'NOT': (1, 43),
+                 'NOT_EQUAL': (1, 43),
+                 'NULL': (1, 43),
+                 'OR': (1, 43),
+                 'PLUS': (1, 43),
+                 'POWER': (1, 43),
+                 'RAISE': (1, 43),
+                 'REGEXP': (1, 43),
+                 'RETURN': (1, 43),
+                 'SINGLE_QUOTED': (1, 43),
+                 'TRUE': (1, 43),
+                 'TRY': (1, 43),
+                 '_AS': (1, 43),
+                 '_CCB': (1, 43),
+                 '_COLON': (1, 43),
+                 '_COMMA': (1, 43),
+                 '_CP': (1, 43),
+                 '_CSB': (1, 43),
+                 '_DEDENT': (1, 43),
+                 '_FOREACH': (1, 43),
+                 '_IF': (1, 43),
+                 '_IMPORT': (1, 43),
+                 '_INDENT': (1, 43),
+                 '_NL': (1, 43),
+                 '_OCB': (1, 43),
+                 '_OP': (1, 43),
+                 '_OSB': (1, 43),
+                 '_THEN': (1, 43),
+                 '_WHEN': (1, 43),
+                 '_WHILE': (1, 43)},
+            54: {'_NL': (1, 101)},
+            55: {'$END': (1, 9),
+                 'AND': (1, 9),
+                 'BREAK': (1, 9),
+                 'BSLASH': (1, 9),
+                 'CONSTANT': (1, 9),
+                 'DASH': (1, 9),
+                 'DOUBLE_QUOTED': (1, 9),
+                 'EQUAL': (1, 9),
+                 'FALSE': (1, 9),
+                 'FLOAT': (1, 9),
+                 'FUNCTION_TYPE': (1, 9),
+                 'GREATER': (1, 9),
+                 'GREATER_EQUAL': (1, 9),
+                 'INT': (1, 9),
+                 'LESSER': (1, 9),
+                 'LESSER_EQUAL': (1, 9),
+                 'MODULUS': (1, 9),
+                 'MULTIPLIER': (1, 9),
+                 'NAME': (1, 9),
+                 'NOT': (1, 9),
+                 'NOT_EQUAL': (1, 9),
+                 'NULL': (1, 9),
+                 'OR': (1, 9),
+                 'PLUS': (1, 9),
+                 'POWER': (1, 9),
+                 'RAISE': (1, 9),
+                 'REGEXP': (1, 9),
+                 'RETURN': (1, 9),
+                 'SINGLE_QUOTED': (1, 9),
+                 'TRUE': (1, 9),
+                 'TRY': (1, 9),
+                 '_AS': (1, 9),
+                 '_CCB': (1, 9),
+                 '_COLON': (1, 9),
+                 '_COMMA': (1, 9),
+                 '_CP': (1, 9),
+                 '_CSB': (1, 9),
+                 '_DEDENT': (1, 9),
+                 '_FOREACH': (1, 9),
+                 '_IF': (1, 9),
+                 '_IMPORT': (1, 9),
+                 '_INDENT': (1, 9),
+                 '_NL': (1, 9),
+                 '_OCB': (1, 9),
+                 '_OP': (1, 9),
+                 '_OSB': (1, 9),
+                 '_THEN': (1, 9),
+                 '_WHEN': (1, 9),
+                 '_WHILE': (1, 9)},
+            56: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 101),
+                 '_OSB': (0, 1),
+                 'boolean': (0, 78),
+                 'entity': (0, 149),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'path': (0, 84),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            57: {'_NL': (0, 150)},
+            58: {'$END': (1, 168),
+                 'BREAK': (1, 168),
+                 'CONSTANT': (1, 168),
+                 'DOUBLE_QUOTED': (1, 168),
+                 'FALSE': (1, 168),
+                 'FLOAT': (1, 168),
+                 'FUNCTION_TYPE': (1, 168),
+                 'INT': (1, 168),
+                 'NAME': (1, 168),
+                 'NOT': (1, 168),
+                 'NULL': (1, 168),
+                 'RAISE': (1, 168),
+                 'REGEXP': (1, 168),
+                 'RETURN': (1, 168),
+                 'SINGLE_QUOTED': (1, 168),
+                 'TRUE': (1, 168),
+                 'TRY': (1, 168),
+                 '_COLON': (1, 168),
+                 '_DEDENT': (1, 168),
+                 '_FOREACH': (1, 168),
+                 '_IF': (1, 168),
+                 '_IMPORT': (1, 168),
+                 '_INDENT': (1, 168),
+                 '_NL': (1, 168),
+                 '_OCB': (1, 168),
+                 '_OP': (1, 168),
+                 '_OSB': (1, 168),
+                 '_THEN': (1, 168),
+                 '_WHEN': (1, 168),
+                 '_WHILE': (1, 168)},
+            59: {'_NL': (1, 105)},
+            60: {'_NL': (1, 155)},
+            61: {'$END': (1, 82),
+                 'AND': (1, 82),
+                 'BREAK': (1, 82),
+                 'BSLASH': (1, 82),
+                 'CONSTANT': (1, 82),
+                 'DASH': (1, 82),
+                 'DOUBLE_QUOTED': (1, 82),
+                 'EQUAL': (1, 82),
+                 'FALSE': (1, 82),
+                 'FLOAT': (1, 82),
+                 'FUNCTION_TYPE': (1, 82),
+                 'GREATER': (1, 82),
+                 'GREATER_EQUAL': (1, 82),
+                 'INT': (1, 82),
+                 'LESSER': (1, 82),
+                 'LESSER_EQUAL': (1, 82),
+                 'MODULUS': (1, 82),
+                 'MULTIPLIER': (1, 82),
+                 'NAME': (1, 82),
+                 'NOT': (1, 82),
+                 'NOT_EQUAL': (1, 82),
+                 'NULL': (1, 82),
+                 'OR': (1, 82),
+                 'PLUS': (1, 82),
+                 'RAISE': (1, 82),
+                 'REGEXP': (1, 82),
+                 'RETURN': (1, 82),
+                 'SINGLE_QUOTED': (1, 82),
+                 'TRUE': (1, 82),
+                 'TRY': (1, 82),
+                 '_AS': (1, 82),
+                 '_CCB': (1, 82),
+                 '_COLON': (1, 82),
+                 '_COMMA': (1, 82),
+                 '_CP': (1, 82),
+                 '_CSB': (1, 82),
+                 '_DEDENT': (1, 82),
+                 '_FOREACH': (1, 82),
+                 '_IF': (1, 82),
+                 '_IMPORT': (1, 82),
+                 '_INDENT': (1, 82),
+                 '_NL': (1, 82),
+                 '_OCB': (1, 82),
+                 '_OP': (1, 82),
+                 '_OSB': (1, 82),
+                 '_THEN': (1, 82),
+                 '_WHEN': (1, 82),
+                 '_WHILE': (1, 82)},
+            62: {'$END': (1, 175),
+                 'BREAK': (1, 175),
+                 'CONSTANT': (1, 175),
+                 'DOUBLE_QUOTED': (1, 175),
+                 'FALSE': (1, 175),
+                 'FLOAT': (1, 175),
+                 'FUNCTION_TYPE': (1, 175),
+                 'INT': (1, 175),
+                 'NAME': (1, 175),
+                 'NOT': (1, 175),
+                 'NULL': (1, 175),
+                 'RAISE': (1, 175),
+                 'REGEXP': (1, 175),
+                 'RETURN': (1, 175),
+                 'SINGLE_QUOTED': (1, 175),
+                 'TRUE': (1, 175),
+                 'TRY': (1, 175),
+                 '_COLON': (1, 175),
+                 '_DEDENT': (1, 175),
+                 '_FOREACH': (1, 175),
+                 '_IF': (1, 175),
+                 '_IMPORT': (1, 175),
+                 '_INDENT': (1, 175),
+                 '_NL': (1, 175),
+                 '_OCB': (1, 175),
+                 '_OP': (1, 175),
+                 '_OSB': (1, 175),
+                 '_THEN': (1, 175),
+                 '_WHEN': (1, 175),
+                 '_WHILE': (1, 175)},
+            63: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'expression': (0, 151),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            64: {'$END': (1, 209),
+                 'BREAK': (1, 209),
+                 'CONSTANT': (1, 209),
+                 'DOUBLE_QUOTED': (1, 209),
+                 'FALSE': (1, 209),
+                 'FLOAT': (1, 209),
+                 'FUNCTION_TYPE': (1, 209),
+                 'INT': (1, 209),
+                 'NAME': (1, 209),
+                 'NOT': (1, 209),
+                 'NULL': (1, 209),
+                 'RAISE': (1, 209),
+                 'REGEXP': (1, 209),
+                 'RETURN': (1, 209),
+                 'SINGLE_QUOTED': (1, 209),
+                 'TRUE': (1, 209),
+                 'TRY': (1, 209),
+                 '_COLON': (1, 209),
+                 '_DEDENT': (1, 209),
+                 '_FOREACH': (1, 209),
+                 '_IF': (1, 209),
+                 '_IMPORT': (1, 209),
+                 '_INDENT': (1, 209),
+                 '_NL': (1, 104),
+                 '_OCB': (1, 209),
+                 '_OP': (1, 209),
+                 '_OSB': (1, 209),
+                 '_THEN': (1, 209),
+                 '_WHEN': (1, 209),
+                 '_WHILE': (1, 209)},
+            65: {'$END': (1, 99),
+                 'AND': (1, 99),
+                 'BREAK': (1, 99),
+                 'BSLASH': (1, 99),
+                 'CONSTANT': (1, 99),
+                 'DASH': (1, 99),
+                 'DOUBLE_QUOTED': (1, 99),
+                 'EQUAL': (1, 99),
+                 'FALSE': (1, 99),
+                 'FLOAT': (1, 99),
+                 'FUNCTION_TYPE': (1, 99),
+                 'GREATER': (1, 99),
+                 'GREATER_EQUAL': (1, 99),
+                 'INT': (1, 99),
+                 'LESSER': (1, 99),
+                 'LESSER_EQUAL': (1, 99),
+                 'MODULUS': (1, 99),
+                 'MULTIPLIER': (1, 99),
+                 'NAME': (1, 99),
+                 'NOT': (1, 99),
+                 'NOT_EQUAL': (1, 99),
+                 'NULL': (1, 99),
+                 'OR': (1, 99),
+                 'PLUS': (1, 99),
+                 'POWER': (1, 99),
+                 'RAISE': (1, 99),
+                 'REGEXP': (1, 99),
+                 'RETURN': (1, 99),
+                 'SINGLE_QUOTED': (1, 99),
+                 'TRUE': (1, 99),
+                 'TRY': (1, 99),
+                 '_AS': (1, 99),
+                 '_CCB': (1, 99),
+                 '_COLON': (1, 99),
+                 '_COMMA': (1, 99),
+                 '_CP': (1, 99),
+                 '_CSB': (1, 99),
+                 '_DEDENT': (1, 99),
+                 '_FOREACH': (1, 99),
+                 '_IF': (1, 99),
+                 '_IMPORT': (1, 99),
+                 '_INDENT': (1, 99),
+                 '_NL': (1, 99),
+                 '_OCB': (1, 99),
+                 '_OP': (1, 99),
+                 '_OSB': (1, 99),
+                 '_THEN': (1, 99),
+                 '_WHEN': (1, 99),
+                 '_WHILE': (1, 99)},
+            66: {'$END': (1, 50),
+                 'AND': (1, 50),
+                 'BREAK': (1, 50),
+                 'BSLASH': (1, 50),
+                 'CONSTANT': (1, 50),
+                 'DASH': (1, 50),
+                 'DOUBLE_QUOTED': (1, 50),
+                 'EQUAL': (1, 50),
+                 'FALSE': (1, 50),
+                 'FLOAT': (1, 50),
+                 'FUNCTION_TYPE': (1, 50),
+                 'GREATER': (1, 50),
+                 'GREATER_EQUAL': (1, 50),
+                 'INT': (1, 50),
+                 'LESSER': (1, 50),
+                 'LESSER_EQUAL': (1, 50),
+                 'MODULUS': (1, 50),
+                 'MULTIPLIER': (1, 50),
+                 'NAME': (1, 50),
+                 'NOT': (1, 50),
+                 'NOT_EQUAL': (1, 50),
+                 'NULL': (1, 50),
+                 'OR': (1, 50),
+                 'PLUS': (1, 50),
+                 'POWER': (1, 50),
+                 'RAISE': (1, 50),
+                 'REGEXP': (1, 50),
+                 'RETURN': (1, 50),
+                 'SINGLE_QUOTED': (1, 50),
+                 'TRUE': (1, 50),
+                 'TRY': (1, 50),
+                 '_AS': (1, 50),
+                 '_CCB': (1, 50),
+                 '_COLON': (1, 50),
+                 '_COMMA': (1, 50),
+                 '_CP': (1, 50),
+                 '_CSB': (1, 50),
+                 '_DEDENT': (1, 50),
+                 '_FOREACH': (1, 50),
+                 '_IF': (1, 50),
+                 '_IMPORT': (1, 50),
+                 '_INDENT': (1, 50),
+                 '_NL': (1, 50),
+                 '_OCB': (1, 50),
+                 '_OP': (1, 50),
+                 '_OSB': (1, 50),
+                 '_THEN': (1, 50),
+                 '_WHEN': (1, 50),
+                 '_WHILE': (1, 50)},
+            67: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'expression': (0, 152),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            68: {'_NL': (1, 98)},
+            69: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'expression': (0, 153),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            70: {'$END': (1, 52),
+                 'AND': (1, 52),
+                 'BREAK': (1, 52),
+                 'BSLASH': (1, 52),
+                 'CONSTANT': (1, 52),
+                 'DASH': (1, 52),
+                 'DOUBLE_QUOTED': (1, 52),
+                 'EQUAL': (1, 52),
+                 'FALSE': (1, 52),
+                 'FLOAT': (1, 52),
+                 'FUNCTION_TYPE': (1, 52),
+                 'GREATER': (1, 52),
+                 'GREATER_EQUAL': (1, 52),
+                 'INT': (1, 52),
+                 'LESSER': (1, 52),
+                 'LESSER_EQUAL': (1, 52),
+                 'MODULUS': (1, 52),
+                 'MULTIPLIER': (1, 52),
+                 'NAME': (1, 52),
+                 'NOT': (1, 52),
+                 'NOT_EQUAL': (1, 52),
+                 'NULL': (1, 52),
+                 'OR': (1, 52),
+                 'PLUS': (1, 52),
+                 'POWER': (1, 52),
+                 'RAISE': (1, 52),
+                 'REGEXP': (1, 52),
+                 'RETURN': (1, 52),
+                 'SINGLE_QUOTED': (1, 52),
+                 'TRUE': (1, 52),
+                 'TRY': (1, 52),
+                 '_AS': (1, 52),
+                 '_CCB': (1, 52),
+                 '_COLON': (1, 52),
+                 '_COMMA': (1, 52),
+                 '_CP': (1, 52),
+                 '_CSB': (1, 52),
+                 '_DEDENT': (1, 52),
+                 '_FOREACH': (1, 52),
+                 '_IF': (1, 52),
+                 '_IMPORT': (1, 52),
+                 '_INDENT': (1, 52),
+                 '_NL': (1, 52),
+                 '_OCB': (1, 52),
+                 '_OP': (1, 52),
+                 '_OSB': (1, 52),
+                 '_THEN': (1, 52),
+                 '_WHEN': (1, 52),
+                 '_WHILE': (1, 52)},
+            71: {'_NL': (0, 154)},
+            72: {'_NL': (1, 106)},
+            73: {'_NL': (1, 107)},
+            74: {'$END': (1, 176),
+                 'BREAK': (1, 176),
+                 'CONSTANT': (1, 176),
+                 'DOUBLE_QUOTED': (1, 176),
+                 'FALSE': (1, 176),
+                 'FLOAT': (1, 176),
+                 'FUNCTION_TYPE': (1, 176),
+                 'INT': (1, 176),
+                 'NAME': (1, 176),
+                 'NOT': (1, 176),
+                 'NULL': (1, 176),
+                 'RAISE': (1, 176),
+                 'REGEXP': (1, 176),
+                 'RETURN': (1, 176),
+                 'SINGLE_QUOTED': (1, 176),
+                 'TRUE': (1, 176),
+                 'TRY': (1, 176),
+                 '_COLON': (1, 176),
+                 '_DEDENT': (1, 176),
+                 '_FOREACH': (1, 176),
+                 '_IF': (1, 176),
+                 '_IMPORT': (1, 176),
+                 '_INDENT': (1, 176),
+                 '_NL': (1, 176),
+                 '_OCB': (1, 176),
+                 '_OP': (1, 176),
+                 '_OSB': (1, 176),
+                 '_THEN': (1, 176),
+                 '_WHEN': (1, 176),
+                 '_WHILE': (1, 176)},
+            75: {'_NL': (1, 95)},
+            76: {'$END': (1, 10),
+                 'AND': (1, 10),
+                 'BREAK': (1, 10),
+                 'BSLASH': (1, 10),
+                 'CONSTANT': (1, 10),
+                 'DASH': (1, 10),
+                 'DOUBLE_QUOTED': (1, 10),
+                 'EQUAL': (1, 10),
+                 'FALSE': (1, 10),
+                 'FLOAT': (1, 10),
+                 'FUNCTION_TYPE': (1, 10),
+                 'GREATER': (1, 10),
+                 'GREATER_EQUAL': (1, 10),
+                 'INT': (1, 10),
+                 'LESSER': (1, 10),
+                 'LESSER_EQUAL': (1, 10),
+                 'MODULUS': (1, 10),
+                 'MULTIPLIER': (1, 10),
+                 'NAME': (1, 10),
+                 'NOT': (1, 10),
+                 'NOT_EQUAL': (1, 10),
+                 'NULL': (1, 10),
+                 'OR': (1, 10),
+                 'PLUS': (1, 10),
+                 'POWER': (1, 10),
+                 'RAISE': (1, 10),
+                 'REGEXP': (1, 10),
+                 'RETURN': (1, 10),
+                 'SINGLE_QUOTED': (1, 10),
+                 'TRUE': (1, 10),
+                 'TRY': (1, 10),
+                 '_AS': (1, 10),
+                 '_CCB': (1, 10),
+                 '_COLON': (1, 10),
+                 '_COMMA': (1, 10),
+                 '_CP': (1, 10),
+                 '_CSB': (1, 10),
+                 '_DEDENT': (1, 10),
+                 '_FOREACH': (1, 10),
+                 '_IF': (1, 10),
+                 '_IMPORT': (1, 10),
+                 '_INDENT': (1, 10),
+                 '_NL': (1, 10),
+                 '_OCB': (1, 10),
+                 '_OP': (1, 10),
+                 '_OSB': (1, 10),
+                 '_THEN': (1, 10),
+                 '_WHEN': (1, 10),
+                 '_WHILE': (1, 10)},
+            77: {'$END': (1, 85),
+                 'AND': (1, 85),
+                 'BREAK': (1, 85),
+                 'BSLASH': (1, 85),
+                 'CONSTANT': (1, 85),
+                 'DASH': (1, 85),
+                 'DOUBLE_QUOTED': (1, 85),
+                 'EQUAL': (1, 85),
+                 'FALSE': (1, 85),
+                 'FLOAT': (1, 85),
+                 'FUNCTION_TYPE': (1, 85),
+                 'GREATER': (1, 85),
+                 'GREATER_EQUAL': (1, 85),
+                 'INT': (1, 85),
+                 'LESSER': (1, 85),
+                 'LESSER_EQUAL': (1, 85),
+                 'MODULUS': (1, 85),
+                 'MULTIPLIER': (1, 85),
+                 'NAME': (1, 85),
+                 'NOT': (1, 85),
+                 'NOT_EQUAL': (1, 85),
+                 'NULL': (1, 85),
+                 'OR': (1, 85),
+                 'PLUS': (1, 85),
+                 'RAISE': (1, 85),
+                 'REGEXP': (1, 85),
+                 'RETURN': (1, 85),
+                 'SINGLE_QUOTED': (1, 85),
+                 'TRUE': (1, 85),
+                 'TRY': (1, 85),
+                 '_AS': (1, 85),
+                 '_CCB': (1, 85),
+                 '_COLON': (1, 85),
+                 '_COMMA': (1, 85),
+                 '_CP': (1, 85),
+                 '_CSB': (1, 85),
+                 '_DEDENT': (1, 85),
+                 '_FOREACH': (1, 85),
+                 '_IF': (1, 85),
+                 '_IMPORT': (1, 85),
+                 '_INDENT': (1, 85),
+                 '_NL': (1, 85),
+                 '_OCB': (1, 85),
+                 '_OP': (1, 85),
+                 '_OSB': (1, 85),
+                 '_THEN': (1, 85),
+                 '_WHEN': (1, 85),
+                 '_WHILE': (1, 85)},
+            78: {'$END': (1, 48),
+                 'AND': (1, 48),
+                 'BREAK': (1, 48),
+                 'BSLASH': (1, 48),
+                 'CONSTANT': (1, 48),
+                 'DASH': (1, 48),
+                 'DOUBLE_QUOTED': (1, 48),
+                 'EQUAL': (1, 48),
+                 'FALSE': (1, 48),
+                 'FLOAT': (1, 48),
+                 'FUNCTION_TYPE': (1, 48),
+                 'GREATER': (1, 48),
+                 'GREATER_EQUAL': (1, 48),
+                 'INT': (1, 48),
+                 'LESSER': (1, 48),
+                 'LESSER_EQUAL': (1, 48),
+                 'MODULUS': (1, 48),
+                 'MULTIPLIER': (1, 48),
+                 'NAME': (1, 48),
+                 'NOT': (1, 48),
+                 'NOT_EQUAL': (1, 48),
+                 'NULL': (1, 48),
+                 'OR': (1, 48),
+                 'PLUS': (1, 48),
+                 'POWER': (1, 48),
+                 'RAISE': (1, 48),
+                 'REGEXP': (1, 48),
+                 'RETURN': (1, 48),
+                 'SINGLE_QUOTED': (1, 48),
+                 'TRUE': (1, 48),
+                 'TRY': (1, 48),
+                 '_AS': (1, 48),
+                 '_CCB': (1, 48),
+                 '_COLON': (1, 48),
+                 '_COMMA': (1, 48),
+                 '_CP': (1, 48),
+                 '_CSB': (1, 48),
+                 '_DEDENT': (1, 48),
+                 '_FOREACH': (1, 48),
+                 '_IF': (1, 48),
+                 '_IMPORT': (1, 48),
+                 '_INDENT': (1, 48),
+                 '_NL': (1, 48),
+                 '_OCB': (1, 48),
+                 '_OP': (1, 48),
+                 '_OSB': (1, 48),
+                 '_THEN': (1, 48),
+                 '_WHEN': (1, 48),
+                 '_WHILE': (1, 48)},
+            79: {'_DEDENT': (0, 156), '_INDENT': (0, 155)},
+            80: {'_COMMA': (0, 158),
+                 '_CSB': (0, 159),
+                 '_NL': (0, 160),
+                 '__anon_star_0': (0, 157)},
+            81: {'$END': (1, 58),
+                 'AND': (1, 58),
+                 'BREAK': (1, 58),
+                 'BSLASH': (1, 58),
+                 'CONSTANT': (1, 58),
+                 'DASH': (1, 58),
+                 'DOUBLE_QUOTED': (1, 58),
+                 'EQUAL': (1, 58),
+                 'EQUALS': (1, 58),
+                 'FALSE': (1, 58),
+                 'FLOAT': (1, 58),
+                 'FUNCTION_TYPE': (1, 58),
+                 'GREATER': (1, 58),
+                 'GREATER_EQUAL': (1, 58),
+                 'INT': (1, 58),
+                 'LESSER': (1, 58),
+                 'LESSER_EQUAL': (1, 58),
+                 'MODULUS': (1, 58),
+                 'MULTIPLIER': (1, 58),
+                 'NAME': (1, 58),
+                 'NOT': (1, 58),
+                 'NOT_EQUAL': (1, 58),
+                 'NULL': (1, 58),
+                 'OR': (1, 58),
+                 'PLUS': (1, 58),
+                 'POWER': (1, 58),
+                 'RAISE': (1, 58),
+                 'REGEXP': (1, 58),
+                 'RETURN': (1, 58),
+                 'SINGLE_QUOTED': (1, 58),
+                 'TRUE': (1, 58),
+                 'TRY': (1, 58),
+                 '_AS': (1, 58),
+                 '_CCB': (1, 58),
+                 '_COLON': (1, 58),
+                 '_COMMA': (1, 58),
+                 '_CP': (1, 58),
+                 '_CSB': (1, 58),
+                 '_DEDENT': (1, 58),
+                 '_DOT': (0, 88),
+                 '_FOREACH': (1, 58),
+                 '_IF': (1, 58),
+                 '_IMPORT': (1, 58),
+                 '_INDENT': (1, 58),
+                 '_NL': (1, 58),
+                 '_OCB': (1, 58),
+                 '_OP': (1, 58),
+                 '_OSB': (0, 86),
+                 '_THEN': (1, 58),
+                 '_WHEN': (1, 58),
+                 '_WHILE': (1, 58),
+                 '__anon_star_2': (0, 87),
+                 'path_fragment': (0, 89)},
+            82: {'$END': (1, 19),
+                 'AND': (1, 19),
+                 'BREAK': (1, 19),
+                 'BSLASH': (1, 19),
+                 'CONSTANT': (1, 19),
+                 'DASH': (1, 19),
+                 'DOUBLE_QUOTED': (1, 19),
+                 'EQUAL': (1, 19),
+                 'FALSE': (1, 19),
+                 'FLOAT': (1, 19),
+                 'FUNCTION_TYPE': (1, 19),
+                 'GREATER': (1, 19),
+                 'GREATER_EQUAL': (1, 19),
+                 'INT': (1, 19),
+                 'LESSER': (1, 19),
+                 'LESSER_EQUAL': (1, 19),
+                 'MODULUS': (1, 19),
+                 'MULTIPLIER': (1, 19),
+                 'NAME': (1, 19),
+                 'NOT': (1, 19),
+                 'NOT_EQUAL': (1, 19),
+                 'NULL': (1, 19),
+                 'OR': (1, 19),
+                 'PLUS': (1, 19),
+                 'POWER': (1, 19),
+                 'RAISE': (1, 19),
+                 'REGEXP': (1, 19),
+                 'RETURN': (1, 19),
+                 'SINGLE_QUOTED': (1, 19),
+                 'TRUE': (1, 19),
+                 'TRY': (1, 19),
+                 '_AS': (1, 19),
+                 '_CCB': (1, 19),
+                 '_COLON': (1, 19),
+                 '_COMMA': (1, 19),
+                 '_CP': (1, 19),
+                 '_CSB': (1, 19),
+                 '_DEDENT': (1, 19),
+                 '_FOREACH': (1, 19),
+                 '_IF': (1, 19),
+                 '_IMPORT': (1, 19),
+                 '_INDENT': (1, 19),
+                 '_NL': (1, 19),
+                 '_OCB': (1, 19),
+                 '_OP': (1, 19),
+                 '_OSB': (1, 19),
+                 '_THEN': (1, 19),
+                 '_WHEN': (1, 19),
+                 '_WHILE': (1, 19)},
+            83: {'$END': (1, 79),
+                 'AND': (1, 79),
+                 'BREAK': (1, 79),
+                 'BSLASH': (1, 79),
+                 'CONSTANT': (1, 79),
+                 'DASH': (1, 79),
+                 'DOUBLE_QUOTED': (1, 79),
+                 'EQUAL': (1, 79),
+                 'FALSE': (1, 79),
+                 'FLOAT': (1, 79),
+                 'FUNCTION_TYPE': (1, 79),
+                 'GREATER': (1, 79),
+                 'GREATER_EQUAL': (1, 79),
+                 'INT': (1, 79),
+                 'LESSER': (1, 79),
+                 'LESSER_EQUAL': (1, 79),
+                 'MODULUS': (1, 79),
+                 'MULTIPLIER': (1, 79),
+                 'NAME': (1, 79),
+                 'NOT': (1, 79),
+                 'NOT_EQUAL': (1, 79),
+                 'NULL': (1, 79),
+                 'OR': (1, 79),
+                 'PLUS': (1, 79),
+                 'POWER': (1, 79),
+                 'RAISE': (1, 79),
+                 'REGEXP': (1, 79),
+                 'RETURN': (1, 79),
+                 'SINGLE_QUOTED': (1, 79),
+                 'TRUE': (1, 79),
+                 'TRY': (1, 79),
+                 '_AS': (1, 79),
+                 '_CCB': (1, 79),
+                 '_COLON': (1, 79),
+                 '_COMMA': (1, 79),
+                 '_CP': (1, 79),
+                 '_CSB': (1, 79),
+                 '_DEDENT': (1, 79),
+                 '_FOREACH': (1, 79),
+                 '_IF': (1, 79),
+                 '_IMPORT': (1, 79),
+                 '_INDENT': (1, 79),
+                 '_NL': (1, 79),
+                 '_OCB': (1, 79),
+                 '_OP': (1, 79),
+                 '_OSB': (1, 79),
+                 '_THEN': (1, 79),
+                 '_WHEN': (1, 79),
+                 '_WHILE': (1, 79)},
+            84: {'$END': (1, 100),
+                 'AND': (1, 100),
+                 'BREAK': (1, 100),
+                 'BSLASH': (1, 100),
+                 'CONSTANT': (1, 100),
+                 'DASH': (1, 100),
+                 'DOUBLE_QUOTED': (1, 100),
+                 'EQUAL': (1, 100),
+                 'FALSE': (1, 100),
+                 'FLOAT': (1, 100),
+                 'FUNCTION_TYPE': (1, 100),
+                 'GREATER': (1, 100),
+                 'GREATER_EQUAL': (1, 100),
+                 'INT': (1, 100),
+                 'LESSER': (1, 100),
+                 'LESSER_EQUAL': (1, 100),
+                 'MODULUS': (1, 100),
+                 'MULTIPLIER': (1, 100),
+                 'NAME': (1, 100),
+                 'NOT': (1, 100),
+                 'NOT_EQUAL': (1, 100),
+                 'NULL': (1, 100),
+                 'OR': (1, 100),
+                 'PLUS': (1, 100),
+                 'POWER': (1, 100),
+                 'RAISE': (1, 100),
+                 'REGEXP': (1, 100),
+                 'RETURN': (1, 100),
+                 'SINGLE_QUOTED': (1, 100),
+                 'TRUE': (1, 100),
+                 'TRY': (1, 100),
+                 '_AS': (1, 100),
+                 '_CCB': (1, 100),
+                 '_COLON': (1, 100),
+                 '_COMMA': (1, 100),
+                 '_CP': (1, 100),
+                 '_CSB': (1, 100),
+                 '_DEDENT': (1, 100),
+                 '_FOREACH': (1, 100),
+                 '_IF': (1, 100),
+                 '_IMPORT': (1, 100),
+                 '_INDENT': (1, 100),
+                 '_NL': (1, 100),
+                 '_OCB': (1, 100),
+                 '_OP': (1, 100),
+                 '_OSB': (1, 100),
+                 '_THEN': (1, 100),
+                 '_WHEN': (1, 100),
+                 '_WHILE': (1, 100)},
+            85: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 83),
+                 'expression': (0, 161),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 84),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            86: {'DOUBLE_QUOTED': (0, 28),
+                 'INT': (0, 162),
+                 'NAME': (0, 81),
+                 'SINGLE_QUOTED': (0, 42),
+                 '_OP': (0, 101),
+                 'inline_expression': (0, 40),
+                 'path': (0, 164),
+                 'string': (0, 163)},
+            87: {'$END': (1, 59),
+                 'AND': (1, 59),
+                 'BREAK': (1, 59),
+                 'BSLASH': (1, 59),
+                 'CONSTANT': (1, 59),
+                 'DASH': (1, 59),
+                 'DOUBLE_QUOTED': (1, 59),
+                 'EQUAL': (1, 59),
+                 'EQUALS': (1, 59),
+                 'FALSE': (1, 59),
+                 'FLOAT': (1, 59),
+                 'FUNCTION_TYPE': (1, 59),
+                 'GREATER': (1, 59),
+                 'GREATER_EQUAL': (1, 59),
+                 'INT': (1, 59),
+                 'LESSER': (1, 59),
+                 'LESSER_EQUAL': (1, 59),
+                 'MODULUS': (1, 59),
+                 'MULTIPLIER': (1, 59),
+                 'NAME': (1, 59),
+                 'NOT': (1, 59),
+                 'NOT_EQUAL': (1, 59),
+                 'NULL': (1, 59),
+                 'OR': (1, 59),
+                 'PLUS': (1, 59),
+                 'POWER': (1, 59),
+                 'RAISE': (1, 59),
+                 'REGEXP': (1, 59),
+                 'RETURN': (1, 59),
+                 'SINGLE_QUOTED': (1, 59),
+                 'TRUE': (1, 59),
+                 'TRY': (1, 59),
+                 '_AS': (1, 59),
+                 '_CCB': (1, 59),
+                 '_COLON': (1, 59),
+                 '_COMMA': (1, 59),
+                 '_CP': (1, 59),
+                 '_CSB': (1, 59),
+                 '_DEDENT': (1, 59),
+                 '_DOT': (0, 88),
+                 '_FOREACH': (1, 59),
+                 '_IF': (1, 59),
+                 '_IMPORT': (1, 59),
+                 '_INDENT': (1, 59),
+                 '_NL': (1, 59),
+                 '_OCB': (1, 59),
+                 '_OP': (1, 59),
+                 '_OSB': (0, 86),
+                 '_THEN': (1, 59),
+                 '_WHEN': (1, 59),
+                 '_WHILE': (1, 59),
+                 'path_fragment': (0, 165)},
+            88: {'NAME': (0, 166)},
+            89: {'$END': (1, 191),
+                 'AND': (1, 191),
+                 'BREAK': (1, 191),
+                 'BSLASH': (1, 191),
+                 'CONSTANT': (1, 191),
+                 'DASH': (1, 191),
+                 'DOUBLE_QUOTED': (1, 191),
+                 'EQUAL': (1, 191),
+                 'EQUALS': (1, 191),
+                 'FALSE': (1, 191),
+                 'FLOAT': (1, 191),
+                 'FUNCTION_TYPE': (1, 191),
+                 'GREATER': (1, 191),
+                 'GREATER_EQUAL': (1, 191),
+                 'INT': (1, 191),
+                 'LESSER': (1, 191),
+                 'LESSER_EQUAL': (1, 191),
+                 'MODULUS': (1, 191),
+                 'MULTIPLIER': (1, 191),
+                 'NAME': (1, 191),
+                 'NOT': (1, 191),
+                 'NOT_EQUAL': (1, 191),
+                 'NULL': (1, 191),
+                 'OR': (1, 191),
+                 'PLUS': (1, 191),
+                 'POWER': (1, 191),
+                 'RAISE': (1, 191),
+                 'REGEXP': (1, 191),
+                 'RETURN': (1, 191),
+                 'SINGLE_QUOTED': (1, 191),
+                 'TRUE': (1, 191),
+                 'TRY': (1, 191),
+                 '_AS': (1, 191),
+                 '_CCB': (1, 191),
+                 '_COLON': (1, 191),
+                 '_COMMA': (1, 191),
+                 '_CP': (1, 191),
+                 '_CSB': (1, 191),
+                 '_DEDENT': (1, 191),
+                 '_DOT': (1, 191),
+                 '_FOREACH': (1, 191),
+                 '_IF': (1, 191),
+                 '_IMPORT': (1, 191),
+                 '_INDENT': (1, 191),
+                 '_NL': (1, 191),
+                 '_OCB': (1, 191),
+                 '_OP': (1, 191),
+                 '_OSB': (1, 191),
+                 '_THEN': (1, 191),
+                 '_WHEN': (1, 191),
+                 '_WHILE': (1, 191)},
+            90: {'NAME': (1, 116),
+                 '_AS': (1, 116),
+                 '_COLON': (0, 85),
+                 '_CP': (1, 116),
+                 '_NL': (1, 116),
+                 '_THEN': (1, 116)},
+            91: {'NAME': (0, 113),
+                 '_AS': (0, 168),
+                 '_COLON': (0, 63),
+                 '_CP': (1, 123),
+                 '_NL': (1, 123),
+                 '_THEN': (1, 123),
+                 '__anon_star_3': (0, 167),
+                 'arguments': (0, 96),
+                 'output': (0, 169)},
+            92: {'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'INT': (0, 11),
+                 'NAME': (0, 81),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'REGEXP': (0, 53),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 'and_expression': (0, 27),
+                 'arith_expression': (0, 48),
+                 'boolean': (0, 78),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 24),
+                 'expression': (0, 170),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'mutation': (0, 171),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 147),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'regular_expression': (0, 47),
+                 'service': (0, 172),
+                 'string': (0, 50),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70)},
+            93: {'_NL': (1, 64)},
+            94: {'_CP': (1, 127),
+                 '_NL': (1, 127),
+                 '_THEN': (0, 12),
+                 '__anon_star_7': (0, 173),
+                 'chained_mutation': (0, 174)},
+            95: {'NAME': (0, 113),
+                 '_AS': (0, 168),
+                 '_COLON': (0, 63),
+                 '_CP': (1, 124),
+                 '_NL': (1, 124),
+                 '_THEN': (1, 124),
+                 'arguments': (0, 175),
+                 'output': (0, 176)},
+            96: {'$END': (1, 194),
+                 'BREAK': (1, 194),
+                 'CONSTANT': (1, 194),
+                 'DOUBLE_QUOTED': (1, 194),
+                 'FALSE': (1, 194),
+                 'FLOAT': (1, 194),
+                 'FUNCTION_TYPE': (1, 194),
+                 'INT': (1, 194),
+                 'NAME': (1, 194),
+                 'NOT': (1, 194),
+                 'NULL': (1, 194),
+                 'RAISE': (1, 194),
+                 'REGEXP': (1, 194),
+                 'RETURN': (1, 194),
+                 'SINGLE_QUOTED': (1, 194),
+                 'TRUE': (1, 194),
+                 'TRY': (1, 194),
+                 '_AS': (1, 194),
+                 '_COLON': (1, 194),
+                 '_CP': (1, 194),
+                 '_DEDENT': (1, 194),
+                 '_FOREACH': (1, 194),
+                 '_IF': (1, 194),
+                 '_IMPORT': (1, 194),
+                 '_INDENT': (1, 194),
+                 '_NL': (1, 194),
+                 '_OCB': (1, 194),
+                 '_OP': (1, 194),
+                 '_OSB': (1, 194),
+                 '_THEN': (1, 194),
+                 '_WHEN': (1, 194),
+                 '_WHILE': (1, 194)},
+            97: {'$END': (1, 181),
+                 'BREAK': (0, 68),
+                 'CONSTANT': (0, 66),
+                 'DOUBLE_QUOTED': (0, 28),
+                 'FALSE': (0, 55),
+                 'FLOAT': (0, 5),
+                 'FUNCTION_TYPE': (0, 10),
+                 'INT': (0, 11),
+                 'NAME': (0, 3),
+                 'NOT': (0, 46),
+                 'NULL': (0, 25),
+                 'RAISE': (0, 20),
+                 'REGEXP': (0, 53),
+                 'RETURN': (0, 15),
+                 'SINGLE_QUOTED': (0, 42),
+                 'TRUE': (0, 76),
+                 'TRY': (0, 60),
+                 '_COLON': (0, 63),
+                 '_FOREACH': (0, 56),
+                 '_IF': (0, 67),
+                 '_IMPORT': (0, 36),
+                 '_INDENT': (0, 18),
+                 '_OCB': (0, 9),
+                 '_OP': (0, 52),
+                 '_OSB': (0, 1),
+                 '_THEN': (0, 12),
+                 '_WHEN': (0, 23),
+                 '_WHILE': (0, 69),
+                 'absolute_expression': (0, 54),
+                 'and_expression': (0, 27),
+                 'arguments': (0, 30),
+                 'arith_expression': (0, 48),
+                 'assignment': (0, 2),
+                 'block': (0, 117),
+                 'boolean': (0, 78),
+                 'break_statement': (0, 14),
+                 'chained_mutation': (0, 13),
+                 'cmp_expression': (0, 51),
+                 'entity': (0, 24),
+                 'expression': (0, 75),
+                 'foreach_block': (0, 44),
+                 'foreach_statement': (0, 34),
+                 'function_block': (0, 37),
+                 'function_statement': (0, 71),
+                 'if_block': (0, 16),
+                 'if_statement': (0, 17),
+                 'imports': (0, 59),
+                 'indented_arguments': (0, 62),
+                 'indented_chain': (0, 32),
+                 'inline_expression': (0, 40),
+                 'list': (0, 41),
+                 'mul_expression': (0, 26),
+                 'mutation': (0, 31),
+                 'mutation_block': (0, 49),
+                 'number': (0, 38),
+                 'objects': (0, 19),
+                 'or_expression': (0, 22),
+                 'path': (0, 4),
+                 'pow_expression': (0, 61),
+                 'primary_expression': (0, 29),
+                 'raise_statement': (0, 72),
+                 'regular_expression': (0, 47),
+                 'return_statement': (0, 73),
+                 'rules': (0, 8),
+                 'service': (0, 57),
+                 'service_block': (0, 43),
+                 'string': (0, 50),
+                 'try_block': (0, 35),
+                 'try_statement': (0, 39),
+                 'unary_expression': (0, 77),
+                 'unary_operator': (0, 33),
+                 'values': (0, 65),
+                 'void': (0, 70),
+                 'when_block': (0, 58),
+                 'while_block': (0, 74),
+                 'while_statement': (0, 45)},
+            98: {},
+            99: {'$END': (1, 174),
+                 'BREAK': (1, 174),
+                 'CONSTANT': (1, 174),
+                 'DOUBLE_QUOTED': (1, 174),
+                 'FALSE': (1, 174),
+                 'FLOAT': (1, 174),
+                 'FUNCTION_TYPE': (1, 174),
+                 'INT': (1, 174),
+                 'NAME': (1, 174),
+                 'NOT': (1, 174),
+                 'NULL': (1, 174),
+                 'RAISE': (1, 174),
+                 'REGEXP': (1, 174),
+                 'RETURN': (1, 174),
+                 'SINGLE_QUOTED': (1, 174),
+                 'TRUE': (1, 174),
+                 'TRY': (1, 174),
+                 '_COLON': (1, 174),
+                 '_DEDENT': (1, 174),
+                 '_FOREACH': (1, 174),
+                 '_IF': (1, 174),
+                 '_IMPORT': (1, 174),
+                 '_INDENT': (1, 174),
+                 '_NL': (1, 174),
+                 '_OCB': (1, 174),
+                 '_OP': (1, 174),
+                 '_OSB': (1, 174),
+                 '_THEN': (1, 174),
+                 '_WHEN': (1, 174),
+                 '_WHILE': (1, 174)},
+            100: {'_DEDENT': (0, 178), '_INDENT': (0, 177)},
+            101: {'NAME': (0, 81),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'path': (0, 179),
+                  'service': (0, 146)},
+            102: {'_CCB': (0, 182),
+                  '_COMMA': (0, 181),
+                  '_NL': (0, 183),
+                  '__anon_star_1': (0, 180)},
+            103: {'_COLON': (0, 184)},
+            104: {'_COLON': (0, 185)},
+            105: {'$END': (1, 30),
+                  'AND': (1, 30),
+                  'BREAK': (1, 30),
+                  'BSLASH': (1, 30),
+                  'CONSTANT': (1, 30),
+                  'DASH': (1, 30),
+                  'DOUBLE_QUOTED': (1, 30),
+                  'EQUAL': (1, 30),
+                  'FALSE': (1, 30),
+                  'FLOAT': (1, 30),
+                  'FUNCTION_TYPE': (1, 30),
+                  'GREATER': (1, 30),
+                  'GREATER_EQUAL': (1, 30),
+                  'INT': (1, 30),
+                  'LESSER': (1, 30),
+                  'LESSER_EQUAL': (1, 30),
+                  'MODULUS': (1, 30),
+                  'MULTIPLIER': (1, 30),
+                  'NAME': (1, 30),
+                  'NOT': (1, 30),
+                  'NOT_EQUAL': (1, 30),
+                  'NULL': (1, 30),
+                  'OR': (1, 30),
+                  'PLUS': (1, 30),
+                  'POWER': (1, 30),
+                  'RAISE': (1, 30),
+                  'REGEXP': (1, 30),
+                  'RETURN': (1, 30),
+                  'SINGLE_QUOTED': (1, 30),
+                  'TRUE': (1, 30),
+                  'TRY': (1, 30),
+                  '_AS': (1, 30),
+                  '_CCB': (1, 30),
+                  '_COLON': (1, 30),
+                  '_COMMA': (1, 30),
+                  '_CP': (1, 30),
+                  '_CSB': (1, 30),
+                  '_DEDENT': (1, 30),
+                  '_FOREACH': (1, 30),
+                  '_IF': (1, 30),
+                  '_IMPORT': (1, 30),
+                  '_INDENT': (1, 30),
+                  '_NL': (1, 30),
+                  '_OCB': (1, 30),
+                  '_OP': (1, 30),
+                  '_OSB': (1, 30),
+                  '_THEN': (1, 30),
+                  '_WHEN': (1, 30),
+                  '_WHILE': (1, 30)},
+            106: {'NAME': (0, 187),
+                  '_NL': (1, 146),
+                  '_RETURNS': (0, 186),
+                  '__anon_star_9': (0, 189),
+                  'function_output': (0, 190),
+                  'typed_argument': (0, 188)},
+            107: {'$END': (1, 108),
+                  'BREAK': (1, 108),
+                  'CONSTANT': (1, 108),
+                  'DOUBLE_QUOTED': (1, 108),
+                  'FALSE': (1, 108),
+                  'FLOAT': (1, 108),
+                  'FUNCTION_TYPE': (1, 108),
+                  'INT': (1, 108),
+                  'NAME': (0, 113),
+                  'NOT': (1, 108),
+                  'NULL': (1, 108),
+                  'RAISE': (1, 108),
+                  'REGEXP': (1, 108),
+                  'RETURN': (1, 108),
+                  'SINGLE_QUOTED': (1, 108),
+                  'TRUE': (1, 108),
+                  'TRY': (1, 108),
+                  '_COLON': (0, 63),
+                  '_CP': (1, 108),
+                  '_DEDENT': (1, 108),
+                  '_FOREACH': (1, 108),
+                  '_IF': (1, 108),
+                  '_IMPORT': (1, 108),
+                  '_INDENT': (1, 108),
+                  '_NL': (1, 108),
+                  '_OCB': (1, 108),
+                  '_OP': (1, 108),
+                  '_OSB': (1, 108),
+                  '_THEN': (1, 108),
+                  '_WHEN': (1, 108),
+                  '_WHILE': (1, 108),
+                  '__anon_star_3': (0, 191),
+                  'arguments': (0, 96)},
+            108: {'$END': (1, 110),
+                  'BREAK': (1, 110),
+                  'CONSTANT': (1, 110),
+                  'DOUBLE_QUOTED': (1, 110),
+                  'FALSE': (1, 110),
+                  'FLOAT': (1, 110),
+                  'FUNCTION_TYPE': (1, 110),
+                  'INT': (1, 110),
+                  'NAME': (1, 110),
+                  'NOT': (1, 110),
+                  'NULL': (1, 110),
+                  'RAISE': (1, 110),
+                  'REGEXP': (1, 110),
+                  'RETURN': (1, 110),
+                  'SINGLE_QUOTED': (1, 110),
+                  'TRUE': (1, 110),
+                  'TRY': (1, 110),
+                  '_COLON': (1, 110),
+                  '_CP': (1, 110),
+                  '_DEDENT': (1, 110),
+                  '_FOREACH': (1, 110),
+                  '_IF': (1, 110),
+                  '_IMPORT': (1, 110),
+                  '_INDENT': (1, 110),
+                  '_NL': (1, 110),
+                  '_OCB': (1, 110),
+                  '_OP': (1, 110),
+                  '_OSB': (1, 110),
+                  '_THEN': (1, 110),
+                  '_WHEN': (1, 110),
+                  '_WHILE': (1, 110)},
+            109: {'_NL': (1, 97)},
+            110: {'_INDENT': (0, 193), 'nested_block': (0, 192)},
+            111: {'NAME': (0, 113),
+                  '_COLON': (0, 63),
+                  '_DEDENT': (0, 195),
+                  'arguments': (0, 194)},
+            112: {'_NL': (0, 196)},
+            113: {'_COLON': (0, 85)},
+            114: {'_NL': (0, 197)},
+            115: {'_DEDENT': (0, 199),
+                  '_THEN': (0, 12),
+                  'chained_mutation': (0, 198)},
+            116: {'_NL': (1, 160)},
+            117: {'$END': (1, 210),
+                  'BREAK': (1, 210),
+                  'CONSTANT': (1, 210),
+                  'DOUBLE_QUOTED': (1, 210),
+                  'FALSE': (1, 210),
+                  'FLOAT': (1, 210),
+                  'FUNCTION_TYPE': (1, 210),
+                  'INT': (1, 210),
+                  'NAME': (1, 210),
+                  'NOT': (1, 210),
+                  'NULL': (1, 210),
+                  'RAISE': (1, 210),
+                  'REGEXP': (1, 210),
+                  'RETURN': (1, 210),
+                  'SINGLE_QUOTED': (1, 210),
+                  'TRUE': (1, 210),
+                  'TRY': (1, 210),
+                  '_COLON': (1, 210),
+                  '_DEDENT': (1, 210),
+                  '_FOREACH': (1, 210),
+                  '_IF': (1, 210),
+                  '_IMPORT': (1, 210),
+                  '_INDENT': (1, 210),
+                  '_NL': (1, 104),
+                  '_OCB': (1, 210),
+                  '_OP': (1, 210),
+                  '_OSB': (1, 210),
+                  '_THEN': (1, 210),
+                  '_WHEN': (1, 210),
+                  '_WHILE': (1, 210)},
+            118: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 200),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            119: {'NAME': (0, 90),
+                  '_AS': (0, 168),
+                  '_COLON': (0, 63),
+                  '__anon_star_3': (0, 95),
+                  'arguments': (0, 96),
+                  'command': (0, 91),
+                  'output': (0, 201),
+                  'service_fragment': (0, 94)},
+            120: {'_NL': (0, 202)},
+            121: {'_NL': (1, 111),
+                  '_THEN': (0, 12),
+                  '__anon_star_4': (0, 204),
+                  'chained_mutation': (0, 203)},
+            122: {'CONSTANT': (1, 77),
+                  'DOUBLE_QUOTED': (1, 77),
+                  'FALSE': (1, 77),
+                  'FLOAT': (1, 77),
+                  'INT': (1, 77),
+                  'NAME': (1, 77),
+                  'NOT': (1, 77),
+                  'NULL': (1, 77),
+                  'REGEXP': (1, 77),
+                  'SINGLE_QUOTED': (1, 77),
+                  'TRUE': (1, 77),
+                  '_OCB': (1, 77),
+                  '_OP': (1, 77),
+                  '_OSB': (1, 77)},
+            123: {'CONSTANT': (1, 76),
+                  'DOUBLE_QUOTED': (1, 76),
+                  'FALSE': (1, 76),
+                  'FLOAT': (1, 76),
+                  'INT': (1, 76),
+                  'NAME': (1, 76),
+                  'NOT': (1, 76),
+                  'NULL': (1, 76),
+                  'REGEXP': (1, 76),
+                  'SINGLE_QUOTED': (1, 76),
+                  'TRUE': (1, 76),
+                  '_OCB': (1, 76),
+                  '_OP': (1, 76),
+                  '_OSB': (1, 76)},
+            124: {'CONSTANT': (1, 75),
+                  'DOUBLE_QUOTED': (1, 75),
+                  'FALSE': (1, 75),
+                  'FLOAT': (1, 75),
+                  'INT': (1, 75),
+                  'NAME': (1, 75),
+                  'NOT': (1, 75),
+                  'NULL': (1, 75),
+                  'REGEXP': (1, 75),
+                  'SINGLE_QUOTED': (1, 75),
+                  'TRUE': (1, 75),
+                  '_OCB': (1, 75),
+                  '_OP': (1, 75),
+                  '_OSB': (1, 75)},
+            125: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'boolean': (0, 78),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 205),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            126: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 206),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            127: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'boolean': (0, 78),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 207),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            128: {'$END': (1, 114),
+                  'BREAK': (1, 114),
+                  'CONSTANT': (1, 114),
+                  'DOUBLE_QUOTED': (1, 114),
+                  'FALSE': (1, 114),
+                  'FLOAT': (1, 114),
+                  'FUNCTION_TYPE': (1, 114),
+                  'INT': (1, 114),
+                  'NAME': (1, 114),
+                  'NOT': (1, 114),
+                  'NULL': (1, 114),
+                  'RAISE': (1, 114),
+                  'REGEXP': (1, 114),
+                  'RETURN': (1, 114),
+                  'SINGLE_QUOTED': (1, 114),
+                  'TRUE': (1, 114),
+                  'TRY': (1, 114),
+                  '_COLON': (1, 114),
+                  '_DEDENT': (1, 114),
+                  '_FOREACH': (1, 114),
+                  '_IF': (1, 114),
+                  '_IMPORT': (1, 114),
+                  '_INDENT': (0, 193),
+                  '_NL': (1, 114),
+                  '_OCB': (1, 114),
+                  '_OP': (1, 114),
+                  '_OSB': (1, 114),
+                  '_THEN': (1, 114),
+                  '_WHEN': (1, 114),
+                  '_WHILE': (1, 114),
+                  'nested_block': (0, 208)},
+            129: {'$END': (1, 83),
+                  'AND': (1, 83),
+                  'BREAK': (1, 83),
+                  'BSLASH': (1, 83),
+                  'CONSTANT': (1, 83),
+                  'DASH': (1, 83),
+                  'DOUBLE_QUOTED': (1, 83),
+                  'EQUAL': (1, 83),
+                  'FALSE': (1, 83),
+                  'FLOAT': (1, 83),
+                  'FUNCTION_TYPE': (1, 83),
+                  'GREATER': (1, 83),
+                  'GREATER_EQUAL': (1, 83),
+                  'INT': (1, 83),
+                  'LESSER': (1, 83),
+                  'LESSER_EQUAL': (1, 83),
+                  'MODULUS': (1, 83),
+                  'MULTIPLIER': (1, 83),
+                  'NAME': (1, 83),
+                  'NOT': (1, 83),
+                  'NOT_EQUAL': (1, 83),
+                  'NULL': (1, 83),
+                  'OR': (1, 83),
+                  'PLUS': (1, 83),
+                  'RAISE': (1, 83),
+                  'REGEXP': (1, 83),
+                  'RETURN': (1, 83),
+                  'SINGLE_QUOTED': (1, 83),
+                  'TRUE': (1, 83),
+                  'TRY': (1, 83),
+                  '_AS': (1, 83),
+                  '_CCB': (1, 83),
+                  '_COLON': (1, 83),
+                  '_COMMA': (1, 83),
+                  '_CP': (1, 83),
+                  '_CSB': (1, 83),
+                  '_DEDENT': (1, 83),
+                  '_FOREACH': (1, 83),
+                  '_IF': (1, 83),
+                  '_IMPORT': (1, 83),
+                  '_INDENT': (1, 83),
+                  '_NL': (1, 83),
+                  '_OCB': (1, 83),
+                  '_OP': (1, 83),
+                  '_OSB': (1, 83),
+                  '_THEN': (1, 83),
+                  '_WHEN': (1, 83),
+                  '_WHILE': (1, 83)},
+            130: {'_INDENT': (0, 193), 'nested_block': (0, 209)},
+            131: {'_AS': (0, 210)},
+            132: {'_INDENT': (0, 193), 'nested_block': (0, 211)},
+            133: {'$END': (1, 57),
+                  'AND': (1, 57),
+                  'BREAK': (1, 57),
+                  'BSLASH': (1, 57),
+                  'CONSTANT': (1, 57),
+                  'DASH': (1, 57),
+                  'DOUBLE_QUOTED': (1, 57),
+                  'EQUAL': (1, 57),
+                  'EQUALS': (1, 57),
+                  'FALSE': (1, 57),
+                  'FLOAT': (1, 57),
+                  'FUNCTION_TYPE': (1, 57),
+                  'GREATER': (1, 57),
+                  'GREATER_EQUAL': (1, 57),
+                  'INT': (1, 57),
+                  'LESSER': (1, 57),
+                  'LESSER_EQUAL': (1, 57),
+                  'MODULUS': (1, 57),
+                  'MULTIPLIER': (1, 57),
+                  'NAME': (1, 57),
+                  'NOT': (1, 57),
+                  'NOT_EQUAL': (1, 57),
+                  'NULL': (1, 57),
+                  'OR': (1, 57),
+                  'PLUS': (1, 57),
+                  'POWER': (1, 57),
+                  'RAISE': (1, 57),
+                  'REGEXP': (1, 57),
+                  'RETURN': (1, 57),
+                  'SINGLE_QUOTED': (1, 57),
+                  'TRUE': (1, 57),
+                  'TRY': (1, 57),
+                  '_AS': (1, 57),
+                  '_CCB': (1, 57),
+                  '_COLON': (1, 57),
+                  '_COMMA': (1, 57),
+                  '_CP': (1, 57),
+                  '_CSB': (1, 57),
+                  '_DEDENT': (1, 57),
+                  '_DOT': (0, 88),
+                  '_FOREACH': (1, 57),
+                  '_IF': (1, 57),
+                  '_IMPORT': (1, 57),
+                  '_INDENT': (1, 57),
+                  '_NL': (1, 57),
+                  '_OCB': (1, 57),
+                  '_OP': (1, 57),
+                  '_OSB': (0, 86),
+                  '_THEN': (1, 57),
+                  '_WHEN': (1, 57),
+                  '_WHILE': (1, 57),
+                  'path_fragment': (0, 165)},
+            134: {'_INDENT': (0, 193), 'nested_block': (0, 212)},
+            135: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'boolean': (0, 78),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 213),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            136: {'CONSTANT': (1, 72),
+                  'DOUBLE_QUOTED': (1, 72),
+                  'FALSE': (1, 72),
+                  'FLOAT': (1, 72),
+                  'INT': (1, 72),
+                  'NAME': (1, 72),
+                  'NOT': (1, 72),
+                  'NULL': (1, 72),
+                  'REGEXP': (1, 72),
+                  'SINGLE_QUOTED': (1, 72),
+                  'TRUE': (1, 72),
+                  '_OCB': (1, 72),
+                  '_OP': (1, 72),
+                  '_OSB': (1, 72)},
+            137: {'CONSTANT': (1, 73),
+                  'DOUBLE_QUOTED': (1, 73),
+                  'FALSE': (1, 73),
+                  'FLOAT': (1, 73),
+                  'INT': (1, 73),
+                  'NAME': (1, 73),
+                  'NOT': (1, 73),
+                  'NULL': (1, 73),
+                  'REGEXP': (1, 73),
+                  'SINGLE_QUOTED': (1, 73),
+                  'TRUE': (1, 73),
+                  '_OCB': (1, 73),
+                  '_OP': (1, 73),
+                  '_OSB': (1, 73)},
+            138: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'arith_expression': (0, 214),
+                  'boolean': (0, 78),
+                  'entity': (0, 83),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            139: {'CONSTANT': (1, 70),
+                  'DOUBLE_QUOTED': (1, 70),
+                  'FALSE': (1, 70),
+                  'FLOAT': (1, 70),
+                  'INT': (1, 70),
+                  'NAME': (1, 70),
+                  'NOT': (1, 70),
+                  'NULL': (1, 70),
+                  'REGEXP': (1, 70),
+                  'SINGLE_QUOTED': (1, 70),
+                  'TRUE': (1, 70),
+                  '_OCB': (1, 70),
+                  '_OP': (1, 70),
+                  '_OSB': (1, 70)},
+            140: {'CONSTANT': (1, 67),
+                  'DOUBLE_QUOTED': (1, 67),
+                  'FALSE': (1, 67),
+                  'FLOAT': (1, 67),
+                  'INT': (1, 67),
+                  'NAME': (1, 67),
+                  'NOT': (1, 67),
+                  'NULL': (1, 67),
+                  'REGEXP': (1, 67),
+                  'SINGLE_QUOTED': (1, 67),
+                  'TRUE': (1, 67),
+                  '_OCB': (1, 67),
+                  '_OP': (1, 67),
+                  '_OSB': (1, 67)},
+            141: {'CONSTANT': (1, 66),
+                  'DOUBLE_QUOTED': (1, 66),
+                  'FALSE': (1, 66),
+                  'FLOAT': (1, 66),
+                  'INT': (1, 66),
+                  'NAME': (1, 66),
+                  'NOT': (1, 66),
+                  'NULL': (1, 66),
+                  'REGEXP': (1, 66),
+                  'SINGLE_QUOTED': (1, 66),
+                  'TRUE': (1, 66),
+                  '_OCB': (1, 66),
+                  '_OP': (1, 66),
+                  '_OSB': (1, 66)},
+            142: {'CONSTANT': (1, 68),
+                  'DOUBLE_QUOTED': (1, 68),
+                  'FALSE': (1, 68),
+                  'FLOAT': (1, 68),
+                  'INT': (1, 68),
+                  'NAME': (1, 68),
+                  'NOT': (1, 68),
+                  'NULL': (1, 68),
+                  'REGEXP': (1, 68),
+                  'SINGLE_QUOTED': (1, 68),
+                  'TRUE': (1, 68),
+                  '_OCB': (1, 68),
+                  '_OP': (1, 68),
+                  '_OSB': (1, 68)},
+            143: {'CONSTANT': (1, 69),
+                  'DOUBLE_QUOTED': (1, 69),
+                  'FALSE': (1, 69),
+                  'FLOAT': (1, 69),
+                  'INT': (1, 69),
+                  'NAME': (1, 69),
+                  'NOT': (1, 69),
+                  'NULL': (1, 69),
+                  'REGEXP': (1, 69),
+                  'SINGLE_QUOTED': (1, 69),
+                  'TRUE': (1, 69),
+                  '_OCB': (1, 69),
+                  '_OP': (1, 69),
+                  '_OSB': (1, 69)},
+            144: {'CONSTANT': (1, 71),
+                  'DOUBLE_QUOTED': (1, 71),
+                  'FALSE': (1, 71),
+                  'FLOAT': (1, 71),
+                  'INT': (1, 71),
+                  'NAME': (1, 71),
+                  'NOT': (1, 71),
+                  'NULL': (1, 71),
+                  'REGEXP': (1, 71),
+                  'SINGLE_QUOTED': (1, 71),
+                  'TRUE': (1, 71),
+                  '_OCB': (1, 71),
+                  '_OP': (1, 71),
+                  '_OSB': (1, 71)},
+            145: {'OR': (0, 118), '_CP': (0, 215)},
+            146: {'_CP': (0, 216)},
+            147: {'$END': (1, 100),
+                  'AND': (1, 100),
+                  'BREAK': (1, 100),
+                  'BSLASH': (1, 100),
+                  'CONSTANT': (1, 100),
+                  'DASH': (1, 100),
+                  'DOUBLE_QUOTED': (1, 100),
+                  'EQUAL': (1, 100),
+                  'FALSE': (1, 100),
+                  'FLOAT': (1, 100),
+                  'FUNCTION_TYPE': (1, 100),
+                  'GREATER': (1, 100),
+                  'GREATER_EQUAL': (1, 100),
+                  'INT': (1, 100),
+                  'LESSER': (1, 100),
+                  'LESSER_EQUAL': (1, 100),
+                  'MODULUS': (1, 100),
+                  'MULTIPLIER': (1, 100),
+                  'NAME': (0, 90),
+                  'NOT': (1, 100),
+                  'NOT_EQUAL': (1, 100),
+                  'NULL': (1, 100),
+                  'OR': (1, 100),
+                  'PLUS': (1, 100),
+                  'POWER': (1, 100),
+                  'RAISE': (1, 100),
+                  'REGEXP': (1, 100),
+                  'RETURN': (1, 100),
+                  'SINGLE_QUOTED': (1, 100),
+                  'TRUE': (1, 100),
+                  'TRY': (1, 100),
+                  '_AS': (1, 100),
+                  '_CCB': (1, 100),
+                  '_COLON': (0, 63),
+                  '_COMMA': (1, 100),
+                  '_CP': (1, 100),
+                  '_CSB': (1, 100),
+                  '_DEDENT': (1, 100),
+                  '_FOREACH': (1, 100),
+                  '_IF': (1, 100),
+                  '_IMPORT': (1, 100),
+                  '_INDENT': (1, 100),
+                  '_NL': (1, 100),
+                  '_OCB': (1, 100),
+                  '_OP': (1, 100),
+                  '_OSB': (1, 100),
+                  '_THEN': (1, 100),
+                  '_WHEN': (1, 100),
+                  '_WHILE': (1, 100),
+                  '__anon_star_3': (0, 95),
+                  'arguments': (0, 96),
+                  'command': (0, 91),
+                  'service_fragment': (0, 94)},
+            148: {'$END': (1, 42),
+                  'AND': (1, 42),
+                  'BREAK': (1, 42),
+                  'BSLASH': (1, 42),
+                  'CONSTANT': (1, 42),
+                  'DASH': (1, 42),
+                  'DOUBLE_QUOTED': (1, 42),
+                  'EQUAL': (1, 42),
+                  'FALSE': (1, 42),
+                  'FLOAT': (1, 42),
+                  'FUNCTION_TYPE': (1, 42),
+                  'GREATER': (1, 42),
+                  'GREATER_EQUAL': (1, 42),
+                  'INT': (1, 42),
+                  'LESSER': (1, 42),
+                  'LESSER_EQUAL': (1, 42),
+                  'MODULUS': (1, 42),
+                  'MULTIPLIER': (1, 42),
+                  'NAME': (1, 42),
+                  'NOT': (1, 42),
+                  'NOT_EQUAL': (1, 42),
+                  'NULL': (1, 42),
+                  'OR': (1, 42),
+                  'PLUS': (1, 42),
+                  'POWER': (1, 42),
+                  'RAISE': (1, 42),
+                  'REGEXP': (1, 42),
+                  'RETURN': (1, 42),
+                  'SINGLE_QUOTED': (1, 42),
+                  'TRUE': (1, 42),
+                  'TRY': (1, 42),
+                  '_AS': (1, 42),
+                  '_CCB': (1, 42),
+                  '_COLON': (1, 42),
+                  '_COMMA': (1, 42),
+                  '_CP': (1, 42),
+                  '_CSB': (1, 42),
+                  '_DEDENT': (1, 42),
+                  '_FOREACH': (1, 42),
+                  '_IF': (1, 42),
+                  '_IMPORT': (1, 42),
+                  '_INDENT': (1, 42),
+                  '_NL': (1, 42),
+                  '_OCB': (1, 42),
+                  '_OP': (1, 42),
+                  '_OSB': (1, 42),
+                  '_THEN': (1, 42),
+                  '_WHEN': (1, 42),
+                  '_WHILE': (1, 42)},
+            149: {'_AS': (0, 168), 'output': (0, 217)},
+            150: {'$END': (1, 130),
+                  'BREAK': (1, 130),
+                  'CONSTANT': (1, 130),
+                  'DOUBLE_QUOTED': (1, 130),
+                  'FALSE': (1, 130),
+                  'FLOAT': (1, 130),
+                  'FUNCTION_TYPE': (1, 130),
+                  'INT': (1, 130),
+                  'NAME': (1, 130),
+                  'NOT': (1, 130),
+                  'NULL': (1, 130),
+                  'RAISE': (1, 130),
+                  'REGEXP': (1, 130),
+                  'RETURN': (1, 130),
+                  'SINGLE_QUOTED': (1, 130),
+                  'TRUE': (1, 130),
+                  'TRY': (1, 130),
+                  '_COLON': (1, 130),
+                  '_DEDENT': (1, 130),
+                  '_FOREACH': (1, 130),
+                  '_IF': (1, 130),
+                  '_IMPORT': (1, 130),
+                  '_INDENT': (0, 193),
+                  '_NL': (1, 130),
+                  '_OCB': (1, 130),
+                  '_OP': (1, 130),
+                  '_OSB': (1, 130),
+                  '_THEN': (1, 130),
+                  '_WHEN': (1, 130),
+                  '_WHILE': (1, 130),
+                  'nested_block': (0, 218)},
+            151: {'$END': (1, 118),
+                  'BREAK': (1, 118),
+                  'CONSTANT': (1, 118),
+                  'DOUBLE_QUOTED': (1, 118),
+                  'FALSE': (1, 118),
+                  'FLOAT': (1, 118),
+                  'FUNCTION_TYPE': (1, 118),
+                  'INT': (1, 118),
+                  'NAME': (1, 118),
+                  'NOT': (1, 118),
+                  'NULL': (1, 118),
+                  'RAISE': (1, 118),
+                  'REGEXP': (1, 118),
+                  'RETURN': (1, 118),
+                  'SINGLE_QUOTED': (1, 118),
+                  'TRUE': (1, 118),
+                  'TRY': (1, 118),
+                  '_AS': (1, 118),
+                  '_COLON': (1, 118),
+                  '_CP': (1, 118),
+                  '_DEDENT': (1, 118),
+                  '_FOREACH': (1, 118),
+                  '_IF': (1, 118),
+                  '_IMPORT': (1, 118),
+                  '_INDENT': (1, 118),
+                  '_NL': (1, 118),
+                  '_OCB': (1, 118),
+                  '_OP': (1, 118),
+                  '_OSB': (1, 118),
+                  '_THEN': (1, 118),
+                  '_WHEN': (1, 118),
+                  '_WHILE': (1, 118)},
+            152: {'_NL': (1, 131)},
+            153: {'_NL': (1, 142)},
+            154: {'_INDENT': (0, 193), 'nested_block': (0, 219)},
+            155: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_CSB': (0, 221),
+                  '_NL': (0, 222),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 220),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            156: {'_CSB': (0, 223)},
+            157: {'_COMMA': (0, 225), '_CSB': (0, 226), '_NL': (0, 224)},
+            158: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_NL': (0, 228),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 227),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            159: {'$END': (1, 25),
+                  'AND': (1, 25),
+                  'BREAK': (1, 25),
+                  'BSLASH': (1, 25),
+                  'CONSTANT': (1, 25),
+                  'DASH': (1, 25),
+                  'DOUBLE_QUOTED': (1, 25),
+                  'EQUAL': (1, 25),
+                  'FALSE': (1, 25),
+                  'FLOAT': (1, 25),
+                  'FUNCTION_TYPE': (1, 25),
+                  'GREATER': (1, 25),
+                  'GREATER_EQUAL': (1, 25),
+                  'INT': (1, 25),
+                  'LESSER': (1, 25),
+                  'LESSER_EQUAL': (1, 25),
+                  'MODULUS': (1, 25),
+                  'MULTIPLIER': (1, 25),
+                  'NAME': (1, 25),
+                  'NOT': (1, 25),
+                  'NOT_EQUAL': (1, 25),
+                  'NULL': (1, 25),
+                  'OR': (1, 25),
+                  'PLUS': (1, 25),
+                  'POWER': (1, 25),
+                  'RAISE': (1, 25),
+                  'REGEXP': (1, 25),
+                  'RETURN': (1, 25),
+                  'SINGLE_QUOTED': (1, 25),
+                  'TRUE': (1, 25),
+                  'TRY': (1, 25),
+                  '_AS': (1, 25),
+                  '_CCB': (1, 25),
+                  '_COLON': (1, 25),
+                  '_COMMA': (1, 25),
+                  '_CP': (1, 25),
+                  '_CSB': (1, 25),
+                  '_DEDENT': (1, 25),
+                  '_FOREACH': (1, 25),
+                  '_IF': (1, 25),
+                  '_IMPORT': (1, 25),
+                  '_INDENT': (1, 25),
+                  '_NL': (1, 25),
+                  '_OCB': (1, 25),
+                  '_OP': (1, 25),
+                  '_OSB': (1, 25),
+                  '_THEN': (1, 25),
+                  '_WHEN': (1, 25),
+                  '_WHILE': (1, 25)},
+            160: {'_DEDENT': (0, 229)},
+            161: {'$END': (1, 117),
+                  'BREAK': (1, 117),
+                  'CONSTANT': (1, 117),
+                  'DOUBLE_QUOTED': (1, 117),
+                  'FALSE': (1, 117),
+                  'FLOAT': (1, 117),
+                  'FUNCTION_TYPE': (1, 117),
+                  'INT': (1, 117),
+                  'NAME': (1, 117),
+                  'NOT': (1, 117),
+                  'NULL': (1, 117),
+                  'RAISE': (1, 117),
+                  'REGEXP': (1, 117),
+                  'RETURN': (1, 117),
+                  'SINGLE_QUOTED': (1, 117),
+                  'TRUE': (1, 117),
+                  'TRY': (1, 117),
+                  '_AS': (1, 117),
+                  '_COLON': (1, 117),
+                  '_CP': (1, 117),
+                  '_DEDENT': (1, 117),
+                  '_FOREACH': (1, 117),
+                  '_IF': (1, 117),
+                  '_IMPORT': (1, 117),
+                  '_INDENT': (1, 117),
+                  '_NL': (1, 117),
+                  '_OCB': (1, 117),
+                  '_OP': (1, 117),
+                  '_OSB': (1, 117),
+                  '_THEN': (1, 117),
+                  '_WHEN': (1, 117),
+                  '_WHILE': (1, 117)},
+            162: {'_CSB': (0, 230)},
+            163: {'_CSB': (0, 231)},
+            164: {'_CSB': (0, 232)},
+            165: {'$END': (1, 192),
+                  'AND': (1, 192),
+                  'BREAK': (1, 192),
+                  'BSLASH': (1, 192),
+                  'CONSTANT': (1, 192),
+                  'DASH': (1, 192),
+                  'DOUBLE_QUOTED': (1, 192),
+                  'EQUAL': (1, 192),
+                  'EQUALS': (1, 192),
+                  'FALSE': (1, 192),
+                  'FLOAT': (1, 192),
+                  'FUNCTION_TYPE': (1, 192),
+                  'GREATER': (1, 192),
+                  'GREATER_EQUAL': (1, 192),
+                  'INT': (1, 192),
+                  'LESSER': (1, 192),
+                  'LESSER_EQUAL': (1, 192),
+                  'MODULUS': (1, 192),
+                  'MULTIPLIER': (1, 192),
+                  'NAME': (1, 192),
+                  'NOT': (1, 192),
+                  'NOT_EQUAL': (1, 192),
+                  'NULL': (1, 192),
+                  'OR': (1, 192),
+                  'PLUS': (1, 192),
+                  'POWER': (1, 192),
+                  'RAISE': (1, 192),
+                  'REGEXP': (1, 192),
+                  'RETURN': (1, 192),
+                  'SINGLE_QUOTED': (1, 192),
+                  'TRUE': (1, 192),
+                  'TRY': (1, 192),
+                  '_AS': (1, 192),
+                  '_CCB': (1, 192),
+                  '_COLON': (1, 192),
+                  '_COMMA': (1, 192),
+                  '_CP': (1, 192),
+                  '_CSB': (1, 192),
+                  '_DEDENT': (1, 192),
+                  '_DOT': (1, 192),
+                  '_FOREACH': (1, 192),
+                  '_IF': (1, 192),
+                  '_IMPORT': (1, 192),
+                  '_INDENT': (1, 192),
+                  '_NL': (1, 192),
+                  '_OCB': (1, 192),
+                  '_OP': (1, 192),
+                  '_OSB': (1, 192),
+                  '_THEN': (1, 192),
+                  '_WHEN': (1, 192),
+                  '_WHILE': (1, 192)},
+            166: {'$END': (1, 53),
+                  'AND': (1, 53),
+                  'BREAK': (1, 53),
+                  'BSLASH': (1, 53),
+                  'CONSTANT': (1, 53),
+                  'DASH': (1, 53),
+                  'DOUBLE_QUOTED': (1, 53),
+                  'EQUAL': (1, 53),
+                  'EQUALS': (1, 53),
+                  'FALSE': (1, 53),
+                  'FLOAT': (1, 53),
+                  'FUNCTION_TYPE': (1, 53),
+                  'GREATER': (1, 53),
+                  'GREATER_EQUAL': (1, 53),
+                  'INT': (1, 53),
+                  'LESSER': (1, 53),
+                  'LESSER_EQUAL': (1, 53),
+                  'MODULUS': (1, 53),
+                  'MULTIPLIER': (1, 53),
+                  'NAME': (1, 53),
+                  'NOT': (1, 53),
+                  'NOT_EQUAL': (1, 53),
+                  'NULL': (1, 53),
+                  'OR': (1, 53),
+                  'PLUS': (1, 53),
+                  'POWER': (1, 53),
+                  'RAISE': (1, 53),
+                  'REGEXP': (1, 53),
+                  'RETURN': (1, 53),
+                  'SINGLE_QUOTED': (1, 53),
+                  'TRUE': (1, 53),
+                  'TRY': (1, 53),
+                  '_AS': (1, 53),
+                  '_CCB': (1, 53),
+                  '_COLON': (1, 53),
+                  '_COMMA': (1, 53),
+                  '_CP': (1, 53),
+                  '_CSB': (1, 53),
+                  '_DEDENT': (1, 53),
+                  '_DOT': (1, 53),
+                  '_FOREACH': (1, 53),
+                  '_IF': (1, 53),
+                  '_IMPORT': (1, 53),
+                  '_INDENT': (1, 53),
+                  '_NL': (1, 53),
+                  '_OCB': (1, 53),
+                  '_OP': (1, 53),
+                  '_OSB': (1, 53),
+                  '_THEN': (1, 53),
+                  '_WHEN': (1, 53),
+                  '_WHILE': (1, 53)},
+            167: {'NAME': (0, 113),
+                  '_AS': (0, 168),
+                  '_COLON': (0, 63),
+                  '_CP': (1, 122),
+                  '_NL': (1, 122),
+                  '_THEN': (1, 122),
+                  'arguments': (0, 175),
+                  'output': (0, 233)},
+            168: {'NAME': (0, 234)},
+            169: {'_CP': (1, 121), '_NL': (1, 121), '_THEN': (1, 121)},
+            170: {'_NL': (1, 63)},
+            171: {'_NL': (1, 61)},
+            172: {'_NL': (1, 62)},
+            173: {'_CP': (1, 128),
+                  '_NL': (1, 128),
+                  '_THEN': (0, 12),
+                  'chained_mutation': (0, 235)},
+            174: {'_CP': (1, 201), '_NL': (1, 201), '_THEN': (1, 201)},
+            175: {'$END': (1, 193),
+                  'BREAK': (1, 193),
+                  'CONSTANT': (1, 193),
+                  'DOUBLE_QUOTED': (1, 193),
+                  'FALSE': (1, 193),
+                  'FLOAT': (1, 193),
+                  'FUNCTION_TYPE': (1, 193),
+                  'INT': (1, 193),
+                  'NAME': (1, 193),
+                  'NOT': (1, 193),
+                  'NULL': (1, 193),
+                  'RAISE': (1, 193),
+                  'REGEXP': (1, 193),
+                  'RETURN': (1, 193),
+                  'SINGLE_QUOTED': (1, 193),
+                  'TRUE': (1, 193),
+                  'TRY': (1, 193),
+                  '_AS': (1, 193),
+                  '_COLON': (1, 193),
+                  '_CP': (1, 193),
+                  '_DEDENT': (1, 193),
+                  '_FOREACH': (1, 193),
+                  '_IF': (1, 193),
+                  '_IMPORT': (1, 193),
+                  '_INDENT': (1, 193),
+                  '_NL': (1, 193),
+                  '_OCB': (1, 193),
+                  '_OP': (1, 193),
+                  '_OSB': (1, 193),
+                  '_THEN': (1, 193),
+                  '_WHEN': (1, 193),
+                  '_WHILE': (1, 193)},
+            176: {'_CP': (1, 126), '_NL': (1, 126), '_THEN': (1, 126)},
+            177: {'DOUBLE_QUOTED': (0, 28),
+                  'NAME': (0, 81),
+                  'SINGLE_QUOTED': (0, 42),
+                  '_CCB': (0, 238),
+                  '_NL': (0, 236),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'key_value': (0, 237),
+                  'path': (0, 104),
+                  'string': (0, 103)},
+            178: {'_CCB': (0, 239)},
+            179: {'NAME': (0, 90),
+                  '_COLON': (0, 63),
+                  '__anon_star_3': (0, 95),
+                  'arguments': (0, 96),
+                  'command': (0, 91),
+                  'service_fragment': (0, 94)},
+            180: {'_CCB': (0, 240), '_COMMA': (0, 242), '_NL': (0, 241)},
+            181: {'DOUBLE_QUOTED': (0, 28),
+                  'NAME': (0, 81),
+                  'SINGLE_QUOTED': (0, 42),
+                  '_NL': (0, 244),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'key_value': (0, 243),
+                  'path': (0, 104),
+                  'string': (0, 103)},
+            182: {'$END': (1, 32),
+                  'AND': (1, 32),
+                  'BREAK': (1, 32),
+                  'BSLASH': (1, 32),
+                  'CONSTANT': (1, 32),
+                  'DASH': (1, 32),
+                  'DOUBLE_QUOTED': (1, 32),
+                  'EQUAL': (1, 32),
+                  'FALSE': (1, 32),
+                  'FLOAT': (1, 32),
+                  'FUNCTION_TYPE': (1, 32),
+                  'GREATER': (1, 32),
+                  'GREATER_EQUAL': (1, 32),
+                  'INT': (1, 32),
+                  'LESSER': (1, 32),
+                  'LESSER_EQUAL': (1, 32),
+                  'MODULUS': (1, 32),
+                  'MULTIPLIER': (1, 32),
+                  'NAME': (1, 32),
+                  'NOT': (1, 32),
+                  'NOT_EQUAL': (1, 32),
+                  'NULL': (1, 32),
+                  'OR': (1, 32),
+                  'PLUS': (1, 32),
+                  'POWER': (1, 32),
+                  'RAISE': (1, 32),
+                  'REGEXP': (1, 32),
+                  'RETURN': (1, 32),
+                  'SINGLE_QUOTED': (1, 32),
+                  'TRUE': (1, 32),
+                  'TRY': (1, 32),
+                  '_AS': (1, 32),
+                  '_CCB': (1, 32),
+                  '_COLON': (1, 32),
+                  '_COMMA': (1, 32),
+                  '_CP': (1, 32),
+                  '_CSB': (1, 32),
+                  '_DEDENT': (1, 32),
+                  '_FOREACH': (1, 32),
+                  '_IF': (1, 32),
+                  '_IMPORT': (1, 32),
+                  '_INDENT': (1, 32),
+                  '_NL': (1, 32),
+                  '_OCB': (1, 32),
+                  '_OP': (1, 32),
+                  '_OSB': (1, 32),
+                  '_THEN': (1, 32),
+                  '_WHEN': (1, 32),
+                  '_WHILE': (1, 32)},
+            183: {'_DEDENT': (0, 245)},
+            184: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 246),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            185: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 247),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            186: {'ANY_TYPE': (0, 256),
+                  'FLOAT_TYPE': (0, 257),
+                  'FUNCTION_TYPE': (0, 251),
+                  'INT_TYPE': (0, 248),
+                  'LIST_TYPE': (0, 250),
+                  'NUMBER_TYPE': (0, 252),
+                  'OBJECT_TYPE': (0, 255),
+                  'REGEXP_TYPE': (0, 249),
+                  'STRING_TYPE': (0, 253),
+                  'types': (0, 254)},
+            187: {'_COLON': (0, 258)},
+            188: {'NAME': (1, 205), '_NL': (1, 205), '_RETURNS': (1, 205)},
+            189: {'NAME': (0, 187),
+                  '_NL': (1, 149),
+                  '_RETURNS': (0, 186),
+                  'function_output': (0, 260),
+                  'typed_argument': (0, 259)},
+            190: {'_NL': (1, 148)},
+            191: {'$END': (1, 109),
+                  'BREAK': (1, 109),
+                  'CONSTANT': (1, 109),
+                  'DOUBLE_QUOTED': (1, 109),
+                  'FALSE': (1, 109),
+                  'FLOAT': (1, 109),
+                  'FUNCTION_TYPE': (1, 109),
+                  'INT': (1, 109),
+                  'NAME': (0, 113),
+                  'NOT': (1, 109),
+                  'NULL': (1, 109),
+                  'RAISE': (1, 109),
+                  'REGEXP': (1, 109),
+                  'RETURN': (1, 109),
+                  'SINGLE_QUOTED': (1, 109),
+                  'TRUE': (1, 109),
+                  'TRY': (1, 109),
+                  '_COLON': (0, 63),
+                  '_CP': (1, 109),
+                  '_DEDENT': (1, 109),
+                  '_FOREACH': (1, 109),
+                  '_IF': (1, 109),
+                  '_IMPORT': (1, 109),
+                  '_INDENT': (1, 109),
+                  '_NL': (1, 109),
+                  '_OCB': (1, 109),
+                  '_OP': (1, 109),
+                  '_OSB': (1, 109),
+                  '_THEN': (1, 109),
+                  '_WHEN': (1, 109),
+                  '_WHILE': (1, 109),
+                  'arguments': (0, 175)},
+            192: {'$END': (1, 136),
+                  'BREAK': (1, 136),
+                  'CONSTANT': (1, 136),
+                  'DOUBLE_QUOTED': (1, 136),
+                  'FALSE': (1, 136),
+                  'FLOAT': (1, 136),
+                  'FUNCTION_TYPE': (1, 136),
+                  'INT': (1, 136),
+                  'NAME': (1, 136),
+                  'NOT': (1, 136),
+                  'NULL': (1, 136),
+                  'RAISE': (1, 136),
+                  'REGEXP': (1, 136),
+                  'RETURN': (1, 136),
+                  'SINGLE_QUOTED': (1, 136),
+                  'TRUE': (1, 136),
+                  'TRY': (1, 136),
+                  '_COLON': (1, 136),
+                  '_DEDENT': (1, 136),
+                  '_ELSE': (0, 264),
+                  '_FOREACH': (1, 136),
+                  '_IF': (1, 136),
+                  '_IMPORT': (1, 136),
+                  '_INDENT': (1, 136),
+                  '_NL': (1, 136),
+                  '_OCB': (1, 136),
+                  '_OP': (1, 136),
+                  '_OSB': (1, 136),
+                  '_THEN': (1, 136),
+                  '_WHEN': (1, 136),
+                  '_WHILE': (1, 136),
+                  '__anon_star_8': (0, 261),
+                  'else_block': (0, 266),
+                  'else_statement': (0, 265),
+                  'elseif_block': (0, 262),
+                  'elseif_statement': (0, 263)},
+            193: {'BREAK': (0, 68),
+                  'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'FUNCTION_TYPE': (0, 10),
+                  'INT': (0, 11),
+                  'NAME': (0, 3),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'RAISE': (0, 20),
+                  'REGEXP': (0, 53),
+                  'RETURN': (0, 15),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  'TRY': (0, 60),
+                  '_COLON': (0, 63),
+                  '_FOREACH': (0, 56),
+                  '_IF': (0, 67),
+                  '_IMPORT': (0, 36),
+                  '_INDENT': (0, 18),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  '_THEN': (0, 12),
+                  '_WHEN': (0, 23),
+                  '_WHILE': (0, 69),
+                  '__anon_plus_11': (0, 267),
+                  'absolute_expression': (0, 54),
+                  'and_expression': (0, 27),
+                  'arguments': (0, 30),
+                  'arith_expression': (0, 48),
+                  'assignment': (0, 2),
+                  'block': (0, 64),
+                  'boolean': (0, 78),
+                  'break_statement': (0, 14),
+                  'chained_mutation': (0, 13),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 24),
+                  'expression': (0, 75),
+                  'foreach_block': (0, 44),
+                  'foreach_statement': (0, 34),
+                  'function_block': (0, 37),
+                  'function_statement': (0, 71),
+                  'if_block': (0, 16),
+                  'if_statement': (0, 17),
+                  'imports': (0, 59),
+                  'indented_arguments': (0, 62),
+                  'indented_chain': (0, 32),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'mutation': (0, 31),
+                  'mutation_block': (0, 49),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 4),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'raise_statement': (0, 72),
+                  'regular_expression': (0, 47),
+                  'return_statement': (0, 73),
+                  'rules': (0, 8),
+                  'service': (0, 57),
+                  'service_block': (0, 43),
+                  'string': (0, 50),
+                  'try_block': (0, 35),
+                  'try_statement': (0, 39),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70),
+                  'when_block': (0, 58),
+                  'while_block': (0, 74),
+                  'while_statement': (0, 45)},
+            194: {'_NL': (0, 268)},
+            195: {'$END': (1, 164),
+                  'BREAK': (1, 164),
+                  'CONSTANT': (1, 164),
+                  'DOUBLE_QUOTED': (1, 164),
+                  'FALSE': (1, 164),
+                  'FLOAT': (1, 164),
+                  'FUNCTION_TYPE': (1, 164),
+                  'INT': (1, 164),
+                  'NAME': (1, 164),
+                  'NOT': (1, 164),
+                  'NULL': (1, 164),
+                  'RAISE': (1, 164),
+                  'REGEXP': (1, 164),
+                  'RETURN': (1, 164),
+                  'SINGLE_QUOTED': (1, 164),
+                  'TRUE': (1, 164),
+                  'TRY': (1, 164),
+                  '_COLON': (1, 164),
+                  '_DEDENT': (1, 164),
+                  '_FOREACH': (1, 164),
+                  '_IF': (1, 164),
+                  '_IMPORT': (1, 164),
+                  '_INDENT': (1, 164),
+                  '_NL': (1, 164),
+                  '_OCB': (1, 164),
+                  '_OP': (1, 164),
+                  '_OSB': (1, 164),
+                  '_THEN': (1, 164),
+                  '_WHEN': (1, 164),
+                  '_WHILE': (1, 164)},
+            196: {'_DEDENT': (1, 198), '_THEN': (1, 198)},
+            197: {'NAME': (1, 208), '_COLON': (1, 208), '_DEDENT': (1, 208)},
+            198: {'_NL': (0, 269)},
+            199: {'$END': (1, 115),
+                  'BREAK': (1, 115),
+                  'CONSTANT': (1, 115),
+                  'DOUBLE_QUOTED': (1, 115),
+                  'FALSE': (1, 115),
+                  'FLOAT': (1, 115),
+                  'FUNCTION_TYPE': (1, 115),
+                  'INT': (1, 115),
+                  'NAME': (1, 115),
+                  'NOT': (1, 115),
+                  'NULL': (1, 115),
+                  'RAISE': (1, 115),
+                  'REGEXP': (1, 115),
+                  'RETURN': (1, 115),
+                  'SINGLE_QUOTED': (1, 115),
+                  'TRUE': (1, 115),
+                  'TRY': (1, 115),
+                  '_COLON': (1, 115),
+                  '_DEDENT': (1, 115),
+                  '_FOREACH': (1, 115),
+                  '_IF': (1, 115),
+                  '_IMPORT': (1, 115),
+                  '_INDENT': (1, 115),
+                  '_NL': (1, 115),
+                  '_OCB': (1, 115),
+                  '_OP': (1, 115),
+                  '_OSB': (1, 115),
+                  '_THEN': (1, 115),
+                  '_WHEN': (1, 115),
+                  '_WHILE': (1, 115)},
+            200: {'$END': (1, 93),
+                  'AND': (0, 126),
+                  'BREAK': (1, 93),
+                  'CONSTANT': (1, 93),
+                  'DOUBLE_QUOTED': (1, 93),
+                  'FALSE': (1, 93),
+                  'FLOAT': (1, 93),
+                  'FUNCTION_TYPE': (1, 93),
+                  'INT': (1, 93),
+                  'NAME': (1, 93),
+                  'NOT': (1, 93),
+                  'NULL': (1, 93),
+                  'OR': (1, 93),
+                  'RAISE': (1, 93),
+                  'REGEXP': (1, 93),
+                  'RETURN': (1, 93),
+                  'SINGLE_QUOTED': (1, 93),
+                  'TRUE': (1, 93),
+                  'TRY': (1, 93),
+                  '_AS': (1, 93),
+                  '_CCB': (1, 93),
+                  '_COLON': (1, 93),
+                  '_COMMA': (1, 93),
+                  '_CP': (1, 93),
+                  '_CSB': (1, 93),
+                  '_DEDENT': (1, 93),
+                  '_FOREACH': (1, 93),
+                  '_IF': (1, 93),
+                  '_IMPORT': (1, 93),
+                  '_INDENT': (1, 93),
+                  '_NL': (1, 93),
+                  '_OCB': (1, 93),
+                  '_OP': (1, 93),
+                  '_OSB': (1, 93),
+                  '_THEN': (1, 93),
+                  '_WHEN': (1, 93),
+                  '_WHILE': (1, 93)},
+            201: {'_NL': (0, 270)},
+            202: {'_INDENT': (0, 193), 'nested_block': (0, 271)},
+            203: {'_NL': (1, 196), '_THEN': (1, 196)},
+            204: {'_NL': (1, 112),
+                  '_THEN': (0, 12),
+                  'chained_mutation': (0, 272)},
+            205: {'$END': (1, 84),
+                  'AND': (1, 84),
+                  'BREAK': (1, 84),
+                  'BSLASH': (1, 84),
+                  'CONSTANT': (1, 84),
+                  'DASH': (1, 84),
+                  'DOUBLE_QUOTED': (1, 84),
+                  'EQUAL': (1, 84),
+                  'FALSE': (1, 84),
+                  'FLOAT': (1, 84),
+                  'FUNCTION_TYPE': (1, 84),
+                  'GREATER': (1, 84),
+                  'GREATER_EQUAL': (1, 84),
+                  'INT': (1, 84),
+                  'LESSER': (1, 84),
+                  'LESSER_EQUAL': (1, 84),
+                  'MODULUS': (1, 84),
+                  'MULTIPLIER': (1, 84),
+                  'NAME': (1, 84),
+                  'NOT': (1, 84),
+                  'NOT_EQUAL': (1, 84),
+                  'NULL': (1, 84),
+                  'OR': (1, 84),
+                  'PLUS': (1, 84),
+                  'RAISE': (1, 84),
+                  'REGEXP': (1, 84),
+                  'RETURN': (1, 84),
+                  'SINGLE_QUOTED': (1, 84),
+                  'TRUE': (1, 84),
+                  'TRY': (1, 84),
+                  '_AS': (1, 84),
+                  '_CCB': (1, 84),
+                  '_COLON': (1, 84),
+                  '_COMMA': (1, 84),
+                  '_CP': (1, 84),
+                  '_CSB': (1, 84),
+                  '_DEDENT': (1, 84),
+                  '_FOREACH': (1, 84),
+                  '_IF': (1, 84),
+                  '_IMPORT': (1, 84),
+                  '_INDENT': (1, 84),
+                  '_NL': (1, 84),
+                  '_OCB': (1, 84),
+                  '_OP': (1, 84),
+                  '_OSB': (1, 84),
+                  '_THEN': (1, 84),
+                  '_WHEN': (1, 84),
+                  '_WHILE': (1, 84)},
+            206: {'$END': (1, 90),
+                  'AND': (1, 90),
+                  'BREAK': (1, 90),
+                  'CONSTANT': (1, 90),
+                  'DOUBLE_QUOTED': (1, 90),
+                  'EQUAL': (0, 141),
+                  'FALSE': (1, 90),
+                  'FLOAT': (1, 90),
+                  'FUNCTION_TYPE': (1, 90),
+                  'GREATER': (0, 139),
+                  'GREATER_EQUAL': (0, 144),
+                  'INT': (1, 90),
+                  'LESSER': (0, 143),
+                  'LESSER_EQUAL': (0, 142),
+                  'NAME': (1, 90),
+                  'NOT': (1, 90),
+                  'NOT_EQUAL': (0, 140),
+                  'NULL': (1, 90),
+                  'OR': (1, 90),
+                  'RAISE': (1, 90),
+                  'REGEXP': (1, 90),
+                  'RETURN': (1, 90),
+                  'SINGLE_QUOTED': (1, 90),
+                  'TRUE': (1, 90),
+                  'TRY': (1, 90),
+                  '_AS': (1, 90),
+                  '_CCB': (1, 90),
+                  '_COLON': (1, 90),
+                  '_COMMA': (1, 90),
+                  '_CP': (1, 90),
+                  '_CSB': (1, 90),
+                  '_DEDENT': (1, 90),
+                  '_FOREACH': (1, 90),
+                  '_IF': (1, 90),
+                  '_IMPORT': (1, 90),
+                  '_INDENT': (1, 90),
+                  '_NL': (1, 90),
+                  '_OCB': (1, 90),
+                  '_OP': (1, 90),
+                  '_OSB': (1, 90),
+                  '_THEN': (1, 90),
+                  '_WHEN': (1, 90),
+                  '_WHILE': (1, 90),
+                  'cmp_operator': (0, 138)},
+            207: {'$END': (1, 80),
+                  'AND': (1, 80),
+                  'BREAK': (1, 80),
+                  'BSLASH': (1, 80),
+                  'CONSTANT': (1, 80),
+                  'DASH': (1, 80),
+                  'DOUBLE_QUOTED': (1, 80),
+                  'EQUAL': (1, 80),
+                  'FALSE': (1, 80),
+                  'FLOAT': (1, 80),
+                  'FUNCTION_TYPE': (1, 80),
+                  'GREATER': (1, 80),
+                  'GREATER_EQUAL': (1, 80),
+                  'INT': (1, 80),
+                  'LESSER': (1, 80),
+                  'LESSER_EQUAL': (1, 80),
+                  'MODULUS': (1, 80),
+                  'MULTIPLIER': (1, 80),
+                  'NAME': (1, 80),
+                  'NOT': (1, 80),
+                  'NOT_EQUAL': (1, 80),
+                  'NULL': (1, 80),
+                  'OR': (1, 80),
+                  'PLUS': (1, 80),
+                  'RAISE': (1, 80),
+                  'REGEXP': (1, 80),
+                  'RETURN': (1, 80),
+                  'SINGLE_QUOTED': (1, 80),
+                  'TRUE': (1, 80),
+                  'TRY': (1, 80),
+                  '_AS': (1, 80),
+                  '_CCB': (1, 80),
+                  '_COLON': (1, 80),
+                  '_COMMA': (1, 80),
+                  '_CP': (1, 80),
+                  '_CSB': (1, 80),
+                  '_DEDENT': (1, 80),
+                  '_FOREACH': (1, 80),
+                  '_IF': (1, 80),
+                  '_IMPORT': (1, 80),
+                  '_INDENT': (1, 80),
+                  '_NL': (1, 80),
+                  '_OCB': (1, 80),
+                  '_OP': (1, 80),
+                  '_OSB': (1, 80),
+                  '_THEN': (1, 80),
+                  '_WHEN': (1, 80),
+                  '_WHILE': (1, 80)},
+            208: {'$END': (1, 113),
+                  'BREAK': (1, 113),
+                  'CONSTANT': (1, 113),
+                  'DOUBLE_QUOTED': (1, 113),
+                  'FALSE': (1, 113),
+                  'FLOAT': (1, 113),
+                  'FUNCTION_TYPE': (1, 113),
+                  'INT': (1, 113),
+                  'NAME': (1, 113),
+                  'NOT': (1, 113),
+                  'NULL': (1, 113),
+                  'RAISE': (1, 113),
+                  'REGEXP': (1, 113),
+                  'RETURN': (1, 113),
+                  'SINGLE_QUOTED': (1, 113),
+                  'TRUE': (1, 113),
+                  'TRY': (1, 113),
+                  '_COLON': (1, 113),
+                  '_DEDENT': (1, 113),
+                  '_FOREACH': (1, 113),
+                  '_IF': (1, 113),
+                  '_IMPORT': (1, 113),
+                  '_INDENT': (1, 113),
+                  '_NL': (1, 113),
+                  '_OCB': (1, 113),
+                  '_OP': (1, 113),
+                  '_OSB': (1, 113),
+                  '_THEN': (1, 113),
+                  '_WHEN': (1, 113),
+                  '_WHILE': (1, 113)},
+            209: {'$END': (1, 141),
+                  'BREAK': (1, 141),
+                  'CONSTANT': (1, 141),
+                  'DOUBLE_QUOTED': (1, 141),
+                  'FALSE': (1, 141),
+                  'FLOAT': (1, 141),
+                  'FUNCTION_TYPE': (1, 141),
+                  'INT': (1, 141),
+                  'NAME': (1, 141),
+                  'NOT': (1, 141),
+                  'NULL': (1, 141),
+                  'RAISE': (1, 141),
+                  'REGEXP': (1, 141),
+                  'RETURN': (1, 141),
+                  'SINGLE_QUOTED': (1, 141),
+                  'TRUE': (1, 141),
+                  'TRY': (1, 141),
+                  '_COLON': (1, 141),
+                  '_DEDENT': (1, 141),
+                  '_FOREACH': (1, 141),
+                  '_IF': (1, 141),
+                  '_IMPORT': (1, 141),
+                  '_INDENT': (1, 141),
+                  '_NL': (1, 141),
+                  '_OCB': (1, 141),
+                  '_OP': (1, 141),
+                  '_OSB': (1, 141),
+                  '_THEN': (1, 141),
+                  '_WHEN': (1, 141),
+                  '_WHILE': (1, 141)},
+            210: {'NAME': (0, 273)},
+            211: {'$END': (1, 157),
+                  'BREAK': (1, 157),
+                  'CONSTANT': (1, 157),
+                  'DOUBLE_QUOTED': (1, 157),
+                  'FALSE': (1, 157),
+                  'FINALLY': (0, 275),
+                  'FLOAT': (1, 157),
+                  'FUNCTION_TYPE': (1, 157),
+                  'INT': (1, 157),
+                  'NAME': (1, 157),
+                  'NOT': (1, 157),
+                  'NULL': (1, 157),
+                  'RAISE': (1, 157),
+                  'REGEXP': (1, 157),
+                  'RETURN': (1, 157),
+                  'SINGLE_QUOTED': (1, 157),
+                  'TRUE': (1, 157),
+                  'TRY': (1, 157),
+                  '_CATCH': (0, 278),
+                  '_COLON': (1, 157),
+                  '_DEDENT': (1, 157),
+                  '_FOREACH': (1, 157),
+                  '_IF': (1, 157),
+                  '_IMPORT': (1, 157),
+                  '_INDENT': (1, 157),
+                  '_NL': (1, 157),
+                  '_OCB': (1, 157),
+                  '_OP': (1, 157),
+                  '_OSB': (1, 157),
+                  '_THEN': (1, 157),
+                  '_WHEN': (1, 157),
+                  '_WHILE': (1, 157),
+                  'catch_block': (0, 276),
+                  'catch_statement': (0, 277),
+                  'finally_block': (0, 274),
+                  'finally_statement': (0, 279)},
+            212: {'$END': (1, 143),
+                  'BREAK': (1, 143),
+                  'CONSTANT': (1, 143),
+                  'DOUBLE_QUOTED': (1, 143),
+                  'FALSE': (1, 143),
+                  'FLOAT': (1, 143),
+                  'FUNCTION_TYPE': (1, 143),
+                  'INT': (1, 143),
+                  'NAME': (1, 143),
+                  'NOT': (1, 143),
+                  'NULL': (1, 143),
+                  'RAISE': (1, 143),
+                  'REGEXP': (1, 143),
+                  'RETURN': (1, 143),
+                  'SINGLE_QUOTED': (1, 143),
+                  'TRUE': (1, 143),
+                  'TRY': (1, 143),
+                  '_COLON': (1, 143),
+                  '_DEDENT': (1, 143),
+                  '_FOREACH': (1, 143),
+                  '_IF': (1, 143),
+                  '_IMPORT': (1, 143),
+                  '_INDENT': (1, 143),
+                  '_NL': (1, 143),
+                  '_OCB': (1, 143),
+                  '_OP': (1, 143),
+                  '_OSB': (1, 143),
+                  '_THEN': (1, 143),
+                  '_WHEN': (1, 143),
+                  '_WHILE': (1, 143)},
+            213: {'$END': (1, 86),
+                  'AND': (1, 86),
+                  'BREAK': (1, 86),
+                  'BSLASH': (0, 122),
+                  'CONSTANT': (1, 86),
+                  'DASH': (1, 86),
+                  'DOUBLE_QUOTED': (1, 86),
+                  'EQUAL': (1, 86),
+                  'FALSE': (1, 86),
+                  'FLOAT': (1, 86),
+                  'FUNCTION_TYPE': (1, 86),
+                  'GREATER': (1, 86),
+                  'GREATER_EQUAL': (1, 86),
+                  'INT': (1, 86),
+                  'LESSER': (1, 86),
+                  'LESSER_EQUAL': (1, 86),
+                  'MODULUS': (0, 124),
+                  'MULTIPLIER': (0, 123),
+                  'NAME': (1, 86),
+                  'NOT': (1, 86),
+                  'NOT_EQUAL': (1, 86),
+                  'NULL': (1, 86),
+                  'OR': (1, 86),
+                  'PLUS': (1, 86),
+                  'RAISE': (1, 86),
+                  'REGEXP': (1, 86),
+                  'RETURN': (1, 86),
+                  'SINGLE_QUOTED': (1, 86),
+                  'TRUE': (1, 86),
+                  'TRY': (1, 86),
+                  '_AS': (1, 86),
+                  '_CCB': (1, 86),
+                  '_COLON': (1, 86),
+                  '_COMMA': (1, 86),
+                  '_CP': (1, 86),
+                  '_CSB': (1, 86),
+                  '_DEDENT': (1, 86),
+                  '_FOREACH': (1, 86),
+                  '_IF': (1, 86),
+                  '_IMPORT': (1, 86),
+                  '_INDENT': (1, 86),
+                  '_NL': (1, 86),
+                  '_OCB': (1, 86),
+                  '_OP': (1, 86),
+                  '_OSB': (1, 86),
+                  '_THEN': (1, 86),
+                  '_WHEN': (1, 86),
+                  '_WHILE': (1, 86),
+                  'mul_operator': (0, 125)},
+            214: {'$END': (1, 88),
+                  'AND': (1, 88),
+                  'BREAK': (1, 88),
+                  'CONSTANT': (1, 88),
+                  'DASH': (0, 136),
+                  'DOUBLE_QUOTED': (1, 88),
+                  'EQUAL': (1, 88),
+                  'FALSE': (1, 88),
+                  'FLOAT': (1, 88),
+                  'FUNCTION_TYPE': (1, 88),
+                  'GREATER': (1, 88),
+                  'GREATER_EQUAL': (1, 88),
+                  'INT': (1, 88),
+                  'LESSER': (1, 88),
+                  'LESSER_EQUAL': (1, 88),
+                  'NAME': (1, 88),
+                  'NOT': (1, 88),
+                  'NOT_EQUAL': (1, 88),
+                  'NULL': (1, 88),
+                  'OR': (1, 88),
+                  'PLUS': (0, 137),
+                  'RAISE': (1, 88),
+                  'REGEXP': (1, 88),
+                  'RETURN': (1, 88),
+                  'SINGLE_QUOTED': (1, 88),
+                  'TRUE': (1, 88),
+                  'TRY': (1, 88),
+                  '_AS': (1, 88),
+                  '_CCB': (1, 88),
+                  '_COLON': (1, 88),
+                  '_COMMA': (1, 88),
+                  '_CP': (1, 88),
+                  '_CSB': (1, 88),
+                  '_DEDENT': (1, 88),
+                  '_FOREACH': (1, 88),
+                  '_IF': (1, 88),
+                  '_IMPORT': (1, 88),
+                  '_INDENT': (1, 88),
+                  '_NL': (1, 88),
+                  '_OCB': (1, 88),
+                  '_OP': (1, 88),
+                  '_OSB': (1, 88),
+                  '_THEN': (1, 88),
+                  '_WHEN': (1, 88),
+                  '_WHILE': (1, 88),
+                  'arith_operator': (0, 135)},
+            215: {'$END': (1, 78),
+                  'AND': (1, 78),
+                  'BREAK': (1, 78),
+                  'BSLASH': (1, 78),
+                  'CONSTANT': (1, 78),
+                  'DASH': (1, 78),
+                  'DOUBLE_QUOTED': (1, 78),
+                  'EQUAL': (1, 78),
+                  'FALSE': (1, 78),
+                  'FLOAT': (1, 78),
+                  'FUNCTION_TYPE': (1, 78),
+                  'GREATER': (1, 78),
+                  'GREATER_EQUAL': (1, 78),
+                  'INT': (1, 78),
+                  'LESSER': (1, 78),
+                  'LESSER_EQUAL': (1, 78),
+                  'MODULUS': (1, 78),
+                  'MULTIPLIER': (1, 78),
+                  'NAME': (1, 78),
+                  'NOT': (1, 78),
+                  'NOT_EQUAL': (1, 78),
+                  'NULL': (1, 78),
+                  'OR': (1, 78),
+                  'PLUS': (1, 78),
+                  'POWER': (1, 78),
+                  'RAISE': (1, 78),
+                  'REGEXP': (1, 78),
+                  'RETURN': (1, 78),
+                  'SINGLE_QUOTED': (1, 78),
+                  'TRUE': (1, 78),
+                  'TRY': (1, 78),
+                  '_AS': (1, 78),
+                  '_CCB': (1, 78),
+                  '_COLON': (1, 78),
+                  '_COMMA': (1, 78),
+                  '_CP': (1, 78),
+                  '_CSB': (1, 78),
+                  '_DEDENT': (1, 78),
+                  '_FOREACH': (1, 78),
+                  '_IF': (1, 78),
+                  '_IMPORT': (1, 78),
+                  '_INDENT': (1, 78),
+                  '_NL': (1, 78),
+                  '_OCB': (1, 78),
+                  '_OP': (1, 78),
+                  '_OSB': (1, 78),
+                  '_THEN': (1, 78),
+                  '_WHEN': (1, 78),
+                  '_WHILE': (1, 78)},
+            216: {'$END': (1, 44),
+                  'AND': (1, 44),
+                  'BREAK': (1, 44),
+                  'BSLASH': (1, 44),
+                  'CONSTANT': (1, 44),
+                  'DASH': (1, 44),
+                  'DOUBLE_QUOTED': (1, 44),
+                  'EQUAL': (1, 44),
+                  'EQUALS': (1, 44),
+                  'FALSE': (1, 44),
+                  'FLOAT': (1, 44),
+                  'FUNCTION_TYPE': (1, 44),
+                  'GREATER': (1, 44),
+                  'GREATER_EQUAL': (1, 44),
+                  'INT': (1, 44),
+                  'LESSER': (1, 44),
+                  'LESSER_EQUAL': (1, 44),
+                  'MODULUS': (1, 44),
+                  'MULTIPLIER': (1, 44),
+                  'NAME': (1, 44),
+                  'NOT': (1, 44),
+                  'NOT_EQUAL': (1, 44),
+                  'NULL': (1, 44),
+                  'OR': (1, 44),
+                  'PLUS': (1, 44),
+                  'POWER': (1, 44),
+                  'RAISE': (1, 44),
+                  'REGEXP': (1, 44),
+                  'RETURN': (1, 44),
+                  'SINGLE_QUOTED': (1, 44),
+                  'TRUE': (1, 44),
+                  'TRY': (1, 44),
+                  '_AS': (1, 44),
+                  '_CCB': (1, 44),
+                  '_COLON': (1, 44),
+                  '_COMMA': (1, 44),
+                  '_CP': (1, 44),
+                  '_CSB': (1, 44),
+                  '_DEDENT': (1, 44),
+                  '_DOT': (1, 44),
+                  '_FOREACH': (1, 44),
+                  '_IF': (1, 44),
+                  '_IMPORT': (1, 44),
+                  '_INDENT': (1, 44),
+                  '_NL': (1, 44),
+                  '_OCB': (1, 44),
+                  '_OP': (1, 44),
+                  '_OSB': (1, 44),
+                  '_THEN': (1, 44),
+                  '_WHEN': (1, 44),
+                  '_WHILE': (1, 44)},
+            217: {'_NL': (1, 140)},
+            218: {'$END': (1, 129),
+                  'BREAK': (1, 129),
+                  'CONSTANT': (1, 129),
+                  'DOUBLE_QUOTED': (1, 129),
+                  'FALSE': (1, 129),
+                  'FLOAT': (1, 129),
+                  'FUNCTION_TYPE': (1, 129),
+                  'INT': (1, 129),
+                  'NAME': (1, 129),
+                  'NOT': (1, 129),
+                  'NULL': (1, 129),
+                  'RAISE': (1, 129),
+                  'REGEXP': (1, 129),
+                  'RETURN': (1, 129),
+                  'SINGLE_QUOTED': (1, 129),
+                  'TRUE': (1, 129),
+                  'TRY': (1, 129),
+                  '_COLON': (1, 129),
+                  '_DEDENT': (1, 129),
+                  '_FOREACH': (1, 129),
+                  '_IF': (1, 129),
+                  '_IMPORT': (1, 129),
+                  '_INDENT': (1, 129),
+                  '_NL': (1, 129),
+                  '_OCB': (1, 129),
+                  '_OP': (1, 129),
+                  '_OSB': (1, 129),
+                  '_THEN': (1, 129),
+                  '_WHEN': (1, 129),
+                  '_WHILE': (1, 129)},
+            219: {'$END': (1, 150),
+                  'BREAK': (1, 150),
+                  'CONSTANT': (1, 150),
+                  'DOUBLE_QUOTED': (1, 150),
+                  'FALSE': (1, 150),
+                  'FLOAT': (1, 150),
+                  'FUNCTION_TYPE': (1, 150),
+                  'INT': (1, 150),
+                  'NAME': (1, 150),
+                  'NOT': (1, 150),
+                  'NULL': (1, 150),
+                  'RAISE': (1, 150),
+                  'REGEXP': (1, 150),
+                  'RETURN': (1, 150),
+                  'SINGLE_QUOTED': (1, 150),
+                  'TRUE': (1, 150),
+                  'TRY': (1, 150),
+                  '_COLON': (1, 150),
+                  '_DEDENT': (1, 150),
+                  '_FOREACH': (1, 150),
+                  '_IF': (1, 150),
+                  '_IMPORT': (1, 150),
+                  '_INDENT': (1, 150),
+                  '_NL': (1, 150),
+                  '_OCB': (1, 150),
+                  '_OP': (1, 150),
+                  '_OSB': (1, 150),
+                  '_THEN': (1, 150),
+                  '_WHEN': (1, 150),
+                  '_WHILE': (1, 150)},
+            220: {'_COMMA': (0, 158),
+                  '_CSB': (0, 282),
+                  '_NL': (0, 281),
+                  '__anon_star_0': (0, 280)},
+            221: {'$END': (1, 20),
+                  'AND': (1, 20),
+                  'BREAK': (1, 20),
+                  'BSLASH': (1, 20),
+                  'CONSTANT': (1, 20),
+                  'DASH': (1, 20),
+                  'DOUBLE_QUOTED': (1, 20),
+                  'EQUAL': (1, 20),
+                  'FALSE': (1, 20),
+                  'FLOAT': (1, 20),
+                  'FUNCTION_TYPE': (1, 20),
+                  'GREATER': (1, 20),
+                  'GREATER_EQUAL': (1, 20),
+                  'INT': (1, 20),
+                  'LESSER': (1, 20),
+                  'LESSER_EQUAL': (1, 20),
+                  'MODULUS': (1, 20),
+                  'MULTIPLIER': (1, 20),
+                  'NAME': (1, 20),
+                  'NOT': (1, 20),
+                  'NOT_EQUAL': (1, 20),
+                  'NULL': (1, 20),
+                  'OR': (1, 20),
+                  'PLUS': (1, 20),
+                  'POWER': (1, 20),
+                  'RAISE': (1, 20),
+                  'REGEXP': (1, 20),
+                  'RETURN': (1, 20),
+                  'SINGLE_QUOTED': (1, 20),
+                  'TRUE': (1, 20),
+                  'TRY': (1, 20),
+                  '_AS': (1, 20),
+                  '_CCB': (1, 20),
+                  '_COLON': (1, 20),
+                  '_COMMA': (1, 20),
+                  '_CP': (1, 20),
+                  '_CSB': (1, 20),
+                  '_DEDENT': (1, 20),
+                  '_FOREACH': (1, 20),
+                  '_IF': (1, 20),
+                  '_IMPORT': (1, 20),
+                  '_INDENT': (1, 20),
+                  '_NL': (1, 20),
+                  '_OCB': (1, 20),
+                  '_OP': (1, 20),
+                  '_OSB': (1, 20),
+                  '_THEN': (1, 20),
+                  '_WHEN': (1, 20),
+                  '_WHILE': (1, 20)},
+            222: {'_DEDENT': (0, 283)},
+            223: {'$END': (1, 27),
+                  'AND': (1, 27),
+                  'BREAK': (1, 27),
+                  'BSLASH': (1, 27),
+                  'CONSTANT': (1, 27),
+                  'DASH': (1, 27),
+                  'DOUBLE_QUOTED': (1, 27),
+                  'EQUAL': (1, 27),
+                  'FALSE': (1, 27),
+                  'FLOAT': (1, 27),
+                  'FUNCTION_TYPE': (1, 27),
+                  'GREATER': (1, 27),
+                  'GREATER_EQUAL': (1, 27),
+                  'INT': (1, 27),
+                  'LESSER': (1, 27),
+                  'LESSER_EQUAL': (1, 27),
+                  'MODULUS': (1, 27),
+                  'MULTIPLIER': (1, 27),
+                  'NAME': (1, 27),
+                  'NOT': (1, 27),
+                  'NOT_EQUAL': (1, 27),
+                  'NULL': (1, 27),
+                  'OR': (1, 27),
+                  'PLUS': (1, 27),
+                  'POWER': (1, 27),
+                  'RAISE': (1, 27),
+                  'REGEXP': (1, 27),
+                  'RETURN': (1, 27),
+                  'SINGLE_QUOTED': (1, 27),
+                  'TRUE': (1, 27),
+                  'TRY': (1, 27),
+                  '_AS': (1, 27),
+                  '_CCB': (1, 27),
+                  '_COLON': (1, 27),
+                  '_COMMA': (1, 27),
+                  '_CP': (1, 27),
+                  '_CSB': (1, 27),
+                  '_DEDENT': (1, 27),
+                  '_FOREACH': (1, 27),
+                  '_IF': (1, 27),
+                  '_IMPORT': (1, 27),
+                  '_INDENT': (1, 27),
+                  '_NL': (1, 27),
+                  '_OCB': (1, 27),
+                  '_OP': (1, 27),
+                  '_OSB': (1, 27),
+                  '_THEN': (1, 27),
+                  '_WHEN': (1, 27),
+                  '_WHILE': (1, 27)},
+            224: {'_DEDENT': (0, 284)},
+            225: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_NL': (0, 285),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 286),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            226: {'$END': (1, 26),
+                  'AND': (1, 26),
+                  'BREAK': (1, 26),
+                  'BSLASH': (1, 26),
+                  'CONSTANT': (1, 26),
+                  'DASH': (1, 26),
+                  'DOUBLE_QUOTED': (1, 26),
+                  'EQUAL': (1, 26),
+                  'FALSE': (1, 26),
+                  'FLOAT': (1, 26),
+                  'FUNCTION_TYPE': (1, 26),
+                  'GREATER': (1, 26),
+                  'GREATER_EQUAL': (1, 26),
+                  'INT': (1, 26),
+                  'LESSER': (1, 26),
+                  'LESSER_EQUAL': (1, 26),
+                  'MODULUS': (1, 26),
+                  'MULTIPLIER': (1, 26),
+                  'NAME': (1, 26),
+                  'NOT': (1, 26),
+                  'NOT_EQUAL': (1, 26),
+                  'NULL': (1, 26),
+                  'OR': (1, 26),
+                  'PLUS': (1, 26),
+                  'POWER': (1, 26),
+                  'RAISE': (1, 26),
+                  'REGEXP': (1, 26),
+                  'RETURN': (1, 26),
+                  'SINGLE_QUOTED': (1, 26),
+                  'TRUE': (1, 26),
+                  'TRY': (1, 26),
+                  '_AS': (1, 26),
+                  '_CCB': (1, 26),
+                  '_COLON': (1, 26),
+                  '_COMMA': (1, 26),
+                  '_CP': (1, 26),
+                  '_CSB': (1, 26),
+                  '_DEDENT': (1, 26),
+                  '_FOREACH': (1, 26),
+                  '_IF': (1, 26),
+                  '_IMPORT': (1, 26),
+                  '_INDENT': (1, 26),
+                  '_NL': (1, 26),
+                  '_OCB': (1, 26),
+                  '_OP': (1, 26),
+                  '_OSB': (1, 26),
+                  '_THEN': (1, 26),
+                  '_WHEN': (1, 26),
+                  '_WHILE': (1, 26)},
+            227: {'_COMMA': (1, 184), '_CSB': (1, 184), '_NL': (1, 184)},
+            228: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 287),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            229: {'_CSB': (0, 288)},
+            230: {'$END': (1, 56),
+                  'AND': (1, 56),
+                  'BREAK': (1, 56),
+                  'BSLASH': (1, 56),
+                  'CONSTANT': (1, 56),
+                  'DASH': (1, 56),
+                  'DOUBLE_QUOTED': (1, 56),
+                  'EQUAL': (1, 56),
+                  'EQUALS': (1, 56),
+                  'FALSE': (1, 56),
+                  'FLOAT': (1, 56),
+                  'FUNCTION_TYPE': (1, 56),
+                  'GREATER': (1, 56),
+                  'GREATER_EQUAL': (1, 56),
+                  'INT': (1, 56),
+                  'LESSER': (1, 56),
+                  'LESSER_EQUAL': (1, 56),
+                  'MODULUS': (1, 56),
+                  'MULTIPLIER': (1, 56),
+                  'NAME': (1, 56),
+                  'NOT': (1, 56),
+                  'NOT_EQUAL': (1, 56),
+                  'NULL': (1, 56),
+                  'OR': (1, 56),
+                  'PLUS': (1, 56),
+                  'POWER': (1, 56),
+                  'RAISE': (1, 56),
+                  'REGEXP': (1, 56),
+                  'RETURN': (1, 56),
+                  'SINGLE_QUOTED': (1, 56),
+                  'TRUE': (1, 56),
+                  'TRY': (1, 56),
+                  '_AS': (1, 56),
+                  '_CCB': (1, 56),
+                  '_COLON': (1, 56),
+                  '_COMMA': (1, 56),
+                  '_CP': (1, 56),
+                  '_CSB': (1, 56),
+                  '_DEDENT': (1, 56),
+                  '_DOT': (1, 56),
+                  '_FOREACH': (1, 56),
+                  '_IF': (1, 56),
+                  '_IMPORT': (1, 56),
+                  '_INDENT': (1, 56),
+                  '_NL': (1, 56),
+                  '_OCB': (1, 56),
+                  '_OP': (1, 56),
+                  '_OSB': (1, 56),
+                  '_THEN': (1, 56),
+                  '_WHEN': (1, 56),
+                  '_WHILE': (1, 56)},
+            231: {'$END': (1, 55),
+                  'AND': (1, 55),
+                  'BREAK': (1, 55),
+                  'BSLASH': (1, 55),
+                  'CONSTANT': (1, 55),
+                  'DASH': (1, 55),
+                  'DOUBLE_QUOTED': (1, 55),
+                  'EQUAL': (1, 55),
+                  'EQUALS': (1, 55),
+                  'FALSE': (1, 55),
+                  'FLOAT': (1, 55),
+                  'FUNCTION_TYPE': (1, 55),
+                  'GREATER': (1, 55),
+                  'GREATER_EQUAL': (1, 55),
+                  'INT': (1, 55),
+                  'LESSER': (1, 55),
+                  'LESSER_EQUAL': (1, 55),
+                  'MODULUS': (1, 55),
+                  'MULTIPLIER': (1, 55),
+                  'NAME': (1, 55),
+                  'NOT': (1, 55),
+                  'NOT_EQUAL': (1, 55),
+                  'NULL': (1, 55),
+                  'OR': (1, 55),
+                  'PLUS': (1, 55),
+                  'POWER': (1, 55),
+                  'RAISE': (1, 55),
+                  'REGEXP': (1, 55),
+                  'RETURN': (1, 55),
+                  'SINGLE_QUOTED': (1, 55),
+                  'TRUE': (1, 55),
+                  'TRY': (1, 55),
+                  '_AS': (1, 55),
+                  '_CCB': (1, 55),
+                  '_COLON': (1, 55),
+                  '_COMMA': (1, 55),
+                  '_CP': (1, 55),
+                  '_CSB': (1, 55),
+                  '_DEDENT': (1, 55),
+                  '_DOT': (1, 55),
+                  '_FOREACH': (1, 55),
+                  '_IF': (1, 55),
+                  '_IMPORT': (1, 55),
+                  '_INDENT': (1, 55),
+                  '_NL': (1, 55),
+                  '_OCB': (1, 55),
+                  '_OP': (1, 55),
+                  '_OSB': (1, 55),
+                  '_THEN': (1, 55),
+                  '_WHEN': (1, 55),
+                  '_WHILE': (1, 55)},
+            232: {'$END': (1, 54),
+                  'AND': (1, 54),
+                  'BREAK': (1, 54),
+                  'BSLASH': (1, 54),
+                  'CONSTANT': (1, 54),
+                  'DASH': (1, 54),
+                  'DOUBLE_QUOTED': (1, 54),
+                  'EQUAL': (1, 54),
+                  'EQUALS': (1, 54),
+                  'FALSE': (1, 54),
+                  'FLOAT': (1, 54),
+                  'FUNCTION_TYPE': (1, 54),
+                  'GREATER': (1, 54),
+                  'GREATER_EQUAL': (1, 54),
+                  'INT': (1, 54),
+                  'LESSER': (1, 54),
+                  'LESSER_EQUAL': (1, 54),
+                  'MODULUS': (1, 54),
+                  'MULTIPLIER': (1, 54),
+                  'NAME': (1, 54),
+                  'NOT': (1, 54),
+                  'NOT_EQUAL': (1, 54),
+                  'NULL': (1, 54),
+                  'OR': (1, 54),
+                  'PLUS': (1, 54),
+                  'POWER': (1, 54),
+                  'RAISE': (1, 54),
+                  'REGEXP': (1, 54),
+                  'RETURN': (1, 54),
+                  'SINGLE_QUOTED': (1, 54),
+                  'TRUE': (1, 54),
+                  'TRY': (1, 54),
+                  '_AS': (1, 54),
+                  '_CCB': (1, 54),
+                  '_COLON': (1, 54),
+                  '_COMMA': (1, 54),
+                  '_CP': (1, 54),
+                  '_CSB': (1, 54),
+                  '_DEDENT': (1, 54),
+                  '_DOT': (1, 54),
+                  '_FOREACH': (1, 54),
+                  '_IF': (1, 54),
+                  '_IMPORT': (1, 54),
+                  '_INDENT': (1, 54),
+                  '_NL': (1, 54),
+                  '_OCB': (1, 54),
+                  '_OP': (1, 54),
+                  '_OSB': (1, 54),
+                  '_THEN': (1, 54),
+                  '_WHEN': (1, 54),
+                  '_WHILE': (1, 54)},
+            233: {'_CP': (1, 125), '_NL': (1, 125), '_THEN': (1, 125)},
+            234: {'_COMMA': (0, 290),
+                  '_CP': (1, 119),
+                  '_NL': (1, 119),
+                  '_THEN': (1, 119),
+                  '__anon_star_6': (0, 289)},
+            235: {'_CP': (1, 202), '_NL': (1, 202), '_THEN': (1, 202)},
+            236: {'_DEDENT': (0, 291)},
+            237: {'_CCB': (0, 293),
+                  '_COMMA': (0, 181),
+                  '_NL': (0, 294),
+                  '__anon_star_1': (0, 292)},
+            238: {'$END': (1, 31),
+                  'AND': (1, 31),
+                  'BREAK': (1, 31),
+                  'BSLASH': (1, 31),
+                  'CONSTANT': (1, 31),
+                  'DASH': (1, 31),
+                  'DOUBLE_QUOTED': (1, 31),
+                  'EQUAL': (1, 31),
+                  'FALSE': (1, 31),
+                  'FLOAT': (1, 31),
+                  'FUNCTION_TYPE': (1, 31),
+                  'GREATER': (1, 31),
+                  'GREATER_EQUAL': (1, 31),
+                  'INT': (1, 31),
+                  'LESSER': (1, 31),
+                  'LESSER_EQUAL': (1, 31),
+                  'MODULUS': (1, 31),
+                  'MULTIPLIER': (1, 31),
+                  'NAME': (1, 31),
+                  'NOT': (1, 31),
+                  'NOT_EQUAL': (1, 31),
+                  'NULL': (1, 31),
+                  'OR': (1, 31),
+                  'PLUS': (1, 31),
+                  'POWER': (1, 31),
+                  'RAISE': (1, 31),
+                  'REGEXP': (1, 31),
+                  'RETURN': (1, 31),
+                  'SINGLE_QUOTED': (1, 31),
+                  'TRUE': (1, 31),
+                  'TRY': (1, 31),
+                  '_AS': (1, 31),
+                  '_CCB': (1, 31),
+                  '_COLON': (1, 31),
+                  '_COMMA': (1, 31),
+                  '_CP': (1, 31),
+                  '_CSB': (1, 31),
+                  '_DEDENT': (1, 31),
+                  '_FOREACH': (1, 31),
+                  '_IF': (1, 31),
+                  '_IMPORT': (1, 31),
+                  '_INDENT': (1, 31),
+                  '_NL': (1, 31),
+                  '_OCB': (1, 31),
+                  '_OP': (1, 31),
+                  '_OSB': (1, 31),
+                  '_THEN': (1, 31),
+                  '_WHEN': (1, 31),
+                  '_WHILE': (1, 31)},
+            239: {'$END': (1, 39),
+                  'AND': (1, 39),
+                  'BREAK': (1, 39),
+                  'BSLASH': (1, 39),
+                  'CONSTANT': (1, 39),
+                  'DASH': (1, 39),
+                  'DOUBLE_QUOTED': (1, 39),
+                  'EQUAL': (1, 39),
+                  'FALSE': (1, 39),
+                  'FLOAT': (1, 39),
+                  'FUNCTION_TYPE': (1, 39),
+                  'GREATER': (1, 39),
+                  'GREATER_EQUAL': (1, 39),
+                  'INT': (1, 39),
+                  'LESSER': (1, 39),
+                  'LESSER_EQUAL': (1, 39),
+                  'MODULUS': (1, 39),
+                  'MULTIPLIER': (1, 39),
+                  'NAME': (1, 39),
+                  'NOT': (1, 39),
+                  'NOT_EQUAL': (1, 39),
+                  'NULL': (1, 39),
+                  'OR': (1, 39),
+                  'PLUS': (1, 39),
+                  'POWER': (1, 39),
+                  'RAISE': (1, 39),
+                  'REGEXP': (1, 39),
+                  'RETURN': (1, 39),
+                  'SINGLE_QUOTED': (1, 39),
+                  'TRUE': (1, 39),
+                  'TRY': (1, 39),
+                  '_AS': (1, 39),
+                  '_CCB': (1, 39),
+                  '_COLON': (1, 39),
+                  '_COMMA': (1, 39),
+                  '_CP': (1, 39),
+                  '_CSB': (1, 39),
+                  '_DEDENT': (1, 39),
+                  '_FOREACH': (1, 39),
+                  '_IF': (1, 39),
+                  '_IMPORT': (1, 39),
+                  '_INDENT': (1, 39),
+                  '_NL': (1, 39),
+                  '_OCB': (1, 39),
+                  '_OP': (1, 39),
+                  '_OSB': (1, 39),
+                  '_THEN': (1, 39),
+                  '_WHEN': (1, 39),
+                  '_WHILE': (1, 39)},
+            240: {'$END': (1, 41),
+                  'AND': (1, 41),
+                  'BREAK': (1, 41),
+                  'BSLASH': (1, 41),
+                  'CONSTANT': (1, 41),
+                  'DASH': (1, 41),
+                  'DOUBLE_QUOTED': (1, 41),
+                  'EQUAL': (1, 41),
+                  'FALSE': (1, 41),
+                  'FLOAT': (1, 41),
+                  'FUNCTION_TYPE': (1, 41),
+                  'GREATER': (1, 41),
+                  'GREATER_EQUAL': (1, 41),
+                  'INT': (1, 41),
+                  'LESSER': (1, 41),
+                  'LESSER_EQUAL': (1, 41),
+                  'MODULUS': (1, 41),
+                  'MULTIPLIER': (1, 41),
+                  'NAME': (1, 41),
+                  'NOT': (1, 41),
+                  'NOT_EQUAL': (1, 41),
+                  'NULL': (1, 41),
+                  'OR': (1, 41),
+                  'PLUS': (1, 41),
+                  'POWER': (1, 41),
+                  'RAISE': (1, 41),
+                  'REGEXP': (1, 41),
+                  'RETURN': (1, 41),
+                  'SINGLE_QUOTED': (1, 41),
+                  'TRUE': (1, 41),
+                  'TRY': (1, 41),
+                  '_AS': (1, 41),
+                  '_CCB': (1, 41),
+                  '_COLON': (1, 41),
+                  '_COMMA': (1, 41),
+                  '_CP': (1, 41),
+                  '_CSB': (1, 41),
+                  '_DEDENT': (1, 41),
+                  '_FOREACH': (1, 41),
+                  '_IF': (1, 41),
+                  '_IMPORT': (1, 41),
+                  '_INDENT': (1, 41),
+                  '_NL': (1, 41),
+                  '_OCB': (1, 41),
+                  '_OP': (1, 41),
+                  '_OSB': (1, 41),
+                  '_THEN': (1, 41),
+                  '_WHEN': (1, 41),
+                  '_WHILE': (1, 41)},
+            241: {'_DEDENT': (0, 295)},
+            242: {'DOUBLE_QUOTED': (0, 28),
+                  'NAME': (0, 81),
+                  'SINGLE_QUOTED': (0, 42),
+                  '_NL': (0, 296),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'key_value': (0, 297),
+                  'path': (0, 104),
+                  'string': (0, 103)},
+            243: {'_CCB': (1, 190), '_COMMA': (1, 190), '_NL': (1, 190)},
+            244: {'DOUBLE_QUOTED': (0, 28),
+                  'NAME': (0, 81),
+                  'SINGLE_QUOTED': (0, 42),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'key_value': (0, 298),
+                  'path': (0, 104),
+                  'string': (0, 103)},
+            245: {'_CCB': (0, 299)},
+            246: {'_CCB': (1, 29), '_COMMA': (1, 29), '_NL': (1, 29)},
+            247: {'_CCB': (1, 28), '_COMMA': (1, 28), '_NL': (1, 28)},
+            248: {'NAME': (1, 2), '_NL': (1, 2), '_RETURNS': (1, 2)},
+            249: {'NAME': (1, 7), '_NL': (1, 7), '_RETURNS': (1, 7)},
+            250: {'NAME': (1, 1), '_NL': (1, 1), '_RETURNS': (1, 1)},
+            251: {'NAME': (1, 6), '_NL': (1, 6), '_RETURNS': (1, 6)},
+            252: {'NAME': (1, 0), '_NL': (1, 0), '_RETURNS': (1, 0)},
+            253: {'NAME': (1, 4), '_NL': (1, 4), '_RETURNS': (1, 4)},
+            254: {'_NL': (1, 145)},
+            255: {'NAME': (1, 8), '_NL': (1, 8), '_RETURNS': (1, 8)},
+            256: {'NAME': (1, 5), '_NL': (1, 5), '_RETURNS': (1, 5)},
+            257: {'NAME': (1, 3), '_NL': (1, 3), '_RETURNS': (1, 3)},
+            258: {'ANY_TYPE': (0, 256),
+                  'FLOAT_TYPE': (0, 257),
+                  'FUNCTION_TYPE': (0, 251),
+                  'INT_TYPE': (0, 248),
+                  'LIST_TYPE': (0, 250),
+                  'NUMBER_TYPE': (0, 252),
+                  'OBJECT_TYPE': (0, 255),
+                  'REGEXP_TYPE': (0, 249),
+                  'STRING_TYPE': (0, 253),
+                  'types': (0, 300)},
+            259: {'NAME': (1, 206), '_NL': (1, 206), '_RETURNS': (1, 206)},
+            260: {'_NL': (1, 147)},
+            261: {'$END': (1, 137),
+                  'BREAK': (1, 137),
+                  'CONSTANT': (1, 137),
+                  'DOUBLE_QUOTED': (1, 137),
+                  'FALSE': (1, 137),
+                  'FLOAT': (1, 137),
+                  'FUNCTION_TYPE': (1, 137),
+                  'INT': (1, 137),
+                  'NAME': (1, 137),
+                  'NOT': (1, 137),
+                  'NULL': (1, 137),
+                  'RAISE': (1, 137),
+                  'REGEXP': (1, 137),
+                  'RETURN': (1, 137),
+                  'SINGLE_QUOTED': (1, 137),
+                  'TRUE': (1, 137),
+                  'TRY': (1, 137),
+                  '_COLON': (1, 137),
+                  '_DEDENT': (1, 137),
+                  '_ELSE': (0, 264),
+                  '_FOREACH': (1, 137),
+                  '_IF': (1, 137),
+                  '_IMPORT': (1, 137),
+                  '_INDENT': (1, 137),
+                  '_NL': (1, 137),
+                  '_OCB': (1, 137),
+                  '_OP': (1, 137),
+                  '_OSB': (1, 137),
+                  '_THEN': (1, 137),
+                  '_WHEN': (1, 137),
+                  '_WHILE': (1, 137),
+                  'else_block': (0, 301),
+                  'else_statement': (0, 265),
+                  'elseif_block': (0, 302),
+                  'elseif_statement': (0, 263)},
+            262: {'$END': (1, 204),
+                  'BREAK': (1, 204),
+                  'CONSTANT': (1, 204),
+                  'DOUBLE_QUOTED': (1, 204),
+                  'FALSE': (1, 204),
+                  'FLOAT': (1, 204),
+                  'FUNCTION_TYPE': (1, 204),
+                  'INT': (1, 204),
+                  'NAME': (1, 204),
+                  'NOT': (1, 204),
+                  'NULL': (1, 204),
+                  'RAISE': (1, 204),
+                  'REGEXP': (1, 204),
+                  'RETURN': (1, 204),
+                  'SINGLE_QUOTED': (1, 204),
+                  'TRUE': (1, 204),
+                  'TRY': (1, 204),
+                  '_COLON': (1, 204),
+                  '_DEDENT': (1, 204),
+                  '_ELSE': (1, 204),
+                  '_FOREACH': (1, 204),
+                  '_IF': (1, 204),
+                  '_IMPORT': (1, 204),
+                  '_INDENT': (1, 204),
+                  '_NL': (1, 204),
+                  '_OCB': (1, 204),
+                  '_OP': (1, 204),
+                  '_OSB': (1, 204),
+                  '_THEN': (1, 204),
+                  '_WHEN': (1, 204),
+                  '_WHILE': (1, 204)},
+            263: {'_NL': (0, 303)},
+            264: {'_IF': (0, 304), '_NL': (1, 134)},
+            265: {'_NL': (0, 305)},
+            266: {'$END': (1, 138),
+                  'BREAK': (1, 138),
+                  'CONSTANT': (1, 138),
+                  'DOUBLE_QUOTED': (1, 138),
+                  'FALSE': (1, 138),
+                  'FLOAT': (1, 138),
+                  'FUNCTION_TYPE': (1, 138),
+                  'INT': (1, 138),
+                  'NAME': (1, 138),
+                  'NOT': (1, 138),
+                  'NULL': (1, 138),
+                  'RAISE': (1, 138),
+                  'REGEXP': (1, 138),
+                  'RETURN': (1, 138),
+                  'SINGLE_QUOTED': (1, 138),
+                  'TRUE': (1, 138),
+                  'TRY': (1, 138),
+                  '_COLON': (1, 138),
+                  '_DEDENT': (1, 138),
+                  '_FOREACH': (1, 138),
+                  '_IF': (1, 138),
+                  '_IMPORT': (1, 138),
+                  '_INDENT': (1, 138),
+                  '_NL': (1, 138),
+                  '_OCB': (1, 138),
+                  '_OP': (1, 138),
+                  '_OSB': (1, 138),
+                  '_THEN': (1, 138),
+                  '_WHEN': (1, 138),
+                  '_WHILE': (1, 138)},
+            267: {'BREAK': (0, 68),
+                  'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'FUNCTION_TYPE': (0, 10),
+                  'INT': (0, 11),
+                  'NAME': (0, 3),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'RAISE': (0, 20),
+                  'REGEXP': (0, 53),
+                  'RETURN': (0, 15),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  'TRY': (0, 60),
+                  '_COLON': (0, 63),
+                  '_DEDENT': (0, 306),
+                  '_FOREACH': (0, 56),
+                  '_IF': (0, 67),
+                  '_IMPORT': (0, 36),
+                  '_INDENT': (0, 18),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  '_THEN': (0, 12),
+                  '_WHEN': (0, 23),
+                  '_WHILE': (0, 69),
+                  'absolute_expression': (0, 54),
+                  'and_expression': (0, 27),
+                  'arguments': (0, 30),
+                  'arith_expression': (0, 48),
+                  'assignment': (0, 2),
+                  'block': (0, 117),
+                  'boolean': (0, 78),
+                  'break_statement': (0, 14),
+                  'chained_mutation': (0, 13),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 24),
+                  'expression': (0, 75),
+                  'foreach_block': (0, 44),
+                  'foreach_statement': (0, 34),
+                  'function_block': (0, 37),
+                  'function_statement': (0, 71),
+                  'if_block': (0, 16),
+                  'if_statement': (0, 17),
+                  'imports': (0, 59),
+                  'indented_arguments': (0, 62),
+                  'indented_chain': (0, 32),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'mutation': (0, 31),
+                  'mutation_block': (0, 49),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 4),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'raise_statement': (0, 72),
+                  'regular_expression': (0, 47),
+                  'return_statement': (0, 73),
+                  'rules': (0, 8),
+                  'service': (0, 57),
+                  'service_block': (0, 43),
+                  'string': (0, 50),
+                  'try_block': (0, 35),
+                  'try_statement': (0, 39),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70),
+                  'when_block': (0, 58),
+                  'while_block': (0, 74),
+                  'while_statement': (0, 45)},
+            268: {'NAME': (1, 207), '_COLON': (1, 207), '_DEDENT': (1, 207)},
+            269: {'_DEDENT': (1, 197), '_THEN': (1, 197)},
+            270: {'_INDENT': (0, 193), 'nested_block': (0, 307)},
+            271: {'$END': (1, 162),
+                  'BREAK': (1, 162),
+                  'CONSTANT': (1, 162),
+                  'DOUBLE_QUOTED': (1, 162),
+                  'FALSE': (1, 162),
+                  'FLOAT': (1, 162),
+                  'FUNCTION_TYPE': (1, 162),
+                  'INT': (1, 162),
+                  'NAME': (1, 162),
+                  'NOT': (1, 162),
+                  'NULL': (1, 162),
+                  'RAISE': (1, 162),
+                  'REGEXP': (1, 162),
+                  'RETURN': (1, 162),
+                  'SINGLE_QUOTED': (1, 162),
+                  'TRUE': (1, 162),
+                  'TRY': (1, 162),
+                  '_COLON': (1, 162),
+                  '_DEDENT': (1, 162),
+                  '_FOREACH': (1, 162),
+                  '_IF': (1, 162),
+                  '_IMPORT': (1, 162),
+                  '_INDENT': (1, 162),
+                  '_NL': (1, 162),
+                  '_OCB': (1, 162),
+                  '_OP': (1, 162),
+                  '_OSB': (1, 162),
+                  '_THEN': (1, 162),
+                  '_WHEN': (1, 162),
+                  '_WHILE': (1, 162)},
+            272: {'_NL': (1, 195), '_THEN': (1, 195)},
+            273: {'_NL': (1, 65)},
+            274: {'$END': (1, 159),
+                  'BREAK': (1, 159),
+                  'CONSTANT': (1, 159),
+                  'DOUBLE_QUOTED': (1, 159),
+                  'FALSE': (1, 159),
+                  'FLOAT': (1, 159),
+                  'FUNCTION_TYPE': (1, 159),
+                  'INT': (1, 159),
+                  'NAME': (1, 159),
+                  'NOT': (1, 159),
+                  'NULL': (1, 159),
+                  'RAISE': (1, 159),
+                  'REGEXP': (1, 159),
+                  'RETURN': (1, 159),
+                  'SINGLE_QUOTED': (1, 159),
+                  'TRUE': (1, 159),
+                  'TRY': (1, 159),
+                  '_COLON': (1, 159),
+                  '_DEDENT': (1, 159),
+                  '_FOREACH': (1, 159),
+                  '_IF': (1, 159),
+                  '_IMPORT': (1, 159),
+                  '_INDENT': (1, 159),
+                  '_NL': (1, 159),
+                  '_OCB': (1, 159),
+                  '_OP': (1, 159),
+                  '_OSB': (1, 159),
+                  '_THEN': (1, 159),
+                  '_WHEN': (1, 159),
+                  '_WHILE': (1, 159)},
+            275: {'_NL': (1, 153)},
+            276: {'$END': (1, 158),
+                  'BREAK': (1, 158),
+                  'CONSTANT': (1, 158),
+                  'DOUBLE_QUOTED': (1, 158),
+                  'FALSE': (1, 158),
+                  'FINALLY': (0, 275),
+                  'FLOAT': (1, 158),
+                  'FUNCTION_TYPE': (1, 158),
+                  'INT': (1, 158),
+                  'NAME': (1, 158),
+                  'NOT': (1, 158),
+                  'NULL': (1, 158),
+                  'RAISE': (1, 158),
+                  'REGEXP': (1, 158),
+                  'RETURN': (1, 158),
+                  'SINGLE_QUOTED': (1, 158),
+                  'TRUE': (1, 158),
+                  'TRY': (1, 158),
+                  '_COLON': (1, 158),
+                  '_DEDENT': (1, 158),
+                  '_FOREACH': (1, 158),
+                  '_IF': (1, 158),
+                  '_IMPORT': (1, 158),
+                  '_INDENT': (1, 158),
+                  '_NL': (1, 158),
+                  '_OCB': (1, 158),
+                  '_OP': (1, 158),
+                  '_OSB': (1, 158),
+                  '_THEN': (1, 158),
+                  '_WHEN': (1, 158),
+                  '_WHILE': (1, 158),
+                  'finally_block': (0, 308),
+                  'finally_statement': (0, 279)},
+            277: {'_NL': (0, 309)},
+            278: {'_AS': (0, 310)},
+            279: {'_NL': (0, 311)},
+            280: {'_COMMA': (0, 225), '_CSB': (0, 312), '_NL': (0, 313)},
+            281: {'_DEDENT': (0, 314)},
+            282: {'$END': (1, 23),
+                  'AND': (1, 23),
+                  'BREAK': (1, 23),
+                  'BSLASH': (1, 23),
+                  'CONSTANT': (1, 23),
+                  'DASH': (1, 23),
+                  'DOUBLE_QUOTED': (1, 23),
+                  'EQUAL': (1, 23),
+                  'FALSE': (1, 23),
+                  'FLOAT': (1, 23),
+                  'FUNCTION_TYPE': (1, 23),
+                  'GREATER': (1, 23),
+                  'GREATER_EQUAL': (1, 23),
+                  'INT': (1, 23),
+                  'LESSER': (1, 23),
+                  'LESSER_EQUAL': (1, 23),
+                  'MODULUS': (1, 23),
+                  'MULTIPLIER': (1, 23),
+                  'NAME': (1, 23),
+                  'NOT': (1, 23),
+                  'NOT_EQUAL': (1, 23),
+                  'NULL': (1, 23),
+                  'OR': (1, 23),
+                  'PLUS': (1, 23),
+                  'POWER': (1, 23),
+                  'RAISE': (1, 23),
+                  'REGEXP': (1, 23),
+                  'RETURN': (1, 23),
+                  'SINGLE_QUOTED': (1, 23),
+                  'TRUE': (1, 23),
+                  'TRY': (1, 23),
+                  '_AS': (1, 23),
+                  '_CCB': (1, 23),
+                  '_COLON': (1, 23),
+                  '_COMMA': (1, 23),
+                  '_CP': (1, 23),
+                  '_CSB': (1, 23),
+                  '_DEDENT': (1, 23),
+                  '_FOREACH': (1, 23),
+                  '_IF': (1, 23),
+                  '_IMPORT': (1, 23),
+                  '_INDENT': (1, 23),
+                  '_NL': (1, 23),
+                  '_OCB': (1, 23),
+                  '_OP': (1, 23),
+                  '_OSB': (1, 23),
+                  '_THEN': (1, 23),
+                  '_WHEN': (1, 23),
+                  '_WHILE': (1, 23)},
+            283: {'_CSB': (0, 315)},
+            284: {'_CSB': (0, 316)},
+            285: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 317),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            286: {'_COMMA': (1, 186), '_CSB': (1, 186), '_NL': (1, 186)},
+            287: {'_COMMA': (1, 183), '_CSB': (1, 183), '_NL': (1, 183)},
+            288: {'$END': (1, 18),
+                  'AND': (1, 18),
+                  'BREAK': (1, 18),
+                  'BSLASH': (1, 18),
+                  'CONSTANT': (1, 18),
+                  'DASH': (1, 18),
+                  'DOUBLE_QUOTED': (1, 18),
+                  'EQUAL': (1, 18),
+                  'FALSE': (1, 18),
+                  'FLOAT': (1, 18),
+                  'FUNCTION_TYPE': (1, 18),
+                  'GREATER': (1, 18),
+                  'GREATER_EQUAL': (1, 18),
+                  'INT': (1, 18),
+                  'LESSER': (1, 18),
+                  'LESSER_EQUAL': (1, 18),
+                  'MODULUS': (1, 18),
+                  'MULTIPLIER': (1, 18),
+                  'NAME': (1, 18),
+                  'NOT': (1, 18),
+                  'NOT_EQUAL': (1, 18),
+                  'NULL': (1, 18),
+                  'OR': (1, 18),
+                  'PLUS': (1, 18),
+                  'POWER': (1, 18),
+                  'RAISE': (1, 18),
+                  'REGEXP': (1, 18),
+                  'RETURN': (1, 18),
+                  'SINGLE_QUOTED': (1, 18),
+                  'TRUE': (1, 18),
+                  'TRY': (1, 18),
+                  '_AS': (1, 18),
+                  '_CCB': (1, 18),
+                  '_COLON': (1, 18),
+                  '_COMMA': (1, 18),
+                  '_CP': (1, 18),
+                  '_CSB': (1, 18),
+                  '_DEDENT': (1, 18),
+                  '_FOREACH': (1, 18),
+                  '_IF': (1, 18),
+                  '_IMPORT': (1, 18),
+                  '_INDENT': (1, 18),
+                  '_NL': (1, 18),
+                  '_OCB': (1, 18),
+                  '_OP': (1, 18),
+                  '_OSB': (1, 18),
+                  '_THEN': (1, 18),
+                  '_WHEN': (1, 18),
+                  '_WHILE': (1, 18)},
+            289: {'_COMMA': (0, 318),
+                  '_CP': (1, 120),
+                  '_NL': (1, 120),
+                  '_THEN': (1, 120)},
+            290: {'NAME': (0, 319)},
+            291: {'_CCB': (0, 320)},
+            292: {'_CCB': (0, 322), '_COMMA': (0, 242), '_NL': (0, 321)},
+            293: {'$END': (1, 38),
+                  'AND': (1, 38),
+                  'BREAK': (1, 38),
+                  'BSLASH': (1, 38),
+                  'CONSTANT': (1, 38),
+                  'DASH': (1, 38),
+                  'DOUBLE_QUOTED': (1, 38),
+                  'EQUAL': (1, 38),
+                  'FALSE': (1, 38),
+                  'FLOAT': (1, 38),
+                  'FUNCTION_TYPE': (1, 38),
+                  'GREATER': (1, 38),
+                  'GREATER_EQUAL': (1, 38),
+                  'INT': (1, 38),
+                  'LESSER': (1, 38),
+                  'LESSER_EQUAL': (1, 38),
+                  'MODULUS': (1, 38),
+                  'MULTIPLIER': (1, 38),
+                  'NAME': (1, 38),
+                  'NOT': (1, 38),
+                  'NOT_EQUAL': (1, 38),
+                  'NULL': (1, 38),
+                  'OR': (1, 38),
+                  'PLUS': (1, 38),
+                  'POWER': (1, 38),
+                  'RAISE': (1, 38),
+                  'REGEXP': (1, 38),
+                  'RETURN': (1, 38),
+                  'SINGLE_QUOTED': (1, 38),
+                  'TRUE': (1, 38),
+                  'TRY': (1, 38),
+                  '_AS': (1, 38),
+                  '_CCB': (1, 38),
+                  '_COLON': (1, 38),
+                  '_COMMA': (1, 38),
+                  '_CP': (1, 38),
+                  '_CSB': (1, 38),
+                  '_DEDENT': (1, 38),
+                  '_FOREACH': (1, 38),
+                  '_IF': (1, 38),
+                  '_IMPORT': (1, 38),
+                  '_INDENT': (1, 38),
+                  '_NL': (1, 38),
+                  '_OCB': (1, 38),
+                  '_OP': (1, 38),
+                  '_OSB': (1, 38),
+                  '_THEN': (1, 38),
+                  '_WHEN': (1, 38),
+                  '_WHILE': (1, 38)},
+            294: {'_DEDENT': (0, 323)},
+            295: {'_CCB': (0, 324)},
+            296: {'DOUBLE_QUOTED': (0, 28),
+                  'NAME': (0, 81),
+                  'SINGLE_QUOTED': (0, 42),
+                  '_OP': (0, 101),
+                  'inline_expression': (0, 40),
+                  'key_value': (0, 325),
+                  'path': (0, 104),
+                  'string': (0, 103)},
+            297: {'_CCB': (1, 189), '_COMMA': (1, 189), '_NL': (1, 189)},
+            298: {'_CCB': (1, 188), '_COMMA': (1, 188), '_NL': (1, 188)},
+            299: {'$END': (1, 37),
+                  'AND': (1, 37),
+                  'BREAK': (1, 37),
+                  'BSLASH': (1, 37),
+                  'CONSTANT': (1, 37),
+                  'DASH': (1, 37),
+                  'DOUBLE_QUOTED': (1, 37),
+                  'EQUAL': (1, 37),
+                  'FALSE': (1, 37),
+                  'FLOAT': (1, 37),
+                  'FUNCTION_TYPE': (1, 37),
+                  'GREATER': (1, 37),
+                  'GREATER_EQUAL': (1, 37),
+                  'INT': (1, 37),
+                  'LESSER': (1, 37),
+                  'LESSER_EQUAL': (1, 37),
+                  'MODULUS': (1, 37),
+                  'MULTIPLIER': (1, 37),
+                  'NAME': (1, 37),
+                  'NOT': (1, 37),
+                  'NOT_EQUAL': (1, 37),
+                  'NULL': (1, 37),
+                  'OR': (1, 37),
+                  'PLUS': (1, 37),
+                  'POWER': (1, 37),
+                  'RAISE': (1, 37),
+                  'REGEXP': (1, 37),
+                  'RETURN': (1, 37),
+                  'SINGLE_QUOTED': (1, 37),
+                  'TRUE': (1, 37),
+                  'TRY': (1, 37),
+                  '_AS': (1, 37),
+                  '_CCB': (1, 37),
+                  '_COLON': (1, 37),
+                  '_COMMA': (1, 37),
+                  '_CP': (1, 37),
+                  '_CSB': (1, 37),
+                  '_DEDENT': (1, 37),
+                  '_FOREACH': (1, 37),
+                  '_IF': (1, 37),
+                  '_IMPORT': (1, 37),
+                  '_INDENT': (1, 37),
+                  '_NL': (1, 37),
+                  '_OCB': (1, 37),
+                  '_OP': (1, 37),
+                  '_OSB': (1, 37),
+                  '_THEN': (1, 37),
+                  '_WHEN': (1, 37),
+                  '_WHILE': (1, 37)},
+            300: {'NAME': (1, 144), '_NL': (1, 144), '_RETURNS': (1, 144)},
+            301: {'$END': (1, 139),
+                  'BREAK': (1, 139),
+                  'CONSTANT': (1, 139),
+                  'DOUBLE_QUOTED': (1, 139),
+                  'FALSE': (1, 139),
+                  'FLOAT': (1, 139),
+                  'FUNCTION_TYPE': (1, 139),
+                  'INT': (1, 139),
+                  'NAME': (1, 139),
+                  'NOT': (1, 139),
+                  'NULL': (1, 139),
+                  'RAISE': (1, 139),
+                  'REGEXP': (1, 139),
+                  'RETURN': (1, 139),
+                  'SINGLE_QUOTED': (1, 139),
+                  'TRUE': (1, 139),
+                  'TRY': (1, 139),
+                  '_COLON': (1, 139),
+                  '_DEDENT': (1, 139),
+                  '_FOREACH': (1, 139),
+                  '_IF': (1, 139),
+                  '_IMPORT': (1, 139),
+                  '_INDENT': (1, 139),
+                  '_NL': (1, 139),
+                  '_OCB': (1, 139),
+                  '_OP': (1, 139),
+                  '_OSB': (1, 139),
+                  '_THEN': (1, 139),
+                  '_WHEN': (1, 139),
+                  '_WHILE': (1, 139)},
+            302: {'$END': (1, 203),
+                  'BREAK': (1, 203),
+                  'CONSTANT': (1, 203),
+                  'DOUBLE_QUOTED': (1, 203),
+                  'FALSE': (1, 203),
+                  'FLOAT': (1, 203),
+                  'FUNCTION_TYPE': (1, 203),
+                  'INT': (1, 203),
+                  'NAME': (1, 203),
+                  'NOT': (1, 203),
+                  'NULL': (1, 203),
+                  'RAISE': (1, 203),
+                  'REGEXP': (1, 203),
+                  'RETURN': (1, 203),
+                  'SINGLE_QUOTED': (1, 203),
+                  'TRUE': (1, 203),
+                  'TRY': (1, 203),
+                  '_COLON': (1, 203),
+                  '_DEDENT': (1, 203),
+                  '_ELSE': (1, 203),
+                  '_FOREACH': (1, 203),
+                  '_IF': (1, 203),
+                  '_IMPORT': (1, 203),
+                  '_INDENT': (1, 203),
+                  '_NL': (1, 203),
+                  '_OCB': (1, 203),
+                  '_OP': (1, 203),
+                  '_OSB': (1, 203),
+                  '_THEN': (1, 203),
+                  '_WHEN': (1, 203),
+                  '_WHILE': (1, 203)},
+            303: {'_INDENT': (0, 193), 'nested_block': (0, 326)},
+            304: {'CONSTANT': (0, 66),
+                  'DOUBLE_QUOTED': (0, 28),
+                  'FALSE': (0, 55),
+                  'FLOAT': (0, 5),
+                  'INT': (0, 11),
+                  'NAME': (0, 81),
+                  'NOT': (0, 46),
+                  'NULL': (0, 25),
+                  'REGEXP': (0, 53),
+                  'SINGLE_QUOTED': (0, 42),
+                  'TRUE': (0, 76),
+                  '_OCB': (0, 9),
+                  '_OP': (0, 52),
+                  '_OSB': (0, 1),
+                  'and_expression': (0, 27),
+                  'arith_expression': (0, 48),
+                  'boolean': (0, 78),
+                  'cmp_expression': (0, 51),
+                  'entity': (0, 83),
+                  'expression': (0, 327),
+                  'inline_expression': (0, 40),
+                  'list': (0, 41),
+                  'mul_expression': (0, 26),
+                  'number': (0, 38),
+                  'objects': (0, 19),
+                  'or_expression': (0, 22),
+                  'path': (0, 84),
+                  'pow_expression': (0, 61),
+                  'primary_expression': (0, 29),
+                  'regular_expression': (0, 47),
+                  'string': (0, 50),
+                  'unary_expression': (0, 77),
+                  'unary_operator': (0, 33),
+                  'values': (0, 65),
+                  'void': (0, 70)},
+            305: {'_INDENT': (0, 193), 'nested_block': (0, 328)},
+            306: {'$END': (1, 178),
+                  'BREAK': (1, 178),
+                  'CONSTANT': (1, 178),
+                  'DOUBLE_QUOTED': (1, 178),
+                  'FALSE': (1, 178),
+                  'FINALLY': (1, 178),
+                  'FLOAT': (1, 178),
+                  'FUNCTION_TYPE': (1, 178),
+                  'INT': (1, 178),
+                  'NAME': (1, 178),
+                  'NOT': (1, 178),
+                  'NULL': (1, 178),
+                  'RAISE': (1, 178),
+                  'REGEXP': (1, 178),
+                  'RETURN': (1, 178),
+                  'SINGLE_QUOTED': (1, 178),
+                  'TRUE': (1, 178),
+                  'TRY': (1, 178),
+                  '_CATCH': (1, 178),
+                  '_COLON': (1, 178),
+                  '_DEDENT': (1, 178),
+                  '_ELSE': (1, 178),
+                  '_FOREACH': (1, 178),
+                  '_IF': (1, 178),
+                  '_IMPORT': (1, 178),
+                  '_INDENT': (1, 178),
+                  '_NL': (1, 178),
+                  '_OCB': (1, 178),
+                  '_OP': (1, 178),
+                  '_OSB': (1, 178),
+                  '_THEN': (1, 178),
+                  '_WHEN': (1, 178),
+                  '_WHILE': (1, 178)},
+            307: {'$END': (1, 163),
+                  'BREAK': (1, 163),
+                  'CONSTANT': (1, 163),
+                  'DOUBLE_QUOTED': (1, 163),
+                  'FALSE': (1, 163),
+                  'FLOAT': (1, 163),
+                  'FUNCTION_TYPE': (1, 163),
+                  'INT': (1, 163),
+                  'NAME': (1, 163),
+                  'NOT': (1, 163),
+                  'NULL': (1, 163),
+                  'RAISE': (1, 163),
+                  'REGEXP': (1, 163),
+                  'RETURN': (1, 163),
+                  'SINGLE_QUOTED': (1, 163),
+                  'TRUE': (1, 163),
+                  'TRY': (1, 163),
+                  '_COLON': (1, 163),
+                  '_DEDENT': (1, 163),
+                  '_FOREACH': (1, 163),
+                  '_IF': (1, 163),
+                  '_IMPORT': (1, 163),
+                  '_INDENT': (1, 163),
+                  '_NL': (1, 163),
+                  '_OCB': (1, 163),
+                  '_OP': (1, 163),
+                  '_OSB': (1, 163),
+                  '_THEN': (1, 163),
+                  '_WHEN': (1, 163),
+                  '_WHILE': (1, 163)},
+            308: {'$END': (1, 156),
+                  'BREAK': (1, 156),
+                  'CONSTANT': (1, 156),
+                  'DOUBLE_QUOTED': (1, 156),
+                  'FALSE': (1, 156),
+                  'FLOAT': (1, 156),
+                  'FUNCTION_TYPE': (1, 156),
+                  'INT': (1, 156),
+                  'NAME': (1, 156),
+                  'NOT': (1, 156),
+                  'NULL': (1, 156),
+                  'RAISE': (1, 156),
+                  'REGEXP': (1, 156),
+                  'RETURN': (1, 156),
+                  'SINGLE_QUOTED': (1, 156),
+                  'TRUE': (1, 156),
+                  'TRY': (1, 156),
+                  '_COLON': (1, 156),
+                  '_DEDENT': (1, 156),
+                  '_FOREACH': (1, 156),
+                  '_IF': (1, 156),
+                  '_IMPORT': (1, 156),
+                  '_INDENT': (1, 156),
+                  '_NL': (1, 156),
+                  '_OCB': (1, 156),
+                  '_OP': (1, 156),
+                  '_OSB': (1, 156),
+                  '_THEN': (1, 156),
+                  '_WHEN': (1, 156),
+                  '_WHILE': (1, 156)},
+            309: {'_INDENT': (0, 193), 'nested_block': (0, 329)},
+            310: {'NAME': (0, 330)},
+            311: {'_INDENT': (0, 193), 'nested_block': (0, 331)},
+            312: {'$END': (1, 17),
+                  'AND': (1, 17),
+                  'BREAK': (1, 17),
+                  'BSLASH': (1, 17),
+                  'CONSTANT': (1, 17),
+                  'DASH': (1, 17),
+                  'DOUBLE_QUOTED': (1, 17),
+                  'EQUAL': (1, 17),
+                  'FALSE': (1, 17),
+                  'FLOAT': (1, 17),
+                  'FUNCTION_TYPE': (1, 17),
+                  'GREATER': (1, 17),
+                  'GREATER_EQUAL': (1, 17),
+                  'INT': (1, 17),
+                  'LESSER': (1, 17),
+                  'LESSER_EQUAL': (1, 17),
+                  'MODULUS': (1, 17),
+                  'MULTIPLIER': (1, 17),
+                  'NAME': (1, 17),
+                  'NOT': (1, 17),
+                  'NOT_EQUAL': (1, 17),
+                  'NULL': (1, 17),
+                  'OR': (1, 17),
+                  'PLUS': (1, 17),
+                  'POWER': (1, 17),
+                  'RAISE': (1, 17),
+                  'REGEXP': (1, 17),
+                  'RETURN': (1, 17),
+                  'SINGLE_QUOTED': (1, 17),
+                  'TRUE': (1, 17),
+                  'TRY': (1, 17),
+                  '_AS': (1, 17),
+                  '_CCB': (1, 17),
+                  '_COLON': (1, 17),
+                  '_COMMA': (1, 17),
+                  '_CP': (1, 17),
+                  '_CSB': (1, 17),
+                  '_DEDENT': (1, 17),
+                  '_FOREACH': (1, 17),
+                  '_IF': (1, 17),
+                  '_IMPORT': (1, 17),
+                  '_INDENT': (1, 17),
+                  '_NL': (1, 17),
+                  '_OCB': (1, 17),
+                  '_OP': (1, 17),
+                  '_OSB': (1, 17),
+                  '_THEN': (1, 17),
+                  '_WHEN': (1, 17),
+                  '_WHILE': (1, 17)},
+            313: {'_DEDENT': (0, 332)},
+            314: {'_CSB': (0, 333)},
+            315: {'$END': (1, 16),
+                  'AND': (1, 16),
+                  'BREAK': (1, 16),
+                  'BSLASH': (1, 16),
+                  'CONSTANT': (1, 16),
+                  'DASH': (1, 16),
+                  'DOUBLE_QUOTED': (1, 16),
+                  'EQUAL': (1, 16),
+                  'FALSE': (1, 16),
+                  'FLOAT': (1, 16),
+                  'FUNCTION_TYPE': (1, 16),
+                  'GREATER': (1, 16),
+                  'GREATER_EQUAL': (1, 16),
+                  'INT': (1, 16),
+                  'LESSER': (1, 16),
+                  'LESSER_EQUAL': (1, 16),
+                  'MODULUS': (1, 16),
+                  'MULTIPLIER': (1, 16),
+                  'NAME': (1, 16),
+                  'NOT': (1, 16),
+                  'NOT_EQUAL': (1, 16),
+                  'NULL': (1, 16),
+                  'OR': (1, 16),
+                  'PLUS': (1, 16),
+                  'POWER': (1, 16),
+                  'RAISE': (1, 16),
+                  'REGEXP': (1, 16),
+                  'RETURN': (1, 16),
+                  'SINGLE_QUOTED': (1, 16),
+                  'TRUE': (1, 16),
+                  'TRY': (1, 16),
+                  '_AS': (1, 16),
+                  '_CCB': (1, 16),
+                  '_COLON': (1, 16),
+                  '_COMMA': (1, 16),
+                  '_CP': (1, 16),
+                  '_CSB': (1, 16),
+                  '_DEDENT': (1, 16),
+                  '_FOREACH': (1, 16),
+                  '_IF': (1, 16),
+                  '_IMPORT': (1, 16),
+                  '_INDENT': (1, 16),
+                  '_NL': (1, 16),
+                  '_OCB': (1, 16),
+                  '_OP': (1, 16),
+                  '_OSB': (1, 16),
+                  '_THEN': (1, 16),
+                  '_WHEN': (1, 16),
+                  '_WHILE': (1, 16)},
+            316: {'$END': (1, 22),
+                  'AND': (1, 22),
+                  'BREAK': (1, 22),
+                  'BSLASH': (1, 22),
+                  'CONSTANT': (1, 22),
+                  'DASH': (1, 22),
+                  'DOUBLE_QUOTED': (1, 22),
+                  'EQUAL': (1, 22),
+                  'FALSE': (1, 22),
+                  'FLOAT': (1, 22),
+                  'FUNCTION_TYPE': (1, 22),
+                  'GREATER': (1, 22),
+                  'GREATER_EQUAL': (1, 22),
+                  'INT': (1, 22),
+                  'LESSER': (1, 22),
+                  'LESSER_EQUAL': (1, 22),
+                  'MODULUS': (1, 22),
+                  'MULTIPLIER': (1, 22),
+                  'NAME': (1, 22),
+                  'NOT': (1, 22),
+                  'NOT_EQUAL': (1, 22),
+                  'NULL': (1, 22),
+                  'OR': (1, 22),
+                  'PLUS': (1, 22),
+                  'POWER': (1, 22),
+                  'RAISE': (1, 22),
+                  'REGEXP': (1, 22),
+                  'RETURN': (1, 22),
+                  'SINGLE_QUOTED': (1, 22),
+                  'TRUE': (1, 22),
+                  'TRY': (1, 22),
+                  '_AS': (1, 22),
+                  '_CCB': (1, 22),
+                  '_COLON': (1, 22),
+                  '_COMMA': (1, 22),
+                  '_CP': (1, 22),
+                  '_CSB': (1, 22),
+                  '_DEDENT': (1, 22),
+                  '_FOREACH': (1, 22),
+                  '_IF': (1, 22),
+                  '_IMPORT': (1, 22),
+                  '_INDENT': (1, 22),
+                  '_NL': (1, 22),
+                  '_OCB': (1, 22),
+                  '_OP': (1, 22),
+                  '_OSB': (1, 22),
+                  '_THEN': (1, 22),
+                  '_WHEN': (1, 22),
+                  '_WHILE': (1, 22)},
+            317: {'_COMMA': (1, 185), '_CSB': (1, 185), '_NL': (1, 185)},
+            318: {'NAME': (0, 334)},
+            319: {'_COMMA': (1, 200),
+                  '_CP': (1, 200),
+                  '_NL': (1, 200),
+                  '_THEN': (1, 200)},
+            320: {'$END': (1, 33),
+                  'AND': (1, 33),
+                  'BREAK': (1, 33),
+                  'BSLASH': (1, 33),
+                  'CONSTANT': (1, 33),
+                  'DASH': (1, 33),
+                  'DOUBLE_QUOTED': (1, 33),
+                  'EQUAL': (1, 33),
+                  'FALSE': (1, 33),
+                  'FLOAT': (1, 33),
+                  'FUNCTION_TYPE': (1, 33),
+                  'GREATER': (1, 33),
+                  'GREATER_EQUAL': (1, 33),
+                  'INT': (1, 33),
+                  'LESSER': (1, 33),
+                  'LESSER_EQUAL': (1, 33),
+                  'MODULUS': (1, 33),
+                  'MULTIPLIER': (1, 33),
+                  'NAME': (1, 33),
+                  'NOT': (1, 33),
+                  'NOT_EQUAL': (1, 33),
+                  'NULL': (1, 33),
+                  'OR': (1, 33),
+                  'PLUS': (1, 33),
+                  'POWER': (1, 33),
+                  'RAISE': (1, 33),
+                  'REGEXP': (1, 33),
+                  'RETURN': (1, 33),
+                  'SINGLE_QUOTED': (1, 33),
+                  'TRUE': (1, 33),
+                  'TRY': (1, 33),
+                  '_AS': (1, 33),
+                  '_CCB': (1, 33),
+                  '_COLON': (1, 33),
+                  '_COMMA': (1, 33),
+                  '_CP': (1, 33),
+                  '_CSB': (1, 33),
+                  '_DEDENT': (1, 33),
+                  '_FOREACH': (1, 33),
+                  '_IF': (1, 33),
+                  '_IMPORT': (1, 33),
+                  '_INDENT': (1, 33),
+                  '_NL': (1, 33),
+                  '_OCB': (1, 33),
+                  '_OP': (1, 33),
+                  '_OSB': (1, 33),
+                  '_THEN': (1, 33),
+                  '_WHEN': (1, 33),
+                  '_WHILE': (1, 33)},
+            321: {'_DEDENT': (0, 335)},
+            322: {'$END': (1, 34),
+                  'AND': (1, 34),
+                  'BREAK': (1, 34),
+                  'BSLASH': (1, 34),
+                  'CONSTANT': (1, 34),
+                  'DASH': (1, 34),
+                  'DOUBLE_QUOTED': (1, 34),
+                  'EQUAL': (1, 34),
+                  'FALSE': (1, 34),
+                  'FLOAT': (1, 34),
+                  'FUNCTION_TYPE': (1, 34),
+                  'GREATER': (1, 34),
+                  'GREATER_EQUAL': (1, 34),
+                  'INT': (1, 34),
+                  'LESSER': (1, 34),
+                  'LESSER_EQUAL': (1, 34),
+                  'MODULUS': (1, 34),
+                  'MULTIPLIER': (1, 34),
+                  'NAME': (1, 34),
+                  'NOT': (1, 34),
+                  'NOT_EQUAL': (1, 34),
+                  'NULL': (1, 34),
+                  'OR': (1, 34),
+                  'PLUS': (1, 34),
+                  'POWER': (1, 34),
+                  'RAISE': (1, 34),
+                  'REGEXP': (1, 34),
+                  'RETURN': (1, 34),
+                  'SINGLE_QUOTED': (1, 34),
+                  'TRUE': (1, 34),
+                  'TRY': (1, 34),
+                  '_AS': (1, 34),
+                  '_CCB': (1, 34),
+                  '_COLON': (1, 34),
+                  '_COMMA': (1, 34),
+                  '_CP': (1, 34),
+                  '_CSB': (1, 34),
+                  '_DEDENT': (1, 34),
+                  '_FOREACH': (1, 34),
+                  '_IF': (1, 34),
+                  '_IMPORT': (1, 34),
+                  '_INDENT': (1, 34),
+                  '_NL': (1, 34),
+                  '_OCB': (1, 34),
+                  '_OP': (1, 34),
+                  '_OSB': (1, 34),
+                  '_THEN': (1, 34),
+                  '_WHEN': (1, 34),
+                  '_WHILE': (1, 34)},
+            323: {'_CCB': (0, 336)},
+            324: {'$END': (1, 40),
+                  'AND': (1, 40),
+                  'BREAK': (1, 40),
+                  'BSLASH': (1, 40),
+                  'CONSTANT': (1, 40),
+                  'DASH': (1, 40),
+                  'DOUBLE_QUOTED': (1, 40),
+                  'EQUAL': (1, 40),
+                  'FALSE': (1, 40),
+                  'FLOAT': (1, 40),
+                  'FUNCTION_TYPE': (1, 40),
+                  'GREATER': (1, 40),
+                  'GREATER_EQUAL': (1, 40),
+                  'INT': (1, 40),
+                  'LESSER': (1, 40),
+                  'LESSER_EQUAL': (1, 40),
+                  'MODULUS': (1, 40),
+                  'MULTIPLIER': (1, 40),
+                  'NAME': (1, 40),
+                  'NOT': (1, 40),
+                  'NOT_EQUAL': (1, 40),
+                  'NULL': (1, 40),
+                  'OR': (1, 40),
+                  'PLUS': (1, 40),
+                  'POWER': (1, 40),
+                  'RAISE': (1, 40),
+                  'REGEXP': (1, 40),
+                  'RETURN': (1, 40),
+                  'SINGLE_QUOTED': (1, 40),
+                  'TRUE': (1, 40),
+                  'TRY': (1, 40),
+                  '_AS': (1, 40),
+                  '_CCB': (1, 40),
+                  '_COLON': (1, 40),
+                  '_COMMA': (1, 40),
+                  '_CP': (1, 40),
+                  '_CSB': (1, 40),
+                  '_DEDENT': (1, 40),
+                  '_FOREACH': (1, 40),
+                  '_IF': (1, 40),
+                  '_IMPORT': (1, 40),
+                  '_INDENT': (1, 40),
+                  '_NL': (1, 40),
+                  '_OCB': (1, 40),
+                  '_OP': (1, 40),
+                  '_OSB': (1, 40),
+                  '_THEN': (1, 40),
+                  '_WHEN': (1, 40),
+                  '_WHILE': (1, 40)},
+            325: {'_CCB': (1, 187), '_COMMA': (1, 187), '_NL': (1, 187)},
+            326: {'$END': (1, 133),
+                  'BREAK': (1, 133),
+                  'CONSTANT': (1, 133),
+                  'DOUBLE_QUOTED': (1, 133),
+                  'FALSE': (1, 133),
+                  'FLOAT': (1, 133),
+                  'FUNCTION_TYPE': (1, 133),
+                  'INT': (1, 133),
+                  'NAME': (1, 133),
+                  'NOT': (1, 133),
+                  'NULL': (1, 133),
+                  'RAISE': (1, 133),
+                  'REGEXP': (1, 133),
+                  'RETURN': (1, 133),
+                  'SINGLE_QUOTED': (1, 133),
+                  'TRUE': (1, 133),
+                  'TRY': (1, 133),
+                  '_COLON': (1, 133),
+                  '_DEDENT': (1, 133),
+                  '_ELSE': (1, 133),
+                  '_FOREACH': (1, 133),
+                  '_IF': (1, 133),
+                  '_IMPORT': (1, 133),
+                  '_INDENT': (1, 133),
+                  '_NL': (1, 133),
+                  '_OCB': (1, 133),
+                  '_OP': (1, 133),
+                  '_OSB': (1, 133),
+                  '_THEN': (1, 133),
+                  '_WHEN': (1, 133),
+                  '_WHILE': (1, 133)},
+            327: {'_NL': (1, 132)},
+            328: {'$END': (1, 135),
+                  'BREAK': (1, 135),
+                  'CONSTANT': (1, 135),
+                  'DOUBLE_QUOTED': (1, 135),
+                  'FALSE': (1, 135),
+                  'FLOAT': (1, 135),
+                  'FUNCTION_TYPE': (1, 135),
+                  'INT': (1, 135),
+                  'NAME': (1, 135),
+                  'NOT': (1, 135),
+                  'NULL': (1, 135),
+                  'RAISE': (1, 135),
+                  'REGEXP': (1, 135),
+                  'RETURN': (1, 135),
+                  'SINGLE_QUOTED': (1, 135),
+                  'TRUE': (1, 135),
+                  'TRY': (1, 135),
+                  '_COLON': (1, 135),
+                  '_DEDENT': (1, 135),
+                  '_FOREACH': (1, 135),
+                  '_IF': (1, 135),
+                  '_IMPORT': (1, 135),
+                  '_INDENT': (1, 135),
+                  '_NL': (1, 135),
+                  '_OCB': (1, 135),
+                  '_OP': (1, 135),
+                  '_OSB': (1, 135),
+                  '_THEN': (1, 135),
+                  '_WHEN': (1, 135),
+                  '_WHILE': (1, 135)},
+            329: {'$END': (1, 152),
+                  'BREAK': (1, 152),
+                  'CONSTANT': (1, 152),
+                  'DOUBLE_QUOTED': (1, 152),
+                  'FALSE': (1, 152),
+                  'FINALLY': (1, 152),
+                  'FLOAT': (1, 152),
+                  'FUNCTION_TYPE': (1, 152),
+                  'INT': (1, 152),
+                  'NAME': (1, 152),
+                  'NOT': (1, 152),
+                  'NULL': (1, 152),
+                  'RAISE': (1, 152),
+                  'REGEXP': (1, 152),
+                  'RETURN': (1, 152),
+                  'SINGLE_QUOTED': (1, 152),
+                  'TRUE': (1, 152),
+                  'TRY': (1, 152),
+                  '_COLON': (1, 152),
+                  '_DEDENT': (1, 152),
+                  '_FOREACH': (1, 152),
+                  '_IF': (1, 152),
+                  '_IMPORT': (1, 152),
+                  '_INDENT': (1, 152),
+                  '_NL': (1, 152),
+                  '_OCB': (1, 152),
+                  '_OP': (1, 152),
+                  '_OSB': (1, 152),
+                  '_THEN': (1, 152),
+                  '_WHEN': (1, 152),
+                  '_WHILE': (1, 152)},
+            330: {'_NL': (1, 151)},
+            331: {'$END': (1, 154),
+                  'BREAK': (1, 154),
+                  'CONSTANT': (1, 154),
+                  'DOUBLE_QUOTED': (1, 154),
+                  'FALSE': (1, 154),
+                  'FLOAT': (1, 154),
+                  'FUNCTION_TYPE': (1, 154),
+                  'INT': (1, 154),
+                  'NAME': (1, 154),
+                  'NOT': (1, 154),
+                  'NULL': (1, 154),
+                  'RAISE': (1, 154),
+                  'REGEXP': (1, 154),
+                  'RETURN': (1, 154),
+                  'SINGLE_QUOTED': (1, 154),
+                  'TRUE': (1, 154),
+                  'TRY': (1, 154),
+                  '_COLON': (1, 154),
+                  '_DEDENT': (1, 154),
+                  '_FOREACH': (1, 154),
+                  '_IF': (1, 154),
+                  '_IMPORT': (1, 154),
+                  '_INDENT': (1, 154),
+                  '_NL': (1, 154),
+                  '_OCB': (1, 154),
+                  '_OP': (1, 154),
+                  '_OSB': (1, 154),
+                  '_THEN': (1, 154),
+                  '_WHEN': (1, 154),
+                  '_WHILE': (1, 154)},
+            332: {'_CSB': (0, 337)},
+            333: {'$END': (1, 21),
+                  'AND': (1, 21),
+                  'BREAK': (1, 21),
+                  'BSLASH': (1, 21),
+                  'CONSTANT': (1, 21),
+                  'DASH': (1, 21),
+                  'DOUBLE_QUOTED': (1, 21),
+                  'EQUAL': (1, 21),
+                  'FALSE': (1, 21),
+                  'FLOAT': (1, 21),
+                  'FUNCTION_TYPE': (1, 21),
+                  'GREATER': (1, 21),
+                  'GREATER_EQUAL': (1, 21),
+                  'INT': (1, 21),
+                  'LESSER': (1, 21),
+                  'LESSER_EQUAL': (1, 21),
+                  'MODULUS': (1, 21),
+                  'MULTIPLIER': (1, 21),
+                  'NAME': (1, 21),
+                  'NOT': (1, 21),
+                  'NOT_EQUAL': (1, 21),
+                  'NULL': (1, 21),
+                  'OR': (1, 21),
+                  'PLUS': (1, 21),
+                  'POWER': (1, 21),
+                  'RAISE': (1, 21),
+                  'REGEXP': (1, 21),
+                  'RETURN': (1, 21),
+                  'SINGLE_QUOTED': (1, 21),
+                  'TRUE': (1, 21),
+                  'TRY': (1, 21),
+                  '_AS': (1, 21),
+                  '_CCB': (1, 21),
+                  '_COLON': (1, 21),
+                  '_COMMA': (1, 21),
+                  '_CP': (1, 21),
+                  '_CSB': (1, 21),
+                  '_DEDENT': (1, 21),
+                  '_FOREACH': (1, 21),
+                  '_IF': (1, 21),
+                  '_IMPORT': (1, 21),
+                  '_INDENT': (1, 21),
+                  '_NL': (1, 21),
+                  '_OCB': (1, 21),
+                  '_OP': (1, 21),
+                  '_OSB': (1, 21),
+                  '_THEN': (1, 21),
+                  '_WHEN': (1, 21),
+                  '_WHILE': (1, 21)},
+            334: {'_COMMA': (1, 199),
+                  '_CP': (1, 199),
+                  '_NL': (1, 199),
+                  '_THEN': (1, 199)},
+            335: {'_CCB': (0, 338)},
+            336: {'$END': (1, 36),
+                  'AND': (1, 36),
+                  'BREAK': (1, 36),
+                  'BSLASH': (1, 36),
+                  'CONSTANT': (1, 36),
+                  'DASH': (1, 36),
+                  'DOUBLE_QUOTED': (1, 36),
+                  'EQUAL': (1, 36),
+                  'FALSE': (1, 36),
+                  'FLOAT': (1, 36),
+                  'FUNCTION_TYPE': (1, 36),
+                  'GREATER': (1, 36),
+                  'GREATER_EQUAL': (1, 36),
+                  'INT': (1, 36),
+                  'LESSER': (1, 36),
+                  'LESSER_EQUAL': (1, 36),
+                  'MODULUS': (1, 36),
+                  'MULTIPLIER': (1, 36),
+                  'NAME': (1, 36),
+                  'NOT': (1, 36),
+                  'NOT_EQUAL': (1, 36),
+                  'NULL': (1, 36),
+                  'OR': (1, 36),
+                  'PLUS': (1, 36),
+                  'POWER': (1, 36),
+                  'RAISE': (1, 36),
+                  'REGEXP': (1, 36),
+                  'RETURN': (1, 36),
+                  'SINGLE_QUOTED': (1, 36),
+                  'TRUE': (1, 36),
+                  'TRY': (1, 36),
+                  '_AS': (1, 36),
+                  '_CCB': (1, 36),
+                  '_COLON': (1, 36),
+                  '_COMMA': (1, 36),
+                  '_CP': (1, 36),
+                  '_CSB': (1, 36),
+                  '_DEDENT': (1, 36),
+                  '_FOREACH': (1, 36),
+                  '_IF': (1, 36),
+                  '_IMPORT': (1, 36),
+                  '_INDENT': (1, 36),
+                  '_NL': (1, 36),
+                  '_OCB': (1, 36),
+                  '_OP': (1, 36),
+                  '_OSB': (1, 36),
+                  '_THEN': (1, 36),
+                  '_WHEN': (1, 36),
+                  '_WHILE': (1, 36)},
+            337: {'$END': (1, 24),
+                  'AND': (1, 24),
+                  'BREAK': (1, 24),
+                  'BSLASH': (1, 24),
+                  'CONSTANT': (1, 24),
+                  'DASH': (1, 24),
+                  'DOUBLE_QUOTED': (1, 24),
+                  'EQUAL': (1, 24),
+                  'FALSE': (1, 24),
+                  'FLOAT': (1, 24),
+                  'FUNCTION_TYPE': (1, 24),
+                  'GREATER': (1, 24),
+                  'GREATER_EQUAL': (1, 24),
+                  'INT': (1, 24),
+                  'LESSER': (1, 24),
+                  'LESSER_EQUAL': (1, 24),
+                  'MODULUS': (1, 24),
+                  'MULTIPLIER': (1, 24),
+                  'NAME': (1, 24),
+                  'NOT': (1, 24),
+                  'NOT_EQUAL': (1, 24),
+                  'NULL': (1, 24),
+                  'OR': (1, 24),
+                  'PLUS': (1, 24),
+                  'POWER': (1, 24),
+                  'RAISE': (1, 24),
+                  'REGEXP': (1, 24),
+                  'RETURN': (1, 24),
+                  'SINGLE_QUOTED': (1, 24),
+                  'TRUE': (1, 24),
+                  'TRY': (1, 24),
+                  '_AS': (1, 24),
+                  '_CCB': (1, 24),
+                  '_COLON': (1, 24),
+                  '_COMMA': (1, 24),
+                  '_CP': (1, 24),
+                  '_CSB': (1, 24),
+                  '_DEDENT': (1, 24),
+                  '_FOREACH': (1, 24),
+                  '_IF': (1, 24),
+                  '_IMPORT': (1, 24),
+                  '_INDENT': (1, 24),
+                  '_NL': (1, 24),
+                  '_OCB': (1, 24),
+                  '_OP': (1, 24),
+                  '_OSB': (1, 24),
+                  '_THEN': (1, 24),
+                  '_WHEN': (1, 24),
+                  '_WHILE': (1, 24)},
+            338: {'$END': (1, 35),
+                  'AND': (1, 35),
+                  'BREAK': (1, 35),
+                  'BSLASH': (1, 35),
+                  'CONSTANT': (1, 35),
+                  'DASH': (1, 35),
+                  'DOUBLE_QUOTED': (1, 35),
+                  'EQUAL': (1, 35),
+                  'FALSE': (1, 35),
+                  'FLOAT': (1, 35),
+                  'FUNCTION_TYPE': (1, 35),
+                  'GREATER': (1, 35),
+                  'GREATER_EQUAL': (1, 35),
+                  'INT': (1, 35),
+                  'LESSER': (1, 35),
+                  'LESSER_EQUAL': (1, 35),
+                  'MODULUS': (1, 35),
+                  'MULTIPLIER': (1, 35),
+                  'NAME': (1, 35),
+                  'NOT': (1, 35),
+                  'NOT_EQUAL': (1, 35),
+                  'NULL': (1, 35),
+                  'OR': (1, 35),
+                  'PLUS': (1, 35),
+                  'POWER': (1, 35),
+                  'RAISE': (1, 35),
+                  'REGEXP': (1, 35),
+                  'RETURN': (1, 35),
+                  'SINGLE_QUOTED': (1, 35),
+                  'TRUE': (1, 35),
+                  'TRY': (1, 35),
+                  '_AS': (1, 35),
+                  '_CCB': (1, 35),
+                  '_COLON': (1, 35),
+                  '_COMMA': (1, 35),
+                  '_CP': (1, 35),
+                  '_CSB': (1, 35),
+                  '_DEDENT': (1, 35),
+                  '_FOREACH': (1, 35),
+                  '_IF': (1, 35),
+                  '_IMPORT': (1, 35),
+                  '_INDENT': (1, 35),
+                  '_NL': (1, 35),
+                  '_OCB': (1, 35),
+                  '_OP': (1, 35),
+                  '_OSB': (1, 35),
+                  '_THEN': (1, 35),
+                  '_WHEN': (1, 35),
+                  '_WHILE': (1, 35)}},
+ 'terminals': [('_WS', 're', '(?:\\ )+', [], 1),
+               ('INT_TYPE', 'str', 'int', [], 1),
+               ('FLOAT_TYPE', 'str', 'float', [], 1),
+               ('NUMBER_TYPE', 'str', 'number', [], 1),
+               ('STRING_TYPE', 'str', 'string', [], 1),
+               ('LIST_TYPE', 'str', 'list', [], 1),
+               ('OBJECT_TYPE', 'str', 'object', [], 1),
+               ('REGEXP_TYPE', 'str', 'regex', [], 1),
+               ('FUNCTION_TYPE', 'str', 'function', [], 1),
+               ('ANY_TYPE', 'str', 'any', [], 1),
+               ('_NL', 're',
+                '(\r'
+                '?\n'
+                '[\t ]*((###(?:[^#]|#(?!##))*###|#(?!##)[^\n'
+                ']*)(?=\r'
+                '?\n'
+                '))?)+',
+                [], 1),
+               ('COMMENT', 're', '###(?:[^#]|#(?!##))*###|#(?!##)[^\n]*', [],
+                1),
+               ('_INDENT', 'str', '<INDENT>', [], 1),
+               ('_DEDENT', 'str', '<DEDENT>', [], 1),
+               ('CONSTANT', 'str', '<CONSTANT>', [], 1),
+               ('TRUE', 'str', 'true', [], 1), ('FALSE', 'str', 'false', [], 1),
+               ('NULL', 'str', 'null', [], 1),
+               ('RAW_INT', 're', '[0-9]+', [], 2),
+               ('INT', 're', '(?:(?:\\+|\\-))?[0-9]+', [], 2),
+               ('FLOAT', 're',
+                '(?:(?:(?:\\+|\\-))?(?:(?:\\+|\\-))?[0-9]+\\.(?:[0-9]+)?|\\.[0-9]+)',
+                [], 2),
+               ('SINGLE_QUOTED', 're', "'([^']*)'", [], 1),
+               ('DOUBLE_QUOTED', 're', '"([^"]*)"', [], 1),
+               ('REGEXP', 're', '\\/([^\\/]*)\\/', [], 2),
+               ('NAME', 're', '[a-zA-Z-\\/_0-9]+', [], 1),
+               ('_OSB', 'str', '[', [], 1), ('_CSB', 'str', ']', [], 1),
+               ('_OCB', 'str', '{', [], 1), ('_CCB', 'str', '}', [], 1),
+               ('_COLON', 'str', ':', [], 1), ('_COMMA', 'str', ',', [], 1),
+               ('_OP', 'str', '(', [], 1), ('_CP', 'str', ')', [], 1),
+               ('EQUALS', 'str', '=', [], 1), ('_DOT', 'str', '.', [], 1),
+               ('_AS', 'str', 'as', [], 1), ('_IMPORT', 'str', 'import', [], 1),
+               ('POWER', 'str', '^', [], 1), ('NOT', 'str', '!', [], 1),
+               ('OR', 'str', 'or', [], 1), ('AND', 'str', 'and', [], 1),
+               ('GREATER', 'str', '>', [], 1),
+               ('GREATER_EQUAL', 'str', '>=', [], 1),
+               ('LESSER', 'str', '<', [], 1),
+               ('LESSER_EQUAL', 'str', '<=', [], 1),
+               ('NOT_EQUAL', 'str', '!=', [], 1), ('EQUAL', 'str', '==', [], 1),
+               ('BSLASH', 'str', '/', [], 5), ('MULTIPLIER', 'str', '*', [], 1),
+               ('MODULUS', 'str', '%', [], 5), ('PLUS', 'str', '+', [], 5),
+               ('DASH', 'str', '-', [], 5), ('RETURN', 'str', 'return', [], 1),
+               ('BREAK', 'str', 'break', [], 1),
+               ('_THEN', 'str', 'then', [], 1), ('_IF', 'str', 'if', [], 1),
+               ('_ELSE', 'str', 'else', [], 1),
+               ('_FOREACH', 'str', 'foreach', [], 1),
+               ('_WHILE', 'str', 'while', [], 1),
+               ('_RETURNS', 'str', 'returns', [], 1),
+               ('TRY', 'str', 'try', [], 1), ('_CATCH', 'str', 'catch', [], 1),
+               ('FINALLY', 'str', 'finally', [], 1),
+               ('RAISE', 'str', 'raise', [], 1),
+               ('_WHEN', 'str', 'when', [], 1)]}
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from .Tree import Tree
+
+
+class IncrementalTree(Tree):
+    """
+    The tree of a story that can be reparsed incrementally, see
+    Parser.reparse.
+
+    Along with its top-level blocks, it keeps the tokens of each block,
+    found the first time they are needed, so that the blocks after an edit
+    can be moved without walking them again.
+    """
+    __slots__ = ('leaves',)
+
+    def __init__(self, children, leaves=None):
+        super().__init__('start', children)
+        if leaves is None:
+            leaves = [None] * len(children)
+        self.leaves = leaves
+
+    @staticmethod
+    def find_leaves(tree):
+        """
+        Finds the tokens of a tree, once even when they appear in several
+        places, like the shorthands of arguments.
+        """
+        leaves = {}
+        stack = [tree]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Tree):
+                stack.extend(item.children)
+            elif item.pos_in_stream is not None:
+                leaves[id(item)] = item
+        return list(leaves.values())
+
+    @staticmethod
+    def move(leaves, offset, lines):
+        """
+        Moves tokens by offset characters and the given number of lines
+        """
+        for token in leaves:
+            token.pos_in_stream += offset
+            token.line += lines
+            token.end_line += lines
+
+    def block_leaves(self, index):
+        """
+        Gets the tokens of a block
+        """
+        leaves = self.leaves[index]
+        if leaves is None:
+            leaves = self.find_leaves(self.children[index])
+            self.leaves[index] = leaves
+        return leaves
+
+    def line_start(self, index):
+        """
+        Finds the offset of the start of the line where a block starts
+        """
+        token = self.children[index].first_token()
+        return token.pos_in_stream - token.column + 1
+
+    def starts_line(self, index):
+        """
+        Whether a block starts its line, as blocks of arguments can end in
+        the middle of lines
+        """
+        return self.children[index].first_token().column == 1
+
+    def line_block(self, index):
+        """
+        Finds the index of the first block of the line where a block starts
+        """
+        while index > 0 and self.starts_line(index) is False:
+            index -= 1
+        return index
+
+    def block_at(self, offset):
+        """
+        Finds the index of the last block starting a line at or before
+        offset, or 0 when there is none.
+        """
+        low = 0
+        high = len(self.children)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.children[middle].start_pos() <= offset:
+                low = middle
+            else:
+                high = middle
+        return self.line_block(low)
+
+    def block_after(self, offset):
+        """
+        Finds the index of the first block starting a line after offset, or
+        the number of blocks when there is none.
+        """
+        low = 0
+        high = len(self.children)
+        while low < high:
+            middle = (low + high) // 2
+            if self.children[middle].start_pos() <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        while low < len(self.children) and self.starts_line(low) is False:
+            low += 1
+        return low
@@ -1,11 +1,27 @@
 # -*- coding: utf-8 -*-
+import copy
+
 from lark.indenter import Indenter
 
 
 class CustomIndenter(Indenter):
+    """
+    Lark's Indenter, keeping the indentation of each stream in its own copy
+    of the indenter, so that an indenter can process many streams at once,
+    like the ones of parsers shared between threads.
+    """
     NL_type = '_NL'
     OPEN_PAREN_types = []
     CLOSE_PAREN_types = []
     INDENT_type = '_INDENT'
     DEDENT_type = '_DEDENT'
     tab_len = 8
+
+    def process(self, stream):
+        """
+        Processes a stream from no indentation, with a copy of the indenter
+        """
+        indenter = copy.copy(self)
+        indenter.paren_level = 0
+        indenter.indent_level = [0]
+        return super(CustomIndenter, indenter).process(stream)
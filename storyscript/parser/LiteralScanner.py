@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+import re
+import threading
+
+
+class LiteralScanner:
+    """
+    Scans constant list and object literals into a single CONSTANT token, so
+    that big literals don't go through the expression rules one value at a
+    time. Constant literals are made only of numbers, strings without
+    templates, booleans, null and other constant literals, with strings as
+    the keys of objects. Objects.constant compiles them.
+
+    Only literals with at least min_items values are scanned, and only when
+    their layout is one the grammar accepts: a newline after an opening
+    bracket must indent, newlines after commas must keep the indentation,
+    and the closing bracket of an indented literal must dedent on its own
+    line. Anything else is left to the grammar, which also reports errors.
+
+    Tokens are matched with the same expression for str and bytes sources,
+    see Scanner. Scanners are shared by the lexers of all threads, so the
+    starts that can't be literals are kept for each thread, and forgotten
+    once the source has been scanned.
+    """
+    starts = '[{'
+    min_items = 32
+    tab_len = 8
+    scalar = (r'"[^"{}]*"|\'[^\'{}]*\'|'
+              r'[+-]?[0-9]+\.[0-9]*|\.[0-9]+|[+-]?[0-9]+|'
+              r'(?:true|false|null)(?![a-zA-Z\-/_0-9])')
+    separators = (r'(?P<space> +)|(?P<newline>(?:\r?\n[\t ]*)+)|'
+                  r'(?P<open>[\[{]) *|(?P<close>[\]}])|(?P<comma>,) *|')
+    pattern = (separators + r'(?P<colon>:)|'
+               r'(?P<string>"[^"{}]*"|\'[^\'{}]*\')|'
+               r'(?P<number>[+-]?[0-9]+\.[0-9]*|\.[0-9]+|[+-]?[0-9]+)|'
+               r'(?P<word>(?:true|false|null)(?![a-zA-Z\-/_0-9]))')
+    values = separators + r'(?P<values>(?:{0})(?: *, *(?:{0}))*)'.format(
+        scalar)
+    pairs = separators + (r'(?P<pairs>(?:{0}) *: *(?:{1})'
+                          r'(?: *, *(?:{0}) *: *(?:{1}))*)|'
+                          r'(?P<key>{0}) *: *').format(
+        r'"[^"{}]*"|\'[^\'{}]*\'', scalar)
+    tokens = re.compile(pattern)
+    scalars = re.compile(scalar)
+    byte_scalars = re.compile(scalar.encode('utf-8'))
+    runs = {'value': re.compile(values), 'key': re.compile(pairs)}
+    runs.update(next=runs['value'], close=runs['value'])
+    byte_runs = {state: re.compile(run.pattern.encode('utf-8'))
+                 for state, run in runs.items()}
+    closers = {'[': ']', '{': '}', ord('['): ord(']'), ord('{'): ord('}')}
+    indentation = re.compile(r'[\t ]*')
+    byte_indentation = re.compile(rb'[\t ]*')
+    everything = re.compile(r'[\s\S]*')
+    byte_everything = re.compile(rb'[\s\S]*')
+
+    def __init__(self):
+        self.state = threading.local()
+
+    def failed(self, source):
+        """
+        Gets the starts that can't be literals in the source scanned by the
+        current thread
+        """
+        failed = getattr(self.state, 'failed', None)
+        if failed is None or failed[0] is not source:
+            failed = (source, set())
+            self.state.failed = failed
+        return failed[1]
+
+    def forget(self):
+        """
+        Forgets the source scanned by the current thread
+        """
+        self.state.failed = None
+
+    @classmethod
+    def indent(cls, text):
+        """
+        Measures the indentation at the end of a newline token, like the
+        indenter
+        """
+        if isinstance(text, str):
+            text = text.rsplit('\n', 1)[-1]
+            return text.count(' ') + text.count('\t') * cls.tab_len
+        text = text.rsplit(b'\n', 1)[-1]
+        return text.count(b' ') + text.count(b'\t') * cls.tab_len
+
+    @classmethod
+    def line_indent(cls, source, position):
+        """
+        Measures the indentation of the line at position
+        """
+        if isinstance(source, str):
+            start = source.rfind('\n', 0, position) + 1
+            return cls.indent(cls.indentation.match(source, start).group())
+        start = source.rfind(b'\n', 0, position) + 1
+        return cls.indent(cls.byte_indentation.match(source, start).group())
+
+    @staticmethod
+    def newline(frame, state, indents, indent):
+        """
+        Checks a newline inside a literal, returning the next state or None.
+        Literals indent after their opening bracket, keep the indentation
+        after commas and dedent before their closing bracket.
+        """
+        if frame[2] and state in ('value', 'key') and frame[1] is False:
+            if indent > indents[-1]:
+                indents.append(indent)
+                frame[1] = True
+                frame[2] = False
+                return state
+            return None
+        if state in ('value', 'key') and indent == indents[-1]:
+            return state
+        if state == 'next' and frame[1] and indent == indents[-2]:
+            indents.pop()
+            return 'close'
+        return None
+
+    @staticmethod
+    def close(frame, state, closer):
+        """
+        Whether a literal can be closed
+        """
+        if frame[0] != closer:
+            return False
+        if frame[1]:
+            return state == 'close'
+        return state == 'next' or (frame[2] and state in ('value', 'key'))
+
+    @classmethod
+    def end(cls, source, position, runs, scalars, failed=None):
+        """
+        Finds where the constant literal starting at position ends, or None
+        when there isn't one. Frames hold the closing bracket of each open
+        literal, whether it's indented, whether it's still empty and where
+        it starts.
+
+        Runs of values and of key-value pairs on the same line are matched
+        at once, with the expression of the state, and so are keys with
+        their colon and separators with the spaces after them.
+
+        When there's no literal, the starts of the literals nested in it
+        that can't be literals either are added to failed: the ones still
+        open where scanning failed, which would fail at the same token, or
+        all of them when there are too few values.
+        """
+        indents = [cls.line_indent(source, position)]
+        frames = []
+        starts = []
+        items = 0
+        state = 'value'
+        while state is not None:
+            match = runs[state].match(source, position)
+            if match is None:
+                break
+            kind = match.lastgroup
+            position = match.end()
+            if kind == 'space':
+                continue
+            if kind == 'newline':
+                state = cls.newline(frames[-1], state, indents,
+                                    cls.indent(match.group()))
+                continue
+            if kind == 'close':
+                if cls.close(frames[-1], state, source[position - 1]) is False:
+                    break
+                frames.pop()
+                state = 'next'
+                if frames == []:
+                    if items >= cls.min_items:
+                        return position
+                    frames = [[None, None, None, start] for start in starts]
+                    break
+                frames[-1][2] = False
+                continue
+            if frames:
+                frames[-1][2] = False
+            state = cls.transition(frames, state, kind)
+            if kind == 'open' and state:
+                items += 1
+                start = match.start()
+                starts.append(start)
+                frames.append([cls.closers[source[start]], False, True,
+                               start])
+                state = 'value'
+                if frames[-1][0] in ('}', ord('}')):
+                    state = 'key'
+            elif kind == 'values':
+                items += len(scalars.findall(match.group()))
+            elif kind == 'pairs':
+                items += len(scalars.findall(match.group())) // 2
+        if failed is not None:
+            failed.update(frame[3] for frame in frames)
+        return None
+
+    @staticmethod
+    def transition(frames, state, kind):
+        """
+        Finds the state after a token that isn't a bracket or a newline
+        """
+        if kind == 'comma' and state == 'next':
+            if frames[-1][0] in ('}', ord('}')):
+                return 'key'
+            return 'value'
+        if kind == 'key' and state == 'key':
+            return 'value'
+        if kind == 'pairs' and state == 'key':
+            return 'next'
+        if state == 'value' and kind in ('values', 'open'):
+            return 'next'
+        return None
+
+    def match(self, source, position):
+        """
+        Matches the constant literal starting at position, like a regular
+        expression would. The starts that can't be literals are kept while
+        the source is scanned, as the scanner tries every bracket of a
+        literal that isn't one.
+        """
+        return self.scan(source, position, self.runs, self.scalars,
+                         self.everything)
+
+    def byte_match(self, source, position):
+        return self.scan(source, position, self.byte_runs, self.byte_scalars,
+                         self.byte_everything)
+
+    def scan(self, source, position, runs, scalars, everything):
+        failed = self.failed(source)
+        if position in failed:
+            return None
+        end = self.end(source, position, runs, scalars, failed)
+        if end is None:
+            return None
+        return everything.match(source, position, end)
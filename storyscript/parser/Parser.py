@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*-
 import io
+import mmap
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 from lark import Lark
+from lark.exceptions import UnexpectedInput, UnexpectedToken
 
+from .Arena import Arena
 from .Grammar import Grammar
+from .IncrementalTree import IncrementalTree
 from .Indenter import CustomIndenter
+from .PrattGrammar import PrattGrammar
+from .Scanner import Scanner
+from .SideTables import SideTables
+from .Tables import Tables
+from .TokenStream import TokenStream
 from .Transformer import Transformer
 from .Tree import Tree
+from ..exceptions import StorySyntaxError
 
 
 class Parser:
@@ -14,9 +27,23 @@ class Parser:
     Wraps up the parser submodule and exposes parsing and lexing
     functionalities.
     """
-    def __init__(self, algo='lalr', ebnf=None):
+    registry = {}
+    lalr_algos = ('lalr', 'pratt')
+    delimiters = ('"', "'", '/')
+    registry_lock = threading.Lock()
+    build_locks = {}
+    parallel_lines = 2000
+    chunks_per_worker = 4
+    top_level = re.compile(r'\n(?![\s#)\]}]|(?:else|catch|finally)\b)')
+
+    def __init__(self, algo='lalr', ebnf=None, compact=False,
+                 lexer='scanner', workers=None, cache=None):
         self.algo = algo
         self.ebnf = ebnf
+        self.compact = compact
+        self.lexer = lexer
+        self.workers = workers
+        self.cache = cache
 
     @staticmethod
     def indenter():
@@ -26,37 +53,304 @@ class Parser:
         return CustomIndenter()
 
     @staticmethod
-    def transformer():
+    def transformer(compact=False):
         """
         Initialize the transformer
         """
-        return Transformer()
+        return Transformer(compact=compact)
+
+    @staticmethod
+    def pool(workers):
+        """
+        Initialize a pool of worker processes
+        """
+        return ProcessPoolExecutor(max_workers=workers)
 
     def grammar(self):
         if self.ebnf:
             with io.open(self.ebnf, 'r') as f:
                 return f.read()
-        return Grammar().build()
+        if self.algo == 'pratt':
+            return PrattGrammar.grammar()
+        return Grammar.grammar()
 
     def lark(self):
         """
-        Get the grammar and initialize Lark.
+        Get the grammar and initialize Lark, reusing an instance from the
+        registry when the same grammar has already been built. Instances are
+        built under a lock of their own, so that other threads can get the
+        instances that are already built meanwhile.
         """
-        return Lark(self.grammar(), parser=self.algo, postlex=self.indenter())
+        grammar = self.grammar()
+        key = (grammar, self.algo, self.compact, self.lexer)
+        with self.registry_lock:
+            if key in self.registry:
+                return self.registry[key]
+            lock = self.build_locks.setdefault(key, threading.Lock())
+        with lock:
+            with self.registry_lock:
+                if key in self.registry:
+                    return self.registry[key]
+            instance = self.build(grammar)
+            with self.registry_lock:
+                self.registry[key] = instance
+                self.build_locks.pop(key, None)
+            return instance
+
+    def build(self, grammar):
+        """
+        Builds a Lark instance for the grammar, using the cached tables for
+        LALR. LALR parsers apply the transformer while reducing, so that only
+        Storyscript's tree is built.
+        """
+        if self.algo in self.lalr_algos:
+            tables = Tables.get(grammar)
+            return Tables.lark(tables, scanner=self.lexer == 'scanner',
+                               postlex=self.indenter(),
+                               transformer=self.transformer(self.compact))
+        return Lark(grammar, parser=self.algo, postlex=self.indenter())
 
     def parse(self, source):
         """
-        Parses the source string.
+        Parses the source string, loading the tree from the cache of the
+        parser when the same source has been parsed before, see TreeCache.
         """
         if source == '':
-            return Tree('empty', [])
+            tree = Tree('empty', [])
+            tree.side_tables = SideTables()
+            return tree
+        if self.cache is None:
+            return self.parse_source(source)
+        key = self.cache.key(source, self.grammar(), self.algo, self.compact)
+        tree = self.cache.load(key)
+        if tree is None:
+            tree = self.parse_source(source)
+            self.cache.dump(key, tree, '{}\n'.format(source))
+        return tree
+
+    def parse_source(self, source):
+        """
+        Parses the source string, in parallel when the parser has workers and
+        the source is long enough. The side tables recorded while building
+        the tree are kept in its root, see SideTables.
+        """
+        if self.workers and source.count('\n') >= self.parallel_lines:
+            tree = self.parse_parallel(source)
+            if tree is not None:
+                return tree
         source = '{}\n'.format(source)
-        lark = self.lark()
-        tree = lark.parse(source)
-        return self.transformer().transform(tree)
+        with Transformer.recording() as side_tables:
+            tree = self.lark().parse(source)
+            if self.algo not in self.lalr_algos:
+                tree = self.transformer(self.compact).transform(tree)
+        tree.side_tables = side_tables
+        return tree
+
+    def incremental(self, source):
+        """
+        Parses the source string into a tree that can be reparsed
+        incrementally
+        """
+        tree = self.parse(source)
+        if tree.data == 'start':
+            return IncrementalTree(tree.children)
+        return tree
+
+    @classmethod
+    def inside(cls, error, region):
+        """
+        Whether an error is found before the end of a region, so that the
+        text after the region can't change it. Unbalanced delimiters could
+        start strings or regular expressions ending after the region.
+        """
+        for delimiter in cls.delimiters:
+            if region.count(delimiter) % 2:
+                return False
+        if isinstance(error, UnexpectedToken):
+            token = error.token
+            return token.type != '$END' and token.pos_in_stream is not None \
+                and token.pos_in_stream < len(region)
+        return getattr(error, 'line', None) is not None
+
+    @staticmethod
+    def move_error(error, offset, lines):
+        """
+        Moves the position of an error by offset characters and the given
+        number of lines
+        """
+        line = int(error.line) + lines
+        if isinstance(error.line, str):
+            line = str(line)
+        error.line = line
+        if isinstance(error, UnexpectedToken):
+            error.pos_in_stream += offset
+            error.token.pos_in_stream += offset
+            error.token.line += lines
+        return error
+
+    def parse_region(self, region, offset, line):
+        """
+        Parses a region of a source, starting at offset on the given line,
+        into its blocks and their tokens. Returns None when the region can't
+        be parsed on its own.
+        """
+        try:
+            tree = self.parse(region)
+        except (UnexpectedToken, StorySyntaxError) as error:
+            if self.inside(error, region):
+                raise self.move_error(error, offset, line)
+            return None
+        except (UnexpectedInput, AssertionError):
+            return None
+        leaves = []
+        for block in tree.children:
+            block_leaves = IncrementalTree.find_leaves(block)
+            IncrementalTree.move(block_leaves, offset, line)
+            leaves.append(block_leaves)
+        return list(tree.children), leaves
+
+    def reparse(self, tree, source, start, end, text):
+        """
+        Parses the source string again after replacing source[start:end]
+        with text, where tree is the tree of source.
+
+        Only the top-level blocks that the edit touches are parsed again,
+        along with the block before them, in case the edit nests them in it.
+        The other blocks of tree are reused, and the ones after the edit are
+        moved. Errors found in the middle of the blocks are raised as they
+        are, but the whole source is parsed when the blocks can't be parsed
+        on their own otherwise, as the rest of the source may change them.
+
+        Compiling changes trees, so tree must not have been compiled.
+        """
+        new_source = source[:start] + text + source[end:]
+        if tree.data != 'start' or len(tree.children) == 0:
+            return self.incremental(new_source)
+        if isinstance(tree, IncrementalTree) is False:
+            tree = IncrementalTree(tree.children)
+        first = tree.line_block(max(tree.block_at(start) - 1, 0))
+        last = tree.block_after(end)
+        region_start = 0
+        line = 0
+        if first > 0:
+            region_start = tree.line_start(first)
+            line = tree.children[first].first_token().line - 1
+        region_end = len(source)
+        if last < len(tree.children):
+            region_end = tree.line_start(last)
+        offset = len(text) - (end - start)
+        region = new_source[region_start:region_end + offset]
+        parsed = self.parse_region(region, region_start, line)
+        if parsed is None:
+            return self.incremental(new_source)
+
+        blocks, leaves = parsed
+        lines = text.count('\n') - source.count('\n', start, end)
+        for index in range(last, len(tree.children)):
+            IncrementalTree.move(tree.block_leaves(index), offset, lines)
+        children = list(tree.children)
+        children = children[:first] + blocks + children[last:]
+        leaves = tree.leaves[:first] + leaves + tree.leaves[last:]
+        return IncrementalTree(children, leaves)
+
+    @classmethod
+    def chunks(cls, source, count):
+        """
+        Splits a source in about count chunks of top-level blocks, at the
+        lines starting at column 0 that don't continue the block before
+        them, outside block comments. Yields the chunks with their offsets
+        and the number of lines before them.
+        """
+        size = len(source) // count + 1
+        start = 0
+        line = 0
+        while start < len(source):
+            match = cls.top_level.search(source, start + size)
+            while match and source.count('###', start, match.end()) % 2:
+                match = cls.top_level.search(source, match.end())
+            end = len(source)
+            if match:
+                end = match.end()
+            chunk = source[start:end]
+            yield chunk, start, line
+            line += chunk.count('\n')
+            start = end
+
+    def parse_chunk(self, chunk):
+        """
+        Parses a chunk of a source into an Arena, which keeps all the
+        positions of its tokens when it's sent between processes. Returns
+        None when the chunk can't be parsed on its own.
+        """
+        try:
+            return self.arena(chunk)
+        except (UnexpectedInput, StorySyntaxError, AssertionError):
+            return None
+
+    def parse_parallel(self, source):
+        """
+        Parses the chunks of top-level blocks of a source in a pool of
+        processes, and joins their blocks in a start tree. Returns None when
+        a chunk can't be parsed, so that the whole source is parsed serially
+        and its errors are found where they are. Lark is built first, so
+        that forked workers inherit it from the registry.
+        """
+        self.lark()
+        parser = Parser(algo=self.algo, ebnf=self.ebnf, compact=self.compact,
+                        lexer=self.lexer)
+        chunks = list(self.chunks(source,
+                                  self.workers * self.chunks_per_worker))
+        with self.pool(self.workers) as pool:
+            arenas = list(pool.map(parser.parse_chunk,
+                                   [chunk for chunk, _, _ in chunks]))
+        if None in arenas:
+            return None
+        children = []
+        for arena, (_, offset, line) in zip(arenas, chunks):
+            children.extend(arena.tree(offset, line).children)
+        return Tree('start', children)
+
+    def arena(self, source):
+        """
+        Parses the source string into an Arena
+        """
+        tree = self.parse(source)
+        return Arena.from_tree(tree, '{}\n'.format(source))
 
     def lex(self, source):
         """
-        Lexes the source string
+        Lexes a source lazily. Sources can be strings, bytes in UTF-8 or
+        memory maps, where positions are byte offsets, or files, see
+        lex_file.
+        """
+        if isinstance(source, io.IOBase):
+            return self.lex_file(source)
+        lark = self.lark()
+        if self.lexer == 'scanner':
+            scanner = Scanner(lark.terminals, lark.ignore_tokens,
+                              indenter=self.indenter())
+            return scanner.lex(source)
+        if isinstance(source, str) is False:
+            source = bytes(source).decode('utf-8')
+        return lark.lex(source)
+
+    def token_stream(self, source):
+        """
+        Lexes a string, bytes or a memory map into a TokenStream
+        """
+        return TokenStream.from_tokens(self.lex(source), source)
+
+    def lex_file(self, file):
+        """
+        Lexes a file from a memory map, so that it's never read in memory.
+        Files that can't be mapped, like pipes or empty files, are read.
         """
-        return self.lark().lex(source)
+        try:
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            source = file.read()
+        try:
+            yield from self.lex(source)
+        finally:
+            if hasattr(source, 'close'):
+                source.close()
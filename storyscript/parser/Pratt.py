@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from .Tree import Tree
+
+
+class Pratt:
+    """
+    Parses the operations of PrattGrammar with precedence climbing, building
+    the same trees as the rules for each level of precedence of Grammar.
+
+    Operators bind by their level, from or_expression to pow_expression.
+    Operators of the same level are left-associative, except for powers,
+    which are right-associative and whose left operand is always a primary
+    expression. Unary operators apply to what follows them up to powers.
+
+    Full trees wrap each operand in the single-child levels between its own
+    and the one its parent expects, while compact trees leave them out, like
+    compact transformers.
+    """
+    levels = Tree.expression_levels
+    unary_level = levels.index('unary_expression')
+    power_level = levels.index('pow_expression')
+    primary_level = levels.index('primary_expression')
+    bindings = {'OR': 0, 'AND': 1, 'cmp_operator': 2, 'arith_operator': 3,
+                'mul_operator': 4, 'POWER': power_level}
+
+    def __init__(self, compact=False):
+        self.compact = compact
+
+    def wrap(self, tree, level, target):
+        """
+        Wraps a tree of the given level in the levels down to target
+        """
+        if self.compact:
+            return tree
+        levels = self.levels
+        while level > target:
+            level -= 1
+            tree = Tree(levels[level], (tree,))
+        return tree
+
+    def binding(self, operator):
+        """
+        Finds the level of a binary operator, a tree or a token
+        """
+        if isinstance(operator, Tree):
+            return self.bindings[operator.data]
+        return self.bindings[operator.type]
+
+    def operand(self, items, position):
+        """
+        Parses an operand: a primary expression, possibly after unary
+        operators, which take everything binding as strongly as powers.
+        """
+        return self.climb(items, position, self.primary_level)
+
+    def apply(self, left, level, operator, right, right_level):
+        """
+        Builds the tree of a binary operation, wrapping its operands in the
+        levels its own level expects
+        """
+        binding = self.binding(operator)
+        if binding == self.power_level:
+            right = self.wrap(right, right_level, self.unary_level)
+        else:
+            right = self.wrap(right, right_level, binding + 1)
+            left = self.wrap(left, level, binding)
+        return Tree(self.levels[binding], (left, operator, right)), binding
+
+    def climb(self, items, position, minimum):
+        """
+        Parses the items from position, as long as operators bind at least
+        at the minimum level. Returns the tree, its level and the position
+        after it.
+
+        The operands that wait for the right side of their operator, and the
+        unary operators that wait for what follows them, are kept on a stack
+        of frames instead of recursing, so that long chains of powers or
+        unary operators don't reach the recursion limit.
+        """
+        frames = [[minimum, None, None, None]]
+        while True:
+            item = items[position]
+            position += 1
+            while item.data == 'unary_operator':
+                frames.append(item)
+                frames.append([self.power_level, None, None, None])
+                item = items[position]
+                position += 1
+            tree, level = item, self.primary_level
+            while True:
+                frame = frames[-1]
+                if isinstance(frame, Tree):
+                    frames.pop()
+                    tree = self.wrap(tree, level, self.unary_level)
+                    tree = Tree('unary_expression', (frame, tree))
+                    level = self.unary_level
+                    continue
+                minimum, left, left_level, operator = frame
+                if operator is not None:
+                    tree, level = self.apply(left, left_level, operator,
+                                             tree, level)
+                if position < len(items):
+                    operator = items[position]
+                    binding = self.binding(operator)
+                    if binding >= minimum:
+                        frame[1:] = [tree, level, operator]
+                        if binding != self.power_level:
+                            binding += 1
+                        frames.append([binding, None, None, None])
+                        position += 1
+                        break
+                frames.pop()
+                if not frames:
+                    return tree, level, position
+
+    def operation(self, items):
+        """
+        Parses an operation into the tree of its or_expression level
+        """
+        tree, level, position = self.climb(items, 0, 0)
+        return self.wrap(tree, level, 0)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from .Grammar import Grammar
+
+
+class PrattGrammar(Grammar):
+    """
+    Storyscript's grammar where expressions are flat operations, a sequence
+    of operands and binary operators, instead of a rule for each level of
+    precedence. Operations are parsed with precedence climbing, see Pratt.
+    """
+    built = None
+
+    def expressions(self):
+        """
+        Defines expressions as operations
+        """
+        self.operators()
+        self.ebnf.primary_expression = 'entity , op operation cp'
+        self.ebnf._operand = 'unary_operator* primary_expression'
+        self.ebnf._binary_operator = ('OR, AND, cmp_operator, arith_operator, '
+                                      'mul_operator, POWER')
+        self.ebnf.operation = '_operand (_binary_operator _operand)*'
+
+        self.ebnf.expression = 'operation'
+        self.ebnf.absolute_expression = 'expression'
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+import re
+import string
+
+from lark.exceptions import UnexpectedCharacters
+from lark.lexer import PatternStr, Token
+
+from .LiteralScanner import LiteralScanner
+
+
+class ScannerTable(dict):
+    """
+    Maps the first character of a token to the terminals that can start with
+    it, in the order Lark would try them, for one set of accepted terminals.
+    Candidates are found the first time a character is seen.
+
+    Strings that a regular expression terminal matches entirely, such as
+    keywords and NAME, are not tried on their own: matches of the regular
+    expression are retyped instead, see unless.
+
+    Tables for bytes are keyed by the byte values of the characters.
+    """
+
+    def __init__(self, scanner, terminals, binary=False):
+        super().__init__()
+        self.scanner = scanner
+        self.binary = binary
+        self.matchers = scanner.matchers
+        if binary:
+            self.matchers = scanner.byte_matchers
+        self.unless = {}
+        embedded = set()
+        strings = [t for t in terminals if isinstance(t.pattern, PatternStr)]
+        for terminal in terminals:
+            if isinstance(terminal.pattern, PatternStr):
+                continue
+            regexp = terminal.pattern.to_regexp()
+            for item in strings:
+                if item.priority > terminal.priority:
+                    continue
+                match = re.match(regexp, item.pattern.value)
+                if match and match.group(0) == item.pattern.value:
+                    retype = self.unless.setdefault(terminal.name, {})
+                    retype.setdefault(item.pattern.value, item.name)
+                    if item.pattern.flags <= terminal.pattern.flags:
+                        embedded.add(item.name)
+        self.terminals = [t for t in terminals if t.name not in embedded]
+
+    def __missing__(self, char):
+        key = char
+        if self.binary:
+            key = chr(char)
+        candidates = []
+        for terminal in self.terminals:
+            starts = self.scanner.starts[terminal.name]
+            if starts is None or key in starts:
+                candidates.append(self.matchers[terminal.name])
+        self[char] = tuple(candidates)
+        return self[char]
+
+
+class Scanner:
+    """
+    Storyscript's lexer: produces the same tokens as Lark's lexers followed
+    by the indenter, in a single scan.
+
+    Instead of matching an alternation of every terminal, the scanner looks
+    up the terminals that can start with the current character and tries
+    them in Lark's order, with a matcher per terminal: strings are compared
+    directly and regular expressions are matched on their own. Indentation
+    tokens are produced while scanning, with an indentation stack that
+    belongs to each scan.
+
+    When the parser states are given, the scanner is contextual like Lark's
+    ContextualLexer, trying only the terminals the current state accepts.
+
+    Terminals in literal_scanners are scanned by their own scanners instead,
+    like big constant literals, see LiteralScanner.
+
+    Sources can also be bytes in UTF-8, or anything exposing them like a
+    memory map, which are scanned in place: only the text of the tokens is
+    decoded, and positions are byte offsets.
+    """
+    digits = string.digits
+    literal_scanners = {'CONSTANT': LiteralScanner}
+    starts_by_pattern = {
+        '(?:\\ )+': ' ',
+        '(\r?\n[\t ]*)+': '\r\n',
+        '[0-9]+': digits,
+        '(?:(?:\\+|\\-))?[0-9]+': '+-' + digits,
+        ('(?:(?:(?:\\+|\\-))?(?:(?:\\+|\\-))?[0-9]+\\.(?:[0-9]+)?|'
+         '\\.[0-9]+)'): '+-.' + digits,
+        "'([^']*)'": "'",
+        '"([^"]*)"': '"',
+        '\\/([^\\/]*)\\/': '/',
+        '[a-zA-Z-\\/_0-9]+': string.ascii_letters + digits + '-/_',
+        '###(?:[^#]|#(?!##))*###|#(?!##)[^\n]*': '#',
+        ('(\r?\n[\t ]*((###(?:[^#]|#(?!##))*###|#(?!##)[^\n]*)'
+         '(?=\r?\n))?)+'): '\r\n'
+    }
+
+    def __init__(self, terminals, ignore=(), indenter=None, states=None):
+        self.terminals = sorted(terminals, key=self.order)
+        self.ignore = frozenset(ignore)
+        self.indenter = indenter
+        self.states = states
+        self.parser_state = None
+        self.always_accept = ()
+        if indenter:
+            self.always_accept = indenter.always_accept
+        self.newline_types = frozenset(t.name for t in terminals
+                                       if self.has_newline(t) or
+                                       t.name in self.literal_scanners)
+        self.matchers = {}
+        self.byte_matchers = {}
+        self.starts = {}
+        self.scanners = []
+        for terminal in terminals:
+            self.matchers[terminal.name] = self.matcher(terminal)
+            self.byte_matchers[terminal.name] = self.byte_matcher(terminal)
+            self.starts[terminal.name] = self.first_characters(terminal)
+            if terminal.name in self.literal_scanners:
+                scanner = self.literal_scanners[terminal.name]()
+                self.scanners.append(scanner)
+                self.matchers[terminal.name] = (terminal.name, None,
+                                                scanner.match)
+                self.byte_matchers[terminal.name] = (terminal.name, None,
+                                                     scanner.byte_match)
+                self.starts[terminal.name] = scanner.starts
+        self.tables = {}
+        self.byte_tables = {}
+        self.tables_by_accepts = {}
+
+    @staticmethod
+    def order(terminal):
+        """
+        Sorts terminals the way Lark's lexers try them
+        """
+        pattern = terminal.pattern
+        return (-terminal.priority, -pattern.max_width, -len(pattern.value),
+                terminal.name)
+
+    @staticmethod
+    def matcher(terminal):
+        """
+        Makes the matcher of a terminal: its name and either its string or
+        the match function of its regular expression.
+        """
+        pattern = terminal.pattern
+        if isinstance(pattern, PatternStr) and not pattern.flags:
+            return (terminal.name, pattern.value, None)
+        regexp = re.compile(pattern.to_regexp())
+        return (terminal.name, None, regexp.match)
+
+    @staticmethod
+    def byte_matcher(terminal):
+        """
+        Makes the matcher of a terminal for bytes, where strings are matched
+        as regular expressions too, as memory maps can't be compared.
+        """
+        regexp = re.compile(terminal.pattern.to_regexp().encode('utf-8'))
+        return (terminal.name, None, regexp.match)
+
+    @staticmethod
+    def has_newline(terminal):
+        """
+        Whether a terminal can match newlines, using Lark's rule
+        """
+        regexp = terminal.pattern.to_regexp()
+        return '\n' in regexp or '\\n' in regexp or '[^' in regexp or \
+            ('(?s' in regexp and '.' in regexp)
+
+    @classmethod
+    def first_characters(cls, terminal):
+        """
+        Finds the characters a terminal can start with, or None when it
+        could be any.
+        """
+        pattern = terminal.pattern
+        if pattern.flags:
+            return None
+        if isinstance(pattern, PatternStr):
+            return pattern.value[0]
+        return cls.starts_by_pattern.get(pattern.value)
+
+    def set_parser_state(self, state):
+        self.parser_state = state
+
+    def table(self, state, binary=False):
+        """
+        Gets the table for a parser state, shared by the states accepting
+        the same terminals.
+        """
+        tables = self.tables
+        if binary:
+            tables = self.byte_tables
+        if state not in tables:
+            accepts = None
+            if self.states is not None and state is not None:
+                accepts = frozenset(self.states[state]) | self.ignore | \
+                    frozenset(self.always_accept)
+            key = (accepts, binary)
+            if key not in self.tables_by_accepts:
+                terminals = self.terminals
+                if accepts is not None:
+                    terminals = [t for t in terminals if t.name in accepts]
+                self.tables_by_accepts[key] = ScannerTable(self, terminals,
+                                                           binary=binary)
+            tables[state] = self.tables_by_accepts[key]
+        return tables[state]
+
+    def indent(self, token, indents):
+        """
+        Produces the indentation tokens following a newline token, like
+        Lark's Indenter.
+        """
+        indenter = self.indenter
+        indent_string = token.rsplit('\n', 1)[1]
+        indent = indent_string.count(' ') + \
+            indent_string.count('\t') * indenter.tab_len
+        if indent > indents[-1]:
+            indents.append(indent)
+            yield Token.new_borrow_pos(indenter.INDENT_type, indent_string,
+                                       token)
+        else:
+            while indent < indents[-1]:
+                indents.pop()
+                yield Token.new_borrow_pos(indenter.DEDENT_type,
+                                           indent_string, token)
+            assert indent == indents[-1], '%s != %s' % (indent, indents[-1])
+
+    def dedent(self, indents):
+        """
+        Closes the indentation left at the end of the source
+        """
+        if self.indenter:
+            while len(indents) > 1:
+                indents.pop()
+                yield Token(self.indenter.DEDENT_type, '')
+
+    def unexpected(self, source, position, line, column):
+        """
+        Makes the error for characters that no terminal matches. The context
+        of errors in bytes is decoded from the bytes around them.
+        """
+        if isinstance(source, str):
+            return UnexpectedCharacters(source, position, line, column,
+                                        state=self.parser_state)
+        before = bytes(source[max(position - 40, 0):position])
+        after = bytes(source[position:position + 40])
+        context = before.decode('utf-8', 'replace')
+        error = UnexpectedCharacters(
+            context + after.decode('utf-8', 'replace'), len(context), line,
+            column, state=self.parser_state)
+        error.pos_in_stream = position
+        return error
+
+    def lex(self, source):
+        """
+        Scans the source, yielding its tokens. The literal scanners forget
+        the source afterwards, so that it isn't kept.
+        """
+        try:
+            yield from self.tokens(source)
+        finally:
+            for scanner in self.scanners:
+                scanner.forget()
+
+    def tokens(self, source):
+        """
+        Yields the tokens of the source
+        """
+        newline_types = self.newline_types
+        ignore = self.ignore
+        binary = isinstance(source, str) is False
+        tables = self.tables
+        line_end = '\n'
+        if binary:
+            tables = self.byte_tables
+            line_end = b'\n'
+        newline = None
+        if self.indenter:
+            newline = self.indenter.NL_type
+        indents = [0]
+        position = 0
+        line = 1
+        line_start = 0
+        length = len(source)
+        while position < length:
+            table = tables.get(self.parser_state)
+            if table is None:
+                table = self.table(self.parser_state, binary)
+            for kind, text, match in table[source[position]]:
+                if match is None:
+                    if source.startswith(text, position):
+                        value = text
+                        break
+                else:
+                    matched = match(source, position)
+                    if matched is not None:
+                        value = matched.group(0)
+                        break
+            else:
+                raise self.unexpected(source, position, line,
+                                      position - line_start + 1)
+            token = None
+            if kind not in ignore:
+                token_value = value.decode('utf-8') if binary else value
+                token_type = kind
+                if kind in table.unless:
+                    token_type = table.unless[kind].get(token_value, kind)
+                token = Token(token_type, token_value, position, line,
+                              position - line_start + 1)
+            if kind in newline_types:
+                newlines = value.count(line_end)
+                if newlines:
+                    line += newlines
+                    line_start = position + value.rindex(line_end) + 1
+            position += len(value)
+            if token is not None:
+                token.end_line = line
+                token.end_column = position - line_start + 1
+                yield token
+                if kind == newline:
+                    yield from self.indent(token, indents)
+        yield from self.dedent(indents)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+
+class SideTables:
+    """
+    Tables of the trees that later stages look for, recorded by the
+    Transformer as the parser builds a tree, so that those stages don't walk
+    the whole tree again: imports, function blocks, inline expressions,
+    services and chained mutations.
+
+    Trees are recorded as they are built, children before their parents and
+    from left to right, which is the order find_data finds them in.
+    """
+    tables = {'imports': 'imports', 'function_block': 'functions',
+              'inline_expression': 'inline_expressions',
+              'service': 'services', 'chained_mutation': 'chained_mutations'}
+
+    def __init__(self):
+        self.imports = []
+        self.functions = []
+        self.inline_expressions = []
+        self.services = []
+        self.chained_mutations = []
+
+    def record(self, tree):
+        """
+        Records a tree in the table of its rule
+        """
+        getattr(self, self.tables[tree.data]).append(tree)
+        return tree
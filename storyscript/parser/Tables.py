@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import io
+import json
+import os
+import pprint
+import sys
+
+import lark
+from lark import Lark
+from lark.common import LexerConf, ParserConf
+from lark.grammar import NonTerminal, Rule, RuleOptions, Terminal
+from lark.lark import LarkOptions
+from lark.lexer import (ContextualLexer, PatternRE, PatternStr, TerminalDef,
+                        TraditionalLexer)
+from lark.load_grammar import load_grammar
+from lark.parse_tree_builder import ParseTreeBuilder
+from lark.parsers.lalr_analysis import (LALR_Analyzer, ParseTable, Reduce,
+                                        Shift)
+from lark.parsers.lalr_parser import Parser as LalrParser, _Parser
+
+from . import GrammarTables
+from .Frontend import Frontend
+from .Scanner import Scanner
+
+
+class LexerStates(dict):
+    """
+    Maps parser states to their contextual lexers, building each lexer only
+    the first time its state is reached.
+    """
+
+    def __init__(self, terminals, states, ignore, always_accept, callbacks):
+        super().__init__()
+        self.terminals = {terminal.name: terminal for terminal in terminals}
+        self.states = states
+        self.ignore = ignore
+        self.always_accept = always_accept
+        self.callbacks = callbacks
+        self.lexers = {}
+
+    def __missing__(self, state):
+        key = frozenset(self.states[state])
+        if key not in self.lexers:
+            accepts = key | set(self.ignore) | set(self.always_accept)
+            terminals = [self.terminals[name] for name in accepts
+                         if name in self.terminals]
+            self.lexers[key] = TraditionalLexer(
+                terminals, ignore=self.ignore, user_callbacks=self.callbacks)
+        self[state] = self.lexers[key]
+        return self[state]
+
+
+class Tables:
+    """
+    Serializes the analysed grammar, terminals and LALR tables of a grammar
+    to plain data, and rebuilds Lark parsers from it without analysing the
+    grammar again. The data is cached on disk as JSON, keyed by the grammar
+    hash, and is used only when it has the stamp and hash of the grammar.
+
+    The tables of the built-in grammar are pregenerated in GrammarTables.
+    """
+    version = 2
+    keys = ('terminals', 'rules', 'ignore', 'states', 'start', 'end')
+    module_header = ('# -*- coding: utf-8 -*-\n'
+                     '# Generated with `python setup.py tables`, '
+                     'do not edit.\n')
+
+    @staticmethod
+    def directory():
+        """
+        Finds the cache directory
+        """
+        if 'STORYSCRIPT_CACHE' in os.environ:
+            return os.environ['STORYSCRIPT_CACHE']
+        cache = os.environ.get('XDG_CACHE_HOME')
+        if cache is None:
+            cache = os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cache, 'storyscript')
+
+    @staticmethod
+    def grammar_hash(grammar):
+        return hashlib.sha256(grammar.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def path(cls, grammar):
+        """
+        Gets the path of the cache file for a grammar
+        """
+        filename = 'lalr-{}.json'.format(cls.grammar_hash(grammar))
+        return os.path.join(cls.directory(), filename)
+
+    @classmethod
+    def stamp(cls):
+        """
+        Identifies the format of the tables, which changes with this module,
+        Lark and the Python version, as it is read back from JSON.
+        """
+        return [cls.version, lark.__version__, list(sys.version_info[:2])]
+
+    @staticmethod
+    def dump_terminal(terminal):
+        pattern = terminal.pattern
+        kind = 're' if isinstance(pattern, PatternRE) else 'str'
+        return (terminal.name, kind, pattern.value, sorted(pattern.flags),
+                terminal.priority)
+
+    @staticmethod
+    def load_terminal(data):
+        name, kind, value, flags, priority = data
+        pattern = PatternStr(value, flags)
+        if kind == 're':
+            pattern = PatternRE(value, flags)
+        return TerminalDef(name, pattern, priority)
+
+    @staticmethod
+    def dump_rule(rule):
+        expansion = []
+        for symbol in rule.expansion:
+            filter_out = getattr(symbol, 'filter_out', False)
+            expansion.append((symbol.name, symbol.is_term, filter_out))
+        options = None
+        if rule.options:
+            options = (rule.options.keep_all_tokens, rule.options.expand1,
+                       rule.options.priority)
+        return (rule.origin.name, expansion, rule.alias, options)
+
+    @staticmethod
+    def load_rule(data):
+        origin, expansion, alias, options = data
+        symbols = []
+        for name, is_term, filter_out in expansion:
+            if is_term:
+                symbols.append(Terminal(name, filter_out=filter_out))
+            else:
+                symbols.append(NonTerminal(name))
+        if options is not None:
+            options = RuleOptions(*options)
+        return Rule(NonTerminal(origin), symbols, alias, options)
+
+    @classmethod
+    def analyse(cls, grammar):
+        """
+        Analyses a grammar, producing its terminals, rules and LALR tables
+        as plain data.
+        """
+        terminals, rules, ignore = load_grammar(grammar, '<string>').compile()
+        analysis = LALR_Analyzer(ParserConf(rules, None, 'start'))
+        analysis.compute_lookahead()
+        table = analysis.parse_table
+        indexes = {id(rule): index for index, rule in enumerate(rules)}
+        states = {}
+        for state, actions in table.states.items():
+            states[state] = {}
+            for symbol, (action, argument) in actions.items():
+                if action is Shift:
+                    states[state][symbol] = (0, argument)
+                else:
+                    states[state][symbol] = (1, indexes[id(argument)])
+        return {
+            'terminals': [cls.dump_terminal(t) for t in terminals],
+            'rules': [cls.dump_rule(rule) for rule in rules],
+            'ignore': list(ignore),
+            'states': states,
+            'start': table.start_state,
+            'end': table.end_state
+        }
+
+    @classmethod
+    def read(cls, grammar):
+        """
+        Reads the cached tables of a grammar, if any. Tables with another
+        stamp or grammar hash, or that aren't tables, are ignored.
+        """
+        try:
+            with io.open(cls.path(grammar), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['stamp'] != cls.stamp() or \
+                    cached['grammar_hash'] != cls.grammar_hash(grammar):
+                return None
+            data = cached['tables']
+            if sorted(data) != sorted(cls.keys):
+                return None
+            data['states'] = {int(state): actions
+                              for state, actions in data['states'].items()}
+        except Exception:
+            return None
+        return data
+
+    @classmethod
+    def write(cls, grammar, data):
+        """
+        Writes the tables of a grammar to the cache. Failing to write the
+        cache is not an error.
+        """
+        path = cls.path(grammar)
+        temporary = '{}.{}'.format(path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            cached = {'stamp': cls.stamp(),
+                      'grammar_hash': cls.grammar_hash(grammar),
+                      'tables': data}
+            with io.open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(cached, f)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def generate(cls, grammar, path):
+        """
+        Generates a module with the tables of the grammar as Python literals
+        """
+        data = cls.analyse(grammar)
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(cls.module_header)
+            f.write('grammar_hash = {!r}\n'.format(cls.grammar_hash(grammar)))
+            f.write('tables = {}\n'.format(pprint.pformat(data, compact=True)))
+
+    @classmethod
+    def get(cls, grammar):
+        """
+        Gets the tables for a grammar, from the pregenerated ones when it's
+        the built-in grammar, or from the cache, analysing and caching it when
+        needed.
+        """
+        if cls.grammar_hash(grammar) == GrammarTables.grammar_hash:
+            return GrammarTables.tables
+        data = cls.read(grammar)
+        if data is None:
+            data = cls.analyse(grammar)
+            cls.write(grammar, data)
+        return data
+
+    @staticmethod
+    def contextual_lexer(terminals, ignore, accepts, lexer_conf):
+        """
+        Builds Lark's contextual lexer, with its lexers built lazily
+        """
+        always_accept = ()
+        if lexer_conf.postlex:
+            always_accept = lexer_conf.postlex.always_accept
+        lexer = ContextualLexer.__new__(ContextualLexer)
+        lexer.lexers = LexerStates(terminals, accepts, ignore, always_accept,
+                                   lexer_conf.callbacks)
+        lexer.root_lexer = TraditionalLexer(
+            terminals, ignore=ignore, user_callbacks=lexer_conf.callbacks)
+        lexer.set_parser_state(None)
+        return lexer
+
+    @classmethod
+    def lark(cls, data, scanner=False, **options):
+        """
+        Builds a LALR Lark instance from tables, lexing with a contextual
+        Scanner instead of Lark's contextual lexer when scanner is true.
+        """
+        options = LarkOptions(dict(options, parser='lalr', lexer='contextual'))
+        terminals = [cls.load_terminal(t) for t in data['terminals']]
+        rules = [cls.load_rule(rule) for rule in data['rules']]
+        ignore = data['ignore']
+
+        states = {}
+        for state, actions in data['states'].items():
+            states[state] = {}
+            for symbol, (action, argument) in actions.items():
+                if action == 0:
+                    states[state][symbol] = (Shift, argument)
+                else:
+                    states[state][symbol] = (Reduce, rules[argument])
+        table = ParseTable(states, data['start'], data['end'])
+
+        builder = ParseTreeBuilder(rules, options.tree_class,
+                                   options.propagate_positions,
+                                   options.keep_all_tokens)
+        callback = builder.create_callback(options.transformer)
+        parser_conf = ParserConf(rules, callback, options.start)
+        callbacks = {}
+        for rule in rules:
+            callbacks[rule] = getattr(callback, rule.alias or rule.origin)
+
+        parser = LalrParser.__new__(LalrParser)
+        parser._parse_table = table
+        parser.parser_conf = parser_conf
+        parser.parser = _Parser(table, callbacks)
+        parser.parse = parser.parser.parse
+
+        accepts = {state: list(actions) for state, actions in states.items()}
+        if scanner:
+            lexer_conf = LexerConf(terminals, ignore, None,
+                                   options.lexer_callbacks)
+            lexer = Scanner(terminals, ignore, indenter=options.postlex,
+                            states=accepts)
+        else:
+            lexer_conf = LexerConf(terminals, ignore, options.postlex,
+                                   options.lexer_callbacks)
+            lexer = cls.contextual_lexer(terminals, ignore, accepts,
+                                         lexer_conf)
+
+        frontend = Frontend.__new__(Frontend)
+        frontend.parser = parser
+        frontend.lexer_conf = lexer_conf
+        frontend.lexer = lexer
+
+        instance = Lark.__new__(Lark)
+        instance.options = options
+        instance.source = '<string>'
+        instance.profiler = None
+        instance.terminals = terminals
+        instance.rules = rules
+        instance.ignore_tokens = ignore
+        instance.lexer_conf = lexer_conf
+        instance._parse_tree_builder = builder
+        instance.parser_class = Frontend
+        instance.parser = frontend
+        return instance
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import json
+
+from lark.lexer import Token
+
+from .ColumnStore import ColumnStore
+
+
+class TokenStream(ColumnStore):
+    """
+    Stores the tokens of a source as columns, see ColumnStore: the id of
+    their type, the offsets where they start and end, and their lines and
+    columns. The ends of the tokens whose values are kept, like indentation
+    tokens, are missing.
+
+    Streams can be written as tab-separated values or JSON lines, a row per
+    token.
+    """
+    fields = ('types', 'starts', 'ends', 'lines', 'columns')
+    headers = ('story', 'index', 'type', 'start', 'end', 'line', 'column',
+               'value')
+    escapes = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n',
+                             '\r': '\\r'})
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.token(index)
+
+    @classmethod
+    def from_tokens(cls, tokens, source):
+        """
+        Stores the tokens lexed from source
+        """
+        stream = cls(source)
+        for token in tokens:
+            stream.append(token)
+        return stream
+
+    def append(self, token):
+        """
+        Adds a token, keeping its value only when the source doesn't have it
+        """
+        index = len(self.types)
+        self.types.append(self.name_id(token.type))
+        start, end = self.offsets(index, token)
+        if index in self.values:
+            end = -1
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(-1 if token.line is None else token.line)
+        self.columns.append(-1 if token.column is None else token.column)
+
+    def type(self, index):
+        return self.names[self.types[index]]
+
+    def token(self, index):
+        """
+        Makes the Token of an index
+        """
+        return Token(self.type(index), self.value(index),
+                     self.optional(self.starts[index]),
+                     self.optional(self.lines[index]),
+                     self.optional(self.columns[index]))
+
+    def rows(self):
+        """
+        Yields the type, offsets, line, column and value of each token
+        """
+        for index in range(len(self)):
+            yield (self.names[self.types[index]],
+                   self.optional(self.starts[index]),
+                   self.optional(self.ends[index]),
+                   self.optional(self.lines[index]),
+                   self.optional(self.columns[index]), self.value(index))
+
+    def tsv(self, story):
+        """
+        Yields the tokens as lines of tab-separated values, see headers.
+        Missing values are empty, and tabs, newlines and backslashes in
+        values are escaped.
+        """
+        escapes = self.escapes
+        for index, row in enumerate(self.rows()):
+            fields = ['' if item is None else str(item) for item in row[:-1]]
+            yield '{}\t{}\t{}\t{}\n'.format(story, index, '\t'.join(fields),
+                                            row[-1].translate(escapes))
+
+    def jsonl(self, story):
+        """
+        Yields the tokens as lines of JSON objects, see headers
+        """
+        for index, row in enumerate(self.rows()):
+            yield '{}\n'.format(json.dumps(dict(zip(self.headers,
+                                                    (story, index) + row))))
@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
+import sys
+import threading
+from contextlib import contextmanager
+
 from lark import Transformer as LarkTransformer
 
+from .Pratt import Pratt
+from .SideTables import SideTables
 from .Tree import Tree
 from ..exceptions import StorySyntaxError
 
@@ -9,13 +15,36 @@ class Transformer(LarkTransformer):
 
     """
     Performs transformations on the tree before it's parsed.
-    All trees are transformed to Storyscript's custom tree. In some cases,
-    additional transformations or checks are performed.
+    All trees are transformed to Storyscript's custom tree, with the children
+    in a tuple. In some cases, additional transformations or checks are
+    performed.
+
+    In compact mode, the pass-through expression levels, which have a single
+    child, are inlined: an entity in an expression becomes
+    expression -> primary_expression -> entity instead of a chain of ten
+    nodes. Primary expressions are kept, as they are the only trace of
+    parentheses.
+
+    The operations of PrattGrammar are parsed with precedence climbing, see
+    Pratt.
+
+    While recording, the trees that later stages look for are recorded in
+    SideTables. Recordings are kept for each thread, since transformers are
+    shared by the parsers of all threads.
     """
     reserved_keywords = ['function', 'if', 'else', 'foreach', 'return',
                          'returns', 'try', 'catch', 'finally', 'when', 'as',
                          'import', 'while', 'raise']
     future_reserved_keywords = ['async', 'story', 'assert', 'called', 'mock']
+    collapsible = ['or_expression', 'and_expression', 'cmp_expression',
+                   'arith_expression', 'mul_expression', 'unary_expression',
+                   'pow_expression']
+    compact = False
+    recorder = threading.local()
+
+    def __init__(self, compact=False):
+        self.compact = compact
+        self.pratt = Pratt(compact=compact)
 
     @classmethod
     def is_keyword(cls, token):
@@ -27,6 +56,30 @@ class Transformer(LarkTransformer):
             error_name = 'future_reserved_keyword_{}'.format(keyword)
             raise StorySyntaxError(error_name, token=token)
 
+    @classmethod
+    @contextmanager
+    def recording(cls):
+        """
+        Records the side tables of the trees built by the current thread
+        """
+        previous = getattr(cls.recorder, 'tables', None)
+        tables = SideTables()
+        cls.recorder.tables = tables
+        try:
+            yield tables
+        finally:
+            cls.recorder.tables = previous
+
+    @classmethod
+    def record(cls, tree):
+        """
+        Records a tree in the side tables, when recording
+        """
+        tables = getattr(cls.recorder, 'tables', None)
+        if tables is not None:
+            tables.record(tree)
+        return tree
+
     @staticmethod
     def implicit_output(tree):
         """
@@ -35,7 +88,7 @@ class Transformer(LarkTransformer):
         fragment = tree.service_fragment
         if fragment.output is None:
             output = Tree('output', [fragment.command.child(0)])
-            fragment.children.append(output)
+            fragment.append(output)
 
     @staticmethod
     def arguments(matches):
@@ -81,7 +134,7 @@ class Transformer(LarkTransformer):
                 cls.implicit_output(matches[0])
             if matches[1].block.rules:
                 for argument in matches[1].find_data('arguments'):
-                    matches[0].service_fragment.children.append(argument)
+                    matches[0].service_fragment.append(argument)
                 return Tree('service_block', [matches[0]])
         return Tree('service_block', matches)
 
@@ -105,11 +158,37 @@ class Transformer(LarkTransformer):
                 'unary_expression', 'pow_expression', 'primary_expression',
                 'entity', 'path'
             ])
+            if path is None:
+                path = matches[0].follow_node_chain([
+                    'expression', 'primary_expression', 'entity', 'path'
+                ])
             if path is not None:
                 service_fragment = Tree('service_fragment', [])
-                service = Tree('service', [path, service_fragment])
+                service = cls.record(Tree('service',
+                                          [path, service_fragment]))
                 return Tree('service_block', [service])
         return Tree('absolute_expression', matches)
 
+    def operation(self, matches):
+        return self.pratt.operation(matches)
+
+    @staticmethod
+    def collapse(rule, matches):
+        """
+        Inlines an expression level when it has a single child.
+        """
+        if len(matches) == 1:
+            return matches[0]
+        return Tree(rule, tuple(matches))
+
     def __getattr__(self, attribute, *args):
-        return lambda matches: Tree(attribute, matches)
+        attribute = sys.intern(attribute)
+        if attribute.startswith('_'):
+            # inlined rules, whose children lark extends in place
+            return lambda matches: Tree(attribute, matches)
+        if self.compact and attribute in self.collapsible:
+            return lambda matches: self.collapse(attribute, matches)
+        if attribute in SideTables.tables:
+            return lambda matches: self.record(Tree(attribute,
+                                                    tuple(matches)))
+        return lambda matches: Tree(attribute, tuple(matches))
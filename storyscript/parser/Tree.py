@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from lark.lexer import Token
+import json
+
 from lark.tree import Tree as LarkTree
 
 from ..exceptions import CompilerError
@@ -10,6 +11,138 @@ class Tree(LarkTree):
     Wraps the original Tree class from lark, providing many useful
     enhancements.
     """
+    __slots__ = ('data', '_children', '_tokens', '_index', '_dependents')
+    _meta = None
+    side_tables = None
+    expression_levels = ['or_expression', 'and_expression', 'cmp_expression',
+                         'arith_expression', 'mul_expression',
+                         'unary_expression', 'pow_expression',
+                         'primary_expression']
+    positions = ('start', 'end', 'line', 'column', 'end_line', 'end_column')
+    headers = ('story', 'index', 'parent', 'rule', 'type',
+               'value') + positions
+
+    def __init__(self, data, children, meta=None):
+        self._children = children
+        self.data = data
+        self._tokens = None
+        self._index = None
+        self._dependents = None
+        if meta is not None:
+            self._meta = meta
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and \
+                tuple(self.children) == tuple(other.children)
+        except (AttributeError, TypeError):
+            return False
+
+    __hash__ = LarkTree.__hash__
+
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        self._children = children
+        self.mutated()
+
+    def mutable_children(self):
+        """
+        Gets the children as a list that can be changed in place
+        """
+        children = self.children
+        if isinstance(children, tuple):
+            children = list(children)
+            self._children = children
+        return children
+
+    def mutated(self):
+        """
+        Invalidates the index and the tokens of the tree after it has been
+        changed, along with the tokens found from them
+        """
+        self._index = None
+        stack = [self]
+        while stack:
+            tree = stack.pop()
+            tree._tokens = None
+            dependents = tree._dependents
+            if dependents is not None:
+                tree._dependents = None
+                stack.extend(dependents)
+
+    def depends(self, tree):
+        """
+        Keeps a tree that found its tokens from the ones of this tree
+        """
+        dependents = self._dependents
+        if dependents is None:
+            self._dependents = [tree]
+        elif all(dependent is not tree for dependent in dependents):
+            dependents.append(tree)
+
+    def find_tokens(self):
+        """
+        Finds the first and last tokens of the tree from its children. The
+        first and last subtrees that need their tokens too are kept on a
+        stack instead of recursing, so that deep trees don't reach the
+        recursion limit. Subtrees finding their tokens in their own way, like
+        ArenaTree, are asked for them.
+        """
+        stack = [self]
+        while stack:
+            tree = stack[-1]
+            if tree is not self and \
+                    type(tree).find_tokens is not Tree.find_tokens:
+                stack.pop()
+                tree.find_tokens()
+                continue
+            children = tree._children
+            first = None
+            last = None
+            if children:
+                pending = False
+                first = children[0]
+                if isinstance(first, Tree):
+                    tokens = first._tokens
+                    if tokens is None:
+                        stack.append(first)
+                        pending = True
+                    else:
+                        first = tokens[0]
+                last = children[-1]
+                if isinstance(last, Tree):
+                    tokens = last._tokens
+                    if tokens is None:
+                        if last is not stack[-1]:
+                            stack.append(last)
+                        pending = True
+                    else:
+                        last = tokens[1]
+                if pending:
+                    continue
+            stack.pop()
+            if children:
+                for child in (children[0], children[-1]):
+                    if isinstance(child, Tree):
+                        child.depends(tree)
+            tree._tokens = (first, last)
+        return self._tokens
+
+    def first_token(self):
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self.find_tokens()
+        return tokens[0]
+
+    def last_token(self):
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self.find_tokens()
+        return tokens[1]
 
     @staticmethod
     def walk(tree, path):
@@ -18,17 +151,31 @@ class Tree(LarkTree):
                 if item.data == path:
                     return item
 
+    def named_child(self, name):
+        """
+        Finds the first subtree with the given name, using the index of the
+        subtrees by name, built the first time it's needed.
+        """
+        index = self._index
+        if index is None:
+            index = {}
+            for child in self.children:
+                if isinstance(child, Tree) and child.data not in index:
+                    index[child.data] = child
+            self._index = index
+        return index.get(name)
+
     def node(self, path):
         """
         Finds a subtree or a nested subtree, using path
         """
-        shards = path.split('.')
-        current = None
-        for shard in shards:
+        if '.' not in path:
+            return self.named_child(path)
+        current = self
+        for shard in path.split('.'):
+            current = current.named_child(shard)
             if current is None:
-                current = self.walk(self, shard)
-            else:
-                current = self.walk(current, shard)
+                return None
         return current
 
     def child(self, index):
@@ -51,16 +198,15 @@ class Tree(LarkTree):
                 children.append(child)
         return children
 
-    def _find_position(self, position):
+    def _find_position(self, position, token=None):
         """
-        Finds the request positional attribute of a tree, by finding the
-        first token its first token and returning the token's positional
-        attribute
+        Finds the request positional attribute of a tree, using its first
+        token, or the given one.
         """
-        for child in self.children:
-            if isinstance(child, Token):
-                return str(getattr(child, position))
-            return child._find_position(position)
+        if token is None:
+            token = self.first_token()
+        if token is not None:
+            return str(getattr(token, position))
 
     def line(self):
         """
@@ -80,11 +226,41 @@ class Tree(LarkTree):
         """
         return self._find_position('end_column')
 
+    def end_line(self):
+        """
+        Finds the line where a tree ends, using its last token
+        """
+        return self._find_position('end_line', token=self.last_token())
+
+    def start_pos(self):
+        """
+        Finds the offset in the source where a tree starts
+        """
+        token = self.first_token()
+        if token is not None:
+            return token.pos_in_stream
+
+    def end_pos(self):
+        """
+        Finds the offset in the source where a tree ends
+        """
+        token = self.last_token()
+        if token is not None and token.pos_in_stream is not None:
+            return token.pos_in_stream + len(token)
+
     def insert(self, item):
         """
         Inserts an item into the current tree.
         """
-        self.children.insert(0, item)
+        self.mutable_children().insert(0, item)
+        self.mutated()
+
+    def append(self, item):
+        """
+        Appends an item to the current tree.
+        """
+        self.mutable_children().append(item)
+        self.mutated()
 
     def rename(self, new_name):
         """
@@ -96,7 +272,8 @@ class Tree(LarkTree):
         """
         Replaces a child at the given index
         """
-        self.children[index] = item
+        self.mutable_children()[index] = item
+        self.mutated()
 
     def extract_path(self):
         """
@@ -110,22 +287,35 @@ class Tree(LarkTree):
                 string += child.value
         return string
 
-    def is_unary_leaf(self):
+    def unary_entity(self):
         """
-        Whether the current expression tree is an unary expression leaf
+        Finds the entity of an unary expression leaf, following its chain of
+        single-child expression levels, which can be collapsed in compact
+        trees. Returns None for any other tree.
         """
+        if self.data != 'expression':
+            return None
+        levels = self.expression_levels
+        level = 0
         e = self
-        nodes = ['expression',
-                 'or_expression', 'and_expression', 'cmp_expression',
-                 'arith_expression', 'mul_expression', 'unary_expression',
-                 'pow_expression', 'primary_expression', 'entity']
-        for n in nodes:
-            if e.data != n:
-                return False
-            if len(e.children) != 1:
-                return False
+        while len(e.children) == 1:
             e = e.child(0)
-        return True
+            if isinstance(e, Tree) is False:
+                return None
+            if e.data == 'entity':
+                if level == len(levels):
+                    return e
+                return None
+            if e.data not in levels[level:]:
+                return None
+            level = levels.index(e.data, level) + 1
+        return None
+
+    def is_unary_leaf(self):
+        """
+        Whether the current expression tree is an unary expression leaf
+        """
+        return self.unary_entity() is not None
 
     def expect(self, cond, error):
         """
@@ -158,5 +348,94 @@ class Tree(LarkTree):
             if p.data != e:
                 return None
 
+    @staticmethod
+    def position(item):
+        """
+        Gets the offsets, lines and columns where a tree or a token starts and
+        ends, see positions
+        """
+        first = item
+        last = item
+        if isinstance(item, Tree):
+            first = item.first_token()
+            last = item.last_token()
+            if first is None:
+                return (None,) * 6
+        end = None
+        if last.pos_in_stream is not None:
+            end = last.pos_in_stream + len(last)
+        return (first.pos_in_stream, end, first.line, first.column,
+                getattr(last, 'end_line', None),
+                getattr(last, 'end_column', None))
+
+    def pretty_lines(self, indent_str='  '):
+        """
+        Yields the lines of Tree.pretty one by one
+        """
+        stack = [(self, 0)]
+        while stack:
+            item, level = stack.pop()
+            indent = indent_str * level
+            if isinstance(item, Tree) is False:
+                yield '{}{}\n'.format(indent, item)
+                continue
+            children = item.children
+            if len(children) == 1 and isinstance(children[0], Tree) is False:
+                yield '{}{}\t{}\n'.format(indent, item.data, children[0])
+                continue
+            yield '{}{}\n'.format(indent, item.data)
+            for child in reversed(children):
+                stack.append((child, level + 1))
+
+    def pretty(self, indent_str='  '):
+        return ''.join(self.pretty_lines(indent_str))
+
+    def jsonl(self, story):
+        """
+        Yields the trees and tokens as lines of JSON objects in preorder,
+        with the index of their parent, see headers. Trees have a rule,
+        tokens a type and a value.
+        """
+        headers = self.headers
+        stack = [(self, -1)]
+        index = 0
+        while stack:
+            item, parent = stack.pop()
+            if isinstance(item, Tree):
+                row = (item.data, None, None)
+                for child in reversed(item.children):
+                    stack.append((child, index))
+            else:
+                row = (None, item.type, str(item))
+            row = (story, index, parent) + row + self.position(item)
+            yield '{}\n'.format(json.dumps(dict(zip(headers, row))))
+            index += 1
+
+    def json(self):
+        """
+        Yields the tree as chunks of nested JSON, where trees have a rule and
+        their children, tokens a type and a value, and both their positions.
+        """
+        positions = self.positions
+        stack = [(self, '')]
+        while stack:
+            item, prefix = stack.pop()
+            if item is None:
+                yield prefix
+                continue
+            node = dict(zip(positions, self.position(item)))
+            if isinstance(item, Tree):
+                node = json.dumps(dict(rule=item.data, **node))
+                yield '{}{}, "children": ['.format(prefix, node[:-1])
+                stack.append((None, ']}'))
+                children = item.children
+                for index in range(len(children) - 1, -1, -1):
+                    stack.append((children[index], ', ' if index else ''))
+                continue
+            node = dict(type=item.type, value=str(item), **node)
+            yield '{}{}'.format(prefix, json.dumps(node))
+
     def __getattr__(self, attribute):
-        return self.node(attribute)
+        if attribute.startswith('_'):
+            raise AttributeError(attribute)
+        return self.named_child(attribute)
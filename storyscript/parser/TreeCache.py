@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import io
+import os
+import threading
+import zlib
+
+import lark
+
+from .Arena import Arena
+from .Tables import Tables
+from ..Version import version as storyscript_version
+
+
+class TreeCache:
+    """
+    Caches parsed trees on disk, so that unchanged stories are loaded
+    instead of parsed again. Trees are stored as dumped arenas, see
+    Arena.dump, in files named after the hash of the source, the hash of
+    the grammar and the options of the parser. Arenas are mostly made of
+    missing positions, so they are compressed, with the fastest level.
+
+    Storyscript and Lark versions are part of the key too, since trees
+    depend on the transformer as well as on the grammar.
+    """
+    version = 1
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = os.path.join(Tables.directory(), 'trees')
+        self.directory = directory
+
+    @classmethod
+    def key(cls, source, grammar, *options):
+        """
+        Makes the key of a tree from its source, grammar and parser options
+        """
+        parts = [cls.version, Arena.version, storyscript_version,
+                 lark.__version__, Tables.grammar_hash(grammar),
+                 hashlib.sha256(source.encode('utf-8')).hexdigest()]
+        parts.extend(options)
+        text = '\n'.join(str(part) for part in parts)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, '{}.arena'.format(key))
+
+    def load(self, key):
+        """
+        Loads the tree of a key, if any. Unreadable entries are misses.
+        """
+        try:
+            with io.open(self.path(key), 'rb') as f:
+                return Arena.load(zlib.decompress(f.read())).tree()
+        except Exception:
+            return None
+
+    def dump(self, key, tree, source):
+        """
+        Dumps the tree parsed from source. Failing to write the cache is not
+        an error.
+        """
+        path = self.path(key)
+        temporary = '{}.{}.{}'.format(path, os.getpid(),
+                                      threading.get_ident())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with io.open(temporary, 'wb') as f:
+                data = Arena.from_tree(tree, source).dump()
+                f.write(zlib.compress(data, 1))
+            os.replace(temporary, path)
+        except OSError:
+            pass
@@ -1,10 +1,25 @@
+from .Arena import Arena
+from .ArenaTree import ArenaTree
+from .ColumnStore import ColumnStore
 from .Ebnf import Ebnf
+from .Frontend import Frontend
 from .Grammar import Grammar
+from .IncrementalTree import IncrementalTree
 from .Indenter import CustomIndenter
+from .LiteralScanner import LiteralScanner
 from .Parser import Parser
+from .Pratt import Pratt
+from .PrattGrammar import PrattGrammar
+from .Scanner import Scanner
+from .SideTables import SideTables
+from .Tables import Tables
+from .TokenStream import TokenStream
 from .Transformer import Transformer
 from .Tree import Tree
+from .TreeCache import TreeCache
 
 
-__all__ = ['CustomIndenter', 'Ebnf', 'Grammar', 'Parser', 'Transformer',
-           'Tree']
+__all__ = ['Arena', 'ArenaTree', 'ColumnStore', 'CustomIndenter', 'Ebnf',
+           'Frontend', 'Grammar', 'IncrementalTree', 'LiteralScanner',
+           'Parser', 'Pratt', 'PrattGrammar', 'Scanner', 'SideTables',
+           'Tables', 'TokenStream', 'Transformer', 'Tree', 'TreeCache']
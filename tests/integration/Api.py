@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from pytest import raises
@@ -98,3 +99,16 @@ def test_compiler_only_comments(parser):
     result = api_result['stories']['a.story']
     assert result['tree'] == {}
     assert result['entrypoint'] is None
+
+
+def test_api_loads_threads():
+    """
+    Ensures stories can be loaded at once from many threads, sharing the
+    same parser
+    """
+    stories = ['a = 1\nif a\n    b = 2\n', 'x = [1, 2]\nwhile x\n    y = 3\n',
+               'alpine echo text: "hi"\n', 'a = 1 + 2 * 3\n' * 10]
+    expected = [Api.loads(story) for story in stories]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(Api.loads, stories * 10))
+    assert results == expected * 10
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from io import StringIO
+from unittest.mock import patch
 
 from storyscript.Story import Story
+from storyscript.parser import Parser, TreeCache
 
 
 def test_story_from_stream():
@@ -10,28 +12,40 @@ def test_story_from_stream():
     assert story.story == 'x = 0'
 
 
+def parse(source):
+    story = Story(source)
+    story.parse()
+    return story.tree
+
+
 def test_story_comments():
-    stream = StringIO('# comment')
-    story = Story.from_stream(stream)
-    assert story.story == ''
+    assert parse('# comment') == parse('\n')
+
+
+def test_story_comments_inline():
+    assert parse('x = 0 # comment\ny = 1') == parse('x = 0\ny = 1')
 
 
 def test_story_comments_indented():
-    stream = StringIO('function test\n\t# comment\n\tx = 0')
-    story = Story.from_stream(stream)
-    assert story.story == 'function test\n\t\n\tx = 0'
+    source = 'function test\n\t# comment\n\tx = 0'
+    assert parse(source) == parse('function test\n\t\n\tx = 0')
+
+
+def test_story_comments_dedented():
+    """
+    Ensures lines with only comments don't change indentation
+    """
+    source = 'function test\n\tx = 0\n# comment\n\ty = 1'
+    assert parse(source) == parse('function test\n\tx = 0\n\ty = 1')
 
 
 def test_story_comments_multiline():
-    stream = StringIO('###\nmultiline\n###')
-    story = Story.from_stream(stream)
-    assert story.story == '\n\n'
+    assert parse('###\nmultiline\n###') == parse('\n\n')
 
 
 def test_story_comments_multiline_idented():
-    stream = StringIO('function test\n\t###\nmultiline\n\t###\n\tx = 0')
-    story = Story.from_stream(stream)
-    assert story.story == 'function test\n\t\n\n\n\tx = 0'
+    source = 'function test\n\t###\nmultiline\n\t###\n\tx = 0'
+    assert parse(source) == parse('function test\n\t\n\n\n\tx = 0')
 
 
 def test_story_comments_multiline_catastrophic():
@@ -39,12 +53,89 @@ def test_story_comments_multiline_catastrophic():
     Certain regular expressions will work correctly on short comments, but
     fail on longer ones because of backtracking.
     """
-    stream = StringIO('###\nFiller filler filler filler\n\n###\nx = 0')
-    story = Story.from_stream(stream)
-    assert story.story == '\n\n\n\nx = 0'
+    source = '###\nFiller filler filler filler\n\n###\nx = 0'
+    assert parse(source) == parse('\n\n\n\nx = 0')
 
 
 def test_story_comments_nested():
-    stream = StringIO('###\nmultiline\n# nested\n###')
-    story = Story.from_stream(stream)
-    assert story.story == '\n\n\n'
+    assert parse('###\nmultiline\n# nested\n###') == parse('\n\n\n')
+
+
+def test_story_comments_lines():
+    """
+    Ensures comments keep the lines of what follows them
+    """
+    tree = parse('###\nmultiline\n###\n# comment\nx = 0 # comment')
+    assert tree.block.line() == '5'
+
+
+def test_story_edit():
+    """
+    Ensures edited stories are parsed like new ones, even when edits change
+    comments
+    """
+    source = 'a = 1 # one\nif a\n    b = 2\n###\nc = 3\n###\nd = 4\n'
+    story = Story(source)
+    story.parse()
+    edits = [('a = 1', 'a = 2'), ('one', 'two'),
+             ('###\nc = 3\n###\n', 'c = 3\n'), ('a = 2', 'x = 0\na = 2')]
+    for old, new in edits:
+        start = source.index(old)
+        source = source.replace(old, new, 1)
+        story.edit(start, start + len(old), new)
+        expected = Story(source)
+        expected.parse()
+        assert story.story == expected.story
+        assert story.tree == expected.tree
+
+
+def test_story_parse_cache(tmpdir):
+    """
+    Ensures trees loaded from the cache are the parsed ones, with the same
+    positions, and compile to the same result
+    """
+    source = 'a = [1, 2]\nif a\n    b = "{a}" # comment\nalpine echo\n'
+    cache = TreeCache(str(tmpdir))
+    expected = Story(source)
+    expected.parse(compact=True)
+    Story(source).parse(compact=True, cache=cache)
+    story = Story(source)
+    with patch.object(Parser, 'parse_source') as parse_source:
+        story.parse(compact=True, cache=cache)
+    assert parse_source.call_count == 0
+    assert story.tree == expected.tree
+    tokens = list(story.tree.scan_values(lambda token: True))
+    expected_tokens = list(expected.tree.scan_values(lambda token: True))
+    for token, expected_token in zip(tokens, expected_tokens):
+        assert token.pos_in_stream == expected_token.pos_in_stream
+        assert (token.line, token.column) == \
+            (expected_token.line, expected_token.column)
+        assert (token.end_line, token.end_column) == \
+            (expected_token.end_line, expected_token.end_column)
+    story.compile()
+    expected.compile()
+    assert story.compiled == expected.compiled
+
+
+def test_story_side_tables():
+    """
+    Ensures the side tables recorded while parsing have the trees found by
+    walking the tree, in the same order, and that stories compile to the
+    same result without them
+    """
+    source = ('import "one" as one\nimport "two.story" as two\n'
+              'function f n:int returns int\n    return n\n'
+              'a = (alpine echo) + 1\n1 increment then format to:"string"\n'
+              'alpine echo\n    message: "{a}"\n')
+    story = Story(source)
+    story.parse()
+    tables = story.tree.side_tables
+    for rule, table in tables.tables.items():
+        assert getattr(tables, table) == list(story.tree.find_data(rule))
+    assert story.modules() == ['one.story', 'two.story']
+    expected = Story(source)
+    expected.parse()
+    expected.tree.side_tables = None
+    story.compile()
+    expected.compile()
+    assert story.compiled == expected.compiled
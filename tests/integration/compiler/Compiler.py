@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+import sys
+
 from pytest import mark
 
 from storyscript.compiler import Compiler
+from storyscript.parser import Parser
 
 
 def test_compiler_expression_sum(parser):
@@ -2163,3 +2166,187 @@ def test_compiler_unary_complex_6(parser):
           }
         ]
     }]
+
+
+sources = [
+    'a = 1', 'a = (1)', 'a = b', 'a = (b)', '3 + 2 * 4', '(3 + 2) * 4',
+    'a = 2 ^ 3 ^ 4', 'a = !-2 or ! -3 - -4', 'a = b and !c == 3',
+    'a = [1, (2), 3 + 4]', 'a = {"x": 1 + 2, "y": (b)}',
+    'alpine echo message: 1 + 2', 'x = alpine echo message: (a)',
+    'if a == b\n    a = 1\nelse if (a)\n    a = 2',
+    'while a < 10\n    a = a + 1', 'function f a: int returns int\n'
+    '    return a * 2', 'return_value = (1 + 2) / 3 % 4', 'alpine'
+]
+
+
+@mark.parametrize('source', sources)
+def test_compiler_compact(parser, compact_parser, source):
+    """
+    Ensures compact trees compile exactly like full trees
+    """
+    expected = Compiler.compile(parser.parse(source))
+    assert Compiler.compile(compact_parser.parse(source)) == expected
+
+
+@mark.parametrize('source', sources + [
+    'a = (alpine echo message: (b))', 'x = a.b[1]["c"]',
+    'try\n    a = 1\ncatch as e\n    raise e'
+])
+def test_compiler_arena(parser, source):
+    """
+    Ensures views of arenas compile exactly like trees
+    """
+    expected = Compiler.compile(parser.parse(source))
+    assert Compiler.compile(parser.arena(source).root()) == expected
+
+
+@mark.parametrize('compact', [False, True])
+@mark.parametrize('source', sources + [
+    'a = 1 - 2 - 3 / 4 / 5', 'a = !b ^ c * -d', 'a = (a or b) and (c or d)',
+    'a = b > 1 == c < 2', 'if !(a ^ 2 + 1 >= b % c)\n    a = 1'
+])
+def test_compiler_pratt(parser, compact, source):
+    """
+    Ensures expressions parsed with precedence climbing build the same trees
+    as the LALR grammar, and compile to the same output
+    """
+    expected = Parser(compact=compact).parse(source)
+    result = Parser(algo='pratt', lexer=parser.lexer,
+                    compact=compact).parse(source)
+    assert result == expected
+    assert Compiler.compile(result) == Compiler.compile(expected)
+
+
+def deep_parentheses(size):
+    return 'a = {}1{}'.format('(' * size, ')' * size)
+
+
+def long_expression(size):
+    return 'a = {}'.format(' + '.join(['b'] * size))
+
+
+def power_chain(size):
+    return 'a = {}'.format(' ^ '.join(['b'] * size))
+
+
+def calls(function, *args):
+    """
+    Counts the calls of Python functions and builtins made by a function,
+    which grow like the time it takes without depending on the machine
+    """
+    count = 0
+
+    def profile(frame, event, argument):
+        nonlocal count
+        if event == 'call' or event == 'c_call':
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        function(*args)
+    finally:
+        sys.setprofile(None)
+    return count
+
+
+def compile_source(parser, source):
+    return Compiler.compile(parser.parse(source))
+
+
+def test_compiler_deep_parentheses(compact_parser):
+    """
+    Ensures 10k-deep parentheses compile without reaching the recursion
+    limit
+    """
+    result = Compiler.compile(compact_parser.parse(deep_parentheses(10000)))
+    assert result['tree']['1']['args'] == [1]
+
+
+def test_compiler_long_expression(compact_parser):
+    """
+    Ensures expressions with 100k terms compile without reaching the
+    recursion limit
+    """
+    tree = compact_parser.parse(long_expression(100000))
+    value = Compiler.compile(tree)['tree']['1']['args'][0]
+    terms = 1
+    while value.get('expression') == 'sum':
+        assert value['values'][1] == {'$OBJECT': 'path', 'paths': ['b']}
+        value = value['values'][0]
+        terms += 1
+    assert terms == 100000
+
+
+def test_compiler_deep_parentheses_full():
+    """
+    Ensures 10k-deep parentheses that aren't compact compile without
+    reaching the recursion limit
+    """
+    result = Compiler.compile(Parser().parse(deep_parentheses(10000)))
+    assert result['tree']['1']['args'] == [1]
+
+
+def test_compiler_long_expression_full():
+    """
+    Ensures expressions with 10k terms that aren't compact compile without
+    reaching the recursion limit
+    """
+    tree = Parser().parse(long_expression(10000))
+    value = Compiler.compile(tree)['tree']['1']['args'][0]
+    terms = 1
+    while value.get('expression') == 'sum':
+        assert value['values'][1] == {'$OBJECT': 'path', 'paths': ['b']}
+        value = value['values'][0]
+        terms += 1
+    assert value == {'$OBJECT': 'path', 'paths': ['b']}
+    assert terms == 10000
+
+
+@mark.parametrize('compact', [False, True])
+def test_compiler_power_chain(compact):
+    """
+    Ensures chains of 10k powers parsed with precedence climbing compile
+    without reaching the recursion limit
+    """
+    parser = Parser(algo='pratt', compact=compact)
+    value = compile_source(parser, power_chain(10000))['tree']['1']['args'][0]
+    terms = 1
+    while value.get('expression') == 'exponential':
+        assert value['values'][0] == {'$OBJECT': 'path', 'paths': ['b']}
+        value = value['values'][1]
+        terms += 1
+    assert terms == 10000
+
+
+@mark.parametrize('algo', ['lalr', 'pratt'])
+@mark.parametrize('compact', [False, True])
+@mark.parametrize('source', [deep_parentheses, long_expression, power_chain])
+def test_compiler_deep_trees_linear(algo, compact, source):
+    """
+    Ensures parsing and compiling take linear time in the depth of trees,
+    making at most twice the calls for twice the depth
+    """
+    parser = Parser(algo=algo, compact=compact)
+    parser.lark()
+    small = calls(compile_source, parser, source(1000))
+    large = calls(compile_source, parser, source(2000))
+    assert large < small * 2.05
+
+
+def long_story(size):
+    statements = ['a{n} = {n} + 1\n', 'b{n} = (alpine echo text: a{n})\n',
+                  'if a{n} > 1\n    c{n} = a{n}\n']
+    return ''.join([statements[n % 3].format(n=n) for n in range(size)])
+
+
+def test_compiler_long_story_linear():
+    """
+    Ensures compiling takes linear time in the number of lines, making at
+    most twice the calls for twice the lines
+    """
+    parser = Parser()
+    parser.lark()
+    small = calls(compile_source, parser, long_story(600))
+    large = calls(compile_source, parser, long_story(1200))
+    assert large < small * 2.05
+    assert len(compile_source(parser, long_story(1200))['tree']) == 2000
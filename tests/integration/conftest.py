@@ -1,9 +1,35 @@
 # -*- coding: utf-8 -*-
+import os
+
 from pytest import fixture
 
 from storyscript.parser import Parser
 
 
+@fixture(scope='session', autouse=True)
+def cache(tmpdir_factory):
+    """
+    Caches the tables of the grammars that aren't pregenerated, like the
+    pratt one, in a temporary directory instead of the user's cache.
+    """
+    previous = os.environ.get('STORYSCRIPT_CACHE')
+    os.environ['STORYSCRIPT_CACHE'] = str(tmpdir_factory.mktemp('cache'))
+    yield
+    if previous is None:
+        del os.environ['STORYSCRIPT_CACHE']
+    else:
+        os.environ['STORYSCRIPT_CACHE'] = previous
+
+
+@fixture(params=['scanner', 'lark'])
+def parser(request):
+    """
+    Runs the tests with both the Scanner and Lark's lexers, which must
+    produce the same results.
+    """
+    return Parser(lexer=request.param)
+
+
 @fixture
-def parser():
-    return Parser()
+def compact_parser():
+    return Parser(compact=True)
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from lark.lexer import Token
 
-from pytest import mark
+from pytest import mark, raises
 
-from storyscript.parser import Tree
+from storyscript.parser import Parser, Tree
 
 
 def get_entity(obj):
@@ -244,3 +247,180 @@ def test_parser_number_float(parser, number):
     entity = get_entity(ar_exp)
     f = entity.values.number
     assert f.child(0) == Token('FLOAT', number)
+
+
+def test_parser_compact(compact_parser):
+    """
+    Ensures compact trees inline the pass-through expression levels
+    """
+    result = compact_parser.parse('3 + 4\n')
+    expression = result.block.rules.absolute_expression.expression
+    arith = expression.arith_expression
+    lhs = arith.child(0).entity.values.number
+    assert lhs.child(0) == Token('INT', 3)
+    assert arith.child(1).child(0) == Token('PLUS', '+')
+    rhs = arith.child(2).entity.values.number
+    assert rhs.child(0) == Token('INT', 4)
+
+
+def test_parser_compact_parentheses(compact_parser):
+    """
+    Ensures compact trees keep the parentheses
+    """
+    result = compact_parser.parse('a = (b)\n')
+    expression = result.block.rules.assignment.assignment_fragment.expression
+    primary = expression.primary_expression.primary_expression
+    assert primary.entity.path.child(0) == Token('NAME', 'b')
+    assert expression.is_unary_leaf() is False
+
+
+def test_parser_compact_service(compact_parser):
+    """
+    Ensures compact trees transform zero-argument expressions to services
+    """
+    result = compact_parser.parse('alpine\n')
+    assert result.block.rules.service_block.service.path.child(0) == \
+        Token('NAME', 'alpine')
+
+
+def test_parser_positions(parser):
+    """
+    Ensures trees know their positions in the source
+    """
+    source = 'a = 1\nb = "hello"\n'
+    result = parser.parse(source)
+    assignment = result.child(1).rules.assignment
+    assert assignment.line() == '2'
+    assert assignment.column() == '1'
+    assert assignment.end_line() == '2'
+    start = assignment.start_pos()
+    assert source[start:assignment.end_pos()] == 'b = "hello"'
+
+
+story = ('a = 1\nif a\n    b = 2\nelse\n    b = 3\n'
+         'alpine echo message: "x"\nc = [1, 2]\n')
+
+
+def positions(tree):
+    return [(token, token.pos_in_stream, token.line, token.column,
+             token.end_line, token.end_column)
+            for token in tree.scan_values(lambda value: True)]
+
+
+def edit(old, new):
+    """
+    Finds the edit replacing the first occurrence of old with new
+    """
+    start = story.index(old)
+    return start, start + len(old), new
+
+
+@mark.parametrize('old, new', [
+    ('a = 1', 'x = 1'), ('1', '1 + 2'), ('else', 'else\n    b = 4'),
+    ('    b = 3', '\n    b = 3'), ('"x"', '"x" text: 1'),
+    ('c = [', '    c = ['), ('2]\n', '2]\nd = 2\n'),
+    ('if a\n    b = 2\nelse\n    b = 3\n', ''), (story, 'a = 1'),
+    ('c = [', 'if b\n    c = [')
+])
+def test_parser_reparse(parser, old, new):
+    """
+    Ensures reparsed trees are the same as parsed ones, with the same
+    positions
+    """
+    tree = parser.incremental(story)
+    start, end, text = edit(old, new)
+    result = parser.reparse(tree, story, start, end, text)
+    expected = parser.parse(story[:start] + text + story[end:])
+    assert result == expected
+    assert positions(result) == positions(expected)
+
+
+def test_parser_reparse_twice(parser):
+    tree = parser.reparse(parser.parse(story), story, *edit('1', '4'))
+    source = story.replace('1', '4', 1)
+    start = source.index('alpine')
+    result = parser.reparse(tree, source, start, start, 'd = 1\n')
+    expected = parser.parse(source[:start] + 'd = 1\n' + source[start:])
+    assert positions(result) == positions(expected)
+
+
+@mark.parametrize('old, new', [
+    ('a = 1', 'a = ='), ('echo', 'echo echo'), ('b = 3', 'b = "3'),
+    ('else', '  else'), ('c = [1, 2]', 'c = [1, 2')
+])
+def test_parser_reparse_error(parser, old, new):
+    """
+    Ensures reparsing raises the errors of full parses
+    """
+    start, end, text = edit(old, new)
+    with raises(Exception) as expected:
+        parser.parse(story[:start] + text + story[end:])
+    with raises(Exception) as error:
+        parser.reparse(parser.parse(story), story, start, end, text)
+    assert type(error.value) is type(expected.value)
+    assert getattr(error.value, 'line', None) == \
+        getattr(expected.value, 'line', None)
+    assert getattr(error.value, 'column', None) == \
+        getattr(expected.value, 'column', None)
+
+
+@mark.parametrize('source', [
+    story * 20,
+    '###\nblock\n###\n# comment\n{}'.format(story) * 20
+])
+def test_parser_parse_parallel(parser, source):
+    """
+    Ensures parsing in parallel builds the tree of a serial parse, with the
+    same positions
+    """
+    parser.workers = 2
+    result = parser.parse_parallel(source)
+    expected = Parser(lexer=parser.lexer).parse(source)
+    assert result == expected
+    assert positions(result) == positions(expected)
+
+
+def test_parser_parse_parallel_strings(parser):
+    """
+    Ensures sources split inside strings are parsed serially
+    """
+    parser.workers = 2
+    parser.parallel_lines = 1
+    source = 'a = "x\ny"\n{}'.format(story) * 20
+    result = parser.parse(source)
+    expected = Parser(lexer=parser.lexer).parse(source)
+    assert positions(result) == positions(expected)
+
+
+def test_parser_parse_parallel_error(parser):
+    """
+    Ensures errors are found by parsing the whole source
+    """
+    parser.workers = 2
+    source = story * 10 + 'a = ]\n' + story * 10
+    assert parser.parse_parallel(source) is None
+
+
+threaded_stories = [
+    'if a\n    b = 1\n    if c\n        d = [1, 2]\nelse\n    e = 2\n',
+    'x = {"a": 1, "b": 2}\nfoo bar key: x as y\n    z = y\n',
+    'function f a:int returns int\n    return a + 1\nwhile 1 > 2\n    g = 3\n',
+    'a = 1 + 2 * (3 - 4)\n' * 20
+]
+
+
+def test_parser_threads(parser):
+    """
+    Ensures a single parser can parse many stories at once from different
+    threads, each one keeping its own lexer and indentation state
+    """
+    expected = [parser.parse(story) for story in threaded_stories]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            stories = threaded_stories * 25
+            results = list(pool.map(parser.parse, stories))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert results == expected * 25
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import io
+
+from lark.exceptions import UnexpectedInput
+
+from pytest import mark, raises
+
+from storyscript.compiler import Compiler
+from storyscript.parser import Parser, Tree
+
+
+sources = [
+    'a = 1', 'a = -1 - -2', 'a = 1.5 + .5 - -0.25', 'a = b/c / d',
+    'a = /^fo+o/', 'a = 3 % 2 * 4 ^ 2', 'a = "x {b}" + \'y\'',
+    'a = "multi\nline"', 'a = [1, 2, {"k": true, "n": null}]',
+    'if a >= 1 and b <= 2 or !c\n    d = 1\nelse if e != f\n    d = 2\n'
+    'else\n    d = 3', 'foreach items as item\n    a = item',
+    'while a < 10\n    a = a + 1\n        \n    b = a',
+    'function f a: int b: string returns list\n    return [a, b]',
+    'try\n    a = 1\ncatch as e\n    raise e\nfinally\n    a = 2',
+    'alpine echo message: "hi" times: 2', 'http server as client\n'
+    '    when client listen path: "/" as r\n        r write content: 1',
+    'x = (alpine echo message: (a))', 'import "a.story" as a',
+    'if a\r\n\tb = 2', 'a = c_d/e', 'iffy = a', 'return', 'break',
+    'a = b.c[0]["d"]', 'a = int', 'x = any'
+]
+
+
+items = ', '.join('{{"n": {}, "s": \'x\'}}'.format(n) for n in range(40))
+literals = [
+    'a = [{}]'.format(items), 'a = [\n    {}\n]'.format(items),
+    'if b\n    a = {{\n        "k": [{}],\n        "e": []\n    }}'.format(
+        items),
+    'a = [{}, "\\n", 1.5, .5, -2., true, null]'.format(items),
+    'a = ["{}"] + [{}]'.format('", "'.join(map(str, range(20))), items)
+]
+
+
+commented = [
+    '# comment\na = 1', 'a = 1 # comment\nb = 2',
+    'if a\n    # comment\n    b = 1\n# comment\n    c = 2\nd = 3',
+    '###\nblock\n###\na = 1', 'a = 1\n  # comment'
+]
+
+
+def tokens(stream):
+    return [(t.type, t.value, t.pos_in_stream, t.line, t.column, t.end_line,
+             t.end_column) for t in list(stream)]
+
+
+def parsed(parser, source):
+    nodes = []
+    for tree in parser.parse(source).iter_subtrees():
+        nodes.append(tree.data)
+        for child in tree.children:
+            if not isinstance(child, Tree):
+                nodes.extend(tokens([child]))
+    return nodes
+
+
+@mark.parametrize('source', sources + commented)
+def test_scanner_lex(source):
+    """
+    Ensures the scanner lexes like Lark's lexer and indenter
+    """
+    expected = tokens(Parser(lexer='lark').lex(source))
+    assert tokens(Parser().lex(source)) == expected
+
+
+@mark.parametrize('source', sources + commented)
+def test_scanner_parse(source):
+    """
+    Ensures the contextual scanner produces the same trees and positions
+    """
+    expected = parsed(Parser(lexer='lark'), source)
+    assert parsed(Parser(), source) == expected
+
+
+@mark.parametrize('source', ['a = ?', 'a = "b', 'a = 1 1', 'if\n'])
+def test_scanner_errors(source):
+    """
+    Ensures the scanner fails like Lark's lexer
+    """
+    with raises(UnexpectedInput) as expected:
+        Parser(lexer='lark').parse(source)
+    with raises(UnexpectedInput) as error:
+        Parser().parse(source)
+    assert type(error.value) is type(expected.value)
+    assert error.value.line == expected.value.line
+    assert error.value.column == expected.value.column
+
+
+@mark.parametrize('source', sources + commented)
+def test_scanner_lex_file(tmpdir, source):
+    """
+    Ensures files are lexed in place like strings
+    """
+    path = tmpdir.join('story')
+    path.write_binary(source.encode('utf-8'))
+    with io.open(str(path), 'rb') as file:
+        result = tokens(Parser().lex(file))
+    assert result == tokens(Parser().lex(source))
+
+
+@mark.parametrize('source', sources + commented)
+def test_scanner_token_stream(source):
+    """
+    Ensures token streams give back the tokens they store
+    """
+    expected = [t[:5] for t in tokens(Parser().lex(source))]
+    stream = Parser().token_stream(source.encode('utf-8'))
+    assert [t[:5] for t in tokens(stream)] == expected
+
+
+@mark.parametrize('source', literals)
+def test_scanner_constant(source):
+    """
+    Ensures big constant literals are scanned at once, and compile like the
+    grammar's literals
+    """
+    types = [token.type for token in Parser().lex(source)]
+    assert 'CONSTANT' in types
+    expected = Compiler.compile(Parser(lexer='lark').parse(source))
+    assert Compiler.compile(Parser().parse(source)) == expected
+
+
+@mark.parametrize('source', ['a = [{}, b]'.format(items),
+                             'a = [\n{}\n]'.format(items)])
+def test_scanner_constant_grammar(source):
+    """
+    Ensures literals that aren't constant, or have layouts the grammar
+    doesn't accept, are left to the grammar
+    """
+    assert 'CONSTANT' not in [token.type for token in Parser().lex(source)]
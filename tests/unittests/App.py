@@ -6,12 +6,13 @@ from pytest import fixture
 from storyscript.App import App
 from storyscript.Bundle import Bundle
 from storyscript.compiler.Preprocessor import Preprocessor
-from storyscript.parser import Grammar
+from storyscript.parser import Grammar, Tree, TreeCache
 
 
 @fixture
 def bundle(patch):
-    patch.many(Bundle, ['from_path', 'bundle_trees', 'bundle', 'lex'])
+    patch.many(Bundle, ['from_path', 'bundle_trees', 'bundle', 'lex',
+                        'lex_files'])
 
 
 def test_app_parse(bundle):
@@ -19,14 +20,27 @@ def test_app_parse(bundle):
     Ensures App.parse returns the parsed bundle
     """
     result = App.parse('path')
-    Bundle.from_path.assert_called_with('path', ignored_path=None)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=None)
     Bundle.from_path().bundle_trees.assert_called_with(ebnf=None)
     assert result == Bundle.from_path().bundle_trees()
 
 
 def test_app_parse_ignored_path(bundle):
     App.parse('path', ignored_path='ignored')
-    Bundle.from_path.assert_called_with('path', ignored_path='ignored')
+    Bundle.from_path.assert_called_with('path', ignored_path='ignored',
+                                        cache=None)
+
+
+def test_app_parse_cache(patch, bundle):
+    """
+    Ensures App.parse can load trees from the cache
+    """
+    patch.object(App, 'tree_cache')
+    App.parse('path', cache=True)
+    App.tree_cache.assert_called_with(True)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=App.tree_cache())
 
 
 def test_app_parse_ebnf(bundle):
@@ -46,15 +60,51 @@ def test_app_parse_preprocess(patch, bundle, magic):
     Bundle.from_path().bundle_trees.return_value = {'foo.story': story}
     result = App.parse('path', preprocess=True)
     assert Preprocessor.process.call_count == 1
-    Bundle.from_path.assert_called_with('path', ignored_path=None)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=None)
     Bundle.from_path().bundle_trees.assert_called_with(ebnf=None)
     assert result == {'foo.story': Preprocessor.process(story)}
 
 
+def test_app_format_trees(magic):
+    tree = magic(pretty_lines=lambda: iter(['start\n']))
+    result = App.format_trees({'a.story': tree})
+    assert list(result) == ['File: a.story\n', 'start\n']
+
+
+def test_app_format_trees_raw():
+    tree = Tree('start', [])
+    result = App.format_trees({'a.story': tree}, raw=True)
+    assert list(result) == ['File: a.story\n', '{!r}\n'.format(tree)]
+
+
+def test_app_format_trees_jsonl(magic):
+    tree = magic()
+    tree.jsonl.return_value = iter(['line\n'])
+    result = App.format_trees({'a.story': tree}, 'jsonl')
+    assert list(result) == ['line\n']
+    tree.jsonl.assert_called_with('a.story')
+
+
+def test_app_format_trees_json():
+    """
+    Ensures the trees of the stories are written as a JSON object
+    """
+    trees = {'a.story': Tree('start', []), 'b.story': Tree('empty', [])}
+    result = json.loads(''.join(App.format_trees(trees, 'json')))
+    assert result['a.story']['rule'] == 'start'
+    assert result['b.story']['children'] == []
+
+
+def test_app_format_trees_json_empty():
+    assert ''.join(App.format_trees({}, 'json')) == '{}\n'
+
+
 def test_app_compile(patch, bundle):
     patch.object(json, 'dumps')
     result = App.compile('path')
-    Bundle.from_path.assert_called_with('path', ignored_path=None)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=None)
     Bundle.from_path().bundle.assert_called_with(ebnf=None)
     json.dumps.assert_called_with(Bundle.from_path().bundle(), indent=2)
     assert result == json.dumps()
@@ -63,7 +113,17 @@ def test_app_compile(patch, bundle):
 def test_app_compile_ignored_path(patch, bundle):
     patch.object(json, 'dumps')
     App.compile('path', ignored_path='ignored')
-    Bundle.from_path.assert_called_with('path', ignored_path='ignored')
+    Bundle.from_path.assert_called_with('path', ignored_path='ignored',
+                                        cache=None)
+
+
+def test_app_compile_cache(patch, bundle):
+    patch.object(json, 'dumps')
+    patch.object(App, 'tree_cache')
+    App.compile('path', cache=True)
+    App.tree_cache.assert_called_with(True)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=App.tree_cache())
 
 
 def test_app_compile_ebnf(patch, bundle):
@@ -75,6 +135,12 @@ def test_app_compile_ebnf(patch, bundle):
     Bundle.from_path().bundle.assert_called_with(ebnf='ebnf')
 
 
+def test_app_tree_cache(patch):
+    patch.init(TreeCache)
+    assert isinstance(App.tree_cache(True), TreeCache)
+    assert App.tree_cache(False) is None
+
+
 def test_app_lex(bundle):
     result = App.lex('/path')
     Bundle.from_path.assert_called_with('/path')
@@ -87,7 +153,19 @@ def test_app_lex_ebnf(bundle):
     Bundle.from_path().lex.assert_called_with(ebnf='my.ebnf')
 
 
+def test_app_lex_files(bundle):
+    result = App.lex_files('/path')
+    Bundle.from_path.assert_called_with('/path')
+    Bundle.from_path().lex_files.assert_called_with(ebnf=None, compact=False)
+    assert result == Bundle.from_path().lex_files()
+
+
+def test_app_lex_files_compact(bundle):
+    App.lex_files('/path', ebnf='my.ebnf', compact=True)
+    lex_files = Bundle.from_path().lex_files
+    lex_files.assert_called_with(ebnf='my.ebnf', compact=True)
+
+
 def test_app_grammar(patch):
-    patch.init(Grammar)
-    patch.object(Grammar, 'build')
-    assert App.grammar() == Grammar().build()
+    patch.object(Grammar, 'grammar')
+    assert App.grammar() == Grammar.grammar()
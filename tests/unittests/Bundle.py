@@ -16,6 +16,11 @@ def bundle(patch):
 def test_bundle_init(bundle):
     assert bundle.stories == {}
     assert bundle.story_files == {}
+    assert bundle.cache is None
+
+
+def test_bundle_init_cache():
+    assert Bundle(cache='cache').cache == 'cache'
 
 
 def test_bundle_init_files():
@@ -143,6 +148,14 @@ def test_bundle_from_path_directory_ignored(patch):
     Bundle.parse_directory.assert_called_with('path', ignored_path='ignored')
 
 
+def test_bundle_from_path_cache(patch):
+    patch.object(os.path, 'isdir', return_value=False)
+    patch.init(Bundle)
+    patch.object(Bundle, 'load_story')
+    Bundle.from_path('path', cache='cache')
+    Bundle.__init__.assert_called_with(cache='cache')
+
+
 def test_bundle_load_story(patch, bundle):
     """
     Ensures Bundle.load_story can load a story
@@ -203,6 +216,7 @@ def test_bundle_parse(patch, bundle):
     bundle.parse(['one.story'], None)
     Bundle.load_story.assert_called_with('one.story')
     story = Bundle.load_story()
+    story.parse.assert_called_with(ebnf=None, cache=None)
     Bundle.parse_modules.assert_called_with(story.modules(), None)
     assert bundle.stories['one.story'] == story.tree
 
@@ -215,6 +229,7 @@ def test_bundle_compile(mocker, patch, bundle):
     Bundle.load_story.assert_called_with('one.story')
 
     story = Bundle.load_story()
+    story.parse.assert_called_with(ebnf=None, compact=True, cache=None)
     Bundle.compile_modules.assert_called_with(story.modules(), None)
     story.compile.assert_called()
     assert bundle.stories['one.story'] == story.compiled
@@ -253,11 +268,12 @@ def test_bundle_lex(patch, bundle):
     Ensures Bundle.lex can lex a bundle
     """
     patch.object(Story, 'from_file')
+    Story.from_file().lex.return_value = iter(['token'])
     patch.object(Bundle, 'find_stories', return_value=['story'])
     result = bundle.lex()
     Story.from_file.assert_called_with('story')
     Story.from_file().lex.assert_called_with(ebnf=None)
-    assert result['story'] == Story.from_file().lex()
+    assert result == {'story': ['token']}
 
 
 def test_bundle_lex_ebnf(patch, bundle):
@@ -268,3 +284,29 @@ def test_bundle_lex_ebnf(patch, bundle):
     patch.object(Bundle, 'find_stories', return_value=['story'])
     bundle.lex(ebnf='ebnf')
     Story.from_file().lex.assert_called_with(ebnf='ebnf')
+
+
+def test_bundle_lex_files(patch, bundle):
+    """
+    Ensures Bundle.lex_files lexes the files of a bundle as they are
+    reached
+    """
+    patch.object(Story, 'lex_file')
+    patch.object(Bundle, 'find_stories', return_value=['one', 'two'])
+    result = bundle.lex_files(ebnf='ebnf')
+    assert Story.lex_file.call_count == 0
+    tokens = Story.lex_file.return_value
+    assert next(result) == ('one', tokens)
+    Story.lex_file.assert_called_with('one', ebnf='ebnf')
+    assert list(result) == [('two', tokens)]
+
+
+def test_bundle_lex_files_compact(patch, bundle):
+    """
+    Ensures Bundle.lex_files can lex a bundle into token streams
+    """
+    patch.object(Story, 'token_stream')
+    patch.object(Bundle, 'find_stories', return_value=['story'])
+    result = bundle.lex_files(ebnf='ebnf', compact=True)
+    assert list(result) == [('story', Story.token_stream.return_value)]
+    Story.token_stream.assert_called_with('story', ebnf='ebnf')
@@ -13,6 +13,7 @@ from storyscript.Project import Project
 from storyscript.Version import version
 from storyscript.exceptions.CompilerError import CompilerError
 from storyscript.exceptions.StoryError import StoryError
+from storyscript.parser import TokenStream
 
 
 @fixture
@@ -97,7 +98,8 @@ def test_cli_compile_with_ignore_option(runner, app):
     runner.invoke(Cli.compile, ['path/fake.story',
                                 '--ignore', 'path/sub_dir/my_fake.story'])
     App.compile.assert_called_with('path/fake.story', ebnf=None,
-                                   ignored_path='path/sub_dir/my_fake.story')
+                                   ignored_path='path/sub_dir/my_fake.story',
+                                   cache=False)
 
 
 def test_cli_parse_with_ignore_option(runner, app):
@@ -108,27 +110,50 @@ def test_cli_parse_with_ignore_option(runner, app):
                               'path/sub_dir/my_fake.story'])
     App.parse.assert_called_with('path/fake.story', ebnf=None,
                                  ignored_path='path/sub_dir/my_fake.story',
-                                 preprocess=False)
+                                 preprocess=False, cache=False)
 
 
-def test_cli_parse(runner, echo, app, tree):
+def test_cli_parse(patch, runner, echo, app, tree):
     """
-    Ensures the parse command produces the trees for given stories.
+    Ensures the parse command writes the trees for given stories.
     """
+    patch.object(App, 'format_trees', return_value=['tree\n'])
     App.parse.return_value = {'path': tree}
-    runner.invoke(Cli.parse, [])
+    result = runner.invoke(Cli.parse, [])
     App.parse.assert_called_with(os.getcwd(), ebnf=None,
-                                 ignored_path=None, preprocess=False)
-    click.echo.assert_called_with(tree.pretty())
+                                 ignored_path=None, preprocess=False,
+                                 cache=False)
+    App.format_trees.assert_called_with(App.parse(), 'text', raw=False)
+    assert result.output == 'tree\n'
+    assert click.echo.call_count == 0
 
 
-def test_cli_parse_raw(runner, echo, app, tree):
+def test_cli_parse_raw(patch, runner, echo, app, tree):
     """
     Ensures the parse command supports raw trees
     """
-    App.parse.return_value = {'path': tree}
+    patch.object(App, 'format_trees', return_value=[])
     runner.invoke(Cli.parse, ['--raw'])
-    click.echo.assert_called_with(tree)
+    App.format_trees.assert_called_with(App.parse(), 'text', raw=True)
+
+
+@mark.parametrize('output_format', ['json', 'jsonl'])
+def test_cli_parse_format(patch, runner, echo, app, output_format):
+    patch.object(App, 'format_trees', return_value=[])
+    runner.invoke(Cli.parse, ['--format', output_format])
+    App.format_trees.assert_called_with(App.parse(), output_format,
+                                        raw=False)
+
+
+def test_cli_parse_output_file(patch, runner, app):
+    """
+    Ensures the parse command supports writing to an output file.
+    """
+    patch.object(io, 'open')
+    patch.object(App, 'format_trees')
+    runner.invoke(Cli.parse, ['/path', 'trees.json', '--format', 'json'])
+    io.open.assert_called_with('trees.json', 'w')
+    io.open().__enter__().writelines.assert_called_with(App.format_trees())
 
 
 def test_cli_parse_path(runner, echo, app):
@@ -137,7 +162,8 @@ def test_cli_parse_path(runner, echo, app):
     """
     runner.invoke(Cli.parse, ['/path'])
     App.parse.assert_called_with('/path', ebnf=None,
-                                 ignored_path=None, preprocess=False)
+                                 ignored_path=None, preprocess=False,
+                                 cache=False)
 
 
 def test_cli_parse_ebnf(runner, echo, app):
@@ -146,7 +172,8 @@ def test_cli_parse_ebnf(runner, echo, app):
     """
     runner.invoke(Cli.parse, ['--ebnf', 'test.ebnf'])
     App.parse.assert_called_with(os.getcwd(), ebnf='test.ebnf',
-                                 ignored_path=None, preprocess=False)
+                                 ignored_path=None, preprocess=False,
+                                 cache=False)
 
 
 def test_cli_parse_preprocess(runner, echo, app):
@@ -155,7 +182,18 @@ def test_cli_parse_preprocess(runner, echo, app):
     """
     runner.invoke(Cli.parse, ['--preprocess'])
     App.parse.assert_called_with(os.getcwd(), ebnf=None,
-                                 ignored_path=None, preprocess=True)
+                                 ignored_path=None, preprocess=True,
+                                 cache=False)
+
+
+def test_cli_parse_cache(runner, echo, app):
+    """
+    Ensures the parse command supports loading trees from the cache
+    """
+    runner.invoke(Cli.parse, ['--cache'])
+    App.parse.assert_called_with(os.getcwd(), ebnf=None,
+                                 ignored_path=None, preprocess=False,
+                                 cache=True)
 
 
 def test_cli_parse_debug(runner, echo, app):
@@ -212,7 +250,7 @@ def test_cli_compile(patch, runner, echo, app):
     patch.object(click, 'style')
     runner.invoke(Cli.compile, [])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
     click.style.assert_called_with('Script syntax passed!', fg='green')
     click.echo.assert_called_with(click.style())
 
@@ -223,7 +261,7 @@ def test_cli_compile_path(patch, runner, app):
     """
     runner.invoke(Cli.compile, ['/path'])
     App.compile.assert_called_with('/path', ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
 
 
 def test_cli_compile_output_file(patch, runner, app):
@@ -243,7 +281,7 @@ def test_cli_compile_silent(runner, echo, app, option):
     """
     result = runner.invoke(Cli.compile, [option])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
     assert result.output == ''
     assert click.echo.call_count == 0
 
@@ -251,7 +289,7 @@ def test_cli_compile_silent(runner, echo, app, option):
 def test_cli_compile_debug(runner, echo, app):
     runner.invoke(Cli.compile, ['--debug'])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
 
 
 @mark.parametrize('option', ['--json', '-j'])
@@ -261,14 +299,20 @@ def test_cli_compile_json(runner, echo, app, option):
     """
     runner.invoke(Cli.compile, [option])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
     click.echo.assert_called_with(App.compile())
 
 
 def test_cli_compile_ebnf(runner, echo, app):
     runner.invoke(Cli.compile, ['--ebnf', 'test.ebnf'])
     App.compile.assert_called_with(os.getcwd(), ebnf='test.ebnf',
-                                   ignored_path=None)
+                                   ignored_path=None, cache=False)
+
+
+def test_cli_compile_cache(runner, echo, app):
+    runner.invoke(Cli.compile, ['--cache'])
+    App.compile.assert_called_with(os.getcwd(), ebnf=None,
+                                   ignored_path=None, cache=True)
 
 
 def test_cli_compile_ice(runner, echo, app):
@@ -322,36 +366,57 @@ def test_cli_lex(patch, magic, runner, app, echo):
     Ensures the lex command outputs lexer tokens
     """
     token = magic(type='token', value='value')
-    patch.object(App, 'lex', return_value={'one.story': [token]})
+    patch.object(App, 'lex_files', return_value=[('one.story', [token])])
     runner.invoke(Cli.lex, [])
-    App.lex.assert_called_with(os.getcwd(), ebnf=None)
+    App.lex_files.assert_called_with(os.getcwd(), ebnf=None)
     click.echo.assert_called_with('0 token value')
     assert click.echo.call_count == 2
 
 
+@mark.parametrize('output_format', ['tsv', 'jsonl'])
+def test_cli_lex_format(patch, magic, runner, app, echo, output_format):
+    """
+    Ensures the lex command can output token streams
+    """
+    stream = magic()
+    getattr(stream, output_format).return_value = ['row\n']
+    patch.object(App, 'lex_files', return_value=[('one.story', stream)])
+    result = runner.invoke(Cli.lex, ['--format', output_format])
+    App.lex_files.assert_called_with(os.getcwd(), ebnf=None, compact=True)
+    getattr(stream, output_format).assert_called_with('one.story')
+    assert result.output.endswith('row\n')
+    assert click.echo.call_count == 0
+
+
+def test_cli_lex_format_tsv_headers(patch, magic, runner, app):
+    patch.object(App, 'lex_files', return_value=[])
+    result = runner.invoke(Cli.lex, ['--format', 'tsv'])
+    assert result.output == '\t'.join(TokenStream.headers) + '\n'
+
+
 def test_cli_lex_path(patch, magic, runner, app):
     """
     Ensures the lex command path defaults to cwd
     """
-    patch.object(App, 'lex', return_value={'one.story': [magic()]})
+    patch.object(App, 'lex_files', return_value=[('one.story', [magic()])])
     runner.invoke(Cli.lex, ['/path'])
-    App.lex.assert_called_with('/path', ebnf=None)
+    App.lex_files.assert_called_with('/path', ebnf=None)
 
 
 def test_cli_lex_ebnf(patch, runner):
     """
     Ensures the lex command allows specifying an ebnf file.
     """
-    patch.object(App, 'lex')
+    patch.object(App, 'lex_files')
     runner.invoke(Cli.lex, ['--ebnf', 'my.ebnf'])
-    App.lex.assert_called_with(os.getcwd(), ebnf='my.ebnf')
+    App.lex_files.assert_called_with(os.getcwd(), ebnf='my.ebnf')
 
 
 def test_cli_lex_ice(patch, runner, echo, app):
     """
     Ensures the lex command prints unknown errors
     """
-    patch.object(App, 'lex', side_effect=Exception('ICE'))
+    patch.object(App, 'lex_files', side_effect=Exception('ICE'))
     e = runner.invoke(Cli.lex, ['/a/non/existent/file'])
     assert e.exit_code == 1
     click.echo.assert_called_with((
@@ -363,7 +428,7 @@ def test_cli_lex_debug_ice(patch, runner, echo, app):
     """
     Ensures the lex command supports raises unknown errors with debug=True
     """
-    patch.object(App, 'lex', side_effect=Exception('ICE'))
+    patch.object(App, 'lex_files', side_effect=Exception('ICE'))
     e = runner.invoke(Cli.lex, ['--debug', '/a/non/existent/file'])
     assert e.exit_code == 1
     assert isinstance(e.exception, Exception)
@@ -375,8 +440,8 @@ def test_cli_lex_not_found(patch, runner, echo, app):
     Ensures the lex command catches errors
     """
     ce = CompilerError(None, message='error')
-    patch.object(App, 'lex')
-    App.lex.side_effect = StoryError(ce, None)
+    patch.object(App, 'lex_files')
+    App.lex_files.side_effect = StoryError(ce, None)
     e = runner.invoke(Cli.lex, ['/a/non/existent/file'])
     assert e.exit_code == 1
     click.echo.assert_called_with('error')
@@ -387,8 +452,8 @@ def test_cli_lex_not_found_debug(patch, runner, echo, app):
     Ensures the lex command raises errors with debug=True
     """
     ce = CompilerError(None, message='error')
-    patch.object(App, 'lex')
-    App.lex.side_effect = StoryError(ce, None)
+    patch.object(App, 'lex_files')
+    App.lex_files.side_effect = StoryError(ce, None)
     e = runner.invoke(Cli.lex, ['--debug', '/a/non/existent/file'])
     assert e.exit_code == 1
     assert isinstance(e.exception, StoryError)
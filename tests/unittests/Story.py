@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import io
 import os
-import re
 
 from lark.exceptions import UnexpectedInput, UnexpectedToken
 
@@ -21,7 +20,7 @@ def story():
 @fixture
 def parser(patch):
     patch.init(Parser)
-    patch.many(Parser, ['parse', 'lex'])
+    patch.many(Parser, ['parse', 'lex', 'reparse'])
 
 
 @fixture
@@ -33,6 +32,7 @@ def compiler(patch, story):
 def test_story_init(story):
     assert story.story == 'story'
     assert story.path is None
+    assert story.parsed_story is None
 
 
 def test_story_init_path():
@@ -40,61 +40,26 @@ def test_story_init_path():
     assert story.path == 'path'
 
 
-def test_story_remove_comments(patch):
-    """
-    Ensures that remove_comments can remove inline comments.
-    """
-    patch.object(re, 'sub')
-    result = Story.remove_comments('source')
-    re.sub.assert_called_with(r'#[^#\n]+', '', 'source')
-    assert result == re.sub()
-
-
-def test_story_delete_line(patch):
-    """
-    Ensures that delete_line can delete lines.
-    """
-    patch.object(re, 'sub')
-    patch.object(re, 'match')
-    result = Story.delete_line(re.match())
-    re.sub.assert_called_with(r'.*', '', re.match().group())
-    assert result == re.sub()
-
-
-def test_story_clean_source(patch):
-    """
-    Ensures that a story is cleaned correctly
-    """
-    patch.object(re, 'sub')
-    patch.object(Story, 'remove_comments')
-    patch.object(Story, 'delete_line')
-    result = Story.clean_source('source')
-    re.sub.assert_called_with(
-        r'###[^#]+###', Story.delete_line, Story.remove_comments()
-    )
-    assert result == re.sub()
-
-
 def test_story_read(patch):
     """
     Ensures Story.read can read a story
     """
     patch.object(io, 'open')
-    patch.object(Story, 'clean_source')
     result = Story.read('hello.story')
     io.open.assert_called_with('hello.story', 'r')
     assert result == io.open().__enter__().read()
 
 
-def test_story_init_clean_source(patch):
-    """
-    Ensures Story.clean_source is called for new stories
-    """
-    patch.object(Story, 'clean_source')
-    source = 'my story'
-    story = Story(source)
-    Story.clean_source.assert_called_with(source)
-    assert story.story == Story.clean_source(source)
+@mark.parametrize('previous, story, expected', [
+    ('abcd', 'abxd', (2, 3, 'x')),
+    ('abcd', 'abd', (2, 3, '')),
+    ('abcd', 'abcxd', (3, 3, 'x')),
+    ('aaaa', 'aaaaa', (4, 4, 'a')),
+    ('abcd', 'abcd', (4, 4, '')),
+    ('', 'ab', (0, 0, 'ab'))
+])
+def test_story_changes(previous, story, expected):
+    assert Story.changes(previous, story) == expected
 
 
 def test_story_read_not_found(patch, capsys):
@@ -105,6 +70,12 @@ def test_story_read_not_found(patch, capsys):
     assert 'E0001: File "whatever" not found at ' in e.value.short_message()
 
 
+def test_story_not_found(patch):
+    patch.object(os.path, 'abspath', return_value='/abs')
+    result = Story.not_found('whatever')
+    assert result == 'File "whatever" not found at /abs'
+
+
 def test_story_from_file(patch):
     patch.init(Story)
     patch.object(Story, 'read')
@@ -116,7 +87,6 @@ def test_story_from_file(patch):
 
 def test_story_from_stream(patch, magic):
     patch.init(Story)
-    patch.object(Story, 'clean_source')
     stream = magic()
     result = Story.from_stream(stream)
     Story.__init__.assert_called_with(stream.read())
@@ -132,14 +102,34 @@ def test_story_error(patch, story):
 
 def test_story_parse(patch, story, parser):
     story.parse()
-    Parser.__init__.assert_called_with(ebnf=None)
+    Parser.__init__.assert_called_with(ebnf=None, compact=False,
+                                       workers=None, cache=None)
     Parser.parse.assert_called_with(story.story)
     assert story.tree == Parser.parse()
 
 
 def test_story_parse_ebnf(patch, story, parser):
     story.parse(ebnf='ebnf')
-    Parser.__init__.assert_called_with(ebnf='ebnf')
+    Parser.__init__.assert_called_with(ebnf='ebnf', compact=False,
+                                       workers=None, cache=None)
+
+
+def test_story_parse_compact(patch, story, parser):
+    story.parse(compact=True)
+    Parser.__init__.assert_called_with(ebnf=None, compact=True,
+                                       workers=None, cache=None)
+
+
+def test_story_parse_workers(patch, story, parser):
+    story.parse(workers=4)
+    Parser.__init__.assert_called_with(ebnf=None, compact=False, workers=4,
+                                       cache=None)
+
+
+def test_story_parse_cache(patch, story, parser):
+    story.parse(cache='cache')
+    Parser.__init__.assert_called_with(ebnf=None, compact=False,
+                                       workers=None, cache='cache')
 
 
 def test_story_parse_debug(patch, story, parser):
@@ -163,27 +153,112 @@ def test_story_parse_error(patch, story, parser, error):
     Story.error.assert_called_with(error)
 
 
+def test_story_parse_parsed_story(patch, story, parser):
+    story.parse()
+    assert story.parsed_story == story.story
+
+
+def test_story_build_tree(magic, story):
+    parse = magic()
+    story.build_tree(parse, 'a', 'b')
+    parse.assert_called_with('a', 'b')
+    assert story.tree == parse()
+    assert story.parsed_story == story.story
+
+
+def test_story_build_tree_error(patch, magic, story):
+    """
+    Ensures the tree is kept when parsing fails
+    """
+    error = StorySyntaxError('test')
+    patch.object(Story, 'error', return_value=Exception('error'))
+    story.tree = 'tree'
+    with raises(Exception):
+        story.build_tree(magic(side_effect=error))
+    Story.error.assert_called_with(error)
+    assert story.tree == 'tree'
+    assert story.parsed_story is None
+
+
+def test_story_edit(patch, story, parser):
+    patch.object(Story, 'changes')
+    story.tree = 'tree'
+    story.parsed_story = 'story'
+    story.edit(3, 3, 'x')
+    assert story.story == 'stoxry'
+    assert Story.changes.call_count == 0
+    Parser.__init__.assert_called_with(ebnf=None, compact=False)
+    Parser.reparse.assert_called_with('tree', 'story', 3, 3, 'x')
+    assert story.tree == Parser.reparse()
+    assert story.parsed_story == 'stoxry'
+
+
+def test_story_edit_after_error(patch, story, parser):
+    """
+    Ensures the changes since the last parsed story are reparsed after a
+    failed parse
+    """
+    patch.object(Story, 'changes', return_value=(0, 1, 'x'))
+    story.tree = 'tree'
+    story.parsed_story = 'stor'
+    story.edit(3, 3, 'x')
+    Story.changes.assert_called_with('stor', 'stoxry')
+    Parser.reparse.assert_called_with('tree', 'stor', 0, 1, 'x')
+
+
+def test_story_edit_compact(patch, story, parser):
+    story.parsed_story = 'story'
+    story.tree = 'tree'
+    story.edit(0, 0, 'a', ebnf='ebnf', compact=True)
+    Parser.__init__.assert_called_with(ebnf='ebnf', compact=True)
+
+
+def test_story_edit_unparsed(patch, story):
+    """
+    Ensures stories without a tree that can be reparsed are parsed
+    """
+    patch.object(Story, 'parse')
+    story.edit(0, 5, 'x')
+    assert story.story == 'x'
+    Story.parse.assert_called_with(ebnf=None, compact=False, cache=None)
+
+
 def test_story_modules(magic, story):
     import_tree = magic()
-    story.tree = magic()
+    story.tree = magic(side_tables=None)
     story.tree.find_data.return_value = [import_tree]
     result = story.modules()
+    story.tree.find_data.assert_called_with('imports')
+    assert result == [import_tree.string.child().value[1:-1]]
+
+
+def test_story_modules_side_tables(magic, story):
+    """
+    Ensures modules are read from the recorded imports, when the tree has
+    side tables
+    """
+    import_tree = magic()
+    story.tree = magic()
+    story.tree.side_tables.imports = [import_tree]
+    result = story.modules()
     assert result == [import_tree.string.child().value[1:-1]]
 
 
 def test_story_modules_no_extension(magic, story):
     import_tree = magic()
     import_tree.string.child.return_value = magic(value='"hello"')
-    story.tree = magic()
+    story.tree = magic(side_tables=None)
     story.tree.find_data.return_value = [import_tree]
     result = story.modules()
     assert result == ['hello.story']
 
 
 def test_story_compile(patch, story, compiler):
+    story.parsed_story = 'story'
     story.compile()
     Compiler.compile.assert_called_with(story.tree)
     assert story.compiled == Compiler.compile()
+    assert story.parsed_story is None
 
 
 @mark.parametrize('error', [StorySyntaxError('error'), CompilerError('error')])
@@ -210,11 +285,83 @@ def test_story_lex_ebnf(patch, story, parser):
     Parser.__init__.assert_called_with(ebnf='ebnf')
 
 
+def test_story_lex_file(patch, parser):
+    """
+    Ensures story files are opened right away and lexed lazily
+    """
+    patch.object(io, 'open')
+    Parser.lex.return_value = ['token']
+    result = Story.lex_file('hello.story')
+    io.open.assert_called_with('hello.story', 'rb')
+    assert Parser.lex.call_count == 0
+    assert list(result) == ['token']
+    Parser.__init__.assert_called_with(ebnf=None)
+    Parser.lex.assert_called_with(io.open())
+
+
+def test_story_lex_file_ebnf(patch, parser):
+    patch.object(io, 'open')
+    list(Story.lex_file('hello.story', ebnf='ebnf'))
+    Parser.__init__.assert_called_with(ebnf='ebnf')
+
+
+def test_story_lex_file_not_found(patch):
+    """
+    Ensures missing files are found when they are lexed, before their
+    tokens are produced
+    """
+    patch.object(io, 'open', side_effect=FileNotFoundError)
+    patch.object(os, 'path')
+    with raises(StoryError) as e:
+        Story.lex_file('whatever')
+    assert 'E0001: File "whatever" not found at ' in e.value.short_message()
+
+
+def test_story_lex_stream(patch, parser, magic):
+    """
+    Ensures files are closed once their tokens have been produced
+    """
+    file = magic()
+    Parser.lex.return_value = ['token']
+    assert list(Story.lex_stream(file, ebnf='ebnf')) == ['token']
+    Parser.__init__.assert_called_with(ebnf='ebnf')
+    Parser.lex.assert_called_with(file)
+    assert file.__exit__.call_count == 1
+
+
+def test_story_token_stream(patch):
+    patch.init(Parser)
+    patch.object(Parser, 'token_stream')
+    patch.object(io, 'open')
+    result = Story.token_stream('hello.story')
+    io.open.assert_called_with('hello.story', 'rb')
+    Parser.__init__.assert_called_with(ebnf=None)
+    source = io.open().__enter__().read()
+    Parser.token_stream.assert_called_with(source)
+    assert result == Parser.token_stream()
+
+
+def test_story_token_stream_ebnf(patch):
+    patch.init(Parser)
+    patch.object(Parser, 'token_stream')
+    patch.object(io, 'open')
+    Story.token_stream('hello.story', ebnf='ebnf')
+    Parser.__init__.assert_called_with(ebnf='ebnf')
+
+
+def test_story_token_stream_not_found(patch):
+    patch.object(io, 'open', side_effect=FileNotFoundError)
+    patch.object(os, 'path')
+    with raises(StoryError) as e:
+        Story.token_stream('whatever')
+    assert 'E0001: File "whatever" not found at ' in e.value.short_message()
+
+
 def test_story_process(patch, story):
     patch.many(Story, ['parse', 'compile'])
     story.compiled = 'compiled'
     result = story.process()
-    Story.parse.assert_called_with(ebnf=None)
+    Story.parse.assert_called_with(ebnf=None, compact=True)
     Story.compile.assert_called_with()
     assert result == story.compiled
 
@@ -223,4 +370,4 @@ def test_story_process_ebnf(patch, story):
     patch.many(Story, ['parse', 'compile'])
     story.compiled = 'compiled'
     story.process(ebnf='ebnf')
-    Story.parse.assert_called_with(ebnf='ebnf')
+    Story.parse.assert_called_with(ebnf='ebnf', compact=True)
@@ -11,7 +11,9 @@ from storyscript.parser import Tree
 
 @fixture
 def lines(magic):
-    return magic()
+    lines = magic()
+    lines.is_variable.return_value = False
+    return lines
 
 
 @fixture
@@ -22,15 +24,6 @@ def compiler(patch, lines):
     return compiler
 
 
-def get_entity(obj):
-    """
-    returns the entity for an expression
-    """
-    return obj.or_expression.and_expression.cmp_expression.arith_expression. \
-        mul_expression.unary_expression.pow_expression.primary_expression. \
-        entity
-
-
 def test_compiler_init(patch):
     patch.init(Lines)
     compiler = Compiler()
@@ -72,15 +65,26 @@ def test_compiler_extract_values_mutation(patch, tree):
     assert result == [Objects.values(), Objects.mutation()]
 
 
-def test_compiler_chained_mutations(patch, magic, tree):
+def test_compiler_chained_mutations(patch, magic, compiler, tree):
     patch.object(Objects, 'mutation')
     mutation = magic()
     tree.find_data.return_value = [mutation]
-    result = Compiler.chained_mutations(tree)
+    result = compiler.chained_mutations(tree)
+    tree.find_data.assert_called_with('chained_mutation')
     Objects.mutation.assert_called_with(mutation.mutation_fragment)
     assert result == [Objects.mutation()]
 
 
+def test_compiler_chained_mutations_side_tables(magic, compiler, tree):
+    """
+    Ensures subtrees aren't walked when the side tables of the tree have no
+    chained mutations
+    """
+    compiler.side_tables = magic(chained_mutations=[])
+    assert compiler.chained_mutations(tree) == []
+    assert tree.find_data.call_count == 0
+
+
 def test_compiler_function_output(patch, tree):
     patch.object(Compiler, 'output')
     result = Compiler.function_output(tree)
@@ -113,8 +117,7 @@ def test_compiler_unary_expression(patch, compiler, lines, tree):
     method = 'set.method'
     parent = '.parent.'
     compiler.unary_expression(tree, parent, method)
-    args = [Objects.entity(tree.expression.multiplication.exponential.
-                           factor.entity)]
+    args = [Objects.entity(tree.unary_entity())]
     lines.append.assert_called_with(method, tree.line(), args=args,
                                     parent=parent)
 
@@ -127,8 +130,7 @@ def test_compiler_unary_expression_name(patch, compiler, lines, tree):
     name = '.name.'
     line = '.line.'
     compiler.unary_expression(tree, parent, method, name=name, line=line)
-    args = [Objects.entity(tree.expression.multiplication.exponential.
-                           factor.entity)]
+    args = [Objects.entity(tree.unary_entity())]
     lines.append.assert_called_with(method, line, args=args, parent=parent,
                                     name=name)
 
@@ -158,8 +160,7 @@ def test_compiler_assignment(patch, compiler, lines, tree):
     compiler.assignment(tree, '1')
     Objects.names.assert_called_with(tree.path)
     fragment = tree.assignment_fragment
-    entity = get_entity(fragment.expression)
-    Objects.entity.assert_called_with(entity)
+    Objects.entity.assert_called_with(fragment.expression.unary_entity())
     kwargs = {'name': Objects.names(), 'args': [Objects.entity()],
               'parent': '1'}
     lines.append.assert_called_with('set', tree.line(), **kwargs)
@@ -169,6 +170,7 @@ def test_compiler_assignment_service(patch, compiler, lines, tree):
     patch.object(Objects, 'names')
     patch.object(Compiler, 'service')
     compiler.assignment(tree, '1')
+    lines.is_variable.assert_called_with([Objects.names()])
     service = tree.assignment_fragment.service
     Compiler.service.assert_called_with(service, None, '1')
     lines.set_name.assert_called_with(Objects.names())
@@ -293,9 +295,10 @@ def test_compiler_service_expressions(patch, compiler, lines, tree):
     """
     patch.object(Objects, 'names', return_value='x')
     patch.object(Compiler, 'mutation_block')
-    lines.variables = ['x']
+    lines.is_variable.return_value = True
     compiler.service(tree, None, 'parent')
     Objects.names.assert_called_with(tree.path)
+    lines.is_variable.assert_called_with('x')
     Compiler.mutation_block.assert_called_with(tree, 'parent')
 
 
@@ -725,6 +728,8 @@ def test_compiler_compile(patch):
     result = Compiler.compile('tree')
     Preprocessor.process.assert_called_with('tree')
     Compiler.compiler().parse_tree.assert_called_with(Preprocessor.process())
+    side_tables = Preprocessor.process().side_tables
+    assert Compiler.compiler().side_tables == side_tables
     lines = Compiler.compiler().lines
     expected = {'tree': lines.lines, 'version': version,
                 'services': lines.get_services(), 'functions': lines.functions,
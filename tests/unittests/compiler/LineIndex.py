@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from storyscript.compiler import LineIndex
+
+
+def test_lineindex_init():
+    index = LineIndex()
+    assert index.keys == []
+    assert index.numbers == []
+
+
+def test_lineindex_init_lines():
+    index = LineIndex({'2': '2', '1': '1', '1.1': '1'})
+    assert index.numbers == ['1.1', '1', '2']
+    assert index.keys == [(1, 1, LineIndex.end), (1, LineIndex.end),
+                          (2, LineIndex.end)]
+
+
+def test_lineindex_len():
+    assert len(LineIndex(['1', '2'])) == 2
+
+
+def test_lineindex_iter():
+    assert list(LineIndex(['2', '1'])) == ['1', '2']
+
+
+def test_lineindex_reversed():
+    assert list(reversed(LineIndex(['2', '1']))) == ['2', '1']
+
+
+def test_lineindex_key():
+    assert LineIndex.key('1') == (1, LineIndex.end)
+    assert LineIndex.key('1.0.9') == (1, 0, 9, LineIndex.end)
+
+
+def test_lineindex_add():
+    index = LineIndex()
+    index.add('1')
+    index.add('2')
+    assert index.numbers == ['1', '2']
+
+
+def test_lineindex_add_fake():
+    """
+    Ensures fake lines are inserted before their line, after the previous
+    one
+    """
+    index = LineIndex(['1', '2', '3'])
+    index.add('2.1')
+    index.add('2.2')
+    index.add('2.1.1')
+    assert index.numbers == ['1', '2.1.1', '2.1', '2.2', '2', '3']
+
+
+def test_lineindex_add_existing():
+    index = LineIndex(['1', '2'])
+    index.add('1')
+    index.add('2')
+    assert index.numbers == ['1', '2']
+
+
+def test_lineindex_order():
+    """
+    Ensures lines are in the order of their fake lines
+    """
+    lines = ['1', '1.0', '1.1', '0', '2', '2.1', '1.9.0', '1.6', '1.4.1',
+             '1.1.0', '1.0.0', '1.0.1', '1.1.26', '1.1.3', '1.0.9',
+             '1.0.22']
+    index = LineIndex()
+    for line in lines:
+        index.add(line)
+    expected = ['0', '1.0.0', '1.0.1', '1.0.9', '1.0.22', '1.0', '1.1.0',
+                '1.1.3', '1.1.26', '1.1', '1.4.1', '1.6', '1.9.0', '1',
+                '2.1', '2']
+    assert index.numbers == expected
+    assert LineIndex(lines).numbers == expected
+
+
+def test_lineindex_first():
+    assert LineIndex(['2', '1.1', '1']).first() == '1.1'
+
+
+def test_lineindex_first_empty():
+    assert LineIndex().first() is None
+
+
+def test_lineindex_last():
+    assert LineIndex(['2', '2.1', '1']).last() == '2'
+
+
+def test_lineindex_last_empty():
+    assert LineIndex().last() is None
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pytest import fixture, mark, raises
 
-from storyscript.compiler import Lines
+from storyscript.compiler import LineIndex, Lines
 from storyscript.exceptions import StorySyntaxError
 
 
@@ -12,7 +12,9 @@ def lines():
 
 def test_lines_init(lines):
     assert lines.lines == {}
+    assert isinstance(lines.index, LineIndex)
     assert lines.variables == []
+    assert lines.variable_names == set()
     assert lines.services == []
     assert lines.functions == {}
     assert lines.output_scopes == {}
@@ -58,20 +60,26 @@ def test_lines_sort_more_complex(lines):
     ]
 
 
-def test_lines_first(patch, lines):
-    patch.object(Lines, 'sort')
-    lines.lines = {'1': '1'}
-    assert lines.first() == lines.sort()[0]
+def test_lines_set_lines(lines):
+    """
+    Ensures setting the lines indexes them
+    """
+    lines.lines = {'2': '2', '1': '1'}
+    assert list(lines.index) == ['1', '2']
+
+
+def test_lines_first(lines):
+    lines.lines = {'2': '2', '1.1': '1', '1': '1'}
+    assert lines.first() == '1.1'
 
 
 def test_lines_first_none(lines):
     assert lines.first() is None
 
 
-def test_lines_last(patch, lines):
-    patch.object(Lines, 'sort')
-    lines.lines = {'1': '1'}
-    assert lines.last() == lines.sort()[-1]
+def test_lines_last(lines):
+    lines.lines = {'2': '2', '2.1': '2', '1': '1'}
+    assert lines.last() == '2'
 
 
 def test_lines_last_no_lines(lines):
@@ -93,12 +101,47 @@ def test_lines_set_next(patch, lines):
 
 
 @mark.parametrize('method', ['if', 'elif', 'try', 'catch'])
-def test_lines_set_exit(patch, lines, method):
-    patch.object(Lines, 'sort', return_value=['1', '2'])
-    lines.lines = {'1': {}, '2': {'method': method}}
-    lines.set_exit('3')
-    assert lines.sort.call_count == 1
-    assert lines.lines['2']['exit'] == '3'
+def test_lines_set_exit(lines, method):
+    lines.lines = {'1': {'method': method}, '2': {'method': method},
+                   '3': {'method': 'set'}}
+    lines.set_exit('4')
+    assert 'exit' not in lines.lines['1']
+    assert lines.lines['2']['exit'] == '4'
+
+
+def test_lines_add_variable(lines):
+    lines.add_variable(['a', 'b'])
+    assert lines.variables == [['a', 'b']]
+    assert lines.variable_names == {repr(['a', 'b'])}
+
+
+def test_lines_is_variable(lines):
+    lines.add_variable(['a'])
+    assert lines.is_variable(['a']) is True
+    assert lines.is_variable(['a', 'b']) is False
+    assert lines.is_variable([['a']]) is False
+
+
+def test_lines_make_in_place(lines):
+    """
+    Ensures lines are made in the same dictionary, instead of copying it
+    """
+    compiled = lines.lines
+    lines.make('method', '1')
+    lines.make('method', '2')
+    assert lines.lines is compiled
+    assert list(compiled) == ['1', '2']
+
+
+def test_lines_make_again(lines):
+    """
+    Ensures lines made again keep their position
+    """
+    lines.make('method', '1')
+    lines.make('method', '2')
+    lines.make('other', '1')
+    assert list(lines.lines) == ['1', '2']
+    assert lines.lines['1']['method'] == 'other'
 
 
 def test_lines_set_scope(lines):
@@ -136,6 +179,16 @@ def test_lines_make(lines):
                       'parent': None}}
     lines.make('method', '1')
     assert lines.lines == expected
+    assert list(lines.index) == ['1']
+
+
+def test_lines_make_index(lines):
+    """
+    Ensures made lines are indexed in order, including fake lines
+    """
+    for line in ('1', '2', '1.1', '2'):
+        lines.make('method', line)
+    assert list(lines.index) == ['1.1', '1', '2']
 
 
 @mark.parametrize('keywords', ['service', 'command', 'function', 'output',
@@ -189,6 +242,7 @@ def test_lines_append_set(patch, lines):
     patch.many(Lines, ['make', 'set_next'])
     lines.append('set', 'line', name=['name'])
     assert lines.variables[-1] == ['name']
+    assert lines.is_variable(['name'])
 
 
 def test_compiler_append_service(patch, lines):
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import json
 import re
 
 from lark.lexer import Token
@@ -187,6 +188,90 @@ def test_objects_list(patch, tree):
     assert result == {'$OBJECT': 'list', 'items': [Objects.expression()]}
 
 
+def test_objects_constant_value_string():
+    result = Objects.constant_value('string', '"a b"')
+    assert result == {'$OBJECT': 'string', 'string': 'a b'}
+
+
+def test_objects_constant_value_string_escapes(patch):
+    patch.object(Objects, 'string')
+    result = Objects.constant_value('string', '"a\\nb"')
+    tree = Tree('string', [Token('STRING', '"a\\nb"')])
+    Objects.string.assert_called_with(tree)
+    assert result == Objects.string()
+
+
+@mark.parametrize('kind, value, expected', [
+    ('number', '-1', -1), ('number', '2.', 2.0), ('number', '.5', 0.5),
+    ('word', 'true', True), ('word', 'false', False), ('word', 'null', None)
+])
+def test_objects_constant_value(kind, value, expected):
+    result = Objects.constant_value(kind, value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_objects_constant(patch):
+    patch.many(json, ['loads'])
+    patch.object(Objects, 'json_constant')
+    result = Objects.constant(Token('CONSTANT', '[1]'))
+    json.loads.assert_called_with('[1]', strict=False, object_pairs_hook=tuple)
+    Objects.json_constant.assert_called_with(json.loads())
+    assert result == Objects.json_constant()
+
+
+def test_objects_constant_escapes(patch):
+    patch.object(Objects, 'constant_tokens')
+    token = Token('CONSTANT', '["\\n"]')
+    result = Objects.constant(token)
+    Objects.constant_tokens.assert_called_with(token)
+    assert result == Objects.constant_tokens()
+
+
+def test_objects_constant_not_json(patch):
+    patch.object(Objects, 'constant_tokens')
+    token = Token('CONSTANT', '[.5]')
+    result = Objects.constant(token)
+    Objects.constant_tokens.assert_called_with(token)
+    assert result == Objects.constant_tokens()
+
+
+def test_objects_json_constant():
+    value = [1, 'a', (('k', [True, None]), ('k', ())), []]
+    result = Objects.json_constant(value)
+    string = {'$OBJECT': 'string', 'string': 'a'}
+    key = {'$OBJECT': 'string', 'string': 'k'}
+    items = [[key, {'$OBJECT': 'list', 'items': [True, None]}],
+             [key, {'$OBJECT': 'dict', 'items': []}]]
+    assert result == {'$OBJECT': 'list', 'items': [
+        1, string, {'$OBJECT': 'dict', 'items': items},
+        {'$OBJECT': 'list', 'items': []}]}
+
+
+def test_objects_json_constant_scalar():
+    assert Objects.json_constant(1.5) == 1.5
+
+
+def test_objects_constant_tokens():
+    token = Token('CONSTANT', '[1, .5, {\'a\': [true]\n, "b": {}}, []]')
+    result = Objects.constant_tokens(token)
+    key = {'$OBJECT': 'string', 'string': 'a'}
+    other = {'$OBJECT': 'string', 'string': 'b'}
+    items = [[key, {'$OBJECT': 'list', 'items': [True]}],
+             [other, {'$OBJECT': 'dict', 'items': []}]]
+    assert result == {'$OBJECT': 'list', 'items': [
+        1, 0.5, {'$OBJECT': 'dict', 'items': items},
+        {'$OBJECT': 'list', 'items': []}]}
+
+
+def test_objects_constant_tokens_json():
+    """
+    Ensures constant literals compile the same as JSON and value by value
+    """
+    token = Token('CONSTANT', '[{"a": [1, "x", null], "a": {}}, [[]], -2.5]')
+    assert Objects.constant(token) == Objects.constant_tokens(token)
+
+
 def test_objects_objects(patch, tree):
     patch.many(Objects, ['string', 'expression'])
     subtree = Tree('key_value', [Tree('string', ['key']), 'value'])
@@ -269,6 +354,15 @@ def test_objects_values_path(patch, magic):
     assert result == Objects.path()
 
 
+def test_objects_values_constant(patch, magic):
+    patch.object(Objects, 'constant')
+    item = magic(type='CONSTANT')
+    tree = magic(child=lambda x: item)
+    result = Objects.values(tree)
+    Objects.constant.assert_called_with(item)
+    assert result == Objects.constant()
+
+
 def test_objects_argument(patch, tree):
     patch.object(Objects, 'expression')
     result = Objects.argument(tree)
@@ -321,12 +415,100 @@ def test_objects_expression_type(operator, expression, tree):
 
 def test_objects_expression(patch, tree):
     """
-    Ensures Objects.expression calls or_expression
+    Ensures Objects.expression compiles the operand of the expression
     """
-    patch.many(Objects, ['or_expression'])
-    tree.child(0).data = 'or_expression'
-    Objects.expression(tree)
-    Objects.or_expression.assert_called_with(tree.child(0))
+    patch.many(Objects, ['operand'])
+    result = Objects.expression(tree)
+    Objects.operand.assert_called_with(tree.child(0))
+    assert result == Objects.operand()
+
+
+def test_objects_expression_compact(patch):
+    """
+    Ensures Objects.expression handles collapsed expression levels
+    """
+    patch.many(Objects, ['entity'])
+    primary = Tree('primary_expression', [Tree('entity', ['a'])])
+    result = Objects.expression(Tree('expression', [primary]))
+    Objects.entity.assert_called_with(primary.entity)
+    assert result == Objects.entity()
+
+
+@mark.parametrize('level', Tree.expression_levels)
+def test_objects_operand(patch, level):
+    """
+    Ensures Objects.operand compiles any expression level
+    """
+    patch.object(Objects, level)
+    patch.object(Objects, 'operands', return_value=())
+    tree = Tree(level, [])
+    result = Objects.operand(tree)
+    Objects.operands.assert_called_with(tree)
+    getattr(Objects, level).assert_called_with(tree)
+    assert result == getattr(Objects, level)()
+
+
+def test_objects_operand_operands(patch):
+    """
+    Ensures Objects.operand compiles the operands of a level first, and
+    gives their objects to it
+    """
+    patch.many(Objects, ['entity', 'build_binary_expression'])
+    Objects.entity.side_effect = lambda tree: tree.child(0)
+    left = Tree('primary_expression', [Tree('entity', ['a'])])
+    right = Tree('primary_expression', [Tree('entity', ['b'])])
+    op = Tree('arith_operator', [Token('PLUS', '+')])
+    tree = Tree('arith_expression', [left, op, right])
+    result = Objects.operand(tree)
+    Objects.build_binary_expression.assert_called_with(tree, op.child(0),
+                                                       'a', 'b')
+    assert result == Objects.build_binary_expression()
+
+
+def test_objects_operand_deep(patch):
+    """
+    Ensures Objects.operand compiles long chains of operators without
+    reaching the recursion limit
+    """
+    patch.object(Objects, 'entity', new=lambda tree: 1)
+    tree = Tree('primary_expression', [Tree('entity', ['a'])])
+    op = Tree('arith_operator', [Token('PLUS', '+')])
+    for _ in range(10000):
+        right = Tree('primary_expression', [Tree('entity', ['b'])])
+        tree = Tree('arith_expression', [tree, op, right])
+    result = Objects.operand(tree)
+    depth = 0
+    while isinstance(result, dict):
+        assert result['expression'] == 'sum'
+        assert result['values'][1] == 1
+        result = result['values'][0]
+        depth += 1
+    assert depth == 10000
+
+
+@mark.parametrize('children, expected', [
+    (['entity'], ()),
+    (['or_expression'], (0,)),
+    (['pow_expression', 'POWER', 'unary_expression'], (0, 2))
+])
+def test_objects_operands(children, expected):
+    children = [Tree(name, []) for name in children]
+    tree = Tree('primary_expression', children)
+    if len(children) > 1:
+        tree.data = 'pow_expression'
+    result = Objects.operands(tree)
+    assert result == tuple(children[index] for index in expected)
+
+
+def test_objects_operands_unary():
+    operand = Tree('unary_expression', [])
+    tree = Tree('unary_expression', [Tree('unary_operator', []), operand])
+    assert Objects.operands(tree) == (operand,)
+
+
+def test_objects_operands_pass_through():
+    child = Tree('and_expression', [])
+    assert Objects.operands(Tree('or_expression', [child])) == (child,)
 
 
 def test_objects_assertion_single_entity(patch, tree):
@@ -410,51 +592,44 @@ def test_objects_primary_expression_two(patch, tree):
     """
     Ensures Objects.primary_expression works with a or_expression node
     """
-    patch.many(Objects, ['entity', 'or_expression'])
+    patch.many(Objects, ['entity'])
     tree.child(0).data = 'or_expression'
-    r = Objects.primary_expression(tree)
-    Objects.or_expression.assert_called_with(tree.child(0))
-    assert r == Objects.or_expression()
+    r = Objects.primary_expression(tree, 'value')
+    assert Objects.entity.call_count == 0
+    assert r == 'value'
 
 
-def test_objects_pow_expression_one(patch, tree):
+def test_objects_pow_expression_one(tree):
     """
     Ensures Objects.pow_expression works with one node
     """
-    patch.many(Objects, ['primary_expression'])
     tree.child(0).data = 'primary_expression'
     tree.children = [1]
-    r = Objects.pow_expression(tree)
-    Objects.primary_expression.assert_called_with(tree.child(0))
-    assert r == Objects.primary_expression()
+    r = Objects.pow_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_pow_expression_two(patch, tree):
     """
     Ensures Objects.pow_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'primary_expression',
-                         'unary_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).type = 'POWER'
     tree.children = [1, '+', 2]
-    r = Objects.pow_expression(tree)
+    r = Objects.pow_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1),
-        Objects.primary_expression(tree.child(0)),
-        Objects.unary_expression(tree.child(2)))
+        tree, tree.child(1), 'left', 'right')
     assert r == Objects.build_binary_expression()
 
 
-def test_objects_unary_expression_one(patch, tree):
+def test_objects_unary_expression_one(tree):
     """
     Ensures Objects.unary_expression works with one node
     """
-    patch.many(Objects, ['pow_expression'])
     tree.child(0).data = 'pow_expression'
     tree.children = [1]
-    r = Objects.unary_expression(tree)
-    Objects.pow_expression.assert_called_with(tree.child(0))
-    assert r == Objects.pow_expression()
+    r = Objects.unary_expression(tree, 'value')
+    assert r == 'value'
 
 
 def test_objects_unary_expression_two(patch, tree):
@@ -463,155 +638,122 @@ def test_objects_unary_expression_two(patch, tree):
     """
     patch.many(Objects, ['build_unary_expression'])
     tree.child(1).data = 'unary_operator'
-    unary_expression = Objects.unary_expression
-    patch.object(Objects, 'unary_expression')
-    r = unary_expression(tree)
+    r = Objects.unary_expression(tree, 'value')
     op = tree.unary_operator.child(0)
-    Objects.build_unary_expression.assert_called_with(
-        tree, op, Objects.unary_expression(tree.child(1)))
+    Objects.build_unary_expression.assert_called_with(tree, op, 'value')
     assert r == Objects.build_unary_expression()
 
 
-def test_objects_mul_expression_one(patch, tree):
+def test_objects_mul_expression_one(tree):
     """
     Ensures Objects.mul_expression works with one node
     """
-    patch.many(Objects, ['unary_expression'])
     tree.child(0).data = 'unary_expression'
     tree.children = [1]
-    r = Objects.mul_expression(tree)
-    Objects.unary_expression.assert_called_with(tree.child(0))
-    assert r == Objects.unary_expression()
+    r = Objects.mul_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_mul_expression_two(patch, tree):
     """
     Ensures Objects.mul_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'unary_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).data = 'mul_operator'
     tree.children = [1, '*', 2]
-    mul_expression = Objects.mul_expression
-    patch.object(Objects, 'mul_expression')
-    r = mul_expression(tree)
+    r = Objects.mul_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1).child(0),
-        Objects.mul_expression(tree.child(0)),
-        Objects.unary_expression(tree.child(2)))
+        tree, tree.child(1).child(0), 'left', 'right')
     assert r == Objects.build_binary_expression()
 
 
-def test_objects_arith_expression_one(patch, tree):
+def test_objects_arith_expression_one(tree):
     """
     Ensures Objects.arith_expression works with one node
     """
-    patch.many(Objects, ['mul_expression'])
     tree.child(0).data = 'mul_expression'
     tree.children = [1]
-    r = Objects.arith_expression(tree)
-    Objects.mul_expression.assert_called_with(tree.child(0))
-    assert r == Objects.mul_expression()
+    r = Objects.arith_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_arith_expression_two(patch, tree):
     """
     Ensures Objects.arith_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'mul_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).data = 'arith_operator'
     tree.children = [1, '+', 2]
-    arith_expression = Objects.arith_expression
-    patch.object(Objects, 'arith_expression')
-    r = arith_expression(tree)
+    r = Objects.arith_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1).child(0),
-        Objects.arith_expression(tree.child(0)),
-        Objects.mul_expression(tree.child(2)))
+        tree, tree.child(1).child(0), 'left', 'right')
     assert r == Objects.build_binary_expression()
 
 
-def test_objects_or_expression_one(patch, tree):
+def test_objects_or_expression_one(tree):
     """
     Ensures Objects.or_expression works with one node
     """
-    patch.many(Objects, ['and_expression'])
     tree.child(0).data = 'and_expression'
     tree.children = [1]
-    r = Objects.or_expression(tree)
-    Objects.and_expression.assert_called_with(tree.child(0))
-    assert r == Objects.and_expression()
+    r = Objects.or_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_or_expression_two(patch, tree):
     """
     Ensures Objects.or_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'and_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).type = 'OR'
     tree.children = [1, 'or', 2]
-    or_expression = Objects.or_expression
-    patch.object(Objects, 'or_expression')
-    r = or_expression(tree)
+    r = Objects.or_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1),
-        Objects.or_expression(tree.child(0)),
-        Objects.and_expression(tree.child(2)))
+        tree, tree.child(1), 'left', 'right')
     assert r == Objects.build_binary_expression()
 
 
-def test_objects_and_expression_one(patch, tree):
+def test_objects_and_expression_one(tree):
     """
     Ensures Objects.and_expression works with one node
     """
-    patch.many(Objects, ['cmp_expression'])
     tree.child(0).data = 'cmp_expression'
     tree.children = [1]
-    r = Objects.and_expression(tree)
-    Objects.cmp_expression.assert_called_with(tree.child(0))
-    assert r == Objects.cmp_expression()
+    r = Objects.and_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_and_expression_two(patch, tree):
     """
     Ensures Objects.and_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'cmp_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).type = 'AND'
     tree.children = [1, 'and', 2]
-    and_expression = Objects.and_expression
-    patch.object(Objects, 'and_expression')
-    r = and_expression(tree)
+    r = Objects.and_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1),
-        Objects.and_expression(tree.child(0)),
-        Objects.cmp_expression(tree.child(2)))
+        tree, tree.child(1), 'left', 'right')
     assert r == Objects.build_binary_expression()
 
 
-def test_objects_cmp_expression_one(patch, tree):
+def test_objects_cmp_expression_one(tree):
     """
     Ensures Objects.and_expression works with one node
     """
-    patch.many(Objects, ['arith_expression'])
     tree.child(0).data = 'arith_expression'
     tree.children = [1]
-    r = Objects.cmp_expression(tree)
-    Objects.arith_expression.assert_called_with(tree.child(0))
-    assert r == Objects.arith_expression()
+    r = Objects.cmp_expression(tree, 'left')
+    assert r == 'left'
 
 
 def test_objects_cmp_expression_two(patch, tree):
     """
     Ensures Objects.and_expression works with two nodes
     """
-    patch.many(Objects, ['build_binary_expression', 'arith_expression'])
+    patch.many(Objects, ['build_binary_expression'])
     tree.child(1).data = 'cmp_operator'
     tree.children = [1, '==', 2]
-    cmp_expression = Objects.cmp_expression
-    patch.object(Objects, 'cmp_expression')
-    r = cmp_expression(tree)
+    r = Objects.cmp_expression(tree, 'left', 'right')
     Objects.build_binary_expression.assert_called_with(
-        tree, tree.child(1).child(0),
-        Objects.cmp_expression(tree.child(0)),
-        Objects.arith_expression(tree.child(2)))
+        tree, tree.child(1).child(0), 'left', 'right')
     assert r == Objects.build_binary_expression()
@@ -4,6 +4,7 @@ from unittest import mock
 from pytest import fixture
 
 from storyscript.compiler import FakeTree, Preprocessor
+from storyscript.parser import Tree
 
 
 @fixture
@@ -50,6 +51,20 @@ def test_preprocessor_process(patch, magic, preprocessor):
         preprocessor.replace_expression)
 
 
+def test_preprocessor_process_no_inline_expressions(patch, magic,
+                                                    preprocessor):
+    """
+    Ensures trees without inline expressions in their side tables aren't
+    visited
+    """
+    patch.object(Preprocessor, 'visit')
+    tree = magic()
+    tree.side_tables.inline_expressions = []
+    result = preprocessor.process(tree)
+    assert result == tree
+    assert preprocessor.visit.call_count == 0
+
+
 def test_preprocessor_is_inline_expression(magic):
     """
     Check that inline_expressions are correctly detected
@@ -278,3 +293,26 @@ def test_preprocessor_visit_nested_same_fake_tree(patch, magic, preprocessor):
         mock.call(cs[1], preprocessor.fake_tree(tree), cs[0]),
         mock.call(cs[0], preprocessor.fake_tree(tree), tree),
     ]
+
+
+def test_preprocessor_visit_deep(magic, preprocessor):
+    """
+    Check that deep trees are visited in postorder without reaching the
+    recursion limit
+    """
+    replace = magic()
+    tree = Tree('inline_expression', [])
+    for _ in range(100000):
+        tree = Tree('inline_expression', [tree, 'token'])
+    tree = Tree('entity', [tree])
+    nodes = []
+
+    def is_inline(n):
+        nodes.append(n)
+        return False
+
+    preprocessor.visit(tree, '.block.', None, is_inline, replace)
+    assert len(nodes) == 100001
+    assert nodes[0].children[0].children == []
+    assert nodes[-1] == tree
+    assert replace.call_count == 0
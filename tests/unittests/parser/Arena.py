@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+import sys
+from array import array
+
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import Arena, ArenaTree, ColumnStore, Tree
+
+
+@fixture
+def source():
+    return 'a = 1\n'
+
+
+@fixture
+def tree():
+    name = Token('NAME', 'a', 0, 1, 1)
+    name.end_line = 1
+    name.end_column = 2
+    number = Token('INT', '1', 4, 1, 5)
+    return Tree('assignment', [Tree('path', [name]),
+                               Tree('number', [number]), Tree('empty', [])])
+
+
+@fixture
+def arena(tree, source):
+    return Arena.from_tree(tree, source)
+
+
+def test_arena():
+    assert issubclass(Arena, ColumnStore)
+
+
+def test_arena_from_tree(arena):
+    assert len(arena) == 6
+    assert arena.names == ['assignment', 'path', 'NAME', 'number', 'INT',
+                           'empty']
+    assert arena.rules == array('i', [0, 1, ~2, 3, ~4, 5])
+    assert arena.parents == array('i', [-1, 0, 1, 0, 3, 0])
+    assert arena.first_children == array('i', [1, 2, -1, 4, -1, -1])
+    assert arena.next_siblings == array('i', [-1, 3, -1, 5, -1, -1])
+    assert arena.starts == array('i', [0, 0, 0, 4, 4, -1])
+    assert arena.ends == array('i', [-1, 1, 1, 5, 5, -1])
+    assert arena.lines == array('i', [-1, -1, 1, -1, 1, -1])
+    assert arena.end_columns == array('i', [-1, -1, 2, -1, -1, -1])
+    assert arena.values == {}
+
+
+def test_arena_from_tree_spans(source):
+    """
+    Ensures trees span from their first to their last token
+    """
+    tree = Tree('start', [Tree('path', [Token('NAME', 'a', 0, 1, 1)]),
+                          Token('EQUALS', '=', 2, 1, 3)])
+    arena = Arena.from_tree(tree, source)
+    assert arena.starts[0] == 0
+    assert arena.ends[0] == 3
+
+
+def test_arena_from_tree_values(source):
+    """
+    Ensures the values of tokens that don't match the source are kept
+    """
+    tree = Tree('start', [Token('NAME', 'b', 0), Token('NAME', 'c')])
+    arena = Arena.from_tree(tree, source)
+    assert arena.values == {1: 'b', 2: 'c'}
+    assert arena.starts[2] == -1
+
+
+def test_arena_is_token(arena):
+    assert arena.is_token(0) is False
+    assert arena.is_token(2) is True
+
+
+def test_arena_name(arena):
+    assert arena.name(0) == 'assignment'
+    assert arena.name(2) == 'NAME'
+
+
+def test_arena_token(arena):
+    token = arena.token(2)
+    assert token == Token('NAME', 'a')
+    assert token.pos_in_stream == 0
+    assert token.line == 1
+    assert token.column == 1
+    assert token.end_line == 1
+    assert token.end_column == 2
+
+
+def test_arena_token_missing(arena):
+    assert arena.token(4).end_line is None
+
+
+def test_arena_item(arena):
+    assert arena.item(2) == Token('NAME', 'a')
+    item = arena.item(1)
+    assert isinstance(item, ArenaTree)
+    assert item.index == 1
+
+
+def test_arena_children(arena):
+    result = arena.children(1)
+    assert result == (Token('NAME', 'a'),)
+
+
+def test_arena_first_leaf(arena):
+    assert arena.first_leaf(0) == 2
+    assert arena.first_leaf(5) == -1
+
+
+def test_arena_last_leaf(arena):
+    assert arena.last_leaf(3) == 4
+    assert arena.last_leaf(0) == -1
+
+
+def test_arena_tree(arena, tree):
+    result = arena.tree()
+    assert type(result) is Tree
+    assert result == tree
+    assert type(result.children) is tuple
+    token = result.children[0].children[0]
+    assert token.end_line == 1
+    assert token.end_column == 2
+
+
+def test_arena_tree_moved(arena):
+    token = arena.tree(10, 2).children[1].children[0]
+    assert token.pos_in_stream == 14
+    assert token.line == 3
+    assert token.column == 5
+    assert token.end_line is None
+
+
+def test_arena_root(arena, tree):
+    root = arena.root()
+    assert root.index == 0
+    assert root == tree
+
+
+def test_arena_dump(arena, tree):
+    result = Arena.load(arena.dump())
+    assert result.source == arena.source
+    assert result.names == arena.names
+    for field in Arena.fields:
+        assert getattr(result, field) == getattr(arena, field)
+    assert result.root() == tree
+
+
+def test_arena_dump_values(source):
+    arena = Arena.from_tree(Tree('start', [Token('NAME', 'b')]), source)
+    assert Arena.load(arena.dump()).values == {1: 'b'}
+
+
+def test_arena_load_byteorder(mocker, arena):
+    """
+    Ensures arrays dumped with another byte order are swapped when loaded
+    """
+    other = 'big' if sys.byteorder == 'little' else 'little'
+    mocker.patch.object(sys, 'byteorder', other)
+    buffer = arena.dump()
+    mocker.stopall()
+    expected = array('i', arena.rules)
+    expected.byteswap()
+    assert Arena.load(buffer).rules == expected
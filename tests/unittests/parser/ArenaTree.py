@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import Arena, ArenaTree, Tree
+
+
+@fixture
+def arena():
+    tree = Tree('assignment', [Tree('path', [Token('NAME', 'a', 0, 1, 1)]),
+                               Tree('empty', []),
+                               Token('EQUALS', '=', 2, 1, 3)])
+    return Arena.from_tree(tree, 'a = 1\n')
+
+
+@fixture
+def view(arena):
+    return ArenaTree(arena, 0)
+
+
+def test_arenatree():
+    assert issubclass(ArenaTree, Tree)
+    assert ArenaTree.__slots__ == ('arena', 'index')
+
+
+def test_arenatree_init(arena, view):
+    assert view.data == 'assignment'
+    assert view.arena == arena
+    assert view.index == 0
+    assert view._children is None
+
+
+def test_arenatree_children(patch, arena, view):
+    patch.object(Arena, 'children')
+    view.children
+    result = view.children
+    Arena.children.assert_called_once_with(0)
+    assert result == Arena.children()
+
+
+def test_arenatree_children_set(patch, view):
+    patch.object(ArenaTree, 'mutated')
+    view.children = ['child']
+    assert view.children == ['child']
+    assert ArenaTree.mutated.call_count == 1
+
+
+def test_arenatree_children_views(view):
+    assert view.path.data == 'path'
+    assert view.path.children == (Token('NAME', 'a'),)
+
+
+def test_arenatree_find_tokens(view):
+    first, last = view.find_tokens()
+    assert first == Token('NAME', 'a')
+    assert first.line == 1
+    assert last == Token('EQUALS', '=')
+    assert last.column == 3
+    assert view._children is None
+
+
+def test_arenatree_find_tokens_empty(arena):
+    assert ArenaTree(arena, 3).find_tokens()[:2] == (None, None)
+
+
+def test_arenatree_find_tokens_loaded(view):
+    view.replace(2, Token('INT', '1', 4, 1, 5))
+    assert view.find_tokens()[1] == Token('INT', '1')
+
+
+def test_arenatree_children_dependents(view):
+    """
+    Ensures changing the first or last child of a view finds its tokens
+    again
+    """
+    assert view.first_token() == Token('NAME', 'a')
+    view.children[0].replace(0, Token('NAME', 'b', 0, 1, 1))
+    assert view._tokens is None
+    assert view.first_token() == Token('NAME', 'b')
+
+
+def test_arenatree_children_tokens(view):
+    """
+    Ensures the tokens read from the arena are forgotten once the children
+    are made, so that changing their tokens changes the positions
+    """
+    assert view.line() == '1'
+    view.children[0].children[0].line = 2
+    assert view.line() == '2'
+    assert view.first_token() is view.children[0].children[0]
+
+
+def test_arenatree_children_tokens_parent(arena):
+    """
+    Ensures the tokens of a view are forgotten when its first child makes its
+    own children
+    """
+    view = ArenaTree(arena, 0)
+    view.children
+    assert view.line() == '1'
+    view.children[0].children[0].line = 2
+    assert view.line() == '2'
+
+
+def test_arenatree_positions(view):
+    assert view.line() == '1'
+    assert view.column() == '1'
+    assert view.start_pos() == 0
+    assert view.end_pos() == 3
+
+
+def test_arenatree_positions_loaded(view):
+    view.replace(2, Token('EQUALS', '=', 3, 1, 4))
+    assert view.end_pos() == 4
+    view.replace(0, Token('NAME', 'b', 1, 1, 2))
+    assert view.start_pos() == 1
+
+
+def test_arenatree_mutations(arena, view):
+    """
+    Ensures changing a view doesn't change the arena
+    """
+    view.path.rename('other')
+    view.append('child')
+    assert len(view.children) == 4
+    assert arena.root().path.data == 'path'
+    assert len(arena.root().children) == 3
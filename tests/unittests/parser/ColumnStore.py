@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import ColumnStore
+
+
+class Store(ColumnStore):
+    fields = ('starts', 'ends')
+
+
+@fixture
+def store():
+    return Store('a = b\n')
+
+
+def test_columnstore_init():
+    store = Store()
+    assert store.source == ''
+    assert store.binary is False
+    assert store.names == []
+    assert store.name_ids == {}
+    assert store.values == {}
+    for field in Store.fields:
+        assert getattr(store, field) == array('i')
+
+
+def test_columnstore_init_binary():
+    assert Store(b'a').binary is True
+
+
+def test_columnstore_len(store):
+    store.starts.extend([0, 4])
+    assert len(store) == 2
+
+
+def test_columnstore_optional():
+    assert ColumnStore.optional(-1) is None
+    assert ColumnStore.optional(0) == 0
+
+
+def test_columnstore_name_id():
+    store = Store()
+    assert store.name_id('NAME') == 0
+    assert store.name_id('INT') == 1
+    assert store.name_id('NAME') == 0
+    assert store.names == ['NAME', 'INT']
+
+
+def test_columnstore_offsets(store):
+    assert store.offsets(0, Token('NAME', 'b', 4)) == (4, 5)
+    assert store.values == {}
+
+
+def test_columnstore_offsets_values(store):
+    """
+    Ensures the values of tokens that don't match the source are kept
+    """
+    assert store.offsets(0, Token('NAME', 'c', 4)) == (4, 5)
+    assert store.offsets(1, Token('_DEDENT', '')) == (-1, -1)
+    assert store.values == {0: 'c', 1: ''}
+
+
+def test_columnstore_offsets_binary():
+    store = Store('é = a'.encode('utf-8'))
+    assert store.offsets(0, Token('NAME', 'é', 0)) == (0, 2)
+    assert store.values == {}
+
+
+def test_columnstore_value(store):
+    store.starts.append(4)
+    store.ends.append(5)
+    assert store.value(0) == 'b'
+
+
+def test_columnstore_value_stored(store):
+    store.values[0] = 'value'
+    assert store.value(0) == 'value'
+
+
+def test_columnstore_value_binary():
+    store = Store(bytearray('é = a'.encode('utf-8')))
+    store.starts.append(0)
+    store.ends.append(2)
+    assert store.value(0) == 'é'
@@ -15,6 +15,7 @@ def test_ebnf_init():
     assert ebnf._rules == {}
     assert ebnf._imports == {}
     assert ebnf._ignores == []
+    assert ebnf._resolved == {}
 
 
 def test_ebnf_macro(ebnf):
@@ -28,6 +29,16 @@ def test_ebnf_set_token(ebnf):
     assert ebnf._tokens['token'] == expected
 
 
+def test_ebnf_set_token_resolved(ebnf):
+    """
+    Ensures that registering a token clears the resolved shards
+    """
+    ebnf.resolve('token')
+    ebnf.set_token('TOKEN', 'value')
+    assert ebnf._resolved == {}
+    assert ebnf.resolve('token') == 'TOKEN'
+
+
 def test_ebnf_set_token_inline(ebnf):
     ebnf.set_token('_TOKEN', 'value')
     assert ebnf._tokens['token']['name'] == '_TOKEN'
@@ -66,6 +77,11 @@ def test_ebnf_resolve_token(ebnf, symbol):
     assert result == '(_TOKEN){}'.format(symbol)
 
 
+def test_ebnf_resolve_memoized(ebnf):
+    ebnf._resolved['token'] = 'TOKEN'
+    assert ebnf.resolve('token') == 'TOKEN'
+
+
 def test_ebnf_resolve_comma(patch, ebnf):
     ebnf._tokens['token'] = {'token': 'TOKEN'}
     assert ebnf.resolve('token,') == 'TOKEN|'
@@ -81,6 +97,12 @@ def test_ebnf_set_rule(patch, ebnf):
     assert ebnf._rules['rule'] == 'name'
 
 
+def test_ebnf_set_rule_many(ebnf):
+    ebnf._tokens['token'] = {'token': 'TOKEN'}
+    ebnf.set_rule('rule', 'token,  other')
+    assert ebnf._rules['rule'] == 'TOKEN| other'
+
+
 def test_ebnf_ignore(ebnf):
     ebnf.ignore('terminal')
     assert ebnf._ignores == ['%ignore terminal']
@@ -96,7 +118,8 @@ def test_ebnf_build_tokens(ebnf):
     Ensures tokens are built correctly.
     """
     ebnf._tokens['token'] = {'name': 'TOKEN', 'value': '"hello"'}
-    assert ebnf.build_tokens() == 'TOKEN: "hello"\n'
+    ebnf._tokens['other'] = {'name': 'OTHER', 'value': '"world"'}
+    assert ebnf.build_tokens() == 'TOKEN: "hello"\nOTHER: "world"\n'
 
 
 def test_ebnf_build_rules(ebnf):
@@ -104,7 +127,8 @@ def test_ebnf_build_rules(ebnf):
     Ensures rules are built correctly.
     """
     ebnf._rules['rule'] = 'value'
-    assert ebnf.build_rules() == 'rule: value\n'
+    ebnf._rules['other'] = 'other value'
+    assert ebnf.build_rules() == 'rule: value\nother: other value\n'
 
 
 def test_ebnf_build(patch, ebnf):
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from lark.parser_frontends import LALR_ContextualLexer
+
+from pytest import fixture
+
+from storyscript.parser import Frontend
+
+
+@fixture
+def frontend(magic):
+    frontend = Frontend.__new__(Frontend)
+    frontend.lexer = magic()
+    frontend.lexer_conf = magic()
+    frontend.parser = magic()
+    return frontend
+
+
+def test_frontend():
+    assert issubclass(Frontend, LALR_ContextualLexer)
+
+
+def test_frontend_lex(patch, frontend):
+    """
+    Ensures Frontend.lex lexes with a copy of the lexer
+    """
+    patch.object(copy, 'copy')
+    result = frontend.lex('text')
+    copy.copy.assert_called_with(frontend.lexer)
+    copy.copy().lex.assert_called_with('text')
+    postlex = frontend.lexer_conf.postlex
+    postlex.process.assert_called_with(copy.copy().lex())
+    assert result == postlex.process()
+
+
+def test_frontend_lex_lexer(magic, frontend):
+    lexer = magic()
+    frontend.lex('text', lexer)
+    lexer.lex.assert_called_with('text')
+
+
+def test_frontend_lex_no_postlex(patch, frontend):
+    patch.object(copy, 'copy')
+    frontend.lexer_conf.postlex = None
+    assert frontend.lex('text') == copy.copy().lex()
+
+
+def test_frontend_parse(patch, frontend):
+    """
+    Ensures Frontend.parse follows the state of the parser with the same
+    copy of the lexer that lexes the text
+    """
+    patch.object(copy, 'copy')
+    patch.object(Frontend, 'lex')
+    result = frontend.parse('text')
+    copy.copy.assert_called_with(frontend.lexer)
+    Frontend.lex.assert_called_with('text', copy.copy())
+    frontend.parser.parse.assert_called_with(Frontend.lex(),
+                                             copy.copy().set_parser_state)
+    assert result == frontend.parser.parse()
+
+
+def test_frontend_parse_copies(frontend):
+    """
+    Ensures each parse has its own lexer, keeping its own parser state
+    """
+    class Lexer:
+        parser_state = None
+
+        def lex(self, text):
+            return []
+
+        def set_parser_state(self, state):
+            self.parser_state = state
+
+    frontend.lexer = Lexer()
+    frontend.lexer_conf.postlex = None
+    frontend.parser.parse = lambda stream, set_state: set_state(stream)
+    frontend.parse('a')
+    assert frontend.lexer.parser_state is None
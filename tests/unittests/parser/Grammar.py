@@ -48,9 +48,13 @@ def test_grammar_types(grammar, ebnf):
 
 def test_grammar_values(grammar, ebnf):
     grammar.values()
-    assert ebnf._NL == r'/(\r?\n[\t ]*)+/'
+    comment = r'###(?:[^#]|#(?!##))*###|#(?!##)[^\n]*'
+    nl = r'/(\r?\n[\t ]*(({})(?=\r?\n))?)+/'.format(comment)
+    assert ebnf._NL == nl
+    assert ebnf.COMMENT == '/{}/'.format(comment)
     assert ebnf._INDENT == '<INDENT>'
     assert ebnf._DEDENT == '<DEDENT>'
+    assert ebnf.CONSTANT == '<CONSTANT>'
     assert ebnf.TRUE == 'true'
     assert ebnf.FALSE == 'false'
     assert ebnf.NULL == 'null'
@@ -73,7 +77,7 @@ def test_grammar_values(grammar, ebnf):
     assert ebnf.regular_expression == 'regexp name?'
     assert ebnf.inline_expression == 'op service cp'
     values = ('number, string, boolean, void, list, objects, '
-              'regular_expression')
+              'regular_expression, constant')
     assert ebnf.values == values
 
 
@@ -97,6 +101,15 @@ def test_grammar_imports(grammar, ebnf):
     assert ebnf.imports == 'import string as name'
 
 
+def test_grammar_operators(grammar, ebnf):
+    grammar.operators()
+    assert ebnf.POWER == '^'
+    assert ebnf.OR == 'or'
+    assert ebnf.unary_operator == 'NOT'
+    assert ebnf.mul_operator == 'MULTIPLIER, BSLASH, MODULUS'
+    ebnf.set_token.assert_called_with('DASH.5', '-')
+
+
 def test_grammar_expressions(grammar, ebnf, magic):
     ebnf.set_token = magic()
     grammar.expressions()
@@ -260,5 +273,20 @@ def test_grammar_build(patch, call_count, grammar, ebnf):
     assert ebnf._WS == '(" ")+'
     call_count(Grammar, methods)
     assert ebnf.start == 'nl? block*'
-    ebnf.ignore.assert_called_with('_WS')
+    assert ebnf.ignore.call_args_list == [call('_WS'), call('COMMENT')]
     assert result == ebnf.build()
+
+
+def test_grammar_grammar(patch):
+    patch.object(Grammar, 'built', None)
+    patch.init(Grammar)
+    patch.object(Grammar, 'build')
+    result = Grammar.grammar()
+    assert Grammar.grammar() == result
+    assert Grammar.build.call_count == 1
+    assert result == Grammar.built
+
+
+def test_grammar_grammar_built(patch):
+    patch.object(Grammar, 'built', 'grammar')
+    assert Grammar.grammar() == 'grammar'
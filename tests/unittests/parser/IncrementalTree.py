@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import IncrementalTree, Tree
+
+
+def token(value, position, line, column):
+    token = Token('NAME', value, position, line, column)
+    token.end_line = line
+    token.end_column = column + len(value)
+    return token
+
+
+def block(*tokens):
+    return Tree('block', [Tree('rules', list(tokens))])
+
+
+@fixture
+def tree():
+    """
+    The tree of 'a\nb c\nd', where c starts a block in the middle of a line
+    """
+    return IncrementalTree([block(token('a', 0, 1, 1)),
+                            block(token('b', 2, 2, 1)),
+                            block(token('c', 4, 2, 3)),
+                            block(token('d', 6, 3, 1))])
+
+
+def test_incrementaltree_init(tree):
+    assert tree.data == 'start'
+    assert tree.leaves == [None, None, None, None]
+
+
+def test_incrementaltree_init_leaves():
+    tree = IncrementalTree(['block'], leaves=['leaves'])
+    assert tree.leaves == ['leaves']
+
+
+def test_incrementaltree_find_leaves():
+    a = token('a', 0, 1, 1)
+    b = token('b', 2, 1, 3)
+    result = IncrementalTree.find_leaves(Tree('block', [a, Tree('x', [b])]))
+    assert sorted(result) == [a, b]
+
+
+def test_incrementaltree_find_leaves_shared():
+    """
+    Ensures tokens found in several places are found once
+    """
+    a = token('a', 0, 1, 1)
+    shared = Tree('path', [a])
+    result = IncrementalTree.find_leaves(Tree('arguments', [shared, shared]))
+    assert result == [a]
+
+
+def test_incrementaltree_find_leaves_positionless():
+    result = IncrementalTree.find_leaves(Tree('block', [Token('NAME', 'a')]))
+    assert result == []
+
+
+def test_incrementaltree_move():
+    a = token('a', 4, 2, 1)
+    IncrementalTree.move([a], 3, -1)
+    assert a.pos_in_stream == 7
+    assert a.line == 1
+    assert a.end_line == 1
+    assert a.column == 1
+
+
+def test_incrementaltree_block_leaves(tree):
+    result = tree.block_leaves(1)
+    assert result == ['b']
+    assert tree.leaves[1] is result
+    assert tree.block_leaves(1) is result
+
+
+def test_incrementaltree_line_start(tree):
+    assert tree.line_start(1) == 2
+    assert tree.line_start(2) == 2
+
+
+def test_incrementaltree_starts_line(tree):
+    assert tree.starts_line(1) is True
+    assert tree.starts_line(2) is False
+
+
+def test_incrementaltree_line_block(tree):
+    assert tree.line_block(3) == 3
+    assert tree.line_block(2) == 1
+    assert tree.line_block(0) == 0
+
+
+def test_incrementaltree_block_at(tree):
+    assert tree.block_at(0) == 0
+    assert tree.block_at(2) == 1
+    assert tree.block_at(3) == 1
+    assert tree.block_at(6) == 3
+    assert tree.block_at(100) == 3
+
+
+def test_incrementaltree_block_at_middle(tree):
+    """
+    Ensures blocks starting in the middle of a line are never found
+    """
+    assert tree.block_at(5) == 1
+
+
+def test_incrementaltree_block_after(tree):
+    assert tree.block_after(0) == 1
+    assert tree.block_after(1) == 1
+    assert tree.block_after(5) == 3
+    assert tree.block_after(6) == 4
+
+
+def test_incrementaltree_block_after_middle(tree):
+    assert tree.block_after(2) == 3
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from lark.indenter import Indenter
+from lark.lexer import Token
 
 from storyscript.parser import CustomIndenter
 
@@ -12,3 +13,27 @@ def test_indenter():
     assert CustomIndenter.INDENT_type == '_INDENT'
     assert CustomIndenter.DEDENT_type == '_DEDENT'
     assert CustomIndenter.tab_len == 8
+
+
+def test_indenter_process(patch):
+    patch.object(Indenter, 'process')
+    indenter = CustomIndenter()
+    indenter.paren_level = 1
+    indenter.indent_level = [0, 4]
+    result = indenter.process('stream')
+    Indenter.process.assert_called_with('stream')
+    assert indenter.paren_level == 1
+    assert indenter.indent_level == [0, 4]
+    assert result == Indenter.process()
+
+
+def test_indenter_process_streams():
+    """
+    Ensures streams processed at once keep their own indentation
+    """
+    indenter = CustomIndenter()
+    first = indenter.process(iter([Token('A', 'a'), Token('_NL', '\n    ')]))
+    second = indenter.process(iter([Token('A', 'a')]))
+    assert [next(first).type for _ in range(3)] == ['A', '_NL', '_INDENT']
+    assert [token.type for token in second] == ['A']
+    assert [token.type for token in first] == ['_DEDENT']
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import fixture, mark
+
+from storyscript.parser import LiteralScanner
+
+
+@fixture
+def min_items(patch):
+    patch.object(LiteralScanner, 'min_items', 1)
+
+
+@fixture
+def scanner():
+    return LiteralScanner()
+
+
+def test_literal_scanner_init(scanner):
+    assert getattr(scanner.state, 'failed', None) is None
+
+
+def test_literal_scanner_failed(scanner):
+    """
+    Ensures the failed starts are kept for the last source
+    """
+    source = 'a = [b]'
+    failed = scanner.failed(source)
+    failed.add(4)
+    assert scanner.failed(source) == {4}
+    assert scanner.failed('a = [c]') == set()
+
+
+def test_literal_scanner_failed_threads(scanner):
+    """
+    Ensures the failed starts are kept for each thread
+    """
+    source = 'a = [b]'
+    scanner.failed(source).add(4)
+    with ThreadPoolExecutor(1) as pool:
+        result = pool.submit(scanner.failed, source).result()
+    assert result == set()
+    assert scanner.failed(source) == {4}
+
+
+def test_literal_scanner_forget(scanner):
+    scanner.failed('a = [b]')
+    scanner.forget()
+    assert scanner.state.failed is None
+
+
+def test_literal_scanner_indent():
+    assert LiteralScanner.indent('\n    ') == 4
+    assert LiteralScanner.indent('\n\n  \t') == 10
+    assert LiteralScanner.indent(b'\n \t') == 9
+
+
+def test_literal_scanner_line_indent():
+    assert LiteralScanner.line_indent('a\n    b = [', 10) == 4
+    assert LiteralScanner.line_indent(b'b = [', 4) == 0
+
+
+def test_literal_scanner_newline_indents():
+    frame = [']', False, True]
+    indents = [0]
+    assert LiteralScanner.newline(frame, 'value', indents, 4) == 'value'
+    assert frame == [']', True, False]
+    assert indents == [0, 4]
+
+
+def test_literal_scanner_newline_not_indented():
+    frame = [']', False, True]
+    assert LiteralScanner.newline(frame, 'value', [4], 4) is None
+
+
+def test_literal_scanner_newline_same_indent():
+    frame = [']', True, False]
+    assert LiteralScanner.newline(frame, 'key', [0, 4], 4) == 'key'
+
+
+def test_literal_scanner_newline_dedent():
+    frame = [']', True, False]
+    indents = [0, 4]
+    assert LiteralScanner.newline(frame, 'next', indents, 0) == 'close'
+    assert indents == [0]
+
+
+def test_literal_scanner_newline_next():
+    frame = [']', False, False]
+    assert LiteralScanner.newline(frame, 'next', [0], 0) is None
+
+
+@mark.parametrize('frame, state, closer, expected', [
+    ([']', False, False], 'next', ']', True),
+    ([']', False, False], 'next', '}', False),
+    ([']', False, True], 'value', ']', True),
+    ([']', True, False], 'next', ']', False),
+    ([']', True, False], 'close', ']', True),
+    (['}', False, False], 'key', '}', False)
+])
+def test_literal_scanner_close(frame, state, closer, expected):
+    assert LiteralScanner.close(frame, state, closer) is expected
+
+
+@mark.parametrize('state, kind, closer, expected', [
+    ('next', 'comma', ']', 'value'),
+    ('next', 'comma', '}', 'key'),
+    ('key', 'key', '}', 'value'),
+    ('key', 'pairs', '}', 'next'),
+    ('value', 'values', ']', 'next'),
+    ('value', 'open', ']', 'next'),
+    ('next', 'values', ']', None),
+    ('key', 'values', '}', None),
+    ('value', 'comma', ']', None)
+])
+def test_literal_scanner_transition(state, kind, closer, expected):
+    frames = [[closer, False, False]]
+    assert LiteralScanner.transition(frames, state, kind) == expected
+
+
+@mark.parametrize('source', [
+    '[1, "a", \'b\', true, null, -2.5, .5, 3.]',
+    '{"a": 1, \'b\' : [2, {}], "c": {"d": []}}',
+    '[\n    1,\n    2\n]',
+    '[1,\n2]',
+    '{\n    "a": [\n        1\n    ],\n    "b": 2\n}',
+    '[ 1 , 2 ]',
+    '[]'
+])
+def test_literal_scanner_match(min_items, scanner, source):
+    text = 'a = {} + b'.format(source)
+    assert scanner.match(text, 4).group() == source
+    data = text.encode('utf-8')
+    assert scanner.byte_match(data, 4).group() == source.encode()
+
+
+@mark.parametrize('source', [
+    '[a, 1]', '["{name}"]', '[1 2]', '[1, ]', '{1: 2}', '{"a"}',
+    '["a": 1]', '[1\n]', '[\n1]', '[\n    1\n  ]', '[(1)]', '[1',
+    '[1, 2}', '[\n    1,\n  2\n]', '[1,\n 2]'
+])
+def test_literal_scanner_match_none(min_items, scanner, source):
+    assert scanner.match('a = {}\n'.format(source), 4) is None
+
+
+def test_literal_scanner_match_min_items(patch, scanner):
+    patch.object(LiteralScanner, 'min_items', 4)
+    assert scanner.match('[1, 2]', 0) is None
+    assert scanner.match('[1, "a,b"]', 0) is None
+    assert scanner.match('[1, [2]]', 0).group() == '[1, [2]]'
+    assert scanner.match('{"a": 1, "b": 2}', 0) is None
+    assert scanner.match('[{"a": 1, "b": 2}]', 0) is not None
+
+
+def test_literal_scanner_end_failed(min_items):
+    """
+    Ensures the literals still open where scanning fails are failed too
+    """
+    failed = set()
+    source = '[[1], [[a]]]'
+    assert LiteralScanner.end(source, 0, LiteralScanner.runs,
+                              LiteralScanner.scalars, failed) is None
+    assert failed == {0, 6, 7}
+
+
+def test_literal_scanner_end_failed_min_items(patch):
+    patch.object(LiteralScanner, 'min_items', 9)
+    failed = set()
+    assert LiteralScanner.end('[[1], [2]]', 0, LiteralScanner.runs,
+                              LiteralScanner.scalars, failed) is None
+    assert failed == {0, 1, 6}
+
+
+def test_literal_scanner_match_failed(patch, scanner):
+    """
+    Ensures starts that can't be literals are scanned once per source
+    """
+    patch.object(LiteralScanner, 'end', return_value=None)
+    source = 'a = [[b]]'
+    scanner.failed(source).add(5)
+    assert scanner.match(source, 5) is None
+    assert LiteralScanner.end.call_count == 0
+    assert scanner.match(source, 4) is None
+    LiteralScanner.end.assert_called_with(source, 4, LiteralScanner.runs,
+                                          LiteralScanner.scalars, {5})
+    other = 'a = [[b]]\n'
+    assert scanner.match(other, 5) is None
+    assert scanner.state.failed == (other, set())
+
+
+def test_literal_scanner_match_nested(scanner):
+    """
+    Ensures deeply nested brackets that aren't literals are scanned in
+    linear time
+    """
+    source = 'a = {}b{}\n'.format('[' * 5000, ']' * 5000)
+    for position in range(4, 5004):
+        assert scanner.match(source, position) is None
+    assert len(scanner.failed(source)) == 5000
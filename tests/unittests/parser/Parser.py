@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 import io
+import mmap
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from lark import Lark
+from lark.exceptions import UnexpectedCharacters, UnexpectedToken
+from lark.lexer import Token
 
-from pytest import fixture
+from pytest import fixture, mark, raises
 
-from storyscript.parser import (CustomIndenter, Grammar, Parser, Transformer,
+from storyscript.exceptions import StorySyntaxError
+from storyscript.parser import (Arena, CustomIndenter, Grammar,
+                                IncrementalTree, Parser, PrattGrammar,
+                                Scanner, Tables, TokenStream, Transformer,
                                 Tree)
 
 
@@ -17,6 +25,10 @@ def parser():
 def test_parser_init(parser):
     assert parser.algo == 'lalr'
     assert parser.ebnf is None
+    assert parser.compact is False
+    assert parser.lexer == 'scanner'
+    assert parser.workers is None
+    assert parser.cache is None
 
 
 def test_parser_init_algo():
@@ -29,6 +41,23 @@ def test_parser_init_ebnf():
     assert parser.ebnf == 'grammar.ebnf'
 
 
+def test_parser_init_compact():
+    parser = Parser(compact=True)
+    assert parser.compact is True
+
+
+def test_parser_init_lexer():
+    assert Parser(lexer='lark').lexer == 'lark'
+
+
+def test_parser_init_workers():
+    assert Parser(workers=4).workers == 4
+
+
+def test_parser_init_cache():
+    assert Parser(cache='cache').cache == 'cache'
+
+
 def test_parser_indenter(patch):
     patch.init(CustomIndenter)
     assert isinstance(Parser.indenter(), CustomIndenter)
@@ -37,15 +66,33 @@ def test_parser_indenter(patch):
 def test_parser_transfomer(patch):
     patch.init(Transformer)
     result = Parser.transformer()
+    Transformer.__init__.assert_called_with(compact=False)
     assert isinstance(result, Transformer)
 
 
+def test_parser_transfomer_compact(patch):
+    patch.init(Transformer)
+    Parser.transformer(compact=True)
+    Transformer.__init__.assert_called_with(compact=True)
+
+
+def test_parser_pool(patch):
+    patch.init(ProcessPoolExecutor)
+    result = Parser.pool(4)
+    ProcessPoolExecutor.__init__.assert_called_with(max_workers=4)
+    assert isinstance(result, ProcessPoolExecutor)
+
+
 def test_parser_grammar(patch, parser):
-    patch.init(Grammar)
-    patch.object(Grammar, 'build')
+    patch.object(Grammar, 'grammar')
     result = parser.grammar()
-    assert Grammar.__init__.call_count == 1
-    assert result == Grammar().build()
+    assert result == Grammar.grammar()
+
+
+def test_parser_grammar_pratt(patch):
+    patch.object(PrattGrammar, 'grammar')
+    result = Parser(algo='pratt').grammar()
+    assert result == PrattGrammar.grammar()
 
 
 def test_parser_grammar_ebnf(patch, parser):
@@ -58,23 +105,164 @@ def test_parser_grammar_ebnf(patch, parser):
 
 def test_parser_lark(patch, parser):
     """
-    Ensures Parser.lark can produce the correct Lark instance.
+    Ensures Parser.lark builds the Lark instance and registers it.
     """
-    patch.init(Lark)
-    patch.many(Parser, ['indenter', 'grammar'])
+    patch.many(Parser, ['grammar', 'build'])
+    patch.object(Parser, 'registry', {})
+    result = parser.lark()
+    Parser.build.assert_called_with(parser.grammar())
+    assert result == Parser.build()
+    key = (parser.grammar(), parser.algo, parser.compact, parser.lexer)
+    assert Parser.registry[key] == result
+
+
+def test_parser_lark_registry(patch, parser):
+    """
+    Ensures Parser.lark reuses Lark instances across parsers
+    """
+    patch.many(Parser, ['grammar', 'build'])
+    patch.object(Parser, 'registry', {})
     result = parser.lark()
-    kwargs = {'parser': parser.algo, 'postlex': Parser.indenter()}
-    Lark.__init__.assert_called_with(parser.grammar(), **kwargs)
+    assert Parser().lark() == result
+    assert Parser.build.call_count == 1
+
+
+def test_parser_lark_registry_algo(patch, parser):
+    """
+    Ensures Parser.lark builds different instances for different algorithms
+    """
+    patch.many(Parser, ['grammar', 'build'])
+    patch.object(Parser, 'registry', {})
+    parser.lark()
+    Parser(algo='earley').lark()
+    assert Parser.build.call_count == 2
+
+
+def test_parser_lark_build_lock(patch, parser):
+    """
+    Ensures building an instance doesn't block the threads getting the
+    instances that are already built
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def build(grammar):
+        started.set()
+        release.wait(5)
+        return 'lalr'
+
+    patch.object(Parser, 'grammar', return_value='grammar')
+    patch.object(Parser, 'build', side_effect=build)
+    patch.object(Parser, 'registry',
+                 {('grammar', 'earley', False, 'scanner'): 'earley'})
+    patch.object(Parser, 'build_locks', {})
+    with ThreadPoolExecutor(1) as pool:
+        future = pool.submit(parser.lark)
+        assert started.wait(5)
+        assert Parser(algo='earley').lark() == 'earley'
+        release.set()
+        assert future.result() == 'lalr'
+    assert Parser.build_locks == {}
+
+
+def test_parser_lark_build_once(patch, parser):
+    """
+    Ensures threads waiting for an instance being built reuse it
+    """
+    patch.object(Parser, 'grammar', return_value='grammar')
+    patch.object(Parser, 'build', return_value='lalr')
+    patch.object(Parser, 'registry', {})
+    lock = threading.Lock()
+    key = ('grammar', 'lalr', False, 'scanner')
+    patch.object(Parser, 'build_locks', {key: lock})
+    with ThreadPoolExecutor(2) as pool:
+        with lock:
+            futures = [pool.submit(Parser().lark) for _ in range(2)]
+            Parser.registry[key] = 'lalr'
+        assert [future.result() for future in futures] == ['lalr', 'lalr']
+    assert Parser.build.call_count == 0
+
+
+def test_parser_build(patch, parser):
+    """
+    Ensures Parser.build builds LALR parsers from the cached tables.
+    """
+    patch.many(Tables, ['get', 'lark'])
+    patch.many(Parser, ['indenter', 'transformer'])
+    result = parser.build('grammar')
+    Tables.get.assert_called_with('grammar')
+    Parser.transformer.assert_called_with(parser.compact)
+    kwargs = {'scanner': True, 'postlex': Parser.indenter(),
+              'transformer': Parser.transformer()}
+    Tables.lark.assert_called_with(Tables.get(), **kwargs)
+    assert result == Tables.lark()
+
+
+def test_parser_build_lark_lexer(patch):
+    patch.many(Tables, ['get', 'lark'])
+    patch.many(Parser, ['indenter', 'transformer'])
+    Parser(lexer='lark').build('grammar')
+    assert Tables.lark.call_args[1]['scanner'] is False
+
+
+def test_parser_build_pratt(patch):
+    patch.many(Tables, ['get', 'lark'])
+    patch.many(Parser, ['indenter', 'transformer'])
+    result = Parser(algo='pratt').build('grammar')
+    Tables.get.assert_called_with('grammar')
+    assert result == Tables.lark()
+
+
+def test_parser_build_earley(patch):
+    """
+    Ensures Parser.build uses Lark directly for other algorithms
+    """
+    patch.init(Lark)
+    patch.object(Parser, 'indenter')
+    parser = Parser(algo='earley')
+    result = parser.build('grammar')
+    kwargs = {'parser': 'earley', 'postlex': Parser.indenter()}
+    Lark.__init__.assert_called_with('grammar', **kwargs)
     assert isinstance(result, Lark)
 
 
 def test_parser_parse(patch, parser):
     """
-    Ensures the build method can build the grammar
+    Ensures LALR parsing transforms the tree while parsing
     """
     patch.many(Parser, ['lark', 'transformer'])
     result = parser.parse('source')
     Parser.lark().parse.assert_called_with('source\n')
+    assert Parser.transformer.call_count == 0
+    assert result == Parser.lark().parse()
+
+
+def test_parser_parse_side_tables(patch, parser):
+    """
+    Ensures the side tables recorded while parsing are kept in the tree
+    """
+    patch.object(Parser, 'lark')
+    patch.object(Transformer, 'recording')
+    result = parser.parse('source')
+    tables = Transformer.recording().__enter__()
+    assert result.side_tables == tables
+
+
+def test_parser_parse_pratt(patch):
+    patch.many(Parser, ['lark', 'transformer'])
+    result = Parser(algo='pratt').parse('source')
+    assert Parser.transformer.call_count == 0
+    assert result == Parser.lark().parse()
+
+
+def test_parser_parse_earley(patch):
+    """
+    Ensures other algorithms transform the tree after parsing
+    """
+    patch.many(Parser, ['lark', 'transformer'])
+    parser = Parser(algo='earley')
+    result = parser.parse('source')
+    Parser.lark().parse.assert_called_with('source\n')
     Parser.transformer().transform.assert_called_with(Parser.lark().parse())
     assert result == Parser.transformer().transform()
 
@@ -83,11 +271,350 @@ def test_parser_parse_empty(patch, parser):
     """
     Ensures that empty stories are parsed correctly
     """
-    assert parser.parse('') == Tree('empty', [])
+    result = parser.parse('')
+    assert result == Tree('empty', [])
+    assert result.side_tables.imports == []
+
+
+def test_parser_parse_cache(patch, magic, parser):
+    """
+    Ensures trees are loaded from the cache of the parser
+    """
+    patch.many(Parser, ['grammar', 'parse_source'])
+    parser.cache = magic()
+    result = parser.parse('source')
+    parser.cache.key.assert_called_with('source', Parser.grammar(), 'lalr',
+                                        False)
+    parser.cache.load.assert_called_with(parser.cache.key())
+    assert Parser.parse_source.call_count == 0
+    assert result == parser.cache.load()
+
+
+def test_parser_parse_cache_miss(patch, magic, parser):
+    """
+    Ensures trees missing from the cache are parsed and stored
+    """
+    patch.many(Parser, ['grammar', 'parse_source'])
+    parser.cache = magic()
+    parser.cache.load.return_value = None
+    result = parser.parse('source')
+    Parser.parse_source.assert_called_with('source')
+    parser.cache.dump.assert_called_with(parser.cache.key(),
+                                         Parser.parse_source(), 'source\n')
+    assert result == Parser.parse_source()
+
+
+def test_parser_parse_parallel(patch):
+    patch.object(Parser, 'parallel_lines', 2)
+    patch.many(Parser, ['lark', 'parse_parallel'])
+    result = Parser(workers=2).parse('a\nb\nc')
+    Parser.parse_parallel.assert_called_with('a\nb\nc')
+    assert Parser.lark.call_count == 0
+    assert result == Parser.parse_parallel()
+
+
+def test_parser_parse_parallel_short(patch):
+    """
+    Ensures short sources are parsed serially
+    """
+    patch.object(Parser, 'parallel_lines', 2)
+    patch.many(Parser, ['lark', 'parse_parallel'])
+    result = Parser(workers=2).parse('a\nb')
+    assert Parser.parse_parallel.call_count == 0
+    assert result == Parser.lark().parse()
+
+
+def test_parser_parse_parallel_fallback(patch):
+    """
+    Ensures sources are parsed serially when their chunks can't be parsed
+    """
+    patch.object(Parser, 'parallel_lines', 2)
+    patch.many(Parser, ['lark', 'parse_parallel'])
+    Parser.parse_parallel.return_value = None
+    result = Parser(workers=2).parse('a\nb\nc')
+    Parser.lark().parse.assert_called_with('a\nb\nc\n')
+    assert result == Parser.lark().parse()
+
+
+def test_parser_incremental(patch, parser):
+    patch.object(Parser, 'parse', return_value=Tree('start', ['block']))
+    result = parser.incremental('source')
+    Parser.parse.assert_called_with('source')
+    assert isinstance(result, IncrementalTree)
+    assert result.children == ['block']
+
+
+def test_parser_incremental_empty(patch, parser):
+    patch.object(Parser, 'parse', return_value=Tree('empty', []))
+    assert parser.incremental('') == Tree('empty', [])
+
+
+def test_parser_inside():
+    token = Token('NAME', 'a', 2, 1, 3)
+    assert Parser.inside(UnexpectedToken(token, []), 'ab a') is True
+    assert Parser.inside(UnexpectedToken(token, []), 'ab') is False
+
+
+def test_parser_inside_end():
+    token = Token('$END', '', 2, 1, 3)
+    assert Parser.inside(UnexpectedToken(token, []), 'ab a') is False
+
+
+@mark.parametrize('region', ['"a', "'a", 'a / b'])
+def test_parser_inside_delimiters(region):
+    """
+    Ensures errors in regions with unbalanced delimiters are not inside them,
+    as they could be strings going on after the region.
+    """
+    token = Token('NAME', 'a', 0, 1, 1)
+    assert Parser.inside(UnexpectedToken(token, []), region) is False
+
+
+def test_parser_inside_syntax_error():
+    error = StorySyntaxError('error', token=Token('NAME', 'a', 0, 1, 1))
+    assert Parser.inside(error, 'a') is True
+    assert Parser.inside(StorySyntaxError('error'), 'a') is False
+
+
+def test_parser_move_error():
+    error = UnexpectedToken(Token('NAME', 'a', 2, 1, 3), [])
+    result = Parser.move_error(error, 10, 2)
+    assert result.line == 3
+    assert result.column == 3
+    assert result.pos_in_stream == 12
+    assert result.token.line == 3
+    assert result.token.pos_in_stream == 12
+
+
+def test_parser_move_error_string_line():
+    """
+    Ensures the lines of errors found from trees are kept as strings
+    """
+    error = StorySyntaxError('error')
+    error.line = '1'
+    assert Parser.move_error(error, 10, 2).line == '3'
+
+
+def test_parser_parse_region(patch, parser):
+    a = Token('NAME', 'a', 0, 1, 1)
+    a.end_line = 1
+    patch.object(Parser, 'parse', return_value=Tree('start', [a]))
+    blocks, leaves = parser.parse_region('a', 10, 2)
+    Parser.parse.assert_called_with('a')
+    assert blocks == [a]
+    assert leaves == [[a]]
+    assert a.pos_in_stream == 10
+    assert a.line == 3
+
+
+def test_parser_parse_region_error(patch, parser):
+    """
+    Ensures errors in the middle of the region are moved and raised
+    """
+    error = UnexpectedToken(Token('NAME', 'a', 0, 1, 1), [])
+    patch.object(Parser, 'parse', side_effect=error)
+    with raises(UnexpectedToken):
+        parser.parse_region('a', 10, 2)
+    assert error.line == 3
+
+
+def test_parser_parse_region_error_end(patch, parser):
+    """
+    Ensures errors at the end of the region, which the rest of the source
+    could change, are not raised
+    """
+    error = UnexpectedToken(Token('$END', '', 0, 1, 1), [])
+    patch.object(Parser, 'parse', side_effect=error)
+    assert parser.parse_region('a', 10, 2) is None
+
+
+@mark.parametrize('error', [UnexpectedCharacters('a', 0, 1, 1),
+                            AssertionError()])
+def test_parser_parse_region_unknown(patch, parser, error):
+    patch.object(Parser, 'parse', side_effect=error)
+    assert parser.parse_region('a', 10, 2) is None
+
+
+def test_parser_reparse_empty(patch, parser):
+    patch.object(Parser, 'incremental')
+    result = parser.reparse(Tree('empty', []), '', 0, 0, 'a')
+    Parser.incremental.assert_called_with('a')
+    assert result == Parser.incremental()
+
+
+def test_parser_reparse_fallback(patch, parser):
+    """
+    Ensures the whole source is parsed when the region can't be
+    """
+    patch.object(Parser, 'incremental')
+    patch.object(Parser, 'parse_region', return_value=None)
+    tree = parser.parse('a = 1')
+    result = parser.reparse(tree, 'a = 1', 4, 5, '"')
+    Parser.incremental.assert_called_with('a = "')
+    assert result == Parser.incremental()
+
+
+def test_parser_reparse(patch, parser):
+    patch.object(Parser, 'parse_region', return_value=(['new'], [['c']]))
+    tree = parser.parse('a = 1\nb = 2\nc = 3')
+    blocks = tree.children
+    result = parser.reparse(tree, 'a = 1\nb = 2\nc = 3', 10, 11, '4')
+    Parser.parse_region.assert_called_with('a = 1\nb = 4\n', 0, 0)
+    assert result.children == ['new', blocks[2]]
+    assert result.leaves[0] == ['c']
+    assert sorted(result.leaves[1]) == ['3', '=', 'c']
+
+
+def test_parser_reparse_moves(patch, parser):
+    """
+    Ensures the blocks after the edit are moved
+    """
+    patch.object(Parser, 'parse_region', return_value=([], []))
+    source = 'a = 1\nb = 2\nc = 3\nd = 4'
+    tree = parser.parse(source)
+    result = parser.reparse(tree, source, 12, 17, 'x\n\ny')
+    Parser.parse_region.assert_called_with('b = 2\nx\n\ny\n', 6, 1)
+    assert result.children[-1].first_token().line == 6
+    assert result.children[-1].start_pos() == 17
+
+
+def test_parser_chunks():
+    result = list(Parser.chunks('a = 1\nb = 2\nc = 3\n', 3))
+    assert result == [('a = 1\nb = 2\n', 0, 0), ('c = 3\n', 12, 2)]
+
+
+@mark.parametrize('source, chunk', [
+    ('if a\n    b\nelse\n    c\nd\n', 'if a\n    b\nelse\n    c\n'),
+    ('try\n    a\ncatch as e\n    b\nd\n', 'try\n    a\ncatch as e\n    b\n'),
+    ('a = [1,\n    2\n]\nd\n', 'a = [1,\n    2\n]\n'),
+    ('a\n# comment\nd\n', 'a\n# comment\n'),
+    ('###\na\n###\nd\n', '###\na\n###\n')
+])
+def test_parser_chunks_blocks(source, chunk):
+    """
+    Ensures sources are split only where top-level blocks start
+    """
+    result = list(Parser.chunks(source, 100))
+    assert result == [(chunk, 0, 0),
+                      ('d\n', len(chunk), chunk.count('\n'))]
+
+
+def test_parser_parse_chunk(patch, parser):
+    patch.object(Parser, 'arena')
+    result = parser.parse_chunk('chunk')
+    Parser.arena.assert_called_with('chunk')
+    assert result == Parser.arena()
+
+
+@mark.parametrize('error', [UnexpectedCharacters('a', 0, 1, 1),
+                            StorySyntaxError('error'), AssertionError()])
+def test_parser_parse_chunk_error(patch, parser, error):
+    patch.object(Parser, 'arena', side_effect=error)
+    assert parser.parse_chunk('chunk') is None
+
+
+def test_parser_parse_parallel_chunks(patch, magic):
+    patch.many(Parser, ['lark', 'pool', 'chunks'])
+    Parser.chunks.return_value = [('a\n', 0, 0), ('b\n', 2, 1)]
+    arenas = [magic(), magic()]
+    for arena in arenas:
+        arena.tree.return_value = Tree('start', [arena])
+    pool = Parser.pool().__enter__()
+    pool.map.return_value = arenas
+    parser = Parser(workers=2)
+    result = parser.parse_parallel('a\nb\n')
+    Parser.pool.assert_called_with(2)
+    Parser.chunks.assert_called_with('a\nb\n', 2 * Parser.chunks_per_worker)
+    assert pool.map.call_args[0][1] == ['a\n', 'b\n']
+    arenas[1].tree.assert_called_with(2, 1)
+    assert result == Tree('start', arenas)
+
+
+def test_parser_parse_parallel_chunks_error(patch, magic):
+    patch.many(Parser, ['lark', 'pool', 'chunks'])
+    Parser.chunks.return_value = [('a\n', 0, 0), ('b\n', 2, 1)]
+    Parser.pool().__enter__().map.return_value = [magic(), None]
+    assert Parser(workers=2).parse_parallel('a\nb\n') is None
+
+
+def test_parser_arena(patch, parser):
+    patch.object(Parser, 'parse')
+    patch.object(Arena, 'from_tree')
+    result = parser.arena('source')
+    Parser.parse.assert_called_with('source')
+    Arena.from_tree.assert_called_with(Parser.parse(), 'source\n')
+    assert result == Arena.from_tree()
 
 
 def test_parser_lex(patch, parser):
     patch.many(Parser, ['lark', 'indenter'])
+    patch.init(Scanner)
+    patch.object(Scanner, 'lex')
     result = parser.lex('source')
+    Scanner.__init__.assert_called_with(Parser.lark().terminals,
+                                        Parser.lark().ignore_tokens,
+                                        indenter=Parser.indenter())
+    Scanner.lex.assert_called_with('source')
+    assert result == Scanner.lex()
+
+
+def test_parser_lex_file(patch, parser):
+    patch.object(Parser, 'lex_file')
+    file = io.BytesIO(b'source')
+    result = parser.lex(file)
+    Parser.lex_file.assert_called_with(file)
+    assert result == Parser.lex_file()
+
+
+def test_parser_lex_lark(patch):
+    patch.many(Parser, ['lark', 'indenter'])
+    result = Parser(lexer='lark').lex('source')
     Parser.lark().lex.assert_called_with('source')
     assert result == Parser.lark().lex()
+
+
+def test_parser_lex_lark_bytes(patch):
+    patch.many(Parser, ['lark', 'indenter'])
+    Parser(lexer='lark').lex('sourcé'.encode('utf-8'))
+    Parser.lark().lex.assert_called_with('sourcé')
+
+
+def test_parser_token_stream(patch, parser):
+    patch.object(Parser, 'lex')
+    patch.object(TokenStream, 'from_tokens')
+    result = parser.token_stream('source')
+    Parser.lex.assert_called_with('source')
+    TokenStream.from_tokens.assert_called_with(Parser.lex(), 'source')
+    assert result == TokenStream.from_tokens()
+
+
+def test_parser_lex_file_mmap(patch, parser, magic):
+    patch.object(mmap, 'mmap')
+    patch.object(Parser, 'lex', return_value=['token'])
+    file = magic()
+    result = list(parser.lex_file(file))
+    mmap.mmap.assert_called_with(file.fileno(), 0, access=mmap.ACCESS_READ)
+    Parser.lex.assert_called_with(mmap.mmap())
+    assert mmap.mmap().close.call_count == 1
+    assert result == ['token']
+
+
+def test_parser_lex_file_closed(patch, parser, tmpdir):
+    """
+    Ensures the memory map of a file is closed once it has been lexed
+    """
+    patch.object(Parser, 'lex', return_value=['token'])
+    path = tmpdir.join('story')
+    path.write('a = 1')
+    with io.open(str(path), 'rb') as file:
+        assert list(parser.lex_file(file)) == ['token']
+    assert Parser.lex.call_args[0][0].closed
+
+
+def test_parser_lex_file_read(patch, parser):
+    """
+    Ensures files that can't be mapped are read
+    """
+    patch.object(Parser, 'lex', return_value=['token'])
+    assert list(parser.lex_file(io.BytesIO(b'source'))) == ['token']
+    Parser.lex.assert_called_with(b'source')
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import Pratt, Tree
+
+
+@fixture
+def pratt():
+    return Pratt()
+
+
+@fixture
+def compact():
+    return Pratt(compact=True)
+
+
+def primary(value):
+    return Tree('primary_expression', [Token('NAME', value)])
+
+
+def operator(rule, token_type, value):
+    return Tree(rule, [Token(token_type, value)])
+
+
+@fixture
+def plus():
+    return operator('arith_operator', 'PLUS', '+')
+
+
+@fixture
+def times():
+    return operator('mul_operator', 'MULTIPLIER', '*')
+
+
+@fixture
+def power():
+    return Token('POWER', '^')
+
+
+@fixture
+def negation():
+    return operator('unary_operator', 'NOT', '!')
+
+
+def test_pratt_init():
+    assert Pratt().compact is False
+    assert Pratt(compact=True).compact is True
+
+
+def test_pratt_levels():
+    assert Pratt.unary_level == 5
+    assert Pratt.power_level == 6
+    assert Pratt.primary_level == 7
+
+
+def test_pratt_wrap(pratt):
+    result = pratt.wrap(primary('a'), 7, 5)
+    expected = Tree('unary_expression', [Tree('pow_expression',
+                                              [primary('a')])])
+    assert result == expected
+
+
+def test_pratt_wrap_same_level(pratt):
+    tree = primary('a')
+    assert pratt.wrap(tree, 7, 7) is tree
+
+
+def test_pratt_wrap_compact(compact):
+    tree = primary('a')
+    assert compact.wrap(tree, 7, 0) is tree
+
+
+def test_pratt_binding(pratt, plus, power):
+    assert pratt.binding(plus) == 3
+    assert pratt.binding(power) == 6
+    assert pratt.binding(Token('OR', 'or')) == 0
+
+
+def test_pratt_operand(pratt):
+    items = [primary('a')]
+    assert pratt.operand(items, 0) == (items[0], 7, 1)
+
+
+def test_pratt_operand_unary(compact, negation):
+    items = [negation, primary('a')]
+    result = compact.operand(items, 0)
+    expected = Tree('unary_expression', [negation, primary('a')])
+    assert result == (expected, 5, 2)
+
+
+def test_pratt_operand_unary_power(compact, negation, power):
+    """
+    Ensures unary operators apply to powers
+    """
+    items = [negation, primary('a'), power, primary('b')]
+    tree, level, position = compact.operand(items, 0)
+    power_tree = Tree('pow_expression', [primary('a'), power, primary('b')])
+    assert tree == Tree('unary_expression', [negation, power_tree])
+    assert position == 4
+
+
+def test_pratt_apply(pratt, plus):
+    tree, level = pratt.apply(primary('a'), 7, plus, primary('b'), 7)
+    expected = Tree('arith_expression', [pratt.wrap(primary('a'), 7, 3), plus,
+                                         pratt.wrap(primary('b'), 7, 4)])
+    assert tree == expected
+    assert level == 3
+
+
+def test_pratt_apply_power(pratt, power):
+    """
+    Ensures the left operand of powers isn't wrapped
+    """
+    tree, level = pratt.apply(primary('a'), 7, power, primary('b'), 7)
+    expected = Tree('pow_expression', [primary('a'), power,
+                                       pratt.wrap(primary('b'), 7, 5)])
+    assert tree == expected
+    assert level == 6
+
+
+def test_pratt_climb(compact, plus, times):
+    items = [primary('a'), plus, primary('b'), times, primary('c')]
+    tree, level, position = compact.climb(items, 0, 0)
+    product = Tree('mul_expression', [primary('b'), times, primary('c')])
+    assert tree == Tree('arith_expression', [primary('a'), plus, product])
+    assert level == 3
+    assert position == 5
+
+
+def test_pratt_climb_left(compact, plus):
+    """
+    Ensures operators of the same level are left-associative
+    """
+    items = [primary('a'), plus, primary('b'), plus, primary('c')]
+    tree = compact.climb(items, 0, 0)[0]
+    left = Tree('arith_expression', [primary('a'), plus, primary('b')])
+    assert tree == Tree('arith_expression', [left, plus, primary('c')])
+
+
+def test_pratt_climb_power(compact, power):
+    """
+    Ensures powers are right-associative
+    """
+    items = [primary('a'), power, primary('b'), power, primary('c')]
+    tree = compact.climb(items, 0, 0)[0]
+    right = Tree('pow_expression', [primary('b'), power, primary('c')])
+    assert tree == Tree('pow_expression', [primary('a'), power, right])
+
+
+def test_pratt_climb_power_chain(compact, power):
+    """
+    Ensures long chains of powers don't reach the recursion limit
+    """
+    items = [primary('a')]
+    for _ in range(10000):
+        items.extend([power, primary('a')])
+    tree, level, position = compact.climb(items, 0, 0)
+    depth = 0
+    while tree.data == 'pow_expression':
+        tree = tree.children[2]
+        depth += 1
+    assert depth == 10000
+    assert position == len(items)
+
+
+def test_pratt_climb_unary_chain(compact, negation):
+    """
+    Ensures long runs of unary operators don't reach the recursion limit
+    """
+    items = [negation] * 10000 + [primary('a')]
+    tree, level, position = compact.climb(items, 0, 0)
+    depth = 0
+    while tree.data == 'unary_expression':
+        tree = tree.children[1]
+        depth += 1
+    assert depth == 10000
+    assert tree == primary('a')
+    assert (level, position) == (5, len(items))
+
+
+def test_pratt_climb_minimum(compact, plus, times):
+    items = [primary('a'), times, primary('b'), plus, primary('c')]
+    tree, level, position = compact.climb(items, 0, 4)
+    assert tree == Tree('mul_expression', [primary('a'), times,
+                                           primary('b')])
+    assert position == 3
+
+
+def test_pratt_climb_full(pratt, plus):
+    """
+    Ensures full trees wrap operands in the levels between theirs and their
+    parent's
+    """
+    items = [primary('a'), plus, primary('b')]
+    tree = pratt.climb(items, 0, 0)[0]
+    operand = pratt.wrap(primary('a'), 7, 3)
+    assert tree.children[0] == operand
+    assert tree.children[2] == pratt.wrap(primary('b'), 7, 4)
+
+
+def test_pratt_operation(patch, pratt):
+    patch.many(Pratt, ['climb', 'wrap'])
+    Pratt.climb.return_value = ('tree', 3, 1)
+    result = pratt.operation(['items'])
+    Pratt.climb.assert_called_with(['items'], 0, 0)
+    Pratt.wrap.assert_called_with('tree', 3, 0)
+    assert result == Pratt.wrap()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from pytest import fixture
+
+from storyscript.parser import Ebnf, Grammar, PrattGrammar
+
+
+@fixture
+def ebnf(magic):
+    return magic()
+
+
+@fixture
+def grammar(patch, ebnf):
+    patch.object(Grammar, 'operators')
+    grammar = PrattGrammar()
+    grammar.ebnf = ebnf
+    return grammar
+
+
+def test_prattgrammar_init():
+    grammar = PrattGrammar()
+    assert isinstance(grammar, Grammar)
+    assert isinstance(grammar.ebnf, Ebnf)
+
+
+def test_prattgrammar_built():
+    """
+    Ensures the grammar is not shared with Grammar
+    """
+    assert PrattGrammar.grammar() != Grammar.grammar()
+
+
+def test_prattgrammar_expressions(grammar, ebnf):
+    grammar.expressions()
+    assert Grammar.operators.call_count == 1
+    assert ebnf.primary_expression == 'entity , op operation cp'
+    assert ebnf._operand == 'unary_operator* primary_expression'
+    assert ebnf._binary_operator == ('OR, AND, cmp_operator, '
+                                     'arith_operator, mul_operator, POWER')
+    assert ebnf.operation == '_operand (_binary_operator _operand)*'
+    assert ebnf.expression == 'operation'
+    assert ebnf.absolute_expression == 'expression'
+
+
+def test_prattgrammar_build():
+    result = PrattGrammar().build()
+    assert 'operation: ' in result
+    assert 'or_expression' not in result
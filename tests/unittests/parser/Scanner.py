@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+from lark.exceptions import UnexpectedCharacters
+from lark.lexer import PatternRE, PatternStr, TerminalDef, Token
+
+from pytest import fixture, raises
+
+from storyscript.parser import (CustomIndenter, GrammarTables,
+                                LiteralScanner, Scanner)
+from storyscript.parser.Scanner import ScannerTable
+
+
+@fixture
+def terminals():
+    return [TerminalDef('NAME', PatternRE('[a-z]+')),
+            TerminalDef('_WS', PatternRE('(?:\\ )+')),
+            TerminalDef('_NL', PatternRE('(\r?\n[\t ]*)+')),
+            TerminalDef('IF', PatternStr('if')),
+            TerminalDef('EQUAL', PatternStr('==')),
+            TerminalDef('EQUALS', PatternStr('='))]
+
+
+@fixture
+def scanner(terminals):
+    return Scanner(terminals, ignore=['_WS'], indenter=CustomIndenter())
+
+
+def tokens(stream):
+    return [(token.type, token.value) for token in stream]
+
+
+def test_scanner_init(terminals, scanner):
+    assert [t.name for t in scanner.terminals] == [
+        '_NL', '_WS', 'NAME', 'EQUAL', 'IF', 'EQUALS']
+    assert scanner.ignore == {'_WS'}
+    assert scanner.states is None
+    assert scanner.parser_state is None
+    assert scanner.always_accept == ('_NL',)
+    assert scanner.newline_types == {'_NL'}
+    assert scanner.matchers['IF'] == ('IF', 'if', None)
+    assert scanner.byte_matchers['IF'][2](b'if').group(0) == b'if'
+    assert scanner.starts['NAME'] is None
+    assert scanner.tables == {}
+    assert scanner.byte_tables == {}
+
+
+def test_scanner_init_literal_scanners(terminals):
+    terminals.append(TerminalDef('CONSTANT', PatternStr('<CONSTANT>')))
+    scanner = Scanner(terminals)
+    assert Scanner.literal_scanners == {'CONSTANT': LiteralScanner}
+    assert scanner.newline_types == {'_NL', 'CONSTANT'}
+    name, string, match = scanner.matchers['CONSTANT']
+    assert (name, string) == ('CONSTANT', None)
+    assert isinstance(match.__self__, LiteralScanner)
+    assert match.__func__ == LiteralScanner.match
+    name, string, match = scanner.byte_matchers['CONSTANT']
+    assert (name, string) == ('CONSTANT', None)
+    assert match.__func__ == LiteralScanner.byte_match
+    assert scanner.starts['CONSTANT'] == '[{'
+    assert scanner.scanners == [match.__self__]
+
+
+def test_scanner_order():
+    low = TerminalDef('LOW', PatternStr('aaa'), priority=1)
+    high = TerminalDef('HIGH', PatternStr('a'), priority=2)
+    wide = TerminalDef('WIDE', PatternStr('aa'), priority=2)
+    result = sorted([low, high, wide], key=Scanner.order)
+    assert result == [wide, high, low]
+
+
+def test_scanner_matcher_regexp():
+    name, string, match = Scanner.matcher(TerminalDef('A', PatternRE('a+')))
+    assert name == 'A'
+    assert string is None
+    assert match('baa', 1).group(0) == 'aa'
+
+
+def test_scanner_matcher_flags():
+    terminal = TerminalDef('A', PatternStr('a', flags=['i']))
+    assert Scanner.matcher(terminal)[2]('A').group(0) == 'A'
+
+
+def test_scanner_byte_matcher():
+    terminal = TerminalDef('A', PatternStr('a.'))
+    name, string, match = Scanner.byte_matcher(terminal)
+    assert name == 'A'
+    assert string is None
+    assert match(b'ba.', 1).group(0) == b'a.'
+    assert match(b'bab', 1) is None
+
+
+def test_scanner_has_newline():
+    assert Scanner.has_newline(TerminalDef('A', PatternRE('"[^"]*"')))
+    assert Scanner.has_newline(TerminalDef('A', PatternRE('a+'))) is False
+
+
+def test_scanner_first_characters():
+    assert Scanner.first_characters(TerminalDef('A', PatternStr('if'))) == 'i'
+    terminal = TerminalDef('A', PatternRE('[0-9]+'))
+    assert Scanner.first_characters(terminal) == Scanner.digits
+
+
+def test_scanner_first_characters_any():
+    terminal = TerminalDef('A', PatternRE('a+'))
+    assert Scanner.first_characters(terminal) is None
+    terminal = TerminalDef('A', PatternStr('a', flags=['i']))
+    assert Scanner.first_characters(terminal) is None
+
+
+def test_scanner_first_characters_builtin():
+    """
+    Ensures the first characters of all the built-in terminals are known
+    """
+    for name, kind, value, flags, priority in \
+            GrammarTables.tables['terminals']:
+        if kind == 're':
+            assert value in Scanner.starts_by_pattern
+
+
+def test_scanner_set_parser_state(scanner):
+    scanner.set_parser_state(1)
+    assert scanner.parser_state == 1
+
+
+def test_scanner_table(scanner):
+    result = scanner.table(None)
+    assert isinstance(result, ScannerTable)
+    assert len(result.terminals) == 5
+    assert scanner.tables[None] == result
+
+
+def test_scanner_table_binary(scanner):
+    result = scanner.table(None, binary=True)
+    assert result.binary is True
+    assert result.matchers == scanner.byte_matchers
+    assert scanner.byte_tables[None] == result
+    assert scanner.table(None) is not result
+
+
+def test_scanner_table_states(terminals):
+    states = {0: ['NAME'], 1: ['NAME'], 2: ['IF']}
+    scanner = Scanner(terminals, ignore=['_WS'], indenter=CustomIndenter(),
+                      states=states)
+    result = scanner.table(0)
+    assert [t.name for t in result.terminals] == ['_NL', '_WS', 'NAME']
+    assert scanner.table(1) is result
+    assert [t.name for t in scanner.table(2).terminals] == ['_NL', '_WS',
+                                                            'IF']
+
+
+def test_scanner_table_unless(scanner):
+    """
+    Ensures strings matched by a regular expression retype its matches
+    """
+    result = scanner.table(None)
+    assert result.unless == {'NAME': {'if': 'IF'}}
+    assert 'IF' not in [t.name for t in result.terminals]
+
+
+def test_scanner_table_unless_priority(terminals):
+    terminals[3].priority = 2
+    result = Scanner(terminals).table(None)
+    assert result.unless == {}
+
+
+def test_scanner_table_candidates(scanner):
+    result = scanner.table(None)
+    assert [m[0] for m in result['=']] == ['NAME', 'EQUAL', 'EQUALS']
+    assert [m[0] for m in result[' ']] == ['_WS', 'NAME']
+
+
+def test_scanner_indent(scanner):
+    indents = [0]
+    token = Token('_NL', '\n    ', 1, 1, 2)
+    result = list(scanner.indent(token, indents))
+    assert tokens(result) == [('_INDENT', '    ')]
+    assert result[0].line == 1
+    assert indents == [0, 4]
+
+
+def test_scanner_indent_tabs(scanner):
+    indents = [0]
+    list(scanner.indent(Token('_NL', '\n\t'), indents))
+    assert indents == [0, 8]
+
+
+def test_scanner_indent_dedent(scanner):
+    indents = [0, 4, 8]
+    result = list(scanner.indent(Token('_NL', '\n'), indents))
+    assert tokens(result) == [('_DEDENT', ''), ('_DEDENT', '')]
+    assert indents == [0]
+
+
+def test_scanner_indent_error(scanner):
+    with raises(AssertionError):
+        list(scanner.indent(Token('_NL', '\n  '), [0, 4]))
+
+
+def test_scanner_lex(scanner):
+    result = list(scanner.lex('a == if\n'))
+    assert tokens(result) == [('NAME', 'a'), ('EQUAL', '=='), ('IF', 'if'),
+                              ('_NL', '\n')]
+    assert result[1].pos_in_stream == 2
+    assert result[1].column == 3
+    assert result[1].end_column == 5
+    assert result[3].end_line == 2
+    assert result[3].end_column == 1
+
+
+def test_scanner_lex_lines(scanner):
+    result = list(scanner.lex('a\n\nb'))
+    assert result[-1].line == 3
+    assert result[-1].column == 1
+
+
+def test_scanner_lex_indentation(scanner):
+    result = tokens(scanner.lex('a\n  b\nc'))
+    assert result == [('NAME', 'a'), ('_NL', '\n  '), ('_INDENT', '  '),
+                      ('NAME', 'b'), ('_NL', '\n'), ('_DEDENT', ''),
+                      ('NAME', 'c')]
+
+
+def test_scanner_lex_dedent_end(scanner):
+    result = tokens(scanner.lex('a\n  b'))
+    assert result[-1] == ('_DEDENT', '')
+
+
+def test_scanner_lex_indentation_scoped(scanner):
+    """
+    Ensures each scan has its own indentation
+    """
+    with raises(UnexpectedCharacters):
+        list(scanner.lex('a\n  b\n?'))
+    assert tokens(scanner.lex('a')) == [('NAME', 'a')]
+
+
+def test_scanner_lex_unexpected(scanner):
+    with raises(UnexpectedCharacters) as error:
+        list(scanner.lex('a ?'))
+    assert error.value.column == 3
+
+
+def test_scanner_lex_unexpected_bytes(scanner):
+    with raises(UnexpectedCharacters) as error:
+        list(scanner.lex(b'a\nbb ?'))
+    assert error.value.pos_in_stream == 5
+    assert error.value.line == 2
+    assert error.value.column == 4
+    assert 'bb ?\n   ^' in str(error.value)
+
+
+def test_scanner_lex_bytes(scanner):
+    """
+    Ensures bytes are scanned with byte offsets, decoding tokens
+    """
+    result = list(scanner.lex(bytearray(b'a == if\n  b')))
+    assert tokens(result) == [('NAME', 'a'), ('EQUAL', '=='), ('IF', 'if'),
+                              ('_NL', '\n  '), ('_INDENT', '  '),
+                              ('NAME', 'b'), ('_DEDENT', '')]
+    assert result[1].pos_in_stream == 2
+    assert result[5].line == 2
+    assert result[5].column == 3
+    assert result[5].end_column == 4
+
+
+def test_scanner_lex_contextual(terminals):
+    """
+    Ensures contextual scanners use the terminals of the current state
+    """
+    states = {0: ['IF'], 1: ['NAME']}
+    scanner = Scanner(terminals, ignore=['_WS'], states=states)
+    scanner.set_parser_state(0)
+    stream = scanner.lex('ifif')
+    assert next(stream) == Token('IF', 'if')
+    scanner.set_parser_state(1)
+    assert next(stream) == Token('NAME', 'if')
+
+
+def test_scanner_lex_literal_scanners(terminals):
+    """
+    Ensures the literal scanners forget the source once it has been scanned
+    """
+    terminals.append(TerminalDef('CONSTANT', PatternStr('<CONSTANT>')))
+    scanner = Scanner(terminals, ignore=['_WS'])
+    literal_scanner = scanner.scanners[0]
+    source = 'a [b'
+    stream = scanner.lex(source)
+    next(stream)
+    with raises(UnexpectedCharacters):
+        next(stream)
+    assert literal_scanner.state.failed is None
+
+
+def test_scanner_lex_literal_scanners_closed(terminals):
+    terminals.append(TerminalDef('CONSTANT', PatternStr('<CONSTANT>')))
+    scanner = Scanner(terminals, ignore=['_WS'])
+    stream = scanner.lex('a b')
+    next(stream)
+    scanner.scanners[0].failed('a b')
+    stream.close()
+    assert scanner.scanners[0].state.failed is None
+
+
+def test_scanner_lex_no_indenter(terminals):
+    scanner = Scanner(terminals, ignore=['_WS'])
+    assert tokens(scanner.lex('a\n b')) == [('NAME', 'a'), ('_NL', '\n '),
+                                            ('NAME', 'b')]
+
+
+def test_scanner_dedent(scanner):
+    indents = [0, 2, 4]
+    assert tokens(scanner.dedent(indents)) == [('_DEDENT', ''),
+                                               ('_DEDENT', '')]
+    assert indents == [0]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from storyscript.parser import SideTables, Tree
+
+
+def test_sidetables():
+    tables = {'imports': 'imports', 'function_block': 'functions',
+              'inline_expression': 'inline_expressions',
+              'service': 'services', 'chained_mutation': 'chained_mutations'}
+    assert SideTables.tables == tables
+
+
+def test_sidetables_init():
+    side_tables = SideTables()
+    for table in SideTables.tables.values():
+        assert getattr(side_tables, table) == []
+
+
+def test_sidetables_record():
+    side_tables = SideTables()
+    tree = Tree('function_block', [])
+    assert side_tables.record(tree) == tree
+    assert side_tables.functions == [tree]
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+from lark import Lark
+from lark.lexer import TraditionalLexer
+
+from pytest import fixture
+
+from storyscript.parser import (Frontend, Grammar, GrammarTables, Scanner,
+                                Tables)
+from storyscript.parser.Tables import LexerStates
+
+
+@fixture
+def grammar():
+    return 'start: NAME+\nNAME: /[a-z]+/\n%ignore " "\n'
+
+
+@fixture
+def cache(patch, tmpdir):
+    patch.object(Tables, 'directory', return_value=str(tmpdir))
+    return tmpdir
+
+
+def test_tables_directory(patch):
+    patch.dict(os.environ, {'STORYSCRIPT_CACHE': '/cache'})
+    assert Tables.directory() == '/cache'
+
+
+def test_tables_directory_xdg(patch):
+    patch.dict(os.environ, {'XDG_CACHE_HOME': '/xdg'}, clear=True)
+    assert Tables.directory() == os.path.join('/xdg', 'storyscript')
+
+
+def test_tables_path(patch):
+    patch.object(Tables, 'directory', return_value='/cache')
+    patch.object(Tables, 'grammar_hash', return_value='hash')
+    assert Tables.path('grammar') == '/cache/lalr-hash.json'
+    Tables.grammar_hash.assert_called_with('grammar')
+
+
+def test_tables_grammar_hash():
+    assert Tables.grammar_hash('a') != Tables.grammar_hash('b')
+    assert len(Tables.grammar_hash('a')) == 64
+
+
+def test_tables_analyse(grammar):
+    result = Tables.analyse(grammar)
+    assert result['ignore'] == ['__IGNORE_0']
+    origins = [rule[0] for rule in result['rules']]
+    assert origins == ['start', '__anon_plus_0', '__anon_plus_0']
+    assert result['start'] in result['states']
+
+
+def test_tables_stamp():
+    assert json.loads(json.dumps(Tables.stamp())) == Tables.stamp()
+
+
+def test_tables_write_read(cache, grammar):
+    data = Tables.analyse(grammar)
+    Tables.write(grammar, data)
+    result = Tables.read(grammar)
+    assert list(result['states']) == list(data['states'])
+    assert json.dumps(result) == json.dumps(data)
+
+
+def test_tables_write_json(cache, grammar):
+    """
+    Ensures the tables are written as JSON, with their stamp and the hash of
+    their grammar
+    """
+    Tables.write(grammar, {'tables': 'data'})
+    with open(Tables.path(grammar)) as f:
+        cached = json.load(f)
+    assert cached == {'stamp': Tables.stamp(),
+                      'grammar_hash': Tables.grammar_hash(grammar),
+                      'tables': {'tables': 'data'}}
+
+
+def test_tables_read_lark(cache, grammar):
+    """
+    Ensures parsers are built from the tables read from the cache
+    """
+    Tables.write(grammar, Tables.analyse(grammar))
+    lark = Tables.lark(Tables.read(grammar))
+    assert lark.parse('a b').children == ['a', 'b']
+
+
+def test_tables_read_missing(cache, grammar):
+    assert Tables.read(grammar) is None
+
+
+def test_tables_read_stamp(cache, grammar):
+    """
+    Ensures tables written in a different format are ignored
+    """
+    data = Tables.analyse(grammar)
+    with open(Tables.path(grammar), 'w') as f:
+        json.dump({'stamp': [0, '0', [0, 0]],
+                   'grammar_hash': Tables.grammar_hash(grammar),
+                   'tables': data}, f)
+    assert Tables.read(grammar) is None
+
+
+def test_tables_read_grammar_hash(cache, grammar):
+    """
+    Ensures tables of other grammars are ignored
+    """
+    data = Tables.analyse(grammar)
+    with open(Tables.path(grammar), 'w') as f:
+        json.dump({'stamp': Tables.stamp(), 'grammar_hash': 'other',
+                   'tables': data}, f)
+    assert Tables.read(grammar) is None
+
+
+def test_tables_read_not_tables(cache, grammar):
+    """
+    Ensures cached data that isn't tables is ignored
+    """
+    Tables.write(grammar, {'tables': 'data'})
+    assert Tables.read(grammar) is None
+
+
+def test_tables_read_not_json(cache, grammar):
+    with open(Tables.path(grammar), 'wb') as f:
+        f.write(b'\x80\x04data')
+    assert Tables.read(grammar) is None
+
+
+def test_tables_write_error(patch, grammar):
+    """
+    Ensures that failing to write the cache is not an error
+    """
+    patch.object(Tables, 'directory', return_value='/proc/storyscript')
+    Tables.write(grammar, {})
+
+
+def test_tables_get(patch):
+    patch.many(Tables, ['read', 'analyse', 'write', 'grammar_hash'])
+    assert Tables.get('grammar') == Tables.read()
+    assert Tables.analyse.call_count == 0
+
+
+def test_tables_get_analyse(patch):
+    patch.many(Tables, ['analyse', 'write', 'grammar_hash'])
+    patch.object(Tables, 'read', return_value=None)
+    result = Tables.get('grammar')
+    Tables.analyse.assert_called_with('grammar')
+    Tables.write.assert_called_with('grammar', Tables.analyse())
+    assert result == Tables.analyse()
+
+
+def test_tables_lark(grammar):
+    """
+    Ensures Tables.lark builds a parser equivalent to Lark's own
+    """
+    result = Tables.lark(Tables.analyse(grammar))
+    assert isinstance(result, Lark)
+    assert isinstance(result.parser, Frontend)
+    expected = Lark(grammar, parser='lalr').parse('hello world')
+    assert result.parse('hello world') == expected
+    assert list(result.lex('hello')) == ['hello']
+
+
+def test_tables_lark_scanner(grammar):
+    """
+    Ensures Tables.lark can lex with a contextual scanner
+    """
+    result = Tables.lark(Tables.analyse(grammar), scanner=True)
+    assert isinstance(result.parser.lexer, Scanner)
+    assert result.parser.lexer.states is not None
+    assert result.parser.lexer_conf.postlex is None
+    expected = Lark(grammar, parser='lalr').parse('hello world')
+    assert result.parse('hello world') == expected
+
+
+def test_lexer_states():
+    terminals = Tables.lark(Tables.analyse('start: "a"\n')).terminals
+    states = LexerStates(terminals, {0: ['A'], 1: ['A']}, [], [], {})
+    assert states == {}
+    assert isinstance(states[0], TraditionalLexer)
+    assert states[1] == states[0]
+
+
+def test_tables_get_builtin(patch):
+    """
+    Ensures Tables.get uses the pregenerated tables for the built-in grammar
+    """
+    patch.object(Tables, 'read')
+    patch.object(Tables, 'grammar_hash',
+                 return_value=GrammarTables.grammar_hash)
+    assert Tables.get('grammar') == GrammarTables.tables
+    assert Tables.read.call_count == 0
+
+
+def test_tables_generate(grammar, tmpdir):
+    module = tmpdir.join('module.py')
+    Tables.generate(grammar, str(module))
+    result = {}
+    exec(module.read(), result)
+    assert result['grammar_hash'] == Tables.grammar_hash(grammar)
+    assert result['tables']['ignore'] == ['__IGNORE_0']
+
+
+def test_grammar_tables():
+    """
+    Ensures the pregenerated tables match the built-in grammar. Run
+    `python setup.py tables` to update them.
+    """
+    grammar_hash = Tables.grammar_hash(Grammar().build())
+    assert GrammarTables.grammar_hash == grammar_hash
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import json
+from array import array
+
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import ColumnStore, TokenStream
+
+
+@fixture
+def source():
+    return 'a = "b\tc"\n  '
+
+
+@fixture
+def tokens():
+    return [Token('NAME', 'a', 0, 1, 1), Token('EQUALS', '=', 2, 1, 3),
+            Token('STRING', '"b\tc"', 4, 1, 5),
+            Token('_NL', '\n  ', 9, 1, 10),
+            Token('_INDENT', '  ', 9, 1, 10), Token('_DEDENT', '')]
+
+
+@fixture
+def stream(tokens, source):
+    return TokenStream.from_tokens(tokens, source)
+
+
+def test_tokenstream():
+    assert issubclass(TokenStream, ColumnStore)
+
+
+def test_tokenstream_from_tokens(stream):
+    assert len(stream) == 6
+    assert stream.names == ['NAME', 'EQUALS', 'STRING', '_NL', '_INDENT',
+                            '_DEDENT']
+    assert stream.types == array('i', [0, 1, 2, 3, 4, 5])
+    assert stream.starts == array('i', [0, 2, 4, 9, 9, -1])
+    assert stream.ends == array('i', [1, 3, 9, 12, -1, -1])
+    assert stream.lines == array('i', [1, 1, 1, 1, 1, -1])
+    assert stream.columns == array('i', [1, 3, 5, 10, 10, -1])
+
+
+def test_tokenstream_from_tokens_values(stream):
+    """
+    Ensures only the values that the source doesn't have are kept
+    """
+    assert stream.values == {4: '  ', 5: ''}
+
+
+def test_tokenstream_from_tokens_binary():
+    source = 'é = a'.encode('utf-8')
+    tokens = [Token('NAME', 'é', 0, 1, 1), Token('NAME', 'a', 5, 1, 6)]
+    stream = TokenStream.from_tokens(tokens, source)
+    assert stream.ends == array('i', [2, 6])
+    assert stream.values == {}
+    assert stream.value(0) == 'é'
+
+
+def test_tokenstream_type(stream):
+    assert stream.type(2) == 'STRING'
+
+
+def test_tokenstream_token(stream):
+    token = stream.token(2)
+    assert token == Token('STRING', '"b\tc"')
+    assert token.pos_in_stream == 4
+    assert token.line == 1
+    assert token.column == 5
+    assert stream.token(5).line is None
+
+
+def test_tokenstream_iter(stream, tokens):
+    assert list(stream) == tokens
+
+
+def test_tokenstream_rows(stream):
+    rows = list(stream.rows())
+    assert rows[0] == ('NAME', 0, 1, 1, 1, 'a')
+    assert rows[5] == ('_DEDENT', None, None, None, None, '')
+
+
+def test_tokenstream_tsv(stream):
+    lines = list(stream.tsv('a.story'))
+    assert lines[0] == 'a.story\t0\tNAME\t0\t1\t1\t1\ta\n'
+    assert lines[2] == 'a.story\t2\tSTRING\t4\t9\t1\t5\t"b\\tc"\n'
+    assert lines[3] == 'a.story\t3\t_NL\t9\t12\t1\t10\t\\n  \n'
+    assert lines[5] == 'a.story\t5\t_DEDENT\t\t\t\t\t\n'
+
+
+def test_tokenstream_jsonl(stream):
+    lines = list(stream.jsonl('a.story'))
+    assert len(lines) == 6
+    assert lines[0].endswith('\n')
+    assert json.loads(lines[2]) == {'story': 'a.story', 'index': 2,
+                                    'type': 'STRING', 'start': 4, 'end': 9,
+                                    'line': 1, 'column': 5,
+                                    'value': '"b\tc"'}
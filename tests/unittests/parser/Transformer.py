@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
+import sys
+
 from lark import Transformer as LarkTransformer
 from lark.lexer import Token
 
 from pytest import fixture, mark, raises
 
 from storyscript.exceptions import StorySyntaxError
-from storyscript.parser import Transformer, Tree
+from storyscript.parser import Pratt, SideTables, Transformer, Tree
 
 
 @fixture
@@ -24,6 +26,13 @@ def test_transformer():
     assert issubclass(Transformer, LarkTransformer)
 
 
+def test_transformer_init():
+    assert Transformer().compact is False
+    assert Transformer(compact=True).compact is True
+    assert isinstance(Transformer().pratt, Pratt)
+    assert Transformer(compact=True).pratt.compact is True
+
+
 @mark.parametrize('keyword', [
     'function', 'if', 'else', 'foreach', 'return', 'returns', 'try', 'catch',
     'finally', 'when', 'as', 'import', 'while', 'raise'
@@ -52,10 +61,9 @@ def test_transformer_implicit_output(tree):
     Ensures Transformer.implicit_output adds an output tree when needed
     """
     tree.service_fragment.output = None
-    tree.service_fragment.children = []
     Transformer.implicit_output(tree)
     expected = Tree('output', [tree.service_fragment.command.child()])
-    assert tree.service_fragment.children[-1] == expected
+    tree.service_fragment.append.assert_called_with(expected)
 
 
 def test_transformer_implicit_output_none(tree):
@@ -134,7 +142,7 @@ def test_transformer_service_block_indented_args(tree, magic):
     block = magic()
     matches = [block, tree]
     result = Transformer.service_block(matches)
-    block.service_fragment.children.append.assert_called_with('argument')
+    block.service_fragment.append.assert_called_with('argument')
     assert result == Tree('service_block', [block])
 
 
@@ -153,7 +161,23 @@ def test_transformer_rules(rule):
     result = getattr(Transformer(), rule)(['matches'])
     assert isinstance(result, Tree)
     assert result.data == rule
-    assert result.children == ['matches']
+    assert result.children == ('matches',)
+
+
+def test_transformer_inlined_rules():
+    """
+    Ensures the trees of inlined rules keep a list of children, which lark
+    extends in place
+    """
+    matches = ['matches']
+    result = Transformer().__anon_plus_0(matches)
+    assert result == Tree('__anon_plus_0', matches)
+    assert result.children is matches
+
+
+def test_transformer_rules_interned():
+    rule = ''.join(['st', 'art'])
+    assert Transformer().__getattr__(rule)([]).data is sys.intern('start')
 
 
 def test_transformer_absolute_expression(patch, tree):
@@ -182,3 +206,101 @@ def test_transformer_absolute_expression_zero(patch, tree, magic):
         Tree('service', [m, Tree('service_fragment', [])])
     ])
     assert result == expected
+
+
+def test_transformer_absolute_expression_records(patch, tree, magic):
+    """
+    Ensures the services made from absolute expressions are recorded
+    """
+    patch.object(Tree, 'follow_node_chain')
+    tree.follow_node_chain.return_value = magic()
+    with Transformer.recording() as tables:
+        result = Transformer.absolute_expression([tree])
+    assert tables.services == [result.service]
+
+
+def test_transformer_absolute_expression_compact(patch, tree, magic):
+    """
+    Ensures absolute_expression transforms compact trees containing just a
+    path
+    """
+    patch.object(Tree, 'follow_node_chain')
+    m = magic()
+    tree.follow_node_chain.side_effect = [None, m]
+    result = Transformer.absolute_expression([tree])
+    tree.follow_node_chain.assert_called_with(['expression',
+                                               'primary_expression',
+                                               'entity', 'path'])
+    assert result.data == 'service_block'
+
+
+def test_transformer_operation(patch):
+    patch.object(Pratt, 'operation')
+    result = Transformer().operation(['matches'])
+    Pratt.operation.assert_called_with(['matches'])
+    assert result == Pratt.operation()
+
+
+def test_transformer_collapse():
+    assert Transformer.collapse('rule', ['child']) == 'child'
+
+
+def test_transformer_collapse_many():
+    result = Transformer.collapse('rule', ['left', 'op', 'right'])
+    assert result.data == 'rule'
+    assert result.children == ('left', 'op', 'right')
+
+
+@mark.parametrize('rule', Transformer.collapsible)
+def test_transformer_compact(patch, rule):
+    """
+    Ensures compact transformers collapse the pass-through expression levels
+    """
+    patch.object(Transformer, 'collapse')
+    result = getattr(Transformer(compact=True), rule)(['matches'])
+    Transformer.collapse.assert_called_with(rule, ['matches'])
+    assert result == Transformer.collapse()
+
+
+@mark.parametrize('rule', ['expression', 'primary_expression', 'entity'])
+def test_transformer_compact_kept(rule):
+    """
+    Ensures compact transformers keep the other nodes
+    """
+    result = getattr(Transformer(compact=True), rule)(['matches'])
+    assert result == Tree(rule, ['matches'])
+
+
+def test_transformer_recording():
+    with Transformer.recording() as tables:
+        assert isinstance(tables, SideTables)
+        assert Transformer.record(Tree('imports', [])) == Tree('imports', [])
+    assert tables.imports == [Tree('imports', [])]
+    assert Transformer.recorder.tables is None
+
+
+def test_transformer_recording_nested():
+    """
+    Ensures nested recordings restore the tables of the outer one
+    """
+    with Transformer.recording() as outer:
+        with Transformer.recording() as inner:
+            Transformer.record(Tree('imports', []))
+        assert Transformer.recorder.tables is outer
+    assert inner.imports == [Tree('imports', [])]
+    assert outer.imports == []
+
+
+def test_transformer_record_not_recording():
+    tree = Tree('imports', [])
+    assert Transformer.record(tree) is tree
+
+
+@mark.parametrize('rule', list(SideTables.tables))
+def test_transformer_getattr_records(rule):
+    """
+    Ensures the rules of the side tables are recorded
+    """
+    with Transformer.recording() as tables:
+        result = getattr(Transformer(), rule)(['matches'])
+    assert getattr(tables, SideTables.tables[rule]) == [result]
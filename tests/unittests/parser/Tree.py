@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import json
+
 from lark.lexer import Token
 from lark.tree import Tree as LarkTree
 
@@ -22,6 +24,105 @@ def test_tree():
     assert issubclass(Tree, LarkTree)
 
 
+def test_tree_init():
+    tree = Tree('rule', ['child'])
+    assert tree.data == 'rule'
+    assert tree.children == ['child']
+    assert tree._tokens is None
+
+
+def test_tree_slots():
+    assert Tree.__slots__ == ('data', '_children', '_tokens', '_index',
+                              '_dependents')
+
+
+def test_tree_init_meta():
+    assert Tree('rule', [], meta='meta').meta == 'meta'
+
+
+def test_tree_eq():
+    """
+    Ensures trees with tuple or list children can be compared
+    """
+    assert Tree('rule', ('child',)) == Tree('rule', ['child'])
+    assert Tree('rule', ('child',)) != Tree('rule', ['other'])
+    assert Tree('rule', ('child',)) != Tree('other', ['child'])
+    assert Tree('rule', []) != 'rule'
+
+
+def test_tree_hash():
+    assert hash(Tree('rule', ('child',))) == hash(Tree('rule', ['child']))
+
+
+def test_tree_mutable_children():
+    tree = Tree('rule', ('child',))
+    assert tree.mutable_children() == ['child']
+    assert tree.children == ['child']
+
+
+def test_tree_insert_tuple():
+    tree = Tree('tree', ('child',))
+    tree.insert('first')
+    assert tree.children == ['first', 'child']
+
+
+def test_tree_children(patch):
+    """
+    Ensures setting the children of a tree invalidates its tokens
+    """
+    patch.object(Tree, 'mutated')
+    tree = Tree('rule', [])
+    tree.children = ['child']
+    assert tree.children == ['child']
+    assert Tree.mutated.call_count == 1
+
+
+def test_tree_mutated():
+    """
+    Ensures changing a tree invalidates its tokens and the ones found from
+    them, but not the ones of other trees
+    """
+    path = Tree('path', [Token('WORD', 'first')])
+    other = Tree('path', [Token('WORD', 'other')])
+    outer = Tree('outer', [path, Tree('middle', [other]), Token('WORD', 'x')])
+    root = Tree('root', [outer])
+    root.find_tokens()
+    other.find_tokens()
+    path.mutated()
+    assert path._tokens is None
+    assert outer._tokens is None
+    assert root._tokens is None
+    assert other._tokens == (Token('WORD', 'other'), Token('WORD', 'other'))
+    assert path._dependents is None
+
+
+def test_tree_mutated_index():
+    tree = Tree('outer', [Tree('path', [])])
+    tree.path
+    tree.mutated()
+    assert tree._index is None
+
+
+def test_tree_depends():
+    tree = Tree('path', [])
+    dependent = Tree('outer', [tree])
+    tree.depends(dependent)
+    tree.depends(dependent)
+    assert tree._dependents == [dependent]
+
+
+def test_tree_depends_shared():
+    """
+    Ensures trees in many trees keep all of them
+    """
+    tree = Tree('path', [])
+    first = Tree('outer', [tree])
+    second = Tree('outer', [tree])
+    tree.depends(first)
+    tree.depends(second)
+    assert tree._dependents == [first, second]
+
+
 def test_tree_walk():
     inner_tree = Tree('inner', [])
     tree = Tree('rule', [inner_tree])
@@ -39,12 +140,50 @@ def test_tree_walk_token():
     assert result == inner_tree
 
 
+def test_tree_named_child():
+    inner = Tree('inner', [])
+    tree = Tree('rule', [Token('test', 'test'), inner, Tree('inner', [1])])
+    assert tree.named_child('inner') is inner
+    assert tree.named_child('other') is None
+
+
+def test_tree_named_child_index(patch):
+    """
+    Ensures the index of the subtrees is built only once
+    """
+    inner = Tree('inner', [])
+    tree = Tree('rule', [inner])
+    tree.named_child('inner')
+    assert tree._index == {'inner': inner}
+    tree._index['inner'] = 'cached'
+    assert tree.named_child('inner') == 'cached'
+
+
+def test_tree_named_child_mutated():
+    """
+    Ensures the index is rebuilt after the children have changed
+    """
+    tree = Tree('rule', [Tree('inner', [])])
+    tree.named_child('inner')
+    new = Tree('new', [])
+    tree.replace(0, new)
+    assert tree.named_child('inner') is None
+    assert tree.named_child('new') is new
+
+
 def test_tree_node(patch):
-    patch.object(Tree, 'walk')
+    patch.object(Tree, 'named_child')
     tree = Tree('rule', [])
     result = tree.node('inner')
-    Tree.walk.assert_called_with(tree, 'inner')
-    assert result == Tree.walk()
+    Tree.named_child.assert_called_with('inner')
+    assert result == Tree.named_child()
+
+
+def test_tree_node_path():
+    inner = Tree('inner', [])
+    tree = Tree('rule', [Tree('outer', [inner])])
+    assert tree.node('outer.inner') is inner
+    assert tree.node('missing.inner') is None
 
 
 def test_tree_child():
@@ -80,10 +219,134 @@ def test_tree_end_column():
     assert tree.end_column() == '1'
 
 
-def test_tree_insert():
+def test_tree_find_tokens():
+    first = Token('WORD', 'first')
+    last = Token('WORD', 'last')
+    tree = Tree('outer', [Tree('path', [first]), Tree('path', [last])])
+    assert tree.find_tokens() == (first, last)
+    assert tree._tokens == (first, last)
+    assert tree.children[0]._dependents == [tree]
+    assert tree.children[1]._dependents == [tree]
+
+
+def test_tree_find_tokens_empty():
+    tree = Tree('outer', [Tree('empty', []), Token('WORD', 'word')])
+    assert tree.find_tokens()[0] is None
+
+
+def test_tree_find_tokens_subtrees():
+    """
+    Ensures the tokens of the first and last subtrees are found too
+    """
+    first = Token('WORD', 'first')
+    last = Token('WORD', 'last')
+    inner = Tree('path', [first])
+    tree = Tree('outer', [inner, Tree('middle', []), Tree('path', [last])])
+    tree.find_tokens()
+    assert inner._tokens == (first, first)
+    assert tree.children[1]._tokens is None
+
+
+def test_tree_find_tokens_deep():
+    """
+    Ensures the tokens of deep trees are found without reaching the
+    recursion limit
+    """
+    first = Token('WORD', 'first', line=1)
+    tree = Tree('path', [first])
+    for _ in range(100000):
+        tree = Tree('outer', [tree, Token('WORD', 'last')])
+    assert tree.first_token() == first
+    assert tree.line() == '1'
+    assert tree.last_token() == 'last'
+
+
+def test_tree_first_token(patch):
+    """
+    Ensures Tree.first_token finds the tokens only once
+    """
+    token = Token('WORD', 'word')
+    tree = Tree('outer', [Tree('path', [token])])
+    assert tree.first_token() == token
+    patch.object(Tree, 'find_tokens')
+    assert tree.first_token() == token
+    assert Tree.find_tokens.call_count == 0
+
+
+def test_tree_last_token():
+    token = Token('WORD', 'word')
+    tree = Tree('outer', [Tree('path', ['first', token])])
+    assert tree.last_token() == token
+
+
+def test_tree_tokens_mutated():
+    """
+    Ensures the tokens are found again after a tree has been changed
+    """
+    first = Token('WORD', 'first')
+    path = Tree('path', [first])
+    tree = Tree('outer', [path])
+    assert tree.first_token() == first
+    new = Token('WORD', 'new')
+    path.replace(0, new)
+    assert tree.first_token() == new
+
+
+def test_tree_tokens_shared():
+    """
+    Ensures the tokens of all the trees with a changed subtree are found
+    again
+    """
+    path = Tree('path', [Token('WORD', 'first')])
+    first = Tree('outer', [path])
+    second = Tree('outer', [path])
+    first.first_token()
+    second.first_token()
+    path.replace(0, Token('WORD', 'new'))
+    assert first.first_token() == 'new'
+    assert second.first_token() == 'new'
+
+
+def test_tree_end_line():
+    token = Token('WORD', 'word')
+    token.end_line = 2
+    tree = Tree('outer', [Token('WORD', 'first', line=1), token])
+    assert tree.end_line() == '2'
+
+
+def test_tree_start_pos():
+    tree = Tree('outer', [Tree('path', [Token('WORD', 'word', 3)])])
+    assert tree.start_pos() == 3
+
+
+def test_tree_start_pos_empty(tree):
+    assert tree.start_pos() is None
+
+
+def test_tree_end_pos():
+    tree = Tree('outer', [Tree('path', [Token('WORD', 'word', 3)])])
+    assert tree.end_pos() == 7
+
+
+@mark.parametrize('children', [[], [Token('WORD', 'word')]])
+def test_tree_end_pos_none(children):
+    assert Tree('outer', children).end_pos() is None
+
+
+def test_tree_insert(patch):
+    patch.object(Tree, 'mutated')
     tree = Tree('tree', [])
     tree.insert('child')
     assert tree.children == ['child']
+    assert Tree.mutated.call_count == 1
+
+
+def test_tree_append(patch):
+    patch.object(Tree, 'mutated')
+    tree = Tree('tree', ['first'])
+    tree.append('child')
+    assert tree.children == ['first', 'child']
+    assert Tree.mutated.call_count == 1
 
 
 def test_tree_rename():
@@ -95,10 +358,12 @@ def test_tree_rename():
     assert tree.data == 'new'
 
 
-def test_tree_replace():
+def test_tree_replace(patch):
+    patch.object(Tree, 'mutated')
     tree = Tree('tree', ['old'])
     tree.replace(0, 'new')
     assert tree.children == ['new']
+    assert Tree.mutated.call_count == 1
 
 
 def test_tree_extract_path():
@@ -113,11 +378,19 @@ def test_tree_extract_path_fragments():
 
 
 def test_tree_attributes(patch):
-    patch.object(Tree, 'node')
+    patch.object(Tree, 'named_child')
     tree = Tree('master', [])
     result = tree.branch
-    Tree.node.assert_called_with('branch')
-    assert result == Tree.node()
+    Tree.named_child.assert_called_with('branch')
+    assert result == Tree.named_child()
+
+
+def test_tree_attributes_private():
+    """
+    Ensures private attributes are not looked up as subtrees
+    """
+    with raises(AttributeError):
+        Tree('master', [Tree('_branch', [])])._branch
 
 
 def test_tree_find():
@@ -183,6 +456,49 @@ def test_tree_is_unary_leaf_false(tree):
     assert tree.is_unary_leaf() is False
 
 
+def test_tree_unary_entity():
+    entity = Tree('entity', [Tree('values', [0])])
+    tree = Tree('expression', [Tree('primary_expression', [entity])])
+    assert tree.unary_entity() == entity
+
+
+def test_tree_unary_entity_full():
+    """
+    Ensures unary_entity follows the full chain of expression levels
+    """
+    entity = Tree('entity', [Tree('values', [0])])
+    tree = entity
+    for level in reversed(Tree.expression_levels):
+        tree = Tree(level, [tree])
+    assert Tree('expression', [tree]).unary_entity() == entity
+
+
+@mark.parametrize('tree', [
+    Tree('any', []),
+    Tree('expression', [Tree('entity', [0])]),
+    Tree('expression', [Tree('arith_expression', [1, 2])]),
+    Tree('expression', [Tree('primary_expression', [Token('INT', 1)])]),
+    Tree('expression', [
+        Tree('primary_expression', [
+            Tree('primary_expression', [Tree('entity', [0])])
+        ])
+    ]),
+    Tree('expression', [
+        Tree('pow_expression', [
+            Tree('unary_expression', [
+                Tree('primary_expression', [Tree('entity', [0])])
+            ])
+        ])
+    ]),
+])
+def test_tree_unary_entity_none(tree):
+    """
+    Ensures unary_entity finds no entity in parentheses, operations or
+    malformed chains
+    """
+    assert tree.unary_entity() is None
+
+
 def test_tree_expect(tree):
     """
     Ensures expect throws an error
@@ -223,3 +539,81 @@ def test_follow_node_chain_children(patch, tree):
     assert tree.follow_node_chain(['m4', 'm2', 'mock']) is None
     assert tree.follow_node_chain(['m4', 'm3', 'm2', 'mock']) is None
     assert tree.follow_node_chain(['m3', 'm2', 'mock']) == m
+
+
+@fixture
+def positioned():
+    """
+    A tree with positioned tokens, like 'a = 1'
+    """
+    a = Token('NAME', 'a', 0, 1, 1)
+    a.end_line, a.end_column = 1, 2
+    one = Token('INT', '1', 4, 1, 5)
+    one.end_line, one.end_column = 1, 6
+    equals = Token('EQUAL', '=')
+    return Tree('assignment', [Tree('path', [a]), equals,
+                               Tree('values', [Tree('number', [one])])])
+
+
+def test_tree_position(positioned):
+    assert Tree.position(positioned) == (0, 5, 1, 1, 1, 6)
+    assert Tree.position(positioned.child(1)) == (None,) * 6
+    assert Tree.position(positioned.path.child(0)) == (0, 1, 1, 1, 1, 2)
+
+
+def test_tree_position_empty():
+    assert Tree.position(Tree('empty', [])) == (None,) * 6
+
+
+def test_tree_pretty_lines(positioned):
+    lines = list(positioned.pretty_lines())
+    assert lines == ['assignment\n', '  path\ta\n', '  =\n', '  values\n',
+                     '    number\t1\n']
+    assert positioned.pretty() == LarkTree.pretty(positioned)
+    assert positioned.pretty('\t') == LarkTree.pretty(positioned, '\t')
+
+
+def test_tree_pretty_lines_deep():
+    tree = Tree('leaf', [])
+    for _ in range(10000):
+        tree = Tree('level', [tree, 'token'])
+    lines = tree.pretty_lines()
+    assert next(lines) == 'level\n'
+    assert len(list(lines)) == 20000
+
+
+def test_tree_jsonl(positioned):
+    lines = list(positioned.jsonl('a.story'))
+    assert len(lines) == 7
+    assert lines[0].endswith('\n')
+    assert json.loads(lines[0]) == {
+        'story': 'a.story', 'index': 0, 'parent': -1, 'rule': 'assignment',
+        'type': None, 'value': None, 'start': 0, 'end': 5, 'line': 1,
+        'column': 1, 'end_line': 1, 'end_column': 6}
+    assert json.loads(lines[2]) == {
+        'story': 'a.story', 'index': 2, 'parent': 1, 'rule': None,
+        'type': 'NAME', 'value': 'a', 'start': 0, 'end': 1, 'line': 1,
+        'column': 1, 'end_line': 1, 'end_column': 2}
+    parents = [json.loads(line)['parent'] for line in lines]
+    assert parents == [-1, 0, 1, 0, 0, 4, 5]
+
+
+def test_tree_json(positioned):
+    result = json.loads(''.join(positioned.json()))
+    assert result['rule'] == 'assignment'
+    assert result['end'] == 5
+    path, equals, values = result['children']
+    assert path['children'] == [{'type': 'NAME', 'value': 'a', 'start': 0,
+                                 'end': 1, 'line': 1, 'column': 1,
+                                 'end_line': 1, 'end_column': 2}]
+    assert equals['type'] == 'EQUAL'
+    assert values['children'][0]['rule'] == 'number'
+
+
+def test_tree_json_deep():
+    tree = Tree('leaf', [])
+    for _ in range(10000):
+        tree = Tree('level', [tree, Token('NAME', 'a')])
+    chunks = list(tree.json())
+    assert chunks[0].startswith('{"rule": "level"')
+    assert chunks[-1] == ']}'
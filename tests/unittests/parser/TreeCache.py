@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import zlib
+
+from lark.lexer import Token
+
+from pytest import fixture
+
+from storyscript.parser import Arena, Tables, Tree, TreeCache
+
+
+@fixture
+def cache(tmpdir):
+    return TreeCache(str(tmpdir))
+
+
+@fixture
+def tree():
+    return Tree('start', [Token('NAME', 'a', 0, 1, 1)])
+
+
+def test_tree_cache_init(patch):
+    patch.object(Tables, 'directory', return_value='/cache')
+    assert TreeCache().directory == os.path.join('/cache', 'trees')
+
+
+def test_tree_cache_init_directory():
+    assert TreeCache('/trees').directory == '/trees'
+
+
+def test_tree_cache_key():
+    key = TreeCache.key('source', 'grammar', 'lalr', False)
+    assert len(key) == 64
+    assert key == TreeCache.key('source', 'grammar', 'lalr', False)
+    assert key != TreeCache.key('other', 'grammar', 'lalr', False)
+    assert key != TreeCache.key('source', 'other', 'lalr', False)
+    assert key != TreeCache.key('source', 'grammar', 'lalr', True)
+
+
+def test_tree_cache_key_version(patch):
+    key = TreeCache.key('source', 'grammar')
+    patch.object(TreeCache, 'version', 0)
+    assert TreeCache.key('source', 'grammar') != key
+
+
+def test_tree_cache_path(cache):
+    expected = os.path.join(cache.directory, 'key.arena')
+    assert cache.path('key') == expected
+
+
+def test_tree_cache_dump_load(cache, tree):
+    cache.dump('key', tree, 'a\n')
+    result = cache.load('key')
+    assert result == tree
+    assert result.children[0].line == 1
+    assert os.listdir(cache.directory) == ['key.arena']
+
+
+def test_tree_cache_dump(patch, cache, tree):
+    patch.object(Arena, 'from_tree')
+    Arena.from_tree().dump.return_value = b'arena'
+    cache.dump('key', tree, 'a\n')
+    Arena.from_tree.assert_called_with(tree, 'a\n')
+    with io.open(cache.path('key'), 'rb') as f:
+        assert zlib.decompress(f.read()) == b'arena'
+
+
+def test_tree_cache_dump_error(patch, tree):
+    """
+    Ensures failing to write the cache is not an error
+    """
+    patch.object(os, 'makedirs', side_effect=OSError)
+    TreeCache('/missing').dump('key', tree, 'a\n')
+
+
+def test_tree_cache_load_missing(cache):
+    assert cache.load('key') is None
+
+
+def test_tree_cache_load_invalid(cache):
+    with io.open(cache.path('key'), 'wb') as f:
+        f.write(b'invalid')
+    assert cache.load('key') is None